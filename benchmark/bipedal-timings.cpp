@@ -416,6 +416,36 @@ int main(int argc, char* argv[]) {
   }
   printStatistics("calcDiff", duration);
 
+  // Gauss-Newton derivatives computed only on the kinematic chain of the frame
+  // versus the ones computed with the dense Jacobian
+  const boost::shared_ptr<crocoddyl::ResidualDataAbstract>& goalTracking_rdata =
+      goalTrackingCost_data->residual;
+  const boost::shared_ptr<crocoddyl::ActivationDataAbstract>&
+      goalTracking_adata = goalTrackingCost_data->activation;
+  duration.setZero();
+  SMOOTH(T) {
+    timer.reset();
+    goalTrackingCost->get_residual()->calcCostDiff(
+        goalTrackingCost_data, goalTracking_rdata, goalTracking_adata);
+    duration[_smooth] = timer.get_us_duration();
+  }
+  printStatistics("calcCostDiff (kinematic chain)", duration);
+
+  duration.setZero();
+  Eigen::MatrixXd Arr_Rq(goalTracking_rdata->Rx.rows(), model.nv);
+  SMOOTH(T) {
+    timer.reset();
+    Eigen::Block<Eigen::MatrixXd, Eigen::Dynamic, Eigen::Dynamic, true> Rq =
+        goalTracking_rdata->Rx.leftCols(model.nv);
+    goalTrackingCost_data->Lx.head(model.nv).noalias() =
+        Rq.transpose() * goalTracking_adata->Ar;
+    Arr_Rq.noalias() = goalTracking_adata->Arr.diagonal().asDiagonal() * Rq;
+    goalTrackingCost_data->Lxx.topLeftCorner(model.nv, model.nv).noalias() =
+        Rq.transpose() * Arr_Rq;
+    duration[_smooth] = timer.get_us_duration();
+  }
+  printStatistics("calcCostDiff (dense)", duration);
+
   duration.setZero();
   SMOOTH(T) {
     timer.reset();
@@ -0,0 +1,87 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, University of Edinburgh
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#include "crocoddyl/core/actions/lqr.hpp"
+#include "crocoddyl/core/actions/unicycle.hpp"
+#include "crocoddyl/core/optctrl/shooting.hpp"
+#include "crocoddyl/core/utils/timer.hpp"
+
+template <typename Scalar>
+void runBenchmark(
+    const boost::shared_ptr<crocoddyl::ActionModelAbstractTpl<Scalar> >& model,
+    const std::string& name, const unsigned int N, const unsigned int T) {
+  typedef typename crocoddyl::MathBaseTpl<Scalar>::VectorXs VectorXs;
+
+  // Formulating the shooting problem
+  const VectorXs x0 = model->get_state()->rand();
+  std::vector<boost::shared_ptr<crocoddyl::ActionModelAbstractTpl<Scalar> > >
+      runningModels(N, model);
+  crocoddyl::ShootingProblemTpl<Scalar> problem(x0, runningModels, model);
+  std::vector<VectorXs> xs(N + 1, x0);
+  std::vector<VectorXs> us(N, VectorXs::Constant(model->get_nu(), Scalar(0.1)));
+
+  // Running rollout
+  Eigen::ArrayXd duration(T);
+  for (unsigned int i = 0; i < T; ++i) {
+    crocoddyl::Timer timer;
+    problem.rollout(us, xs);
+    duration[i] = timer.get_duration();
+  }
+  std::cout << "  " << name
+            << " ShootingProblem.rollout [ms]: " << duration.sum() / T << " ("
+            << duration.minCoeff() << "-" << duration.maxCoeff() << ")"
+            << std::endl;
+
+  // Running calc
+  for (unsigned int i = 0; i < T; ++i) {
+    crocoddyl::Timer timer;
+    problem.calc(xs, us);
+    duration[i] = timer.get_duration();
+  }
+  std::cout << "  " << name
+            << " ShootingProblem.calc [ms]: " << duration.sum() / T << " ("
+            << duration.minCoeff() << "-" << duration.maxCoeff() << ")"
+            << std::endl;
+
+  // Running calcDiff
+  for (unsigned int i = 0; i < T; ++i) {
+    crocoddyl::Timer timer;
+    problem.calcDiff(xs, us);
+    duration[i] = timer.get_duration();
+  }
+  std::cout << "  " << name
+            << " ShootingProblem.calcDiff [ms]: " << duration.sum() / T << " ("
+            << duration.minCoeff() << "-" << duration.maxCoeff() << ")"
+            << std::endl;
+}
+
+int main(int argc, char* argv[]) {
+  unsigned int N = 200;  // number of nodes
+  unsigned int T = 5e3;  // number of trials
+  unsigned int NX = 40;  // dimension of the LQR state
+  if (argc > 1) {
+    T = atoi(argv[1]);
+  }
+
+  std::cout << "Unicycle (N=" << N << "):" << std::endl;
+  runBenchmark<double>(
+      boost::make_shared<crocoddyl::ActionModelUnicycleTpl<double> >(),
+      "double", N, T);
+  runBenchmark<float>(
+      boost::make_shared<crocoddyl::ActionModelUnicycleTpl<float> >(), "float",
+      N, T);
+
+  std::cout << "LQR (N=" << N << ", nx=" << NX << ", nu=" << NX / 2
+            << "):" << std::endl;
+  runBenchmark<double>(
+      boost::make_shared<crocoddyl::ActionModelLQRTpl<double> >(NX, NX / 2),
+      "double", N, T);
+  runBenchmark<float>(
+      boost::make_shared<crocoddyl::ActionModelLQRTpl<float> >(NX, NX / 2),
+      "float", N, T);
+}
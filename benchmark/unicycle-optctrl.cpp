@@ -8,6 +8,7 @@
 
 #include "crocoddyl/core/actions/unicycle.hpp"
 #include "crocoddyl/core/solvers/ddp.hpp"
+#include "crocoddyl/core/solvers/mppi.hpp"
 #include "crocoddyl/core/utils/callbacks.hpp"
 #include "crocoddyl/core/utils/timer.hpp"
 
@@ -53,6 +54,22 @@ int main(int argc, char* argv[]) {
   std::cout << "  DDP.solve [ms]: " << avrg_duration << " (" << min_duration
             << "-" << max_duration << ")" << std::endl;
 
+  // Solving the optimal control problem with a sampling-based solver
+  crocoddyl::SolverMPPI mppi(problem);
+  for (unsigned int i = 0; i < T; ++i) {
+    crocoddyl::Timer timer;
+    mppi.solve(xs, us, MAXITER);
+    duration[i] = timer.get_duration();
+  }
+
+  avrg_duration = duration.sum() / T;
+  min_duration = duration.minCoeff();
+  max_duration = duration.maxCoeff();
+  std::cout << "  MPPI.solve [ms]: " << avrg_duration << " (" << min_duration
+            << "-" << max_duration << "), "
+            << 1e3 * mppi.get_nsamples() / avrg_duration << " rollouts/s"
+            << std::endl;
+
   // Running calc
   for (unsigned int i = 0; i < T; ++i) {
     crocoddyl::Timer timer;
@@ -1,4 +1,5 @@
 # flake8: noqa: F405
+import sys
 import time
 
 import numpy as np
@@ -6,6 +7,9 @@ import pinocchio
 
 from .libcrocoddyl_pywrap import *  # noqa
 
+# Make the single-precision submodule importable as crocoddyl.float32
+sys.modules[__name__ + ".float32"] = float32
+
 
 def rotationMatrixFromTwoVectors(a, b):
     a_norm = np.linalg.norm(a)
@@ -556,39 +560,6 @@ class CallbackDisplay(CallbackAbstract):
         self.visualization.displayFromSolver(solver)
 
 
-class CallbackLogger(CallbackAbstract):
-    def __init__(self):
-        CallbackAbstract.__init__(self)
-        self.xs = []
-        self.us = []
-        self.fs = []
-        self.iters = []
-        self.costs = []
-        self.stops = []
-        self.grads = []
-        self.pregs = []
-        self.dregs = []
-        self.steps = []
-        self.ffeass = []
-        self.hfeass = []
-
-    def __call__(self, solver):
-        import copy
-
-        self.xs = copy.copy(solver.xs)
-        self.us = copy.copy(solver.us)
-        self.fs.append(copy.copy(solver.fs))
-        self.iters.append(solver.iter)
-        self.costs.append(solver.cost)
-        self.stops.append(solver.stoppingCriteria())
-        self.grads.append(-solver.expectedImprovement()[1].item())
-        self.pregs.append(solver.preg)
-        self.dregs.append(solver.dreg)
-        self.steps.append(solver.stepLength)
-        self.ffeass.append(solver.ffeas)
-        self.hfeass.append(solver.hfeas)
-
-
 def plotOCSolution(xs=None, us=None, figIndex=1, show=True, figTitle=""):
     import matplotlib.pyplot as plt
 
@@ -720,7 +691,6 @@ def saveLogfile(filename, log):
     data = {
         "xs": log.xs,
         "us": log.us,
-        "fs": log.fs,
         "steps": log.steps,
         "iters": log.iters,
         "costs": log.costs,
@@ -729,5 +699,8 @@ def saveLogfile(filename, log):
         "stops": log.stops,
         "grads": log.grads,
     }
+    # The gaps of each iteration are only recorded with the trajectories
+    if log.with_trajectories:
+        data["fs"] = log.fs
     with open(filename, "wb") as f:
         pickle.dump(data, f)
@@ -16,7 +16,12 @@
 namespace crocoddyl {
 namespace python {
 
-void exposeActionAbstract() {
+template <typename Scalar>
+void exposeActionAbstractTpl() {
+  typedef ActionModelAbstractTpl<Scalar> ActionModelAbstract;
+  typedef ActionDataAbstractTpl<Scalar> ActionDataAbstract;
+  typedef ActionModelAbstractTpl_wrap<Scalar> ActionModelAbstract_wrap;
+  typedef typename MathBaseTpl<Scalar>::VectorXs VectorXs;
   // Register custom converters between std::vector and Python list
   typedef boost::shared_ptr<ActionModelAbstract> ActionModelPtr;
   typedef boost::shared_ptr<ActionDataAbstract> ActionDataPtr;
@@ -39,7 +44,7 @@ void exposeActionAbstract() {
       "derivatives. These computations are mainly carried out inside calc() "
       "and calcDiff(),\n"
       "respectively.",
-      bp::init<boost::shared_ptr<StateAbstract>, std::size_t,
+      bp::init<boost::shared_ptr<StateAbstractTpl<Scalar> >, std::size_t,
                bp::optional<std::size_t, std::size_t, std::size_t> >(
           bp::args("self", "state", "nu", "nr", "ng", "nh"),
           "Initialize the action model.\n\n"
@@ -58,9 +63,9 @@ void exposeActionAbstract() {
            ":param data: action data\n"
            ":param x: state point (dim. state.nx)\n"
            ":param u: control input (dim. nu)")
-      .def<void (ActionModelAbstract::*)(
+      .template def<void (ActionModelAbstract::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
+          const Eigen::Ref<const VectorXs>&)>(
           "calc", &ActionModelAbstract::calc, bp::args("self", "data", "x"),
           "Compute the total cost value for nodes that depends only on the "
           "state.\n\n"
@@ -81,9 +86,9 @@ void exposeActionAbstract() {
            ":param data: action data\n"
            ":param x: state point (dim. state.nx)\n"
            ":param u: control input (dim. nu)")
-      .def<void (ActionModelAbstract::*)(
+      .template def<void (ActionModelAbstract::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
+          const Eigen::Ref<const VectorXs>&)>(
           "calcDiff", &ActionModelAbstract::calcDiff,
           bp::args("self", "data", "x"),
           "Compute the derivatives of the cost functions with respect to the "
@@ -94,6 +99,27 @@ void exposeActionAbstract() {
           "problem.\n"
           ":param data: action data\n"
           ":param x: state point (dim. state.nx)")
+      .def("calcBatch", &ActionModel_calcBatch<Scalar>,
+           bp::args("self", "datas", "X", "U"),
+           "Compute the next states and cost values of a batch of samples.\n\n"
+           "The i-th sample is defined by the i-th rows of X and U, and it is "
+           "evaluated in the i-th data.\n"
+           "By default, the samples are evaluated in parallel when the "
+           "multithreading support is enabled.\n"
+           ":param datas: action datas (size N)\n"
+           ":param X: state points (dim. N x state.nx)\n"
+           ":param U: control inputs (dim. N x nu)\n"
+           ":return the stacked next states (dim. N x state.nx) and cost "
+           "values (dim. N)")
+      .def("calcDiffBatch", &ActionModel_calcDiffBatch<Scalar>,
+           bp::args("self", "datas", "X", "U"),
+           "Compute the derivatives of the dynamics and cost functions of a "
+           "batch of samples.\n\n"
+           "The derivatives of the i-th sample are stored in the i-th data. It "
+           "assumes that calcBatch has been run first.\n"
+           ":param datas: action datas (size N)\n"
+           ":param X: state points (dim. N x state.nx)\n"
+           ":param U: control inputs (dim. N x nu)")
       .def("createData", &ActionModelAbstract_wrap::createData,
            &ActionModelAbstract_wrap::default_createData, bp::args("self"),
            "Create the action data.\n\n"
@@ -257,5 +283,9 @@ void exposeActionAbstract() {
       .def(CopyableVisitor<ActionDataAbstract>());
 }
 
+void exposeActionAbstract() { exposeActionAbstractTpl<double>(); }
+
+template void exposeActionAbstractTpl<float>();
+
 }  // namespace python
 }  // namespace crocoddyl
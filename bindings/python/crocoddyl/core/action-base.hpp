@@ -13,27 +13,37 @@
 #include "crocoddyl/core/action-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
 
-class ActionModelAbstract_wrap : public ActionModelAbstract,
-                                 public bp::wrapper<ActionModelAbstract> {
+template <typename Scalar>
+class ActionModelAbstractTpl_wrap
+    : public ActionModelAbstractTpl<Scalar>,
+      public bp::wrapper<ActionModelAbstractTpl<Scalar> > {
  public:
   EIGEN_MAKE_ALIGNED_OPERATOR_NEW
+  typedef ActionModelAbstractTpl<Scalar> ActionModelAbstract;
+  typedef ActionDataAbstractTpl<Scalar> ActionDataAbstract;
+  typedef StateAbstractTpl<Scalar> StateAbstract;
+  typedef typename MathBaseTpl<Scalar>::VectorXs VectorXs;
   using ActionModelAbstract::ng_;
   using ActionModelAbstract::nh_;
   using ActionModelAbstract::nu_;
+  using ActionModelAbstract::state_;
 
-  ActionModelAbstract_wrap(boost::shared_ptr<StateAbstract> state,
-                           const std::size_t nu, const std::size_t nr = 1,
-                           const std::size_t ng = 0, const std::size_t nh = 0)
+  ActionModelAbstractTpl_wrap(boost::shared_ptr<StateAbstract> state,
+                              const std::size_t nu, const std::size_t nr = 1,
+                              const std::size_t ng = 0,
+                              const std::size_t nh = 0)
       : ActionModelAbstract(state, nu, nr, ng, nh),
         bp::wrapper<ActionModelAbstract>() {}
 
   void calc(const boost::shared_ptr<ActionDataAbstract>& data,
-            const Eigen::Ref<const Eigen::VectorXd>& x,
-            const Eigen::Ref<const Eigen::VectorXd>& u) {
+            const Eigen::Ref<const VectorXs>& x,
+            const Eigen::Ref<const VectorXs>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -44,13 +54,14 @@ class ActionModelAbstract_wrap : public ActionModelAbstract,
                    << "u has wrong dimension (it should be " +
                           std::to_string(nu_) + ")");
     }
-    return bp::call<void>(this->get_override("calc").ptr(), data,
-                          (Eigen::VectorXd)x, (Eigen::VectorXd)u);
+    return bp::call<void>(this->get_override("calc").ptr(), data, (VectorXs)x,
+                          (VectorXs)u);
   }
 
   void calcDiff(const boost::shared_ptr<ActionDataAbstract>& data,
-                const Eigen::Ref<const Eigen::VectorXd>& x,
-                const Eigen::Ref<const Eigen::VectorXd>& u) {
+                const Eigen::Ref<const VectorXs>& x,
+                const Eigen::Ref<const VectorXs>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -62,10 +73,11 @@ class ActionModelAbstract_wrap : public ActionModelAbstract,
                           std::to_string(nu_) + ")");
     }
     return bp::call<void>(this->get_override("calcDiff").ptr(), data,
-                          (Eigen::VectorXd)x, (Eigen::VectorXd)u);
+                          (VectorXs)x, (VectorXs)u);
   }
 
   boost::shared_ptr<ActionDataAbstract> createData() {
+    ScopedGILAcquire gil;
     enableMultithreading() = false;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<ActionDataAbstract> >(createData.ptr());
@@ -78,13 +90,13 @@ class ActionModelAbstract_wrap : public ActionModelAbstract,
   }
 
   void quasiStatic(const boost::shared_ptr<ActionDataAbstract>& data,
-                   Eigen::Ref<Eigen::VectorXd> u,
-                   const Eigen::Ref<const Eigen::VectorXd>& x,
-                   const std::size_t maxiter, const double tol) {
+                   Eigen::Ref<VectorXs> u, const Eigen::Ref<const VectorXs>& x,
+                   const std::size_t maxiter, const Scalar tol) {
+    ScopedGILAcquire gil;
     if (boost::python::override quasiStatic =
             this->get_override("quasiStatic")) {
-      u = bp::call<Eigen::VectorXd>(quasiStatic.ptr(), data, (Eigen::VectorXd)x,
-                                    maxiter, tol);
+      u = bp::call<VectorXs>(quasiStatic.ptr(), data, (VectorXs)x, maxiter,
+                             tol);
       if (static_cast<std::size_t>(u.size()) != nu_) {
         throw_pretty("Invalid argument: "
                      << "u has wrong dimension (it should be " +
@@ -96,15 +108,41 @@ class ActionModelAbstract_wrap : public ActionModelAbstract,
   }
 
   void default_quasiStatic(const boost::shared_ptr<ActionDataAbstract>& data,
-                           Eigen::Ref<Eigen::VectorXd> u,
-                           const Eigen::Ref<const Eigen::VectorXd>& x,
-                           const std::size_t maxiter, const double tol) {
+                           Eigen::Ref<VectorXs> u,
+                           const Eigen::Ref<const VectorXs>& x,
+                           const std::size_t maxiter, const Scalar tol) {
     return this->ActionModelAbstract::quasiStatic(data, u, x, maxiter, tol);
   }
 };
 
+typedef ActionModelAbstractTpl_wrap<double> ActionModelAbstract_wrap;
+
+template <typename Scalar>
+bp::tuple ActionModel_calcBatch(
+    ActionModelAbstractTpl<Scalar>& model,
+    const std::vector<boost::shared_ptr<ActionDataAbstractTpl<Scalar> > >&
+        datas,
+    const typename ActionModelAbstractTpl<Scalar>::MatrixXsRowMajor& X,
+    const typename ActionModelAbstractTpl<Scalar>::MatrixXsRowMajor& U) {
+  typename ActionModelAbstractTpl<Scalar>::MatrixXsRowMajor xnext(
+      X.rows(), model.get_state()->get_nx());
+  typename MathBaseTpl<Scalar>::VectorXs cost(X.rows());
+  model.calcBatch(datas, X, U, xnext, cost);
+  return bp::make_tuple(xnext, cost);
+}
+
+template <typename Scalar>
+void ActionModel_calcDiffBatch(
+    ActionModelAbstractTpl<Scalar>& model,
+    const std::vector<boost::shared_ptr<ActionDataAbstractTpl<Scalar> > >&
+        datas,
+    const typename ActionModelAbstractTpl<Scalar>::MatrixXsRowMajor& X,
+    const typename ActionModelAbstractTpl<Scalar>::MatrixXsRowMajor& U) {
+  model.calcDiffBatch(datas, X, U);
+}
+
 BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(ActionModel_quasiStatic_wraps,
-                                       ActionModelAbstract::quasiStatic_x, 2, 4)
+                                       quasiStatic_x, 2, 4)
 
 }  // namespace python
 }  // namespace crocoddyl
@@ -16,7 +16,13 @@
 namespace crocoddyl {
 namespace python {
 
-void exposeActionLQR() {
+template <typename Scalar>
+void exposeActionLQRTpl() {
+  typedef ActionModelAbstractTpl<Scalar> ActionModelAbstract;
+  typedef ActionDataAbstractTpl<Scalar> ActionDataAbstract;
+  typedef ActionModelLQRTpl<Scalar> ActionModelLQR;
+  typedef ActionDataLQRTpl<Scalar> ActionDataLQR;
+  typedef typename MathBaseTpl<Scalar>::VectorXs VectorXs;
   boost::python::register_ptr_to_python<boost::shared_ptr<ActionModelLQR> >();
 
   bp::class_<ActionModelLQR, bp::bases<ActionModelAbstract> >(
@@ -33,10 +39,10 @@ void exposeActionLQR() {
           ":param nu: dimension of the control vector\n"
           ":param driftFree: enable/disable the bias term of the linear "
           "dynamics (default True)"))
-      .def<void (ActionModelLQR::*)(
+      .template def<void (ActionModelLQR::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
+          const Eigen::Ref<const VectorXs>&,
+          const Eigen::Ref<const VectorXs>&)>(
           "calc", &ActionModelLQR::calc, bp::args("self", "data", "x", "u"),
           "Compute the next state and cost value.\n\n"
           "It describes the time-discrete evolution of the LQR system. "
@@ -46,14 +52,14 @@ void exposeActionLQR() {
           ":param data: action data\n"
           ":param x: state point (dim. state.nx)\n"
           ":param u: control input (dim. nu)")
-      .def<void (ActionModelLQR::*)(
+      .template def<void (ActionModelLQR::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
+          const Eigen::Ref<const VectorXs>&)>(
           "calc", &ActionModelAbstract::calc, bp::args("self", "data", "x"))
-      .def<void (ActionModelLQR::*)(
+      .template def<void (ActionModelLQR::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
+          const Eigen::Ref<const VectorXs>&,
+          const Eigen::Ref<const VectorXs>&)>(
           "calcDiff", &ActionModelLQR::calcDiff,
           bp::args("self", "data", "x", "u"),
           "Compute the derivatives of the LQR dynamics and cost functions.\n\n"
@@ -64,11 +70,11 @@ void exposeActionLQR() {
           ":param data: action data\n"
           ":param x: state point (dim. state.nx)\n"
           ":param u: control input (dim. nu)")
-      .def<void (ActionModelLQR::*)(
+      .template def<void (ActionModelLQR::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
-          "calcDiff", &ActionModelAbstract::calcDiff,
-          bp::args("self", "data", "x"))
+          const Eigen::Ref<const VectorXs>&)>("calcDiff",
+                                              &ActionModelAbstract::calcDiff,
+                                              bp::args("self", "data", "x"))
       .def("createData", &ActionModelLQR::createData, bp::args("self"),
            "Create the LQR action data.")
       .add_property("Fx",
@@ -115,5 +121,9 @@ void exposeActionLQR() {
       .def(CopyableVisitor<ActionDataLQR>());
 }
 
+void exposeActionLQR() { exposeActionLQRTpl<double>(); }
+
+template void exposeActionLQRTpl<float>();
+
 }  // namespace python
 }  // namespace crocoddyl
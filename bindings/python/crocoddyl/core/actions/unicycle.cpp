@@ -16,7 +16,13 @@
 namespace crocoddyl {
 namespace python {
 
-void exposeActionUnicycle() {
+template <typename Scalar>
+void exposeActionUnicycleTpl() {
+  typedef ActionModelAbstractTpl<Scalar> ActionModelAbstract;
+  typedef ActionDataAbstractTpl<Scalar> ActionDataAbstract;
+  typedef ActionModelUnicycleTpl<Scalar> ActionModelUnicycle;
+  typedef ActionDataUnicycleTpl<Scalar> ActionDataUnicycle;
+  typedef typename MathBaseTpl<Scalar>::VectorXs VectorXs;
   bp::register_ptr_to_python<boost::shared_ptr<ActionModelUnicycle> >();
 
   bp::class_<ActionModelUnicycle, bp::bases<ActionModelAbstract> >(
@@ -30,10 +36,10 @@ void exposeActionUnicycle() {
       "other hand, we define the quadratic cost functions for the state and\n"
       "control.",
       bp::init<>(bp::args("self"), "Initialize the unicycle action model."))
-      .def<void (ActionModelUnicycle::*)(
+      .template def<void (ActionModelUnicycle::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
+          const Eigen::Ref<const VectorXs>&,
+          const Eigen::Ref<const VectorXs>&)>(
           "calc", &ActionModelUnicycle::calc,
           bp::args("self", "data", "x", "u"),
           "Compute the next state and cost value.\n\n"
@@ -44,14 +50,14 @@ void exposeActionUnicycle() {
           ":param data: action data\n"
           ":param x: state point (dim. state.nx)\n"
           ":param u: control input (dim. nu)")
-      .def<void (ActionModelUnicycle::*)(
+      .template def<void (ActionModelUnicycle::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
+          const Eigen::Ref<const VectorXs>&)>(
           "calc", &ActionModelAbstract::calc, bp::args("self", "data", "x"))
-      .def<void (ActionModelUnicycle::*)(
+      .template def<void (ActionModelUnicycle::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
+          const Eigen::Ref<const VectorXs>&,
+          const Eigen::Ref<const VectorXs>&)>(
           "calcDiff", &ActionModelUnicycle::calcDiff,
           bp::args("self", "data", "x", "u"),
           "Compute the derivatives of the unicycle dynamics and cost "
@@ -63,11 +69,11 @@ void exposeActionUnicycle() {
           ":param data: action data\n"
           ":param x: state point (dim. state.nx)\n"
           ":param u: control input (dim. nu)")
-      .def<void (ActionModelUnicycle::*)(
+      .template def<void (ActionModelUnicycle::*)(
           const boost::shared_ptr<ActionDataAbstract>&,
-          const Eigen::Ref<const Eigen::VectorXd>&)>(
-          "calcDiff", &ActionModelAbstract::calcDiff,
-          bp::args("self", "data", "x"))
+          const Eigen::Ref<const VectorXs>&)>("calcDiff",
+                                              &ActionModelAbstract::calcDiff,
+                                              bp::args("self", "data", "x"))
       .def("createData", &ActionModelUnicycle::createData, bp::args("self"),
            "Create the unicycle action data.")
       .add_property("dt", bp::make_function(&ActionModelUnicycle::get_dt),
@@ -94,5 +100,9 @@ void exposeActionUnicycle() {
       .def(CopyableVisitor<ActionDataUnicycle>());
 }
 
+void exposeActionUnicycle() { exposeActionUnicycleTpl<double>(); }
+
+template void exposeActionUnicycleTpl<float>();
+
 }  // namespace python
 }  // namespace crocoddyl
@@ -16,6 +16,11 @@ namespace crocoddyl {
 namespace python {
 
 void exposeActivationAbstract() {
+  bp::enum_<ActivationHessianType>("ActivationHessianType")
+      .value("DiagonalHessian", DiagonalHessian)
+      .value("ScalarHessian", ScalarHessian)
+      .export_values();
+
   bp::register_ptr_to_python<boost::shared_ptr<ActivationModelAbstract> >();
 
   bp::class_<ActivationModelAbstract_wrap, boost::noncopyable>(
@@ -26,9 +31,12 @@ void exposeActivationAbstract() {
       "value and its derivatives from it. Activation value and its derivatives "
       "are computed by\n"
       "calc() and calcDiff(), respectively.",
-      bp::init<int>(bp::args("self", "nr"),
-                    "Initialize the activation model.\n\n"
-                    ":param nr: dimension of the cost-residual vector"))
+      bp::init<int, bp::optional<ActivationHessianType> >(
+          bp::args("self", "nr", "hessian_type"),
+          "Initialize the activation model.\n\n"
+          ":param nr: dimension of the cost-residual vector\n"
+          ":param hessian_type: structure of the activation Hessian (default "
+          "DiagonalHessian)"))
       .def("calc", pure_virtual(&ActivationModelAbstract_wrap::calc),
            bp::args("self", "data", "r"),
            "Compute the activation value.\n\n"
@@ -47,6 +55,10 @@ void exposeActivationAbstract() {
       .add_property("nr",
                     bp::make_function(&ActivationModelAbstract_wrap::get_nr),
                     "dimension of cost-residual vector")
+      .add_property(
+          "hessian_type",
+          bp::make_function(&ActivationModelAbstract_wrap::get_hessian_type),
+          "structure of the activation Hessian")
       .def(PrintableVisitor<ActivationModelAbstract>());
 
   bp::register_ptr_to_python<boost::shared_ptr<ActivationDataAbstract> >();
@@ -71,6 +83,11 @@ void exposeActivationAbstract() {
       .add_property("Arr", &ActivationDataAbstract::getHessianMatrix,
                     &ActivationDataAbstract::setHessianMatrix,
                     "Hessian of the residual")
+      .add_property(
+          "hessian_type",
+          bp::make_getter(&ActivationDataAbstract::hessian_type,
+                          bp::return_value_policy<bp::return_by_value>()),
+          "structure of the Hessian")
       .def(CopyableVisitor<ActivationDataAbstract>());
 }
 
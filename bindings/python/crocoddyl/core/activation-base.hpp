@@ -12,6 +12,7 @@
 #include "crocoddyl/core/activation-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -20,11 +21,15 @@ class ActivationModelAbstract_wrap
     : public ActivationModelAbstract,
       public bp::wrapper<ActivationModelAbstract> {
  public:
-  explicit ActivationModelAbstract_wrap(const std::size_t nr)
-      : ActivationModelAbstract(nr), bp::wrapper<ActivationModelAbstract>() {}
+  explicit ActivationModelAbstract_wrap(
+      const std::size_t nr,
+      const ActivationHessianType hessian_type = DiagonalHessian)
+      : ActivationModelAbstract(nr, hessian_type),
+        bp::wrapper<ActivationModelAbstract>() {}
 
   void calc(const boost::shared_ptr<ActivationDataAbstract>& data,
             const Eigen::Ref<const Eigen::VectorXd>& r) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(r.size()) != nr_) {
       throw_pretty("Invalid argument: "
                    << "r has wrong dimension (it should be " +
@@ -36,6 +41,7 @@ class ActivationModelAbstract_wrap
 
   void calcDiff(const boost::shared_ptr<ActivationDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& r) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(r.size()) != nr_) {
       throw_pretty("Invalid argument: "
                    << "r has wrong dimension (it should be " +
@@ -46,6 +52,7 @@ class ActivationModelAbstract_wrap
   }
 
   boost::shared_ptr<ActivationDataAbstract> createData() {
+    ScopedGILAcquire gil;
     enableMultithreading() = false;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<ActivationDataAbstract> >(
@@ -13,6 +13,7 @@
 #include "crocoddyl/core/actuation-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -28,6 +29,7 @@ class ActuationModelAbstract_wrap : public ActuationModelAbstract,
   void calc(const boost::shared_ptr<ActuationDataAbstract>& data,
             const Eigen::Ref<const Eigen::VectorXd>& x,
             const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -45,6 +47,7 @@ class ActuationModelAbstract_wrap : public ActuationModelAbstract,
   void calcDiff(const boost::shared_ptr<ActuationDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& x,
                 const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -62,6 +65,7 @@ class ActuationModelAbstract_wrap : public ActuationModelAbstract,
   void commands(const boost::shared_ptr<ActuationDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& x,
                 const Eigen::Ref<const Eigen::VectorXd>& tau) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -79,6 +83,7 @@ class ActuationModelAbstract_wrap : public ActuationModelAbstract,
   void torqueTransform(const boost::shared_ptr<ActuationDataAbstract>& data,
                        const Eigen::Ref<const VectorXs>& x,
                        const Eigen::Ref<const VectorXs>& u) {
+    ScopedGILAcquire gil;
     if (boost::python::override torqueTransform =
             this->get_override("torqueTransform")) {
       if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
@@ -105,6 +110,7 @@ class ActuationModelAbstract_wrap : public ActuationModelAbstract,
   }
 
   boost::shared_ptr<ActuationDataAbstract> createData() {
+    ScopedGILAcquire gil;
     enableMultithreading() = false;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<ActuationDataAbstract> >(
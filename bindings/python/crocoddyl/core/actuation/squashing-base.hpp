@@ -12,6 +12,7 @@
 #include "crocoddyl/core/actuation/squashing-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -24,6 +25,7 @@ class SquashingModelAbstract_wrap : public SquashingModelAbstract,
 
   void calc(const boost::shared_ptr<SquashingDataAbstract>& data,
             const Eigen::Ref<const Eigen::VectorXd>& s) {
+    ScopedGILAcquire gil;
     assert_pretty(static_cast<std::size_t>(s.size()) == ns_,
                   "s has wrong dimension");
     return bp::call<void>(this->get_override("calc").ptr(), data,
@@ -32,6 +34,7 @@ class SquashingModelAbstract_wrap : public SquashingModelAbstract,
 
   void calcDiff(const boost::shared_ptr<SquashingDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& s) {
+    ScopedGILAcquire gil;
     assert_pretty(static_cast<std::size_t>(s.size()) == ns_,
                   "s has wrong dimension");
     return bp::call<void>(this->get_override("calcDiff").ptr(), data,
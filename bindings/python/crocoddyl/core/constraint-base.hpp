@@ -12,6 +12,7 @@
 #include "crocoddyl/core/constraint-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -40,6 +41,7 @@ class ConstraintModelAbstract_wrap
   void calc(const boost::shared_ptr<ConstraintDataAbstract>& data,
             const Eigen::Ref<const Eigen::VectorXd>& x,
             const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -57,6 +59,7 @@ class ConstraintModelAbstract_wrap
   void calcDiff(const boost::shared_ptr<ConstraintDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& x,
                 const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -73,6 +76,7 @@ class ConstraintModelAbstract_wrap
 
   boost::shared_ptr<ConstraintDataAbstract> createData(
       DataCollectorAbstract* const data) {
+    ScopedGILAcquire gil;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<ConstraintDataAbstract> >(
           createData.ptr(), boost::ref(data));
@@ -59,7 +59,8 @@ void exposeConstraintManager() {
           bp::make_getter(&ConstraintItem::constraint,
                           bp::return_value_policy<bp::return_by_value>()),
           "constraint model")
-      .def_readwrite("active", &ConstraintItem::active, "constraint status")
+      .def_readonly("active", &ConstraintItem::active,
+                    "constraint status (change it with changeConstraintStatus)")
       .def(CopyableVisitor<ConstraintItem>())
       .def(PrintableVisitor<ConstraintItem>());
 
@@ -13,6 +13,7 @@
 #include "crocoddyl/core/control-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -27,6 +28,7 @@ class ControlParametrizationModelAbstract_wrap
 
   void calc(const boost::shared_ptr<ControlParametrizationDataAbstract>& data,
             double t, const Eigen::Ref<const Eigen::VectorXd>& u) const {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(u.size()) != nu_) {
       throw_pretty("Invalid argument: "
                    << "u has wrong dimension (it should be " +
@@ -39,6 +41,7 @@ class ControlParametrizationModelAbstract_wrap
   void calcDiff(
       const boost::shared_ptr<ControlParametrizationDataAbstract>& data,
       double t, const Eigen::Ref<const Eigen::VectorXd>& u) const {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(u.size()) != nu_) {
       throw_pretty("Invalid argument: "
                    << "u has wrong dimension (it should be " +
@@ -50,6 +53,7 @@ class ControlParametrizationModelAbstract_wrap
 
   void params(const boost::shared_ptr<ControlParametrizationDataAbstract>& data,
               double t, const Eigen::Ref<const Eigen::VectorXd>& w) const {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(w.size()) != nw_) {
       throw_pretty("Invalid argument: "
                    << "w has wrong dimension (it should be " +
@@ -60,6 +64,7 @@ class ControlParametrizationModelAbstract_wrap
   }
 
   boost::shared_ptr<ControlParametrizationDataAbstract> createData() {
+    ScopedGILAcquire gil;
     enableMultithreading() = false;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<ControlParametrizationDataAbstract> >(
@@ -76,6 +81,7 @@ class ControlParametrizationModelAbstract_wrap
                      const Eigen::Ref<const Eigen::VectorXd>& w_ub,
                      Eigen::Ref<Eigen::VectorXd> u_lb,
                      Eigen::Ref<Eigen::VectorXd> u_ub) const {
+    ScopedGILAcquire gil;
     bp::list res = convertBounds_wrap(w_lb, w_ub);
     u_lb.derived() = bp::extract<Eigen::VectorXd>(res[0])();
     u_ub.derived() = bp::extract<Eigen::VectorXd>(res[1])();
@@ -84,6 +90,7 @@ class ControlParametrizationModelAbstract_wrap
   bp::list convertBounds_wrap(
       const Eigen::Ref<const Eigen::VectorXd>& w_lb,
       const Eigen::Ref<const Eigen::VectorXd>& w_ub) const {
+    ScopedGILAcquire gil;
     bp::list p_bounds =
         bp::call<bp::list>(this->get_override("convertBounds").ptr(),
                            (Eigen::VectorXd)w_lb, (Eigen::VectorXd)w_ub);
@@ -118,6 +125,7 @@ class ControlParametrizationModelAbstract_wrap
   Eigen::MatrixXd multiplyByJacobian_wrap(
       const boost::shared_ptr<ControlParametrizationDataAbstract>& data,
       const Eigen::Ref<const Eigen::MatrixXd>& A) const {
+    ScopedGILAcquire gil;
     return bp::call<Eigen::MatrixXd>(
         this->get_override("multiplyByJacobian").ptr(), data,
         (Eigen::MatrixXd)A);
@@ -151,6 +159,7 @@ class ControlParametrizationModelAbstract_wrap
   Eigen::MatrixXd multiplyJacobianTransposeBy_wrap(
       const boost::shared_ptr<ControlParametrizationDataAbstract>& data,
       const Eigen::Ref<const Eigen::MatrixXd>& A) const {
+    ScopedGILAcquire gil;
     return bp::call<Eigen::MatrixXd>(
         this->get_override("multiplyJacobianTransposeBy").ptr(), data,
         (Eigen::MatrixXd)A);
@@ -68,12 +68,15 @@ void exposeCore() {
   exposeSolverBoxDDP();
   exposeSolverBoxFDDP();
   exposeSolverIntro();
+  exposeSolverBatch();
+  exposeSolverMPPI();
 #ifdef CROCODDYL_WITH_IPOPT
   exposeSolverIpopt();
 #endif
   exposeCallbacks();
   exposeException();
   exposeStopWatch();
+  exposeFloat32();
 }
 
 }  // namespace python
@@ -70,12 +70,29 @@ void exposeSolverBoxQP();
 void exposeSolverBoxDDP();
 void exposeSolverBoxFDDP();
 void exposeSolverIntro();
+void exposeSolverBatch();
+void exposeSolverMPPI();
 #ifdef CROCODDYL_WITH_IPOPT
 void exposeSolverIpopt();
 #endif
 void exposeCallbacks();
 void exposeException();
 void exposeStopWatch();
+void exposeFloat32();
+
+// Classes exposed for a given scalar type (e.g., in the float32 submodule)
+template <typename Scalar>
+void exposeStateAbstractTpl();
+template <typename Scalar>
+void exposeStateEuclideanTpl();
+template <typename Scalar>
+void exposeActionAbstractTpl();
+template <typename Scalar>
+void exposeActionUnicycleTpl();
+template <typename Scalar>
+void exposeActionLQRTpl();
+template <typename Scalar>
+void exposeShootingProblemTpl();
 
 void exposeCore();
 
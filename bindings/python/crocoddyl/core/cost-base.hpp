@@ -12,6 +12,7 @@
 #include "crocoddyl/core/cost-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -48,6 +49,7 @@ class CostModelAbstract_wrap : public CostModelAbstract,
   void calc(const boost::shared_ptr<CostDataAbstract>& data,
             const Eigen::Ref<const Eigen::VectorXd>& x,
             const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -65,6 +67,7 @@ class CostModelAbstract_wrap : public CostModelAbstract,
   void calcDiff(const boost::shared_ptr<CostDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& x,
                 const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -81,6 +84,7 @@ class CostModelAbstract_wrap : public CostModelAbstract,
 
   boost::shared_ptr<CostDataAbstract> createData(
       DataCollectorAbstract* const data) {
+    ScopedGILAcquire gil;
     enableMultithreading() = false;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<CostDataAbstract> >(createData.ptr(),
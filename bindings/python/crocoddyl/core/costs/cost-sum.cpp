@@ -182,6 +182,12 @@ void exposeCostSum() {
           bp::make_function(&CostModelSum::get_inactive_set,
                             bp::return_value_policy<bp::return_by_value>()),
           "name of the inactive set of cost items")
+      .add_property(
+          "fused", bp::make_function(&CostModelSum::get_fused),
+          bp::make_function(&CostModelSum::set_fused),
+          "true for computing the Gauss-Newton Hessian of the "
+          "residual-based costs from their stacked Jacobians (the data has to "
+          "be created after enabling it)")
       .def("getCostStatus", &CostModelSum::getCostStatus,
            bp::args("self", "name"),
            "Return the cost status of a given cost name.\n\n"
@@ -247,6 +253,20 @@ void exposeCostSum() {
           bp::make_function(&CostDataSum::get_Luu,
                             bp::return_value_policy<bp::return_by_value>()),
           bp::make_function(&CostDataSum::set_Luu), "Hessian of the cost")
+      .add_property("Rstack",
+                    bp::make_getter(&CostDataSum::Rstack,
+                                    bp::return_internal_reference<>()),
+                    "stacked residual Jacobians (fused mode)")
+      .add_property(
+          "Arr_Rstack",
+          bp::make_getter(&CostDataSum::Arr_Rstack,
+                          bp::return_internal_reference<>()),
+          "stacked residual Jacobians weighted by the activation Hessians "
+          "(fused mode)")
+      .add_property("Lstack",
+                    bp::make_getter(&CostDataSum::Lstack,
+                                    bp::return_internal_reference<>()),
+                    "Hessian of the stacked residuals (fused mode)")
       .def(CopyableVisitor<CostDataSum>());
 }
 
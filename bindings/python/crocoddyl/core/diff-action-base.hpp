@@ -12,6 +12,7 @@
 #include "crocoddyl/core/diff-action-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -33,6 +34,7 @@ class DifferentialActionModelAbstract_wrap
   void calc(const boost::shared_ptr<DifferentialActionDataAbstract>& data,
             const Eigen::Ref<const Eigen::VectorXd>& x,
             const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -50,6 +52,7 @@ class DifferentialActionModelAbstract_wrap
   void calcDiff(const boost::shared_ptr<DifferentialActionDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& x,
                 const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -65,6 +68,7 @@ class DifferentialActionModelAbstract_wrap
   }
 
   boost::shared_ptr<DifferentialActionDataAbstract> createData() {
+    ScopedGILAcquire gil;
     enableMultithreading() = false;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<DifferentialActionDataAbstract> >(
@@ -81,6 +85,7 @@ class DifferentialActionModelAbstract_wrap
       const boost::shared_ptr<DifferentialActionDataAbstract>& data,
       Eigen::Ref<Eigen::VectorXd> u, const Eigen::Ref<const Eigen::VectorXd>& x,
       const std::size_t maxiter, const double tol) {
+    ScopedGILAcquire gil;
     if (boost::python::override quasiStatic =
             this->get_override("quasiStatic")) {
       u = bp::call<Eigen::VectorXd>(quasiStatic.ptr(), data, (Eigen::VectorXd)x,
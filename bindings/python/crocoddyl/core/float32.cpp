@@ -0,0 +1,58 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, University of Edinburgh
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#include "crocoddyl/core/mathbase.hpp"
+#include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/vector-converter.hpp"
+
+namespace crocoddyl {
+namespace python {
+
+// Only the state, the action base, the unicycle and LQR action models and the
+// shooting problem are instantiated for float. The rest of the stack keeps its
+// double-only bindings.
+void exposeFloat32() {
+  // Create the crocoddyl.float32 submodule and expose the classes inside it
+  std::string name = bp::extract<std::string>(bp::scope().attr("__name__"));
+  name += ".float32";
+  bp::object module(
+      bp::handle<>(bp::borrowed(PyImport_AddModule(name.c_str()))));
+  bp::scope().attr("float32") = module;
+  bp::scope float32_scope = module;
+  float32_scope.attr("__doc__") =
+      "Single-precision instantiation of a reduced subset of crocoddyl.\n\n"
+      "It only contains StateAbstract, StateVector, ActionModelAbstract, "
+      "ActionDataAbstract,\n"
+      "ActionModelUnicycle, ActionModelLQR and ShootingProblem. These classes "
+      "mirror the ones\n"
+      "of the crocoddyl module, but they operate on float32 arrays. Custom "
+      "action models can\n"
+      "be written in Python by deriving from ActionModelAbstract.\n\n"
+      "The differential action models, integrators, control "
+      "parametrizations, costs,\n"
+      "residuals, activations, constraints, solvers and the multibody stack "
+      "are only\n"
+      "available in double precision.\n\n"
+      "They are meant for throughput-bound workloads (e.g., sampling rollouts "
+      "or data generation),\n"
+      "where single precision is enough.";
+
+  // Register custom converters between std::vector and Python list
+  typedef MathBaseTpl<float>::VectorXs VectorXf;
+  StdVectorPythonVisitor<std::vector<VectorXf>, true>::expose("StdVec_VectorX");
+
+  exposeStateAbstractTpl<float>();
+  exposeStateEuclideanTpl<float>();
+  exposeActionAbstractTpl<float>();
+  exposeActionUnicycleTpl<float>();
+  exposeActionLQRTpl<float>();
+  exposeShootingProblemTpl<float>();
+}
+
+}  // namespace python
+}  // namespace crocoddyl
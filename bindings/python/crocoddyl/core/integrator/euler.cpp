@@ -84,6 +84,12 @@ void exposeIntegratedActionEuler() {
           bp::args("self", "data", "x"))
       .def("createData", &IntegratedActionModelEuler::createData,
            bp::args("self"), "Create the Euler integrator data.")
+      .add_property(
+          "euler_structure",
+          bp::make_function(&IntegratedActionModelEuler::get_euler_structure),
+          bp::make_function(&IntegratedActionModelEuler::set_euler_structure),
+          "true if the Euler block structure of the Jacobians is declared, "
+          "which is exploited by the DDP solvers (it requires nq == nv)")
       .def(CopyableVisitor<IntegratedActionModelEuler>());
 
   bp::register_ptr_to_python<boost::shared_ptr<IntegratedActionDataEuler> >();
@@ -14,17 +14,51 @@
 #include "python/crocoddyl/core/core.hpp"
 #include "python/crocoddyl/utils/copyable.hpp"
 #include "python/crocoddyl/utils/deprecate.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 #include "python/crocoddyl/utils/printable.hpp"
 
 namespace crocoddyl {
 namespace python {
 
-void exposeShootingProblem() {
+// The GIL is released while the action models are evaluated. Python-derived
+// models reacquire it when they are called.
+template <typename Scalar>
+Scalar ShootingProblem_calc(
+    ShootingProblemTpl<Scalar>& self,
+    const std::vector<typename MathBaseTpl<Scalar>::VectorXs>& xs,
+    const std::vector<typename MathBaseTpl<Scalar>::VectorXs>& us) {
+  ScopedGILRelease gil;
+  return self.calc(xs, us);
+}
+
+template <typename Scalar>
+Scalar ShootingProblem_calcDiff(
+    ShootingProblemTpl<Scalar>& self,
+    const std::vector<typename MathBaseTpl<Scalar>::VectorXs>& xs,
+    const std::vector<typename MathBaseTpl<Scalar>::VectorXs>& us) {
+  ScopedGILRelease gil;
+  return self.calcDiff(xs, us);
+}
+
+template <typename Scalar>
+std::vector<typename MathBaseTpl<Scalar>::VectorXs> ShootingProblem_rollout(
+    ShootingProblemTpl<Scalar>& self,
+    const std::vector<typename MathBaseTpl<Scalar>::VectorXs>& us) {
+  ScopedGILRelease gil;
+  return self.rollout_us(us);
+}
+
+template <typename Scalar>
+void exposeShootingProblemTpl() {
 // TODO: Remove once the deprecated update call has been removed in a future
 // release
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wdeprecated-declarations"
 
+  typedef ShootingProblemTpl<Scalar> ShootingProblem;
+  typedef ActionModelAbstractTpl<Scalar> ActionModelAbstract;
+  typedef ActionDataAbstractTpl<Scalar> ActionDataAbstract;
+  typedef typename MathBaseTpl<Scalar>::VectorXs VectorXs;
   bp::register_ptr_to_python<boost::shared_ptr<ShootingProblem> >();
 
   bp::class_<ShootingProblem>(
@@ -39,15 +73,14 @@ void exposeShootingProblem() {
       "updates the derivatives of all action models. The last rollouts the "
       "stacks of actions\n"
       "models.",
-      bp::init<Eigen::VectorXd,
-               std::vector<boost::shared_ptr<ActionModelAbstract> >,
+      bp::init<VectorXs, std::vector<boost::shared_ptr<ActionModelAbstract> >,
                boost::shared_ptr<ActionModelAbstract> >(
           bp::args("self", "x0", "runningModels", "terminalModel"),
           "Initialize the shooting problem and allocate its data.\n\n"
           ":param x0: initial state\n"
           ":param runningModels: running action models (size T)\n"
           ":param terminalModel: terminal action model"))
-      .def(bp::init<Eigen::VectorXd,
+      .def(bp::init<VectorXs,
                     std::vector<boost::shared_ptr<ActionModelAbstract> >,
                     boost::shared_ptr<ActionModelAbstract>,
                     std::vector<boost::shared_ptr<ActionDataAbstract> >,
@@ -60,7 +93,7 @@ void exposeShootingProblem() {
           ":param terminalModel: terminal action model\n"
           ":param runningDatas: running action datas  (size T)\n"
           ":param terminalData: terminal action data"))
-      .def("calc", &ShootingProblem::calc, bp::args("self", "xs", "us"),
+      .def("calc", &ShootingProblem_calc<Scalar>, bp::args("self", "xs", "us"),
            "Compute the cost and the next states.\n\n"
            "For each node k, and along the state xs and control us "
            "trajectories, it computes the next state x_{k+1}\n"
@@ -68,7 +101,8 @@ void exposeShootingProblem() {
            ":param xs: time-discrete state trajectory (size T+1)\n"
            ":param us: time-discrete control sequence (size T)\n"
            ":returns the total cost value")
-      .def("calcDiff", &ShootingProblem::calcDiff, bp::args("self", "xs", "us"),
+      .def("calcDiff", &ShootingProblem_calcDiff<Scalar>,
+           bp::args("self", "xs", "us"),
            "Compute the derivatives of the cost and dynamics.\n\n"
            "For each node k, and along the state x_s and control u_s "
            "trajectories, it computes the derivatives of\n"
@@ -76,7 +110,7 @@ void exposeShootingProblem() {
            ":param xs: time-discrete state trajectory (size T+1)\n"
            ":param us: time-discrete control sequence (size T)\n"
            ":returns the total cost value")
-      .def("rollout", &ShootingProblem::rollout_us, bp::args("self", "us"),
+      .def("rollout", &ShootingProblem_rollout<Scalar>, bp::args("self", "us"),
            "Integrate the dynamics given a control sequence.\n\n"
            "Rollout the dynamics give a sequence of control commands\n"
            ":param us: time-discrete control sequence (size T)")
@@ -86,8 +120,9 @@ void exposeShootingProblem() {
            "Generally speaking, it uses Newton-Raphson method for computing "
            "the quasi static commands.\n"
            ":param xs: time-discrete state trajectory (size T)")
-      .def<void (ShootingProblem::*)(boost::shared_ptr<ActionModelAbstract>,
-                                     boost::shared_ptr<ActionDataAbstract>)>(
+      .template def<void (ShootingProblem::*)(
+          boost::shared_ptr<ActionModelAbstract>,
+          boost::shared_ptr<ActionDataAbstract>)>(
           "circularAppend", &ShootingProblem::circularAppend,
           bp::args("self", "model", "data"),
           "Circular append the model and data onto the end running node.\n\n"
@@ -95,7 +130,8 @@ void exposeShootingProblem() {
           "removed as in a circular buffer.\n"
           ":param model: new model\n"
           ":param data: new data")
-      .def<void (ShootingProblem::*)(boost::shared_ptr<ActionModelAbstract>)>(
+      .template def<void (ShootingProblem::*)(
+          boost::shared_ptr<ActionModelAbstract>)>(
           "circularAppend", &ShootingProblem::circularAppend,
           bp::args("self", "model"),
           "Circular append the model and data onto the end running node.\n\n"
@@ -146,6 +182,33 @@ void exposeShootingProblem() {
                     "number of threads launch by the multi-threading support "
                     "(if you set nthreads <= 1, then "
                     "nthreads=CROCODDYL_WITH_NTHREADS)")
+      .add_property("schedule",
+                    bp::make_function(&ShootingProblem::get_schedule),
+                    bp::make_function(&ShootingProblem::set_schedule),
+                    "policy used for distributing the nodes among the threads "
+                    "(StaticSchedule by default)")
+      .add_property("chunksize",
+                    bp::make_function(&ShootingProblem::get_chunksize),
+                    bp::make_function(&ShootingProblem::set_chunksize),
+                    "number of nodes per chunk used by the scheduling policy "
+                    "(if you set chunksize = 0, then it uses the default value "
+                    "of the policy)")
+      .add_property(
+          "calc_timings",
+          bp::make_function(
+              &ShootingProblem::get_calc_timings,
+              bp::return_value_policy<bp::copy_const_reference>()),
+          "smoothed computation time (in milliseconds) of calc for each node, "
+          "where the last\n"
+          "element is the terminal node (only measured under BalancedSchedule)")
+      .add_property(
+          "calcDiff_timings",
+          bp::make_function(
+              &ShootingProblem::get_calcDiff_timings,
+              bp::return_value_policy<bp::copy_const_reference>()),
+          "smoothed computation time (in milliseconds) of calcDiff for each "
+          "node, where the last\n"
+          "element is the terminal node (only measured under BalancedSchedule)")
       .add_property("nx", bp::make_function(&ShootingProblem::get_nx),
                     "dimension of state tuple")
       .add_property("ndx", bp::make_function(&ShootingProblem::get_ndx),
@@ -166,5 +229,18 @@ void exposeShootingProblem() {
 #pragma GCC diagnostic pop
 }
 
+void exposeShootingProblem() {
+  bp::enum_<ParallelSchedule>("ParallelSchedule")
+      .value("StaticSchedule", StaticSchedule)
+      .value("DynamicSchedule", DynamicSchedule)
+      .value("GuidedSchedule", GuidedSchedule)
+      .value("BalancedSchedule", BalancedSchedule)
+      .export_values();
+
+  exposeShootingProblemTpl<double>();
+}
+
+template void exposeShootingProblemTpl<float>();
+
 }  // namespace python
 }  // namespace crocoddyl
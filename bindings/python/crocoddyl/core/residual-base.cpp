@@ -170,16 +170,22 @@ void exposeResidualAbstract() {
                                     bp::return_internal_reference<>()),
                     bp::make_setter(&ResidualDataAbstract::Ru),
                     "Jacobian of the residual")
-      .add_property("Arr_Rx",
-                    bp::make_getter(&ResidualDataAbstract::Arr_Rx,
-                                    bp::return_internal_reference<>()),
-                    "Intermediate product of Arr (2nd deriv of Activation) "
-                    "with Rx (deriv of residue)")
-      .add_property("Arr_Ru",
-                    bp::make_getter(&ResidualDataAbstract::Arr_Ru,
-                                    bp::return_internal_reference<>()),
-                    "Intermediate product of Arr (2nd deriv of Activation) "
-                    "with Ru (deriv of residue)")
+      .add_property(
+          "Arr_Rx",
+          bp::make_getter(&ResidualDataAbstract::Arr_Rx,
+                          bp::return_internal_reference<>()),
+          "Intermediate product of Arr (2nd deriv of Activation) "
+          "with Rx (deriv of residue). It is only updated for diagonal "
+          "activation Hessians, and it is empty in the residual data "
+          "of a cost with a scalar activation Hessian")
+      .add_property(
+          "Arr_Ru",
+          bp::make_getter(&ResidualDataAbstract::Arr_Ru,
+                          bp::return_internal_reference<>()),
+          "Intermediate product of Arr (2nd deriv of Activation) "
+          "with Ru (deriv of residue). It is only updated for diagonal "
+          "activation Hessians, and it is empty in the residual data "
+          "of a cost with a scalar activation Hessian")
       .def(CopyableVisitor<ResidualDataAbstract>());
 }
 
@@ -12,6 +12,7 @@
 #include "crocoddyl/core/residual-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -39,6 +40,7 @@ class ResidualModelAbstract_wrap : public ResidualModelAbstract,
   void calc(const boost::shared_ptr<ResidualDataAbstract>& data,
             const Eigen::Ref<const Eigen::VectorXd>& x,
             const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -56,6 +58,7 @@ class ResidualModelAbstract_wrap : public ResidualModelAbstract,
   void calcDiff(const boost::shared_ptr<ResidualDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& x,
                 const Eigen::Ref<const Eigen::VectorXd>& u) {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != state_->get_nx()) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -72,6 +75,7 @@ class ResidualModelAbstract_wrap : public ResidualModelAbstract,
 
   boost::shared_ptr<ResidualDataAbstract> createData(
       DataCollectorAbstract* const data) {
+    ScopedGILAcquire gil;
     enableMultithreading() = false;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<ResidualDataAbstract> >(
@@ -89,6 +93,7 @@ class ResidualModelAbstract_wrap : public ResidualModelAbstract,
                     const boost::shared_ptr<ResidualDataAbstract>& rdata,
                     const boost::shared_ptr<ActivationDataAbstract>& adata,
                     const bool update_u = true) {
+    ScopedGILAcquire gil;
     if (boost::python::override calcCostDiff =
             this->get_override("calcCostDiff")) {
       return bp::call<void>(calcCostDiff.ptr(), boost::ref(cdata),
@@ -27,6 +27,15 @@ void exposeSolverAbstract() {
       .value("L1", L1)
       .export_values();
 
+  bp::enum_<SolverStatus>("SolverStatus")
+      .value("Unsolved", Unsolved)
+      .value("Converged", Converged)
+      .value("MaxIterReached", MaxIterReached)
+      .value("MaxTimeReached", MaxTimeReached)
+      .value("MaxRegReached", MaxRegReached)
+      .value("Failed", Failed)
+      .export_values();
+
   bp::class_<SolverAbstract_wrap, boost::noncopyable>(
       "SolverAbstract",
       "Abstract class for optimal control solvers.\n\n"
@@ -129,6 +138,27 @@ void exposeSolverAbstract() {
                ":param isFeasible: true if the xs are obtained from "
                "integrating the\n"
                "us (rollout)."))
+      .def("checkTimeBudget", &SolverAbstract_wrap::checkTimeBudget,
+           checkTimeBudget_overloads(
+               bp::args("self", "duration"),
+               "Check if there is enough time budget for running a phase.\n\n"
+               "The time budget is counted since the beginning of solve(). "
+               "When it is\n"
+               "exhausted, the solver status is set to MaxTimeReached.\n"
+               ":param duration: expected duration of the next phase in "
+               "milliseconds (default 0).\n"
+               ":return True if the phase can be run within the time budget."))
+      .def("shift", &SolverAbstract::shift, &SolverAbstract_wrap::default_shift,
+           bp::args("self"),
+           "Shift the solver trajectories one node backwards in time.\n\n"
+           "It rotates in place the state and control trajectories (and the "
+           "solver\n"
+           "buffers such as the feedback gains) for warm-starting "
+           "receding-horizon\n"
+           "problems. The last node is extrapolated by keeping the last state "
+           "and control.\n"
+           "It should be called after appending the new node through "
+           "problem.circularAppend.")
       .def("computeDynamicFeasibility",
            &SolverAbstract_wrap::computeDynamicFeasibility, bp::args("self"),
            "Compute the dynamic feasibility for the current guess.\n\n"
@@ -172,6 +202,21 @@ void exposeSolverAbstract() {
       .def_readwrite("xs", &SolverAbstract_wrap::xs_, "state trajectory")
       .def_readwrite("us", &SolverAbstract_wrap::us_, "control sequence")
       .def_readwrite("fs", &SolverAbstract_wrap::fs_, "dynamics gaps")
+      .add_property("stacked_xs",
+                    bp::make_function(&SolverAbstract_wrap::get_stacked_xs,
+                                      bp::return_internal_reference<>()),
+                    "state trajectory as a (T+1, nx) array that shares memory "
+                    "with the solver (refreshed on each access)")
+      .add_property("stacked_us",
+                    bp::make_function(&SolverAbstract_wrap::get_stacked_us,
+                                      bp::return_internal_reference<>()),
+                    "control sequence as a (T, nu) array that shares memory "
+                    "with the solver (refreshed on each access)")
+      .add_property("stacked_fs",
+                    bp::make_function(&SolverAbstract_wrap::get_stacked_fs,
+                                      bp::return_internal_reference<>()),
+                    "dynamics gaps as a (T+1, ndx) array that shares memory "
+                    "with the solver (refreshed on each access)")
       .def_readwrite("isFeasible", &SolverAbstract_wrap::is_feasible_,
                      "feasible (xs,us)")
       .def_readwrite("cost", &SolverAbstract_wrap::cost_,
@@ -256,6 +301,12 @@ void exposeSolverAbstract() {
           "norm used to compute the dynamic and constraints feasibility")
       .def_readwrite("iter", &SolverAbstract_wrap::iter_,
                      "number of iterations runned in solve()")
+      .add_property("max_time",
+                    bp::make_function(&SolverAbstract_wrap::get_max_time),
+                    bp::make_function(&SolverAbstract_wrap::set_max_time),
+                    "time budget of solve() in milliseconds (default inf)")
+      .def_readwrite("status", &SolverAbstract_wrap::status_,
+                     "reason why the solver stopped its last resolution")
       .def(CopyableVisitor<SolverAbstract_wrap>());
 
   bp::class_<CallbackAbstract_wrap, boost::noncopyable>(
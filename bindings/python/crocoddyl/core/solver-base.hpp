@@ -16,6 +16,7 @@
 
 #include "crocoddyl/core/solver-base.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -41,6 +42,7 @@ class SolverAbstract_wrap : public SolverAbstract,
   using SolverAbstract::is_feasible_;
   using SolverAbstract::iter_;
   using SolverAbstract::merit_;
+  using SolverAbstract::status_;
   using SolverAbstract::steplength_;
   using SolverAbstract::stop_;
   using SolverAbstract::us_;
@@ -54,30 +56,46 @@ class SolverAbstract_wrap : public SolverAbstract,
              const std::vector<Eigen::VectorXd>& init_us,
              const std::size_t maxiter, const bool is_feasible,
              const double reg_init) {
+    ScopedGILAcquire gil;
     return bp::call<bool>(this->get_override("solve").ptr(), init_xs, init_us,
                           maxiter, is_feasible, reg_init);
   }
 
   void computeDirection(const bool recalc = true) {
+    ScopedGILAcquire gil;
     return bp::call<void>(this->get_override("computeDirection").ptr(), recalc);
   }
 
   double tryStep(const double step_length = 1) {
+    ScopedGILAcquire gil;
     return bp::call<double>(this->get_override("tryStep").ptr(), step_length);
   }
 
   double stoppingCriteria() {
+    ScopedGILAcquire gil;
     stop_ = bp::call<double>(this->get_override("stoppingCriteria").ptr());
     return stop_;
   }
 
   const Eigen::Vector2d& expectedImprovement() {
+    ScopedGILAcquire gil;
     bp::list exp_impr =
         bp::call<bp::list>(this->get_override("expectedImprovement").ptr());
     d_ << bp::extract<double>(exp_impr[0]), bp::extract<double>(exp_impr[1]);
     return d_;
   }
 
+  void shift() {
+    ScopedGILAcquire gil;
+    if (boost::python::override shift = this->get_override("shift")) {
+      bp::call<void>(shift.ptr());
+      return;
+    }
+    return SolverAbstract::shift();
+  }
+
+  void default_shift() { return this->SolverAbstract::shift(); }
+
   bp::list expectedImprovement_wrap() {
     expectedImprovement();
     bp::list exp_impr;
@@ -95,13 +113,29 @@ class CallbackAbstract_wrap : public CallbackAbstract,
   ~CallbackAbstract_wrap() {}
 
   void operator()(SolverAbstract& solver) {
+    ScopedGILAcquire gil;
     return bp::call<void>(this->get_override("__call__").ptr(),
                           boost::ref(solver));
   }
 };
 
+inline bool SolverAbstract_solve(
+    SolverAbstract& self,
+    const std::vector<Eigen::VectorXd>& init_xs = DEFAULT_VECTOR,
+    const std::vector<Eigen::VectorXd>& init_us = DEFAULT_VECTOR,
+    const std::size_t maxiter = 100, const bool is_feasible = false,
+    const double init_reg = NAN) {
+  // Python-derived models and callbacks reacquire the GIL when they are called
+  ScopedGILRelease gil;
+  return self.solve(init_xs, init_us, maxiter, is_feasible, init_reg);
+}
+
+BOOST_PYTHON_FUNCTION_OVERLOADS(SolverAbstract_solves, SolverAbstract_solve, 1,
+                                6)
 BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(setCandidate_overloads,
                                        SolverAbstract::setCandidate, 0, 3)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(checkTimeBudget_overloads,
+                                       SolverAbstract::checkTimeBudget, 0, 1)
 
 }  // namespace python
 }  // namespace crocoddyl
@@ -0,0 +1,133 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, Heriot-Watt University, University of Edinburgh
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#include "crocoddyl/core/solvers/batch.hpp"
+
+#include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
+#include "python/crocoddyl/utils/vector-converter.hpp"
+
+namespace crocoddyl {
+namespace python {
+
+std::size_t solve_maxiter(SolverBatch& self, const std::size_t maxiter = 100,
+                          const bool is_feasible = false,
+                          const double init_reg = NAN) {
+  ScopedGILRelease gil;
+  return self.solve(maxiter, is_feasible, init_reg);
+}
+
+std::size_t solve_maxiters(SolverBatch& self, const bp::list& maxiters,
+                           const bool is_feasible = false,
+                           const double init_reg = NAN) {
+  std::vector<std::size_t> iters(bp::len(maxiters));
+  for (std::size_t i = 0; i < iters.size(); ++i) {
+    iters[i] = bp::extract<std::size_t>(maxiters[i]);
+  }
+  ScopedGILRelease gil;
+  return self.solve(iters, is_feasible, init_reg);
+}
+
+bp::list get_statuses(const SolverBatch& self) {
+  const std::vector<SolverStatus>& statuses = self.get_statuses();
+  bp::list list;
+  for (std::size_t i = 0; i < statuses.size(); ++i) {
+    list.append(statuses[i]);
+  }
+  return list;
+}
+
+bp::list get_errors(const SolverBatch& self) {
+  const std::vector<std::string>& errors = self.get_errors();
+  bp::list list;
+  for (std::size_t i = 0; i < errors.size(); ++i) {
+    list.append(errors[i]);
+  }
+  return list;
+}
+
+BOOST_PYTHON_FUNCTION_OVERLOADS(solve_maxiter_overloads, solve_maxiter, 1, 4)
+BOOST_PYTHON_FUNCTION_OVERLOADS(solve_maxiters_overloads, solve_maxiters, 2, 4)
+
+void exposeSolverBatch() {
+  // Register custom converters between std::vector and Python list
+  typedef boost::shared_ptr<SolverAbstract> SolverAbstractPtr;
+  StdVectorPythonVisitor<std::vector<SolverAbstractPtr>, true>::expose(
+      "StdVec_Solver");
+
+  bp::register_ptr_to_python<boost::shared_ptr<SolverBatch> >();
+
+  bp::class_<SolverBatch, boost::noncopyable>(
+      "SolverBatch",
+      "Batch of independent optimal control solvers.\n\n"
+      "It solves a set of independent optimal control problems concurrently. "
+      "Each problem\n"
+      "is solved by its own solver, which is warm started from its current "
+      "trajectories.\n"
+      "The problems are distributed among the threads, and each solver runs "
+      "within a single\n"
+      "thread. Therefore, we recommend to define a single thread in each "
+      "shooting problem.\n"
+      "A solver that raises an exception does not abort the batch, and its "
+      "problem is\n"
+      "reported with the Failed status.",
+      bp::init<std::vector<SolverAbstractPtr> >(
+          bp::args("self", "solvers"),
+          "Initialize the batch of solvers.\n\n"
+          ":param solvers: independent solvers, each one with its own "
+          "shooting problem"))
+      .def("solve", &solve_maxiters,
+           solve_maxiters_overloads(
+               bp::args("self", "maxiters", "is_feasible", "init_reg"),
+               "Solve all the problems with per-problem iteration limits.\n\n"
+               ":param maxiters: maximum allowed number of iterations of each "
+               "problem.\n"
+               ":param is_feasible: true if the current trajectories of the "
+               "solvers are obtained\n"
+               "from a rollout (default False).\n"
+               ":param init_reg: initial guess for the regularization value.\n"
+               ":return the number of problems that have converged."))
+      .def("solve", &solve_maxiter,
+           solve_maxiter_overloads(
+               bp::args("self", "maxiter", "is_feasible", "init_reg"),
+               "Solve all the problems.\n\n"
+               ":param maxiter: maximum allowed number of iterations per "
+               "problem (default 100).\n"
+               ":param is_feasible: true if the current trajectories of the "
+               "solvers are obtained\n"
+               "from a rollout (default False).\n"
+               ":param init_reg: initial guess for the regularization value.\n"
+               ":return the number of problems that have converged."))
+      .add_property("solvers",
+                    bp::make_function(
+                        &SolverBatch::get_solvers,
+                        bp::return_value_policy<bp::copy_const_reference>()),
+                    "solvers")
+      .add_property("converged",
+                    bp::make_function(
+                        &SolverBatch::get_converged,
+                        bp::return_value_policy<bp::copy_const_reference>()),
+                    "convergence status of each problem")
+      .add_property("costs",
+                    bp::make_function(
+                        &SolverBatch::get_costs,
+                        bp::return_value_policy<bp::copy_const_reference>()),
+                    "total cost of each problem")
+      .add_property("statuses", &get_statuses,
+                    "status of each problem (Failed if its solver raised an "
+                    "exception)")
+      .add_property("errors", &get_errors,
+                    "error message of each problem (empty if its solver did "
+                    "not raise an exception)")
+      .add_property("nthreads", bp::make_function(&SolverBatch::get_nthreads),
+                    bp::make_function(&SolverBatch::set_nthreads),
+                    "number of threads used for solving the problems");
+}
+
+}  // namespace python
+}  // namespace crocoddyl
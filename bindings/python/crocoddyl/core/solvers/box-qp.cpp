@@ -66,16 +66,37 @@ void exposeSolverBoxQP() {
           ":param th_acceptstep: acceptance step condition (default 0.1)\n"
           ":param th_grad: gradient tolerance condition (default 1e-9)\n"
           ":param reg: regularization (default 1e-9)"))
-      .def("solve", &BoxQP::solve,
-           bp::return_value_policy<bp::return_by_value>(),
-           bp::args("H", "q", "lb", "ub", "xinit"),
-           "Compute the solution of bound-constrained QP based on Newton "
-           "projection.\n\n"
-           ":param H: Hessian (dimension nx * nx)\n"
-           ":param q: gradient (dimension nx)\n"
-           ":param lb: lower bound (dimension nx)\n"
-           ":param ub: upper bound (dimension nx)\n"
-           ":param xinit: initial guess")
+      .def<const BoxQPSolution& (
+          BoxQP::*)(const Eigen::MatrixXd&, const Eigen::VectorXd&,
+                    const Eigen::VectorXd&, const Eigen::VectorXd&,
+                    const Eigen::VectorXd&)>(
+          "solve", &BoxQP::solve,
+          bp::return_value_policy<bp::return_by_value>(),
+          bp::args("H", "q", "lb", "ub", "xinit"),
+          "Compute the solution of bound-constrained QP based on Newton "
+          "projection.\n\n"
+          ":param H: Hessian (dimension nx * nx)\n"
+          ":param q: gradient (dimension nx)\n"
+          ":param lb: lower bound (dimension nx)\n"
+          ":param ub: upper bound (dimension nx)\n"
+          ":param xinit: initial guess")
+      .def<const BoxQPSolution& (
+          BoxQP::*)(const Eigen::MatrixXd&, const Eigen::VectorXd&,
+                    const Eigen::VectorXd&, const Eigen::VectorXd&,
+                    const BoxQPSolution&)>(
+          "solve", &BoxQP::solve,
+          bp::return_value_policy<bp::return_by_value>(),
+          bp::args("H", "q", "lb", "ub", "warmstart"),
+          "Compute the solution of bound-constrained QP warm-started from a "
+          "previous solution.\n\n"
+          "The initial active set is seeded from the previous solution. If it "
+          "is still optimal,\n"
+          "then it converges after a single Newton step.\n"
+          ":param H: Hessian (dimension nx * nx)\n"
+          ":param q: gradient (dimension nx)\n"
+          ":param lb: lower bound (dimension nx)\n"
+          ":param ub: upper bound (dimension nx)\n"
+          ":param warmstart: previous solution")
       .add_property("solution",
                     bp::make_function(
                         &BoxQP::get_solution,
@@ -10,17 +10,21 @@
 #include "crocoddyl/core/solvers/ddp.hpp"
 
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/core/solver-base.hpp"
 #include "python/crocoddyl/utils/copyable.hpp"
 #include "python/crocoddyl/utils/deprecate.hpp"
 
 namespace crocoddyl {
 namespace python {
 
-BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverDDP_solves, SolverDDP::solve, 0, 5)
 BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverDDP_computeDirections,
                                        SolverDDP::computeDirection, 0, 1)
 BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverDDP_trySteps, SolverDDP::tryStep,
                                        0, 1)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverDDP_prepares, SolverDDP::prepare,
+                                       0, 3)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverDDP_feedbacks, SolverDDP::feedback,
+                                       0, 2)
 
 void exposeSolverDDP() {
   bp::register_ptr_to_python<boost::shared_ptr<SolverDDP> >();
@@ -42,8 +46,8 @@ void exposeSolverDDP() {
           bp::args("self", "problem"),
           "Initialize the vector dimension.\n\n"
           ":param problem: shooting problem."))
-      .def("solve", &SolverDDP::solve,
-           SolverDDP_solves(
+      .def("solve", &SolverAbstract_solve,
+           SolverAbstract_solves(
                bp::args("self", "init_xs", "init_us", "maxiter", "is_feasible",
                         "init_reg"),
                "Compute the optimal trajectory xopt, uopt as lists of T+1 and "
@@ -69,6 +73,35 @@ void exposeSolverDDP() {
                "1e-9).\n"
                ":returns the optimal trajectory xopt, uopt and a boolean that "
                "describes if convergence was reached."))
+      .def("prepare", &SolverDDP::prepare,
+           SolverDDP_prepares(
+               bp::args("self", "init_xs", "init_us", "is_feasible"),
+               "Prepare the next real-time iteration.\n\n"
+               "It defines the solver candidate and computes the derivatives "
+               "of the\n"
+               "problem around it. This is the expensive half of an iteration "
+               "and\n"
+               "it can run before the new initial state arrives.\n"
+               ":param init_xs: initial guess for state trajectory with T+1 "
+               "elements (default []).\n"
+               ":param init_us: initial guess for control trajectory with T "
+               "elements (default []).\n"
+               ":param is_feasible: true if the init_xs are obtained from "
+               "integrating the init_us (rollout)\n"
+               "(default False).\n"
+               ":returns the total cost around the guess trajectory."))
+      .def("feedback", &SolverDDP::feedback,
+           SolverDDP_feedbacks(
+               bp::args("self", "maxiter", "init_reg"),
+               "Run the feedback phase of a real-time iteration.\n\n"
+               "It runs the backward pass and line search from the derivatives "
+               "computed\n"
+               "by prepare, after updating the initial state of the problem.\n"
+               ":param maxiter: maximum allowed number of iterations (default "
+               "1).\n"
+               ":param init_reg: initial guess for the regularization value.\n"
+               ":returns a boolean that describes if convergence was "
+               "reached."))
       .def("computeDirection", &SolverDDP::computeDirection,
            SolverDDP_computeDirections(
                bp::args("self", "recalc"),
@@ -174,6 +207,17 @@ void exposeSolverDDP() {
           make_function(&SolverDDP::get_k,
                         bp::return_value_policy<bp::copy_const_reference>()),
           "k")
+      .add_property("stacked_K",
+                    make_function(&SolverDDP::get_stacked_K,
+                                  bp::return_internal_reference<>()),
+                    "feedback gains as a (T * nu, ndx) array that shares "
+                    "memory with the solver (refreshed on each access).\n\n"
+                    "Use stacked_K.reshape(T, nu, ndx) to get a view per node.")
+      .add_property("stacked_k",
+                    make_function(&SolverDDP::get_stacked_k,
+                                  bp::return_internal_reference<>()),
+                    "feed-forward terms as a (T, nu) array that shares memory "
+                    "with the solver (refreshed on each access)")
       .add_property(
           "reg_incFactor", bp::make_function(&SolverDDP::get_reg_incfactor),
           bp::make_function(&SolverDDP::set_reg_incfactor),
@@ -237,6 +281,17 @@ void exposeSolverDDP() {
                         bp::return_value_policy<bp::copy_const_reference>()),
                     bp::make_function(&SolverDDP::set_alphas),
                     "list of step length (alpha) values")
+      .add_property("parallel_backward",
+                    bp::make_function(&SolverDDP::get_parallel_backward),
+                    bp::make_function(&SolverDDP::set_parallel_backward),
+                    "enable the parallel-in-time backward pass (it uses the "
+                    "number of threads defined in the shooting problem)")
+      .add_property("parallel_linesearch",
+                    bp::make_function(&SolverDDP::get_parallel_linesearch),
+                    bp::make_function(&SolverDDP::set_parallel_linesearch),
+                    "evaluate the step lengths concurrently (it uses the "
+                    "number of threads defined in the shooting problem, and "
+                    "it is not supported by the FDDP family)")
       .def(CopyableVisitor<SolverDDP>());
 }
 
@@ -10,13 +10,12 @@
 #include "crocoddyl/core/solvers/fddp.hpp"
 
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/core/solver-base.hpp"
 #include "python/crocoddyl/utils/copyable.hpp"
 
 namespace crocoddyl {
 namespace python {
 
-BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverFDDP_solves, SolverFDDP::solve, 0,
-                                       5)
 BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverFDDP_computeDirections,
                                        SolverDDP::computeDirection, 0, 1)
 
@@ -40,8 +39,8 @@ void exposeSolverFDDP() {
           bp::args("self", "problem"),
           "Initialize the vector dimension.\n\n"
           ":param problem: shooting problem."))
-      .def("solve", &SolverFDDP::solve,
-           SolverFDDP_solves(
+      .def("solve", &SolverAbstract_solve,
+           SolverAbstract_solves(
                bp::args("self", "init_xs", "init_us", "maxiter", "is_feasible",
                         "init_reg"),
                "Compute the optimal trajectory xopt, uopt as lists of T+1 and "
@@ -74,6 +73,12 @@ void exposeSolverFDDP() {
                     bp::make_function(&SolverFDDP::get_th_acceptnegstep),
                     bp::make_function(&SolverFDDP::set_th_acceptnegstep),
                     "threshold for step acceptance in ascent direction")
+      .add_property("multiple_shooting",
+                    bp::make_function(&SolverFDDP::get_multiple_shooting),
+                    bp::make_function(&SolverFDDP::set_multiple_shooting),
+                    "build the candidate from the linearized dynamics and "
+                    "evaluate the nodes in parallel (the candidate is feasible "
+                    "if its gaps are lower than th_gapTol)")
       .def(CopyableVisitor<SolverFDDP>());
 }
 
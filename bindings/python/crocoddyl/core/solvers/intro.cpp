@@ -9,13 +9,12 @@
 #include "crocoddyl/core/solvers/intro.hpp"
 
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/core/solver-base.hpp"
 #include "python/crocoddyl/utils/copyable.hpp"
 
 namespace crocoddyl {
 namespace python {
 
-BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverIntro_solves, SolverIntro::solve,
-                                       0, 5)
 BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverIntro_trySteps,
                                        SolverIntro::tryStep, 0, 1)
 
@@ -33,8 +32,8 @@ void exposeSolverIntro() {
                          bp::args("self", "problem"),
                          "Initialize the vector dimension.\n\n"
                          ":param problem: shooting problem."))
-      .def("solve", &SolverIntro::solve,
-           SolverIntro_solves(
+      .def("solve", &SolverAbstract_solve,
+           SolverAbstract_solves(
                bp::args("self", "init_xs", "init_us", "maxiter", "is_feasible",
                         "init_reg"),
                "Compute the optimal trajectory xopt, uopt as lists of T+1 and "
@@ -3,22 +3,20 @@
 #include "crocoddyl/core/solvers/ipopt.hpp"
 
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/core/solver-base.hpp"
 #include "python/crocoddyl/utils/copyable.hpp"
 
 namespace crocoddyl {
 namespace python {
 
-BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverIpopt_solves, SolverIpopt::solve,
-                                       0, 5)
-
 void exposeSolverIpopt() {
   bp::register_ptr_to_python<boost::shared_ptr<SolverIpopt>>();
   bp::class_<SolverIpopt, bp::bases<SolverAbstract>>(
       "SolverIpopt",
       bp::init<const boost::shared_ptr<crocoddyl::ShootingProblem>&>(
           bp::args("self", "problem"), "Initialize solver"))
-      .def("solve", &SolverIpopt::solve,
-           SolverIpopt_solves(
+      .def("solve", &SolverAbstract_solve,
+           SolverAbstract_solves(
                bp::args("self", "init_xs", "init_us", "maxiter", "is_feasible",
                         "init_reg"),
                "Compute the optimal trajectory xopt, uopt as lists of T+1 and "
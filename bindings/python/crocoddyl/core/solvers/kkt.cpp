@@ -9,12 +9,12 @@
 #include "crocoddyl/core/solvers/kkt.hpp"
 
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/core/solver-base.hpp"
 #include "python/crocoddyl/utils/copyable.hpp"
 
 namespace crocoddyl {
 namespace python {
 
-BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverKKT_solves, SolverKKT::solve, 0, 5)
 BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverKKT_computeDirections,
                                        SolverKKT::computeDirection, 0, 1)
 BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverKKT_trySteps, SolverKKT::tryStep,
@@ -34,8 +34,8 @@ void exposeSolverKKT() {
           bp::args("self", "problem"),
           "Initialize the vector dimension.\n\n"
           ":param problem: shooting problem."))
-      .def("solve", &SolverKKT::solve,
-           SolverKKT_solves(
+      .def("solve", &SolverAbstract_solve,
+           SolverAbstract_solves(
                bp::args("self", "init_xs", "init_us", "maxiter", "isFeasible",
                         "regInit"),
                "Compute the optimal primal(xopt, uopt) and dual(Vx) terms.\n\n"
@@ -84,11 +84,8 @@ void exposeSolverKKT() {
            "the search direction by running computeDirection. The quadratic\n"
            "improvement model is described as dV = f_0 - f_+ = d1*a + "
            "d2*a**2/2.")
-      .add_property(
-          "kkt",
-          make_function(&SolverKKT::get_kkt,
-                        bp::return_value_policy<bp::copy_const_reference>()),
-          "kkt")
+      .add_property("kkt", bp::make_function(&SolverKKT::get_kkt),
+                    "kkt (dense copy of the sparse KKT matrix)")
       .add_property(
           "kktref",
           make_function(&SolverKKT::get_kktref,
@@ -0,0 +1,118 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, Heriot-Watt University, University of Edinburgh
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#include "crocoddyl/core/solvers/mppi.hpp"
+
+#include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/core/solver-base.hpp"
+
+namespace crocoddyl {
+namespace python {
+
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverMPPI_computeDirections,
+                                       SolverMPPI::computeDirection, 0, 1)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(SolverMPPI_trySteps, SolverMPPI::tryStep,
+                                       0, 1)
+
+void exposeSolverMPPI() {
+  bp::register_ptr_to_python<boost::shared_ptr<SolverMPPI> >();
+
+  bp::class_<SolverMPPI, bp::bases<SolverAbstract> >(
+      "SolverMPPI",
+      "Model predictive path integral (MPPI) solver.\n\n"
+      "This sampling-based solver does not require the derivatives of the "
+      "action models.\n"
+      "In each iteration, it rolls out a set of control trajectories "
+      "perturbed by Gaussian\n"
+      "noise, and it updates the controls with the exponentially-weighted "
+      "average of the\n"
+      "perturbations. The rollouts are distributed among the threads. The "
+      "resulting\n"
+      "trajectories are dynamically feasible, and they can be used to warm "
+      "start a\n"
+      "gradient-based solver such as FDDP.",
+      bp::init<boost::shared_ptr<ShootingProblem>, bp::optional<std::size_t> >(
+          bp::args("self", "problem", "nsamples"),
+          "Initialize the MPPI solver.\n\n"
+          ":param problem: shooting problem\n"
+          ":param nsamples: number of sampled control trajectories (default "
+          "100)"))
+      .def("solve", &SolverAbstract_solve,
+           SolverAbstract_solves(
+               bp::args("self", "init_xs", "init_us", "maxiter", "is_feasible",
+                        "init_reg"),
+               "Compute the trajectory xopt, uopt as lists of T+1 and T "
+               "terms.\n\n"
+               "From an initial guess init_xs,init_us, iterate over "
+               "computeDirection and\n"
+               "tryStep until stoppingCriteria is below threshold. The state "
+               "trajectory is\n"
+               "always obtained from a rollout of the control trajectory.\n"
+               ":param init_xs: initial guess for state trajectory with T+1 "
+               "elements (default [])\n"
+               ":param init_us: initial guess for control trajectory with T "
+               "elements (default []).\n"
+               ":param maxiter: maximum allowed number of iterations (default "
+               "100).\n"
+               ":param is_feasible: true if the init_xs are obtained from "
+               "integrating the init_us (rollout)\n"
+               "(default False).\n"
+               ":param init_reg: unused (default None).\n"
+               ":returns a boolean that describes if convergence was reached."))
+      .def("computeDirection", &SolverMPPI::computeDirection,
+           SolverMPPI_computeDirections(
+               bp::args("self", "recalc"),
+               "Sample and roll out the control trajectories, and compute the "
+               "weighted control update.\n\n"
+               ":param recalc: unused (default True)"))
+      .def("tryStep", &SolverMPPI::tryStep,
+           SolverMPPI_trySteps(
+               bp::args("self", "stepLength"),
+               "Roll out the control update scaled by the step length.\n\n"
+               ":param stepLength: step length (default 1)\n"
+               ":returns the cost reduction."))
+      .def("stoppingCriteria", &SolverMPPI::stoppingCriteria, bp::args("self"),
+           "Return the squared norm of the weighted control update.")
+      .def("expectedImprovement", &SolverMPPI::expectedImprovement,
+           bp::return_value_policy<bp::copy_const_reference>(),
+           bp::args("self"),
+           "Return a null expected improvement (there is no local model).")
+      .add_property("nsamples", bp::make_function(&SolverMPPI::get_nsamples),
+                    bp::make_function(&SolverMPPI::set_nsamples),
+                    "number of sampled control trajectories")
+      .add_property("lambda_", bp::make_function(&SolverMPPI::get_lambda),
+                    bp::make_function(&SolverMPPI::set_lambda),
+                    "temperature of the exponential weights")
+      .add_property("noise_std", bp::make_function(&SolverMPPI::get_noise_std),
+                    bp::make_function(&SolverMPPI::set_noise_std),
+                    "standard deviation of the control noise")
+      .add_property("seed", bp::make_function(&SolverMPPI::get_seed),
+                    bp::make_function(&SolverMPPI::set_seed),
+                    "seed of the random-number generators")
+      .add_property("nthreads", bp::make_function(&SolverMPPI::get_nthreads),
+                    bp::make_function(&SolverMPPI::set_nthreads),
+                    "number of threads used for rolling out the samples")
+      .add_property("dus",
+                    bp::make_function(
+                        &SolverMPPI::get_dus,
+                        bp::return_value_policy<bp::copy_const_reference>()),
+                    "weighted control update")
+      .add_property("sample_costs",
+                    bp::make_function(
+                        &SolverMPPI::get_sample_costs,
+                        bp::return_value_policy<bp::copy_const_reference>()),
+                    "total cost of each sample computed in the last iteration")
+      .add_property("weights",
+                    bp::make_function(
+                        &SolverMPPI::get_weights,
+                        bp::return_value_policy<bp::copy_const_reference>()),
+                    "weight of each sample computed in the last iteration");
+}
+
+}  // namespace python
+}  // namespace crocoddyl
@@ -15,20 +15,10 @@
 namespace crocoddyl {
 namespace python {
 
-void exposeStateAbstract() {
-  bp::register_ptr_to_python<boost::shared_ptr<StateAbstract> >();
-
-  bp::enum_<Jcomponent>("Jcomponent")
-      .value("both", both)
-      .value("first", first)
-      .export_values()
-      .value("second", second);
-
-  bp::enum_<AssignmentOp>("AssignmentOp")
-      .value("setto", setto)
-      .value("addto", addto)
-      .value("rmfrom", rmfrom)
-      .export_values();
+template <typename Scalar>
+void exposeStateAbstractTpl() {
+  typedef StateAbstractTpl_wrap<Scalar> StateAbstract_wrap;
+  bp::register_ptr_to_python<boost::shared_ptr<StateAbstractTpl<Scalar> > >();
 
   bp::class_<StateAbstract_wrap, boost::noncopyable>(
       "StateAbstract",
@@ -149,5 +139,23 @@ void exposeStateAbstract() {
                     &StateAbstract_wrap::set_ub, "upper state limits");
 }
 
+void exposeStateAbstract() {
+  bp::enum_<Jcomponent>("Jcomponent")
+      .value("both", both)
+      .value("first", first)
+      .export_values()
+      .value("second", second);
+
+  bp::enum_<AssignmentOp>("AssignmentOp")
+      .value("setto", setto)
+      .value("addto", addto)
+      .value("rmfrom", rmfrom)
+      .export_values();
+
+  exposeStateAbstractTpl<double>();
+}
+
+template void exposeStateAbstractTpl<float>();
+
 }  // namespace python
 }  // namespace crocoddyl
@@ -15,35 +15,42 @@
 #include "crocoddyl/core/state-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 #include "python/crocoddyl/core/core.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
 
-class StateAbstract_wrap : public StateAbstract,
-                           public bp::wrapper<StateAbstract> {
+template <typename Scalar>
+class StateAbstractTpl_wrap : public StateAbstractTpl<Scalar>,
+                              public bp::wrapper<StateAbstractTpl<Scalar> > {
  public:
-  using StateAbstract::lb_;
-  using StateAbstract::ndx_;
-  using StateAbstract::nq_;
-  using StateAbstract::nv_;
-  using StateAbstract::nx_;
-  using StateAbstract::ub_;
+  typedef StateAbstractTpl<Scalar> Base;
+  typedef typename MathBaseTpl<Scalar>::VectorXs VectorXs;
+  typedef typename MathBaseTpl<Scalar>::MatrixXs MatrixXs;
+  using Base::lb_;
+  using Base::ndx_;
+  using Base::nq_;
+  using Base::nv_;
+  using Base::nx_;
+  using Base::ub_;
 
-  StateAbstract_wrap(int nx, int ndx)
-      : StateAbstract(nx, ndx), bp::wrapper<StateAbstract>() {
+  StateAbstractTpl_wrap(int nx, int ndx) : Base(nx, ndx), bp::wrapper<Base>() {
     enableMultithreading() = false;
   }
 
-  Eigen::VectorXd zero() const {
-    return bp::call<Eigen::VectorXd>(this->get_override("zero").ptr());
+  VectorXs zero() const {
+    ScopedGILAcquire gil;
+    return bp::call<VectorXs>(this->get_override("zero").ptr());
   }
 
-  Eigen::VectorXd rand() const {
-    return bp::call<Eigen::VectorXd>(this->get_override("rand").ptr());
+  VectorXs rand() const {
+    ScopedGILAcquire gil;
+    return bp::call<VectorXs>(this->get_override("rand").ptr());
   }
 
-  Eigen::VectorXd diff_wrap(const Eigen::Ref<const Eigen::VectorXd>& x0,
-                            const Eigen::Ref<const Eigen::VectorXd>& x1) const {
+  VectorXs diff_wrap(const Eigen::Ref<const VectorXs>& x0,
+                     const Eigen::Ref<const VectorXs>& x1) const {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x0.size()) != nx_) {
       throw_pretty("Invalid argument: "
                    << "x0 has wrong dimension (it should be " +
@@ -54,19 +61,19 @@ class StateAbstract_wrap : public StateAbstract,
                    << "x1 has wrong dimension (it should be " +
                           std::to_string(nx_) + ")");
     }
-    return bp::call<Eigen::VectorXd>(this->get_override("diff").ptr(),
-                                     (Eigen::VectorXd)x0, (Eigen::VectorXd)x1);
+    return bp::call<VectorXs>(this->get_override("diff").ptr(), (VectorXs)x0,
+                              (VectorXs)x1);
   }
 
-  void diff(const Eigen::Ref<const Eigen::VectorXd>& x0,
-            const Eigen::Ref<const Eigen::VectorXd>& x1,
-            Eigen::Ref<Eigen::VectorXd> dxout) const {
+  void diff(const Eigen::Ref<const VectorXs>& x0,
+            const Eigen::Ref<const VectorXs>& x1,
+            Eigen::Ref<VectorXs> dxout) const {
     dxout = diff_wrap(x0, x1);
   }
 
-  Eigen::VectorXd integrate_wrap(
-      const Eigen::Ref<const Eigen::VectorXd>& x,
-      const Eigen::Ref<const Eigen::VectorXd>& dx) const {
+  VectorXs integrate_wrap(const Eigen::Ref<const VectorXs>& x,
+                          const Eigen::Ref<const VectorXs>& dx) const {
+    ScopedGILAcquire gil;
     if (static_cast<std::size_t>(x.size()) != nx_) {
       throw_pretty("Invalid argument: "
                    << "x has wrong dimension (it should be " +
@@ -77,47 +84,47 @@ class StateAbstract_wrap : public StateAbstract,
                    << "dx has wrong dimension (it should be " +
                           std::to_string(ndx_) + ")");
     }
-    return bp::call<Eigen::VectorXd>(this->get_override("integrate").ptr(),
-                                     (Eigen::VectorXd)x, (Eigen::VectorXd)dx);
+    return bp::call<VectorXs>(this->get_override("integrate").ptr(),
+                              (VectorXs)x, (VectorXs)dx);
   }
 
-  void integrate(const Eigen::Ref<const Eigen::VectorXd>& x,
-                 const Eigen::Ref<const Eigen::VectorXd>& dx,
-                 Eigen::Ref<Eigen::VectorXd> x1out) const {
+  void integrate(const Eigen::Ref<const VectorXs>& x,
+                 const Eigen::Ref<const VectorXs>& dx,
+                 Eigen::Ref<VectorXs> x1out) const {
     x1out = integrate_wrap(x, dx);
   }
 
-  void Jdiff(const Eigen::Ref<const Eigen::VectorXd>& x0,
-             const Eigen::Ref<const Eigen::VectorXd>& x1,
-             Eigen::Ref<Eigen::MatrixXd> Jfirst,
-             Eigen::Ref<Eigen::MatrixXd> Jsecond,
-             const Jcomponent firstsecond) const {
+  void Jdiff(const Eigen::Ref<const VectorXs>& x0,
+             const Eigen::Ref<const VectorXs>& x1, Eigen::Ref<MatrixXs> Jfirst,
+             Eigen::Ref<MatrixXs> Jsecond, const Jcomponent firstsecond) const {
+    ScopedGILAcquire gil;
     bp::list res = Jdiff_wrap(x0, x1, firstsecond);
     switch (firstsecond) {
       case first: {
-        Jfirst.derived() = bp::extract<Eigen::MatrixXd>(res[0])();
+        Jfirst.derived() = bp::extract<MatrixXs>(res[0])();
         break;
       }
       case second: {
-        Jsecond.derived() = bp::extract<Eigen::MatrixXd>(res[0])();
+        Jsecond.derived() = bp::extract<MatrixXs>(res[0])();
         break;
       }
       case both: {
-        Jfirst.derived() = bp::extract<Eigen::MatrixXd>(res[0])();
-        Jsecond.derived() = bp::extract<Eigen::MatrixXd>(res[1])();
+        Jfirst.derived() = bp::extract<MatrixXs>(res[0])();
+        Jsecond.derived() = bp::extract<MatrixXs>(res[1])();
         break;
       }
       default: {
-        Jfirst.derived() = bp::extract<Eigen::MatrixXd>(res[0])();
-        Jsecond.derived() = bp::extract<Eigen::MatrixXd>(res[1])();
+        Jfirst.derived() = bp::extract<MatrixXs>(res[0])();
+        Jsecond.derived() = bp::extract<MatrixXs>(res[1])();
         break;
       }
     }
   }
 
-  bp::list Jdiff_wrap(const Eigen::Ref<const Eigen::VectorXd>& x0,
-                      const Eigen::Ref<const Eigen::VectorXd>& x1,
+  bp::list Jdiff_wrap(const Eigen::Ref<const VectorXs>& x0,
+                      const Eigen::Ref<const VectorXs>& x1,
                       const Jcomponent firstsecond) const {
+    ScopedGILAcquire gil;
     assert_pretty(
         is_a_Jcomponent(firstsecond),
         ("firstsecond must be one of the Jcomponent {both, first, second}"));
@@ -135,40 +142,38 @@ class StateAbstract_wrap : public StateAbstract,
     bp::list Jacs;
     switch (firstsecond) {
       case first: {
-        Eigen::MatrixXd J = bp::call<Eigen::MatrixXd>(
-            this->get_override("Jdiff").ptr(), (Eigen::VectorXd)x0,
-            (Eigen::VectorXd)x1, firstsecond);
+        MatrixXs J =
+            bp::call<MatrixXs>(this->get_override("Jdiff").ptr(), (VectorXs)x0,
+                               (VectorXs)x1, firstsecond);
         Jacs.append(J);
         break;
       }
       case second: {
-        Eigen::MatrixXd J = bp::call<Eigen::MatrixXd>(
-            this->get_override("Jdiff").ptr(), (Eigen::VectorXd)x0,
-            (Eigen::VectorXd)x1, firstsecond);
+        MatrixXs J =
+            bp::call<MatrixXs>(this->get_override("Jdiff").ptr(), (VectorXs)x0,
+                               (VectorXs)x1, firstsecond);
         Jacs.append(J);
         break;
       }
       case both: {
         Jacs = bp::call<bp::list>(this->get_override("Jdiff").ptr(),
-                                  (Eigen::VectorXd)x0, (Eigen::VectorXd)x1,
-                                  firstsecond);
+                                  (VectorXs)x0, (VectorXs)x1, firstsecond);
         break;
       }
       default: {
         Jacs = bp::call<bp::list>(this->get_override("Jdiff").ptr(),
-                                  (Eigen::VectorXd)x0, (Eigen::VectorXd)x1,
-                                  firstsecond);
+                                  (VectorXs)x0, (VectorXs)x1, firstsecond);
         break;
       }
     }
     return Jacs;
   }
 
-  void Jintegrate(const Eigen::Ref<const Eigen::VectorXd>& x,
-                  const Eigen::Ref<const Eigen::VectorXd>& dx,
-                  Eigen::Ref<Eigen::MatrixXd> Jfirst,
-                  Eigen::Ref<Eigen::MatrixXd> Jsecond,
+  void Jintegrate(const Eigen::Ref<const VectorXs>& x,
+                  const Eigen::Ref<const VectorXs>& dx,
+                  Eigen::Ref<MatrixXs> Jfirst, Eigen::Ref<MatrixXs> Jsecond,
                   const Jcomponent firstsecond, const AssignmentOp op) const {
+    ScopedGILAcquire gil;
     bp::list res = Jintegrate_wrap(x, dx, firstsecond);
     if (firstsecond == first || firstsecond == both) {
       if (static_cast<std::size_t>(Jfirst.rows()) != ndx_ ||
@@ -180,15 +185,15 @@ class StateAbstract_wrap : public StateAbstract,
       }
       switch (op) {
         case setto: {
-          Jfirst.derived() = bp::extract<Eigen::MatrixXd>(res[0])();
+          Jfirst.derived() = bp::extract<MatrixXs>(res[0])();
           break;
         }
         case addto: {
-          Jfirst.derived() += bp::extract<Eigen::MatrixXd>(res[0])();
+          Jfirst.derived() += bp::extract<MatrixXs>(res[0])();
           break;
         }
         case rmfrom: {
-          Jfirst.derived() -= bp::extract<Eigen::MatrixXd>(res[0])();
+          Jfirst.derived() -= bp::extract<MatrixXs>(res[0])();
           break;
         }
         default: {
@@ -208,15 +213,15 @@ class StateAbstract_wrap : public StateAbstract,
       }
       switch (op) {
         case setto: {
-          Jsecond.derived() = bp::extract<Eigen::MatrixXd>(res[0])();
+          Jsecond.derived() = bp::extract<MatrixXs>(res[0])();
           break;
         }
         case addto: {
-          Jsecond.derived() += bp::extract<Eigen::MatrixXd>(res[0])();
+          Jsecond.derived() += bp::extract<MatrixXs>(res[0])();
           break;
         }
         case rmfrom: {
-          Jsecond.derived() -= bp::extract<Eigen::MatrixXd>(res[0])();
+          Jsecond.derived() -= bp::extract<MatrixXs>(res[0])();
           break;
         }
         default: {
@@ -228,9 +233,10 @@ class StateAbstract_wrap : public StateAbstract,
     }
   }
 
-  bp::list Jintegrate_wrap(const Eigen::Ref<const Eigen::VectorXd>& x,
-                           const Eigen::Ref<const Eigen::VectorXd>& dx,
+  bp::list Jintegrate_wrap(const Eigen::Ref<const VectorXs>& x,
+                           const Eigen::Ref<const VectorXs>& dx,
                            const Jcomponent firstsecond) const {
+    ScopedGILAcquire gil;
     assert_pretty(
         is_a_Jcomponent(firstsecond),
         ("firstsecond must be one of the Jcomponent {both, first, second}"));
@@ -248,46 +254,43 @@ class StateAbstract_wrap : public StateAbstract,
     bp::list Jacs;
     switch (firstsecond) {
       case first: {
-        Eigen::MatrixXd J = bp::call<Eigen::MatrixXd>(
-            this->get_override("Jintegrate").ptr(), (Eigen::VectorXd)x,
-            (Eigen::VectorXd)dx, firstsecond);
+        MatrixXs J = bp::call<MatrixXs>(this->get_override("Jintegrate").ptr(),
+                                        (VectorXs)x, (VectorXs)dx, firstsecond);
         Jacs.append(J);
         break;
       }
       case second: {
-        Eigen::MatrixXd J = bp::call<Eigen::MatrixXd>(
-            this->get_override("Jintegrate").ptr(), (Eigen::VectorXd)x,
-            (Eigen::VectorXd)dx, firstsecond);
+        MatrixXs J = bp::call<MatrixXs>(this->get_override("Jintegrate").ptr(),
+                                        (VectorXs)x, (VectorXs)dx, firstsecond);
         Jacs.append(J);
         break;
       }
       case both: {
         Jacs = bp::call<bp::list>(this->get_override("Jintegrate").ptr(),
-                                  (Eigen::VectorXd)x, (Eigen::VectorXd)dx,
-                                  firstsecond);
+                                  (VectorXs)x, (VectorXs)dx, firstsecond);
         break;
       }
       default: {
         Jacs = bp::call<bp::list>(this->get_override("Jintegrate").ptr(),
-                                  (Eigen::VectorXd)x, (Eigen::VectorXd)dx,
-                                  firstsecond);
+                                  (VectorXs)x, (VectorXs)dx, firstsecond);
         break;
       }
     }
     return Jacs;
   }
 
-  void JintegrateTransport(const Eigen::Ref<const Eigen::VectorXd>& x,
-                           const Eigen::Ref<const Eigen::VectorXd>& dx,
-                           Eigen::Ref<Eigen::MatrixXd> Jin,
+  void JintegrateTransport(const Eigen::Ref<const VectorXs>& x,
+                           const Eigen::Ref<const VectorXs>& dx,
+                           Eigen::Ref<MatrixXs> Jin,
                            const Jcomponent firstsecond) const {
     Jin = JintegrateTransport_wrap(x, dx, Jin, firstsecond);
   }
 
-  Eigen::MatrixXd JintegrateTransport_wrap(
-      const Eigen::Ref<const Eigen::VectorXd>& x,
-      const Eigen::Ref<const Eigen::VectorXd>& dx,
-      Eigen::Ref<Eigen::MatrixXd> Jin, const Jcomponent firstsecond) const {
+  MatrixXs JintegrateTransport_wrap(const Eigen::Ref<const VectorXs>& x,
+                                    const Eigen::Ref<const VectorXs>& dx,
+                                    Eigen::Ref<MatrixXs> Jin,
+                                    const Jcomponent firstsecond) const {
+    ScopedGILAcquire gil;
     assert_pretty(
         is_a_Jcomponent(firstsecond),
         ("firstsecond must be one of the Jcomponent {both, first, second}"));
@@ -301,15 +304,16 @@ class StateAbstract_wrap : public StateAbstract,
                    << "dx has wrong dimension (it should be " +
                           std::to_string(ndx_) + ")");
     }
-    return bp::call<Eigen::MatrixXd>(
-        this->get_override("JintegrateTransport").ptr(), (Eigen::VectorXd)x,
-        (Eigen::VectorXd)dx, (Eigen::MatrixXd)Jin, firstsecond);
+    return bp::call<MatrixXs>(this->get_override("JintegrateTransport").ptr(),
+                              (VectorXs)x, (VectorXs)dx, (MatrixXs)Jin,
+                              firstsecond);
   }
 };
 
-BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(Jdiffs, StateAbstract::Jdiff_Js, 2, 3)
-BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(Jintegrates,
-                                       StateAbstract::Jintegrate_Js, 2, 3)
+typedef StateAbstractTpl_wrap<double> StateAbstract_wrap;
+
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(Jdiffs, Jdiff_Js, 2, 3)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(Jintegrates, Jintegrate_Js, 2, 3)
 
 }  // namespace python
 }  // namespace crocoddyl
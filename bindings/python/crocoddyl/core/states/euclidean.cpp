@@ -16,10 +16,12 @@
 namespace crocoddyl {
 namespace python {
 
-void exposeStateEuclidean() {
+template <typename Scalar>
+void exposeStateEuclideanTpl() {
+  typedef StateVectorTpl<Scalar> StateVector;
   bp::register_ptr_to_python<boost::shared_ptr<StateVector> >();
 
-  bp::class_<StateVector, bp::bases<StateAbstract> >(
+  bp::class_<StateVector, bp::bases<StateAbstractTpl<Scalar> > >(
       "StateVector",
       "Euclidean state vector.\n\n"
       "For this type of states, the difference and integrate operators are "
@@ -107,5 +109,9 @@ void exposeStateEuclidean() {
       .def(CopyableVisitor<StateVector>());
 }
 
+void exposeStateEuclidean() { exposeStateEuclideanTpl<double>(); }
+
+template void exposeStateEuclideanTpl<float>();
+
 }  // namespace python
 }  // namespace crocoddyl
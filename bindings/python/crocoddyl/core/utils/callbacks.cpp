@@ -15,7 +15,32 @@
 namespace crocoddyl {
 namespace python {
 
+// The recorded values are returned as copies rather than views on purpose.
+// Reading them rotates the ring buffers in place (so a view taken earlier
+// would silently reorder), while set_capacity() and set_with_trajectories()
+// reallocate them (so a view would dangle, even with return_internal_reference
+// keeping the logger alive). These getters are read once per solve, so the
+// copy is not on the hot path.
+template <typename Matrix,
+          Eigen::Ref<const Matrix> (CallbackLogger::*get)() const>
+Matrix CallbackLogger_copy(const CallbackLogger& self) {
+  return (self.*get)();
+}
+
+bp::list CallbackLogger_get_fs(const CallbackLogger& self) {
+  const std::vector<std::vector<Eigen::VectorXd> > fs = self.get_fs();
+  bp::list fs_list;
+  for (std::size_t i = 0; i < fs.size(); ++i) {
+    fs_list.append(fs[i]);
+  }
+  return fs_list;
+}
+
 void exposeCallbacks() {
+  typedef CallbackLogger::VectorXi VectorXi;
+  typedef Eigen::VectorXd VectorXd;
+  typedef Eigen::MatrixXd MatrixXd;
+
   bp::register_ptr_to_python<boost::shared_ptr<CallbackAbstract> >();
 
   bp::enum_<VerboseLevel>("VerboseLevel")
@@ -40,6 +65,117 @@ void exposeCallbacks() {
       .add_property("precision", &CallbackVerbose::get_precision,
                     &CallbackVerbose::set_precision, "precision")
       .def(CopyableVisitor<CallbackVerbose>());
+
+  bp::class_<CallbackLogger, bp::bases<CallbackAbstract> >(
+      "CallbackLogger",
+      "Callback function for logging the solver values.\n\n"
+      "It records the values of each iteration into preallocated ring buffers "
+      "of fixed capacity,\n"
+      "and the oldest iterations are overwritten once the capacity is "
+      "reached. The recorded\n"
+      "values are returned as numpy arrays that copy the buffers, and they "
+      "are ordered\n"
+      "from the oldest to the newest iteration.",
+      bp::init<bp::optional<std::size_t, bool> >(
+          bp::args("self", "capacity", "with_trajectories"),
+          "Initialize the logger callback.\n\n"
+          ":param capacity: maximum number of recorded iterations (default "
+          "1000)\n"
+          ":param with_trajectories: true for recording the trajectories of "
+          "each iteration\n"
+          "(default False)"))
+      .def("__call__", &CallbackLogger::operator(), bp::args("self", "solver"),
+           "Run the callback function given a solver.\n\n"
+           ":param solver: solver to be logged")
+      .def("reset", &CallbackLogger::reset, bp::args("self"),
+           "Remove the recorded iterations.")
+      .add_property("size", bp::make_function(&CallbackLogger::get_size),
+                    "number of recorded iterations")
+      .add_property("capacity",
+                    bp::make_function(&CallbackLogger::get_capacity),
+                    bp::make_function(&CallbackLogger::set_capacity),
+                    "maximum number of recorded iterations")
+      .add_property("with_trajectories",
+                    bp::make_function(&CallbackLogger::get_with_trajectories),
+                    bp::make_function(&CallbackLogger::set_with_trajectories),
+                    "true if the trajectories of each iteration are recorded")
+      .add_property(
+          "iters",
+          bp::make_function(
+              &CallbackLogger_copy<VectorXi, &CallbackLogger::get_iters>),
+          "iteration numbers")
+      .add_property(
+          "costs",
+          bp::make_function(
+              &CallbackLogger_copy<VectorXd, &CallbackLogger::get_costs>),
+          "total costs")
+      .add_property(
+          "stops",
+          bp::make_function(
+              &CallbackLogger_copy<VectorXd, &CallbackLogger::get_stops>),
+          "stopping-criteria values")
+      .add_property(
+          "grads",
+          bp::make_function(
+              &CallbackLogger_copy<VectorXd, &CallbackLogger::get_grads>),
+          "expected gradients")
+      .add_property(
+          "pregs",
+          bp::make_function(
+              &CallbackLogger_copy<VectorXd, &CallbackLogger::get_pregs>),
+          "primal-variable regularizations")
+      .add_property(
+          "dregs",
+          bp::make_function(
+              &CallbackLogger_copy<VectorXd, &CallbackLogger::get_dregs>),
+          "dual-variable regularizations")
+      .add_property(
+          "steps",
+          bp::make_function(
+              &CallbackLogger_copy<VectorXd, &CallbackLogger::get_steps>),
+          "step lengths")
+      .add_property(
+          "ffeass",
+          bp::make_function(
+              &CallbackLogger_copy<VectorXd, &CallbackLogger::get_ffeass>),
+          "dynamic feasibilities")
+      .add_property(
+          "hfeass",
+          bp::make_function(
+              &CallbackLogger_copy<VectorXd, &CallbackLogger::get_hfeass>),
+          "inequality feasibilities")
+      .add_property("xs",
+                    bp::make_function(
+                        &CallbackLogger::get_xs,
+                        bp::return_value_policy<bp::copy_const_reference>()),
+                    "state trajectory of the last iteration")
+      .add_property("us",
+                    bp::make_function(
+                        &CallbackLogger::get_us,
+                        bp::return_value_policy<bp::copy_const_reference>()),
+                    "control trajectory of the last iteration")
+      .add_property(
+          "xs_log",
+          bp::make_function(
+              &CallbackLogger_copy<MatrixXd, &CallbackLogger::get_xs_log>),
+          "stacked state trajectory of each iteration (one column per "
+          "iteration)")
+      .add_property(
+          "us_log",
+          bp::make_function(
+              &CallbackLogger_copy<MatrixXd, &CallbackLogger::get_us_log>),
+          "stacked control trajectory of each iteration (one column per "
+          "iteration)")
+      .add_property(
+          "fs_log",
+          bp::make_function(
+              &CallbackLogger_copy<MatrixXd, &CallbackLogger::get_fs_log>),
+          "stacked gap trajectory of each iteration (one column per "
+          "iteration)")
+      .add_property("fs", bp::make_function(&CallbackLogger_get_fs),
+                    "gap trajectory of each iteration (it requires to record "
+                    "the trajectories)")
+      .def(CopyableVisitor<CallbackLogger>());
 }
 
 }  // namespace python
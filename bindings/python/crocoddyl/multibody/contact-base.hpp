@@ -13,6 +13,7 @@
 #include "crocoddyl/core/utils/exception.hpp"
 #include "crocoddyl/multibody/contact-base.hpp"
 #include "python/crocoddyl/multibody/multibody.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -31,6 +32,7 @@ class ContactModelAbstract_wrap : public ContactModelAbstract,
 
   void calc(const boost::shared_ptr<ContactDataAbstract>& data,
             const Eigen::Ref<const Eigen::VectorXd>& x) {
+    ScopedGILAcquire gil;
     assert_pretty(static_cast<std::size_t>(x.size()) == state_->get_nx(),
                   "x has wrong dimension");
     return bp::call<void>(this->get_override("calc").ptr(), data,
@@ -39,6 +41,7 @@ class ContactModelAbstract_wrap : public ContactModelAbstract,
 
   void calcDiff(const boost::shared_ptr<ContactDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& x) {
+    ScopedGILAcquire gil;
     assert_pretty(static_cast<std::size_t>(x.size()) == state_->get_nx(),
                   "x has wrong dimension");
     return bp::call<void>(this->get_override("calcDiff").ptr(), data,
@@ -47,6 +50,7 @@ class ContactModelAbstract_wrap : public ContactModelAbstract,
 
   void updateForce(const boost::shared_ptr<ContactDataAbstract>& data,
                    const Eigen::VectorXd& force) {
+    ScopedGILAcquire gil;
     assert_pretty(static_cast<std::size_t>(force.size()) == nc_,
                   "force has wrong dimension");
     return bp::call<void>(this->get_override("updateForce").ptr(), data, force);
@@ -54,6 +58,7 @@ class ContactModelAbstract_wrap : public ContactModelAbstract,
 
   boost::shared_ptr<ContactDataAbstract> createData(
       pinocchio::DataTpl<Scalar>* const data) {
+    ScopedGILAcquire gil;
     enableMultithreading() = false;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<ContactDataAbstract> >(
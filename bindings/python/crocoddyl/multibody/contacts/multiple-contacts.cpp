@@ -55,7 +55,8 @@ void exposeContactMultiple() {
           bp::make_getter(&ContactItem::contact,
                           bp::return_value_policy<bp::return_by_value>()),
           "contact model")
-      .def_readwrite("active", &ContactItem::active, "contact status")
+      .def_readonly("active", &ContactItem::active,
+                    "contact status (change it with changeContactStatus)")
       .def(CopyableVisitor<ContactItem>())
       .def(PrintableVisitor<ContactItem>());
 
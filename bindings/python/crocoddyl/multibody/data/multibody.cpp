@@ -14,6 +14,14 @@
 namespace crocoddyl {
 namespace python {
 
+void DataCollectorMultibody_invalidateFrameCache(DataCollectorMultibody& self) {
+  self.frame_cache.invalidate();
+}
+
+void DataCollectorMultibody_releaseFrameCache(DataCollectorMultibody& self) {
+  self.frame_cache.release();
+}
+
 void exposeDataCollectorMultibody() {
   bp::class_<DataCollectorMultibody, bp::bases<DataCollectorAbstract> >(
       "DataCollectorMultibody", "Data collector for multibody systems.\n\n",
@@ -25,6 +33,22 @@ void exposeDataCollectorMultibody() {
                     bp::make_getter(&DataCollectorMultibody::pinocchio,
                                     bp::return_internal_reference<>()),
                     "pinocchio data")
+      .def("invalidateFrameCache", &DataCollectorMultibody_invalidateFrameCache,
+           bp::args("self"),
+           "Invalidate the cached frame kinematics.\n\n"
+           "It has to be called after updating the kinematics of the Pinocchio "
+           "data\n"
+           "for a new (x, u). It also enables the cache of frame placements "
+           "and\n"
+           "local Jacobians shared by the residuals until releaseFrameCache() "
+           "is called.")
+      .def("releaseFrameCache", &DataCollectorMultibody_releaseFrameCache,
+           bp::args("self"),
+           "Disable the cached frame kinematics.\n\n"
+           "It has to be called once the costs and constraints of the current "
+           "(x, u)\n"
+           "are evaluated, as the Pinocchio data might be updated by someone "
+           "else.")
       .def(CopyableVisitor<DataCollectorMultibody>());
 
   bp::class_<DataCollectorActMultibody,
@@ -13,6 +13,7 @@
 #include "crocoddyl/core/utils/exception.hpp"
 #include "crocoddyl/multibody/impulse-base.hpp"
 #include "python/crocoddyl/multibody/multibody.hpp"
+#include "python/crocoddyl/utils/gil.hpp"
 
 namespace crocoddyl {
 namespace python {
@@ -35,6 +36,7 @@ class ImpulseModelAbstract_wrap : public ImpulseModelAbstract,
 
   void calc(const boost::shared_ptr<ImpulseDataAbstract>& data,
             const Eigen::Ref<const Eigen::VectorXd>& x) {
+    ScopedGILAcquire gil;
     assert_pretty(static_cast<std::size_t>(x.size()) == state_->get_nx(),
                   "x has wrong dimension");
     return bp::call<void>(this->get_override("calc").ptr(), data,
@@ -43,6 +45,7 @@ class ImpulseModelAbstract_wrap : public ImpulseModelAbstract,
 
   void calcDiff(const boost::shared_ptr<ImpulseDataAbstract>& data,
                 const Eigen::Ref<const Eigen::VectorXd>& x) {
+    ScopedGILAcquire gil;
     assert_pretty(static_cast<std::size_t>(x.size()) == state_->get_nx(),
                   "x has wrong dimension");
     return bp::call<void>(this->get_override("calcDiff").ptr(), data,
@@ -51,6 +54,7 @@ class ImpulseModelAbstract_wrap : public ImpulseModelAbstract,
 
   void updateForce(const boost::shared_ptr<ImpulseDataAbstract>& data,
                    const Eigen::VectorXd& force) {
+    ScopedGILAcquire gil;
     assert_pretty(static_cast<std::size_t>(force.size()) == nc_,
                   "force has wrong dimension");
     return bp::call<void>(this->get_override("updateForce").ptr(), data, force);
@@ -58,6 +62,7 @@ class ImpulseModelAbstract_wrap : public ImpulseModelAbstract,
 
   boost::shared_ptr<ImpulseDataAbstract> createData(
       pinocchio::DataTpl<Scalar>* const data) {
+    ScopedGILAcquire gil;
     enableMultithreading() = false;
     if (boost::python::override createData = this->get_override("createData")) {
       return bp::call<boost::shared_ptr<ImpulseDataAbstract> >(
@@ -0,0 +1,54 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, Heriot-Watt University
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#ifndef BINDINGS_PYTHON_CROCODDYL_UTILS_GIL_HPP_
+#define BINDINGS_PYTHON_CROCODDYL_UTILS_GIL_HPP_
+
+#include <boost/noncopyable.hpp>
+#include <boost/python.hpp>
+
+namespace crocoddyl {
+namespace python {
+
+///
+/// \brief Release the Python GIL during the lifetime of this object.
+///
+/// It is used by the bindings of computationally-expensive routines (e.g.,
+/// solve, calc, calcDiff and rollout), so other Python threads can run
+/// concurrently. All the arguments must be converted before, and the results
+/// after, the GIL is released.
+///
+class ScopedGILRelease : boost::noncopyable {
+ public:
+  ScopedGILRelease() : state_(PyEval_SaveThread()) {}
+  ~ScopedGILRelease() { PyEval_RestoreThread(state_); }
+
+ private:
+  PyThreadState* state_;
+};
+
+///
+/// \brief Acquire the Python GIL during the lifetime of this object.
+///
+/// It is used by the wrappers of Python-derived classes (e.g., models and
+/// callbacks) before calling their Python overrides. It also works if the
+/// calling thread already holds the GIL.
+///
+class ScopedGILAcquire : boost::noncopyable {
+ public:
+  ScopedGILAcquire() : state_(PyGILState_Ensure()) {}
+  ~ScopedGILAcquire() { PyGILState_Release(state_); }
+
+ private:
+  PyGILState_STATE state_;
+};
+
+}  // namespace python
+}  // namespace crocoddyl
+
+#endif  // BINDINGS_PYTHON_CROCODDYL_UTILS_GIL_HPP_
@@ -101,6 +101,7 @@ class ActionModelAbstractTpl {
   typedef ActionDataAbstractTpl<Scalar> ActionDataAbstract;
   typedef StateAbstractTpl<Scalar> StateAbstract;
   typedef typename MathBase::VectorXs VectorXs;
+  typedef typename MathBase::MatrixXsRowMajor MatrixXsRowMajor;
 
   /**
    * @brief Initialize the action model
@@ -171,6 +172,47 @@ class ActionModelAbstractTpl {
   virtual void calcDiff(const boost::shared_ptr<ActionDataAbstract>& data,
                         const Eigen::Ref<const VectorXs>& x);
 
+  /**
+   * @brief Compute the next states and cost values of a batch of samples
+   *
+   * The \f$i\f$-th sample is defined by the \f$i\f$-th rows of `X` and
+   * `U`, and it is evaluated in the \f$i\f$-th data. Its next state and cost
+   * value are stored in the \f$i\f$-th data, and stacked in the \f$i\f$-th
+   * row of `xnext` and the \f$i\f$-th element of `cost`, respectively. By
+   * default, the samples are evaluated in parallel with `calc()` when the
+   * multithreading support is enabled. Models with a closed-form batched
+   * evaluation might override this function.
+   *
+   * @param[in] datas   Action datas (size \f$N\f$)
+   * @param[in] X       State points \f$N\times nx\f$
+   * @param[in] U       Control inputs \f$N\times nu\f$
+   * @param[out] xnext  Next states \f$N\times nx\f$
+   * @param[out] cost   Cost values \f$N\f$
+   */
+  virtual void calcBatch(
+      const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+      const Eigen::Ref<const MatrixXsRowMajor>& X,
+      const Eigen::Ref<const MatrixXsRowMajor>& U,
+      Eigen::Ref<MatrixXsRowMajor> xnext, Eigen::Ref<VectorXs> cost);
+
+  /**
+   * @brief Compute the derivatives of the dynamics and cost functions of a
+   * batch of samples
+   *
+   * The derivatives of the \f$i\f$-th sample are stored in the \f$i\f$-th
+   * data. It assumes that `calcBatch()` has been run first. By default, the
+   * samples are evaluated in parallel with `calcDiff()` when the
+   * multithreading support is enabled.
+   *
+   * @param[in] datas  Action datas (size \f$N\f$)
+   * @param[in] X      State points \f$N\times nx\f$
+   * @param[in] U      Control inputs \f$N\times nu\f$
+   */
+  virtual void calcDiffBatch(
+      const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+      const Eigen::Ref<const MatrixXsRowMajor>& X,
+      const Eigen::Ref<const MatrixXsRowMajor>& U);
+
   /**
    * @brief Create the action data
    *
@@ -267,6 +309,24 @@ class ActionModelAbstractTpl {
    */
   bool get_has_control_limits() const;
 
+  /**
+   * @brief Return the time step of the Euler block structure of the
+   * dynamics Jacobians
+   *
+   * A model declares this structure when its Jacobians are defined by their
+   * velocity rows \f$\mathbf{B_x}\f$ and \f$\mathbf{B_u}\f$ as
+   * \f$\mathbf{F_x}=\begin{bmatrix}\mathbf{I}&\mathbf{0}\\\mathbf{0}&\mathbf{0}
+   * \end{bmatrix}+\begin{bmatrix}\Delta t\,\mathbf{I}\\\mathbf{I}\end{bmatrix}
+   * \mathbf{B_x}\f$ and
+   * \f$\mathbf{F_u}=\begin{bmatrix}\Delta
+   * t\,\mathbf{I}\\\mathbf{I}\end{bmatrix} \mathbf{B_u}\f$. Solvers use it to
+   * skip the identity and time-step blocks of the Riccati recursion.
+   *
+   * @return the time step \f$\Delta t\f$, or zero when the model does not
+   * declare this structure (default)
+   */
+  virtual Scalar get_structure_timestep() const;
+
   /**
    * @brief Modify the lower bound of the inequality constraints
    */
@@ -321,6 +381,34 @@ class ActionModelAbstractTpl {
    */
   void update_has_control_limits();
 
+  /**
+   * @brief Check the dimensions of the batch of samples
+   *
+   * @param[in] datas  Action datas (size \f$N\f$)
+   * @param[in] X      State points \f$N\times nx\f$
+   * @param[in] U      Control inputs \f$N\times nu\f$
+   */
+  void checkBatch(
+      const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+      const Eigen::Ref<const MatrixXsRowMajor>& X,
+      const Eigen::Ref<const MatrixXsRowMajor>& U) const;
+
+  /**
+   * @brief Check the dimensions of the batch of samples and of its outputs
+   *
+   * @param[in] datas  Action datas (size \f$N\f$)
+   * @param[in] X      State points \f$N\times nx\f$
+   * @param[in] U      Control inputs \f$N\times nu\f$
+   * @param[in] xnext  Next states \f$N\times nx\f$
+   * @param[in] cost   Cost values \f$N\f$
+   */
+  void checkBatch(
+      const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+      const Eigen::Ref<const MatrixXsRowMajor>& X,
+      const Eigen::Ref<const MatrixXsRowMajor>& U,
+      const Eigen::Ref<const MatrixXsRowMajor>& xnext,
+      const Eigen::Ref<const VectorXs>& cost) const;
+
   template <class Scalar>
   friend class ConstraintModelManagerTpl;
 };
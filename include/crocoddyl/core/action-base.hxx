@@ -50,6 +50,91 @@ void ActionModelAbstractTpl<Scalar>::calcDiff(
   calcDiff(data, x, unone_);
 }
 
+template <typename Scalar>
+void ActionModelAbstractTpl<Scalar>::calcBatch(
+    const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+    const Eigen::Ref<const MatrixXsRowMajor>& X,
+    const Eigen::Ref<const MatrixXsRowMajor>& U,
+    Eigen::Ref<MatrixXsRowMajor> xnext, Eigen::Ref<VectorXs> cost) {
+  checkBatch(datas, X, U, xnext, cost);
+  const std::size_t N = datas.size();
+#ifdef CROCODDYL_WITH_MULTITHREADING
+  const int nthreads = enableMultithreading() ? CROCODDYL_WITH_NTHREADS : 1;
+#pragma omp parallel for num_threads(nthreads)
+#endif
+  for (std::size_t i = 0; i < N; ++i) {
+    const boost::shared_ptr<ActionDataAbstract>& data = datas[i];
+    calc(data, X.row(i).transpose(), U.row(i).transpose());
+    xnext.row(i) = data->xnext.transpose();
+    cost[i] = data->cost;
+  }
+}
+
+template <typename Scalar>
+void ActionModelAbstractTpl<Scalar>::calcDiffBatch(
+    const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+    const Eigen::Ref<const MatrixXsRowMajor>& X,
+    const Eigen::Ref<const MatrixXsRowMajor>& U) {
+  checkBatch(datas, X, U);
+  const std::size_t N = datas.size();
+#ifdef CROCODDYL_WITH_MULTITHREADING
+  const int nthreads = enableMultithreading() ? CROCODDYL_WITH_NTHREADS : 1;
+#pragma omp parallel for num_threads(nthreads)
+#endif
+  for (std::size_t i = 0; i < N; ++i) {
+    calcDiff(datas[i], X.row(i).transpose(), U.row(i).transpose());
+  }
+}
+
+template <typename Scalar>
+void ActionModelAbstractTpl<Scalar>::checkBatch(
+    const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+    const Eigen::Ref<const MatrixXsRowMajor>& X,
+    const Eigen::Ref<const MatrixXsRowMajor>& U) const {
+  const std::size_t N = datas.size();
+  if (static_cast<std::size_t>(X.rows()) != N ||
+      static_cast<std::size_t>(X.cols()) != state_->get_nx()) {
+    throw_pretty("Invalid argument: "
+                 << "X has wrong dimension (it should be " + std::to_string(N) +
+                        "x" + std::to_string(state_->get_nx()) + ")");
+  }
+  if (static_cast<std::size_t>(U.rows()) != N ||
+      static_cast<std::size_t>(U.cols()) != nu_) {
+    throw_pretty("Invalid argument: "
+                 << "U has wrong dimension (it should be " + std::to_string(N) +
+                        "x" + std::to_string(nu_) + ")");
+  }
+  for (std::size_t i = 0; i < N; ++i) {
+    if (!datas[i]) {
+      throw_pretty("Invalid argument: "
+                   << "the data " + std::to_string(i) + " is not allocated");
+    }
+  }
+}
+
+template <typename Scalar>
+void ActionModelAbstractTpl<Scalar>::checkBatch(
+    const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+    const Eigen::Ref<const MatrixXsRowMajor>& X,
+    const Eigen::Ref<const MatrixXsRowMajor>& U,
+    const Eigen::Ref<const MatrixXsRowMajor>& xnext,
+    const Eigen::Ref<const VectorXs>& cost) const {
+  checkBatch(datas, X, U);
+  const std::size_t N = datas.size();
+  if (static_cast<std::size_t>(xnext.rows()) != N ||
+      static_cast<std::size_t>(xnext.cols()) != state_->get_nx()) {
+    throw_pretty("Invalid argument: "
+                 << "xnext has wrong dimension (it should be " +
+                        std::to_string(N) + "x" +
+                        std::to_string(state_->get_nx()) + ")");
+  }
+  if (static_cast<std::size_t>(cost.size()) != N) {
+    throw_pretty("Invalid argument: "
+                 << "cost has wrong dimension (it should be " +
+                        std::to_string(N) + ")");
+  }
+}
+
 template <typename Scalar>
 void ActionModelAbstractTpl<Scalar>::quasiStatic(
     const boost::shared_ptr<ActionDataAbstract>& data, Eigen::Ref<VectorXs> u,
@@ -170,6 +255,11 @@ bool ActionModelAbstractTpl<Scalar>::get_has_control_limits() const {
   return has_control_limits_;
 }
 
+template <typename Scalar>
+Scalar ActionModelAbstractTpl<Scalar>::get_structure_timestep() const {
+  return Scalar(0.);
+}
+
 template <typename Scalar>
 void ActionModelAbstractTpl<Scalar>::set_g_lb(const VectorXs& g_lb) {
   if (static_cast<std::size_t>(g_lb.size()) != ng_) {
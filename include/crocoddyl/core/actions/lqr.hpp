@@ -28,6 +28,7 @@ class ActionModelLQRTpl : public ActionModelAbstractTpl<_Scalar> {
   typedef MathBaseTpl<Scalar> MathBase;
   typedef typename MathBase::VectorXs VectorXs;
   typedef typename MathBase::MatrixXs MatrixXs;
+  typedef typename MathBase::MatrixXsRowMajor MatrixXsRowMajor;
 
   ActionModelLQRTpl(const std::size_t nx, const std::size_t nu,
                     const bool drift_free = true);
@@ -43,6 +44,11 @@ class ActionModelLQRTpl : public ActionModelAbstractTpl<_Scalar> {
                         const Eigen::Ref<const VectorXs>& u);
   virtual void calcDiff(const boost::shared_ptr<ActionDataAbstract>& data,
                         const Eigen::Ref<const VectorXs>& x);
+  virtual void calcBatch(
+      const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+      const Eigen::Ref<const MatrixXsRowMajor>& X,
+      const Eigen::Ref<const MatrixXsRowMajor>& U,
+      Eigen::Ref<MatrixXsRowMajor> xnext, Eigen::Ref<VectorXs> cost);
   virtual boost::shared_ptr<ActionDataAbstract> createData();
   virtual bool checkData(const boost::shared_ptr<ActionDataAbstract>& data);
 
@@ -129,6 +129,40 @@ void ActionModelLQRTpl<Scalar>::calcDiff(
   data->Lxx = Lxx_;
 }
 
+template <typename Scalar>
+void ActionModelLQRTpl<Scalar>::calcBatch(
+    const std::vector<boost::shared_ptr<ActionDataAbstract>>& datas,
+    const Eigen::Ref<const MatrixXsRowMajor>& X,
+    const Eigen::Ref<const MatrixXsRowMajor>& U,
+    Eigen::Ref<MatrixXsRowMajor> xnext, Eigen::Ref<VectorXs> cost) {
+  Base::checkBatch(datas, X, U, xnext, cost);
+  const std::size_t N = datas.size();
+
+  // Evaluate the whole batch through matrix-matrix products
+  xnext.noalias() = X * Fx_.transpose();
+  xnext.noalias() += U * Fu_.transpose();
+  if (!drift_free_) {
+    xnext.rowwise() += f0_.transpose();
+  }
+
+  // cost = 0.5 * x^T*Lxx*x + 0.5 * u^T*Luu*u + x^T*Lxu*u + lx^T*x + lu^T*u
+  MatrixXsRowMajor tmp(N, state_->get_nx());
+  tmp.noalias() = X * Lxx_.transpose();
+  cost = Scalar(0.5) * X.cwiseProduct(tmp).rowwise().sum();
+  tmp.noalias() = U * Lxu_.transpose();
+  cost += X.cwiseProduct(tmp).rowwise().sum();
+  tmp.resize(N, nu_);
+  tmp.noalias() = U * Luu_.transpose();
+  cost += Scalar(0.5) * U.cwiseProduct(tmp).rowwise().sum();
+  cost.noalias() += X * lx_;
+  cost.noalias() += U * lu_;
+
+  for (std::size_t i = 0; i < N; ++i) {
+    datas[i]->xnext = xnext.row(i).transpose();
+    datas[i]->cost = cost[i];
+  }
+}
+
 template <typename Scalar>
 boost::shared_ptr<ActionDataAbstractTpl<Scalar>>
 ActionModelLQRTpl<Scalar>::createData() {
@@ -28,6 +28,7 @@ class ActionModelUnicycleTpl : public ActionModelAbstractTpl<_Scalar> {
   typedef MathBaseTpl<Scalar> MathBase;
   typedef typename MathBase::VectorXs VectorXs;
   typedef typename MathBase::Vector2s Vector2s;
+  typedef typename MathBase::MatrixXsRowMajor MatrixXsRowMajor;
 
   ActionModelUnicycleTpl();
   virtual ~ActionModelUnicycleTpl();
@@ -42,6 +43,11 @@ class ActionModelUnicycleTpl : public ActionModelAbstractTpl<_Scalar> {
                         const Eigen::Ref<const VectorXs>& u);
   virtual void calcDiff(const boost::shared_ptr<ActionDataAbstract>& data,
                         const Eigen::Ref<const VectorXs>& x);
+  virtual void calcBatch(
+      const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+      const Eigen::Ref<const MatrixXsRowMajor>& X,
+      const Eigen::Ref<const MatrixXsRowMajor>& U,
+      Eigen::Ref<MatrixXsRowMajor> xnext, Eigen::Ref<VectorXs> cost);
   virtual boost::shared_ptr<ActionDataAbstract> createData();
   virtual bool checkData(const boost::shared_ptr<ActionDataAbstract>& data);
 
@@ -109,6 +109,35 @@ void ActionModelUnicycleTpl<Scalar>::calcDiff(
   d->Lxx.diagonal().setConstant(w_x);
 }
 
+template <typename Scalar>
+void ActionModelUnicycleTpl<Scalar>::calcBatch(
+    const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas,
+    const Eigen::Ref<const MatrixXsRowMajor>& X,
+    const Eigen::Ref<const MatrixXsRowMajor>& U,
+    Eigen::Ref<MatrixXsRowMajor> xnext, Eigen::Ref<VectorXs> cost) {
+  Base::checkBatch(datas, X, U, xnext, cost);
+  const std::size_t N = datas.size();
+
+  // Evaluate the whole batch through coefficient-wise operations
+  xnext.col(0).array() =
+      X.col(0).array() + X.col(2).array().cos() * U.col(0).array() * dt_;
+  xnext.col(1).array() =
+      X.col(1).array() + X.col(2).array().sin() * U.col(0).array() * dt_;
+  xnext.col(2).array() = X.col(2).array() + U.col(1).array() * dt_;
+  const Scalar w_x = cost_weights_[0] * cost_weights_[0];
+  const Scalar w_u = cost_weights_[1] * cost_weights_[1];
+  cost = Scalar(0.5) *
+         (w_x * X.rowwise().squaredNorm() + w_u * U.rowwise().squaredNorm());
+
+  for (std::size_t i = 0; i < N; ++i) {
+    Data* d = static_cast<Data*>(datas[i].get());
+    d->xnext = xnext.row(i).transpose();
+    d->r.template head<3>() = cost_weights_[0] * X.row(i).transpose();
+    d->r.template tail<2>() = cost_weights_[1] * U.row(i).transpose();
+    d->cost = cost[i];
+  }
+}
+
 template <typename Scalar>
 boost::shared_ptr<ActionDataAbstractTpl<Scalar> >
 ActionModelUnicycleTpl<Scalar>::createData() {
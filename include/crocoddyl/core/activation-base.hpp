@@ -20,6 +20,16 @@
 
 namespace crocoddyl {
 
+/**
+ * @brief Structure of the activation Hessian
+ *
+ * The activation Hessian \f$\mathbf{A_{rr}}\f$ is always diagonal. A
+ * `ScalarHessian` is also a multiple of the identity matrix, i.e.,
+ * \f$\mathbf{A_{rr}}=\alpha\mathbf{I}\f$, which lets the cost models skip
+ * the scaling of the residual Jacobians.
+ */
+enum ActivationHessianType { DiagonalHessian = 0, ScalarHessian };
+
 template <typename _Scalar>
 class ActivationModelAbstractTpl {
  public:
@@ -31,7 +41,10 @@ class ActivationModelAbstractTpl {
   typedef typename MathBase::VectorXs VectorXs;
   typedef typename MathBase::MatrixXs MatrixXs;
 
-  explicit ActivationModelAbstractTpl(const std::size_t nr) : nr_(nr){};
+  explicit ActivationModelAbstractTpl(
+      const std::size_t nr,
+      const ActivationHessianType hessian_type = DiagonalHessian)
+      : nr_(nr), hessian_type_(hessian_type){};
   virtual ~ActivationModelAbstractTpl(){};
 
   virtual void calc(const boost::shared_ptr<ActivationDataAbstract>& data,
@@ -45,6 +58,11 @@ class ActivationModelAbstractTpl {
 
   std::size_t get_nr() const { return nr_; };
 
+  /**
+   * @brief Return the structure of the activation Hessian
+   */
+  ActivationHessianType get_hessian_type() const { return hessian_type_; };
+
   /**
    * @brief Print information on the activation model
    */
@@ -65,6 +83,7 @@ class ActivationModelAbstractTpl {
 
  protected:
   std::size_t nr_;
+  ActivationHessianType hessian_type_;
 };
 
 template <typename _Scalar>
@@ -81,7 +100,8 @@ struct ActivationDataAbstractTpl {
   explicit ActivationDataAbstractTpl(Activation<Scalar>* const activation)
       : a_value(Scalar(0.)),
         Ar(VectorXs::Zero(activation->get_nr())),
-        Arr(DiagonalMatrixXs(activation->get_nr())) {
+        Arr(DiagonalMatrixXs(activation->get_nr())),
+        hessian_type(activation->get_hessian_type()) {
     Arr.setZero();
   }
   virtual ~ActivationDataAbstractTpl() {}
@@ -89,6 +109,7 @@ struct ActivationDataAbstractTpl {
   Scalar a_value;
   VectorXs Ar;
   DiagonalMatrixXs Arr;
+  ActivationHessianType hessian_type;
 
   static MatrixXs getHessianMatrix(
       const ActivationDataAbstractTpl<Scalar>& data) {
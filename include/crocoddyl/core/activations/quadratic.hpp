@@ -30,7 +30,8 @@ class ActivationModelQuadTpl : public ActivationModelAbstractTpl<_Scalar> {
   typedef typename MathBase::VectorXs VectorXs;
   typedef typename MathBase::MatrixXs MatrixXs;
 
-  explicit ActivationModelQuadTpl(const std::size_t nr) : Base(nr){};
+  explicit ActivationModelQuadTpl(const std::size_t nr)
+      : Base(nr, ScalarHessian){};
   virtual ~ActivationModelQuadTpl(){};
 
   virtual void calc(const boost::shared_ptr<ActivationDataAbstract>& data,
@@ -53,8 +54,7 @@ class ActivationModelQuadTpl : public ActivationModelAbstractTpl<_Scalar> {
 
     data->Ar = r;
     // The Hessian has constant values which were set in createData.
-    assert_pretty(MatrixXs(data->Arr).isApprox(MatrixXs::Identity(nr_, nr_)),
-                  "Arr has wrong value");
+    assert_pretty(data->Arr.diagonal().isOnes(), "Arr has wrong value");
   };
 
   virtual boost::shared_ptr<ActivationDataAbstract> createData() {
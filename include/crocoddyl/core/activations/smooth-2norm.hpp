@@ -54,7 +54,7 @@ class ActivationModelSmooth2NormTpl
    */
   explicit ActivationModelSmooth2NormTpl(const std::size_t nr,
                                          const Scalar eps = Scalar(1.))
-      : Base(nr), eps_(eps) {
+      : Base(nr, ScalarHessian), eps_(eps) {
     if (eps < Scalar(0.)) {
       throw_pretty("Invalid argument: "
                    << "eps should be a positive value");
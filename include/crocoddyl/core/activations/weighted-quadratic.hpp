@@ -64,7 +64,7 @@ class ActivationModelWeightedQuadTpl
     }
     // The Hessian has constant values which were set in createData.
 #ifndef NDEBUG
-    assert_pretty(MatrixXs(data->Arr).isApprox(Arr_), "Arr has wrong value");
+    assert_pretty(data->Arr.diagonal().isApprox(Arr_), "Arr has wrong value");
 #endif
   };
 
@@ -74,7 +74,7 @@ class ActivationModelWeightedQuadTpl
     data->Arr.diagonal() = weights_;
 
 #ifndef NDEBUG
-    Arr_ = data->Arr;
+    Arr_ = data->Arr.diagonal();
 #endif
 
     return data;
@@ -109,7 +109,7 @@ class ActivationModelWeightedQuadTpl
   bool new_weights_;
 
 #ifndef NDEBUG
-  MatrixXs Arr_;
+  VectorXs Arr_;
 #endif
 };
 
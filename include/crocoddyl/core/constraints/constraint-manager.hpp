@@ -43,7 +43,8 @@ struct ConstraintItemTpl {
 
   std::string name;
   boost::shared_ptr<ConstraintModelAbstract> constraint;
-  bool active;
+  bool active;  //!< Constraint status (change it with
+                //!< `changeConstraintStatus()`)
 };
 
 /**
@@ -126,6 +127,10 @@ class ConstraintModelManagerTpl {
   /**
    * @brief Change the constraint status
    *
+   * The status of the constraint items has to be changed through this
+   * function, as it rebuilds the list of active constraint items used in
+   * `calc()` and `calcDiff()`.
+   *
    * @param[in] name    Constraint name
    * @param[in] active  Constraint status (true for active and false for
    * inactive)
@@ -255,6 +260,14 @@ class ConstraintModelManagerTpl {
       std::ostream& os, const ConstraintModelManagerTpl<Scalar>& model);
 
  private:
+  /**
+   * @brief Update the list of active constraint items
+   *
+   * It is called every time a constraint item is added or removed, or when its
+   * status changes.
+   */
+  void updateActiveItems();
+
   boost::shared_ptr<StateAbstract> state_;  //!< State description
   ConstraintModelContainer constraints_;    //!< Stack of constraint items
   VectorXs lb_;                             //!< Lower bound of the constraint
@@ -266,6 +279,10 @@ class ConstraintModelManagerTpl {
   std::set<std::string>
       inactive_set_;  //!< Names of the inactive constraint items
   VectorXs unone_;    //!< No control vector
+  std::vector<boost::shared_ptr<ConstraintItem> >
+      active_items_;  //!< Active constraint items, ordered by name
+  std::vector<std::size_t>
+      active_ids_;  //!< Positions of the active constraint items in the stack
 };
 
 template <typename _Scalar>
@@ -309,6 +326,13 @@ struct ConstraintDataManagerTpl {
       constraints.insert(
           std::make_pair(item->name, item->constraint->createData(data)));
     }
+    constraint_datas.reserve(constraints.size());
+    for (typename ConstraintModelManagerTpl<
+             Scalar>::ConstraintDataContainer::const_iterator it =
+             constraints.begin();
+         it != constraints.end(); ++it) {
+      constraint_datas.push_back(it->second);
+    }
   }
 
   template <class ActionData>
@@ -423,6 +447,9 @@ struct ConstraintDataManagerTpl {
 
   typename ConstraintModelManagerTpl<Scalar>::ConstraintDataContainer
       constraints;
+  std::vector<boost::shared_ptr<ConstraintDataAbstractTpl<Scalar> > >
+      constraint_datas;  //!< Constraint datas ordered as the stack of
+                         //!< constraint items
   DataCollectorAbstract* shared;
   Eigen::Map<VectorXs> g;
   Eigen::Map<MatrixXs> Gx;
@@ -49,6 +49,7 @@ void ConstraintModelManagerTpl<Scalar>::addConstraint(
   } else if (!active) {
     inactive_set_.insert(name);
   }
+  updateActiveItems();
 }
 
 template <typename Scalar>
@@ -62,6 +63,7 @@ void ConstraintModelManagerTpl<Scalar>::removeConstraint(
     inactive_set_.erase(name);
     lb_.resize(ng_);
     ub_.resize(ng_);
+    updateActiveItems();
   } else {
     std::cout << "Warning: we couldn't remove the " << name
               << " constraint item, it doesn't exist." << std::endl;
@@ -90,12 +92,28 @@ void ConstraintModelManagerTpl<Scalar>::changeConstraintStatus(
       lb_.resize(ng_);
       ub_.resize(ng_);
     }
+    updateActiveItems();
   } else {
     std::cout << "Warning: we couldn't change the status of the " << name
               << " constraint item, it doesn't exist." << std::endl;
   }
 }
 
+template <typename Scalar>
+void ConstraintModelManagerTpl<Scalar>::updateActiveItems() {
+  active_items_.clear();
+  active_ids_.clear();
+  std::size_t i = 0;
+  for (typename ConstraintModelContainer::const_iterator it =
+           constraints_.begin();
+       it != constraints_.end(); ++it, ++i) {
+    if (it->second->active) {
+      active_items_.push_back(it->second);
+      active_ids_.push_back(i);
+    }
+  }
+}
+
 template <typename Scalar>
 void ConstraintModelManagerTpl<Scalar>::calc(
     const boost::shared_ptr<ConstraintDataManager>& data,
@@ -122,29 +140,19 @@ void ConstraintModelManagerTpl<Scalar>::calc(
   std::size_t ng_i = 0;
   std::size_t nh_i = 0;
 
-  typename ConstraintModelContainer::iterator it_m, end_m;
-  typename ConstraintDataContainer::iterator it_d, end_d;
-  for (it_m = constraints_.begin(), end_m = constraints_.end(),
-      it_d = data->constraints.begin(), end_d = data->constraints.end();
-       it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-    const boost::shared_ptr<ConstraintItem>& m_i = it_m->second;
-    if (m_i->active) {
-      const boost::shared_ptr<ConstraintDataAbstract>& d_i = it_d->second;
-      assert_pretty(
-          it_m->first == it_d->first,
-          "it doesn't match the constraint name between model and data ("
-              << it_m->first << " != " << it_d->first << ")");
-
-      m_i->constraint->calc(d_i, x, u);
-      const std::size_t ng = m_i->constraint->get_ng();
-      const std::size_t nh = m_i->constraint->get_nh();
-      data->g.segment(ng_i, ng) = d_i->g;
-      data->h.segment(nh_i, nh) = d_i->h;
-      lb_.segment(ng_i, ng) = m_i->constraint->get_lb();
-      ub_.segment(ng_i, ng) = m_i->constraint->get_ub();
-      ng_i += ng;
-      nh_i += nh;
-    }
+  for (std::size_t i = 0; i < active_items_.size(); ++i) {
+    const boost::shared_ptr<ConstraintItem>& m_i = active_items_[i];
+    const boost::shared_ptr<ConstraintDataAbstract>& d_i =
+        data->constraint_datas[active_ids_[i]];
+    m_i->constraint->calc(d_i, x, u);
+    const std::size_t ng = m_i->constraint->get_ng();
+    const std::size_t nh = m_i->constraint->get_nh();
+    data->g.segment(ng_i, ng) = d_i->g;
+    data->h.segment(nh_i, nh) = d_i->h;
+    lb_.segment(ng_i, ng) = m_i->constraint->get_lb();
+    ub_.segment(ng_i, ng) = m_i->constraint->get_ub();
+    ng_i += ng;
+    nh_i += nh;
   }
 }
 
@@ -169,29 +177,19 @@ void ConstraintModelManagerTpl<Scalar>::calc(
   std::size_t ng_i = 0;
   std::size_t nh_i = 0;
 
-  typename ConstraintModelContainer::iterator it_m, end_m;
-  typename ConstraintDataContainer::iterator it_d, end_d;
-  for (it_m = constraints_.begin(), end_m = constraints_.end(),
-      it_d = data->constraints.begin(), end_d = data->constraints.end();
-       it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-    const boost::shared_ptr<ConstraintItem>& m_i = it_m->second;
-    if (m_i->active) {
-      const boost::shared_ptr<ConstraintDataAbstract>& d_i = it_d->second;
-      assert_pretty(
-          it_m->first == it_d->first,
-          "it doesn't match the constraint name between model and data ("
-              << it_m->first << " != " << it_d->first << ")");
-
-      m_i->constraint->calc(d_i, x);
-      const std::size_t ng = m_i->constraint->get_ng();
-      const std::size_t nh = m_i->constraint->get_nh();
-      data->g.segment(ng_i, ng) = d_i->g;
-      data->h.segment(nh_i, nh) = d_i->h;
-      lb_.segment(ng_i, ng) = m_i->constraint->get_lb();
-      ub_.segment(ng_i, ng) = m_i->constraint->get_ub();
-      ng_i += ng;
-      nh_i += nh;
-    }
+  for (std::size_t i = 0; i < active_items_.size(); ++i) {
+    const boost::shared_ptr<ConstraintItem>& m_i = active_items_[i];
+    const boost::shared_ptr<ConstraintDataAbstract>& d_i =
+        data->constraint_datas[active_ids_[i]];
+    m_i->constraint->calc(d_i, x);
+    const std::size_t ng = m_i->constraint->get_ng();
+    const std::size_t nh = m_i->constraint->get_nh();
+    data->g.segment(ng_i, ng) = d_i->g;
+    data->h.segment(nh_i, nh) = d_i->h;
+    lb_.segment(ng_i, ng) = m_i->constraint->get_lb();
+    ub_.segment(ng_i, ng) = m_i->constraint->get_ub();
+    ng_i += ng;
+    nh_i += nh;
   }
 }
 
@@ -225,29 +223,19 @@ void ConstraintModelManagerTpl<Scalar>::calcDiff(
   std::size_t ng_i = 0;
   std::size_t nh_i = 0;
 
-  typename ConstraintModelContainer::iterator it_m, end_m;
-  typename ConstraintDataContainer::iterator it_d, end_d;
-  for (it_m = constraints_.begin(), end_m = constraints_.end(),
-      it_d = data->constraints.begin(), end_d = data->constraints.end();
-       it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-    const boost::shared_ptr<ConstraintItem>& m_i = it_m->second;
-    if (m_i->active) {
-      const boost::shared_ptr<ConstraintDataAbstract>& d_i = it_d->second;
-      assert_pretty(
-          it_m->first == it_d->first,
-          "it doesn't match the constraint name between model and data ("
-              << it_m->first << " != " << it_d->first << ")");
-
-      m_i->constraint->calcDiff(d_i, x, u);
-      const std::size_t ng = m_i->constraint->get_ng();
-      const std::size_t nh = m_i->constraint->get_nh();
-      data->Gx.block(ng_i, 0, ng, ndx) = d_i->Gx;
-      data->Gu.block(ng_i, 0, ng, nu_) = d_i->Gu;
-      data->Hx.block(nh_i, 0, nh, ndx) = d_i->Hx;
-      data->Hu.block(nh_i, 0, nh, nu_) = d_i->Hu;
-      ng_i += ng;
-      nh_i += nh;
-    }
+  for (std::size_t i = 0; i < active_items_.size(); ++i) {
+    const boost::shared_ptr<ConstraintItem>& m_i = active_items_[i];
+    const boost::shared_ptr<ConstraintDataAbstract>& d_i =
+        data->constraint_datas[active_ids_[i]];
+    m_i->constraint->calcDiff(d_i, x, u);
+    const std::size_t ng = m_i->constraint->get_ng();
+    const std::size_t nh = m_i->constraint->get_nh();
+    data->Gx.block(ng_i, 0, ng, ndx) = d_i->Gx;
+    data->Gu.block(ng_i, 0, ng, nu_) = d_i->Gu;
+    data->Hx.block(nh_i, 0, nh, ndx) = d_i->Hx;
+    data->Hu.block(nh_i, 0, nh, nu_) = d_i->Hu;
+    ng_i += ng;
+    nh_i += nh;
   }
 }
 
@@ -275,27 +263,17 @@ void ConstraintModelManagerTpl<Scalar>::calcDiff(
   std::size_t ng_i = 0;
   std::size_t nh_i = 0;
 
-  typename ConstraintModelContainer::iterator it_m, end_m;
-  typename ConstraintDataContainer::iterator it_d, end_d;
-  for (it_m = constraints_.begin(), end_m = constraints_.end(),
-      it_d = data->constraints.begin(), end_d = data->constraints.end();
-       it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-    const boost::shared_ptr<ConstraintItem>& m_i = it_m->second;
-    if (m_i->active) {
-      const boost::shared_ptr<ConstraintDataAbstract>& d_i = it_d->second;
-      assert_pretty(
-          it_m->first == it_d->first,
-          "it doesn't match the constraint name between model and data ("
-              << it_m->first << " != " << it_d->first << ")");
-
-      m_i->constraint->calcDiff(d_i, x);
-      const std::size_t ng = m_i->constraint->get_ng();
-      const std::size_t nh = m_i->constraint->get_nh();
-      data->Gx.block(ng_i, 0, ng, ndx) = d_i->Gx;
-      data->Hx.block(nh_i, 0, nh, ndx) = d_i->Hx;
-      ng_i += ng;
-      nh_i += nh;
-    }
+  for (std::size_t i = 0; i < active_items_.size(); ++i) {
+    const boost::shared_ptr<ConstraintItem>& m_i = active_items_[i];
+    const boost::shared_ptr<ConstraintDataAbstract>& d_i =
+        data->constraint_datas[active_ids_[i]];
+    m_i->constraint->calcDiff(d_i, x);
+    const std::size_t ng = m_i->constraint->get_ng();
+    const std::size_t nh = m_i->constraint->get_nh();
+    data->Gx.block(ng_i, 0, ng, ndx) = d_i->Gx;
+    data->Hx.block(nh_i, 0, nh, ndx) = d_i->Hx;
+    ng_i += ng;
+    nh_i += nh;
   }
 }
 
@@ -230,6 +230,19 @@ class CostModelAbstractTpl {
    */
   std::size_t get_nu() const;
 
+  /**
+   * @brief Return true if the cost derivatives only follow from its residual
+   * and activation
+   *
+   * In that case, the cost Jacobian and Hessian are the chain rule of the
+   * residual Jacobian and the activation derivatives (i.e., the Gauss-Newton
+   * approximation of `ResidualModelAbstractTpl::calcCostDiff()`), so the cost
+   * sum can stack or accumulate them blockwise. It is false by default, and
+   * derived classes that override `calcDiff()` with other derivatives must
+   * keep it false.
+   */
+  virtual bool get_residual_based() const;
+
   /**
    * @brief Print information on the cost model
    */
@@ -303,6 +316,12 @@ struct CostDataAbstractTpl {
     Lxx.setZero();
     Lxu.setZero();
     Luu.setZero();
+    // The products of the activation Hessian and the residual Jacobians are
+    // not needed for scalar Hessians
+    if (activation->hessian_type == ScalarHessian) {
+      residual->Arr_Rx.resize(0, 0);
+      residual->Arr_Ru.resize(0, 0);
+    }
   }
   virtual ~CostDataAbstractTpl() {}
 
@@ -129,6 +129,11 @@ std::size_t CostModelAbstractTpl<Scalar>::get_nu() const {
   return nu_;
 }
 
+template <typename Scalar>
+bool CostModelAbstractTpl<Scalar>::get_residual_based() const {
+  return false;
+}
+
 template <typename Scalar>
 template <class ReferenceType>
 void CostModelAbstractTpl<Scalar>::set_reference(ReferenceType ref) {
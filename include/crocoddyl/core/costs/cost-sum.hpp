@@ -68,6 +68,18 @@ struct CostItemTpl {
  * \f$\mathbf{\ell_{uu}}\in\mathbb{R}^{nu\times nu}\f$ are the Jacobians and
  * Hessians, respectively.
  *
+ * In the fused mode (see `set_fused()`), the Hessians of the residual-based
+ * costs (i.e., the ones whose `get_residual_based()` is true, such as
+ * `CostModelResidualTpl`) are not computed individually. Instead,
+ * their residual Jacobians \f$\mathbf{R}_i\f$ are stacked into a single
+ * matrix, and the Gauss-Newton approximation of the total Hessian,
+ * \f$\sum_i w_i\mathbf{R}_i^T\mathbf{A}_{rr,i}\mathbf{R}_i\f$, is computed
+ * with a single (lower-triangular) matrix product. The residual, activation
+ * and gradient data of each cost are still updated, but not their Hessians.
+ * Note that this mode ignores any custom implementation of
+ * `ResidualModelAbstractTpl::calcCostDiff()`, and that the stacked buffers
+ * are only allocated by the data created after enabling it.
+ *
  * \sa `CostModelAbstractTpl`, `calc()`, `calcDiff()`, `createData()`
  */
 template <typename _Scalar>
@@ -264,6 +276,23 @@ class CostModelSumTpl {
    */
   bool getCostStatus(const std::string& name) const;
 
+  /**
+   * @brief Return true if the Gauss-Newton Hessians of the residual-based costs
+   * are computed in the fused mode
+   */
+  bool get_fused() const;
+
+  /**
+   * @brief Modify the fused mode
+   *
+   * The data allocates the stacked Jacobians only in the fused mode, so it
+   * has to be created again after enabling it.
+   *
+   * @param[in] fused  True for computing the Gauss-Newton Hessian of the
+   * residual-based costs from their stacked Jacobians
+   */
+  void set_fused(const bool fused);
+
   /**
    * @brief Print information on the stack of costs
    */
@@ -272,6 +301,56 @@ class CostModelSumTpl {
                                   const CostModelSumTpl<Scalar>& model);
 
  private:
+  /**
+   * @brief Update the list of cost items
+   *
+   * It is called every time a cost item is added or removed.
+   */
+  void updateItems();
+
+  /**
+   * @brief Add the weighted derivatives of a cost item
+   *
+   * For residual-based costs with a sparse state Jacobian, it only adds the
+   * blocks related to the columns supported by the residual.
+   *
+   * @param[in] data      Cost-sum data
+   * @param[in] item      Cost item
+   * @param[in] cdata     Cost data
+   * @param[in] update_u  True for adding the derivatives w.r.t. the control
+   */
+  void addCostDiff(const boost::shared_ptr<CostDataSum>& data,
+                   const boost::shared_ptr<CostItem>& item,
+                   const boost::shared_ptr<CostDataAbstract>& cdata,
+                   const bool update_u);
+
+  /**
+   * @brief Stack the residual Jacobian of a residual-based cost
+   *
+   * It also computes the gradient of the cost, and stores its residual
+   * Jacobian weighted by the cost weight and activation Hessian.
+   *
+   * @param[in] data      Cost-sum data
+   * @param[in] item      Cost item
+   * @param[in] cdata     Cost data
+   * @param[in] ir        First row of the cost in the stacked Jacobians
+   * @param[in] update_u  True for stacking the Jacobian w.r.t. the control
+   */
+  void stackResidual(const boost::shared_ptr<CostDataSum>& data,
+                     const boost::shared_ptr<CostItem>& item,
+                     const boost::shared_ptr<CostDataAbstract>& cdata,
+                     const std::size_t ir, const bool update_u);
+
+  /**
+   * @brief Add the Gauss-Newton Hessian of the stacked residuals
+   *
+   * @param[in] data      Cost-sum data
+   * @param[in] nr        Number of stacked rows
+   * @param[in] update_u  True for updating the Hessians w.r.t. the control
+   */
+  void addStackedHessian(const boost::shared_ptr<CostDataSum>& data,
+                         const std::size_t nr, const bool update_u);
+
   boost::shared_ptr<StateAbstract> state_;  //!< State description
   CostModelContainer costs_;                //!< Stack of cost items
   std::size_t nu_;                          //!< Dimension of the control input
@@ -280,6 +359,9 @@ class CostModelSumTpl {
   std::set<std::string> active_set_;  //!< Names of the active set of cost items
   std::set<std::string>
       inactive_set_;  //!< Names of the inactive set of cost items
+  bool fused_;        //!< True for the fused Gauss-Newton mode
+  std::vector<boost::shared_ptr<CostItem> >
+      items_;  //!< Cost items ordered as the cost datas
 
   // Vector variants. These are to maintain the API compatibility for the
   // deprecated syntax. These will be removed in future versions along with
@@ -321,12 +403,25 @@ struct CostDataSumTpl {
     Lxx.setZero();
     Lxu.setZero();
     Luu.setZero();
+    if (model->get_fused()) {
+      // The stacked Jacobians are only needed in the fused mode
+      const std::size_t nc = model->get_state()->get_ndx() + model->get_nu();
+      Rstack = MatrixXs::Zero(model->get_nr_total(), nc);
+      Arr_Rstack = MatrixXs::Zero(model->get_nr_total(), nc);
+      Lstack = MatrixXs::Zero(nc, nc);
+    }
     for (typename CostModelSumTpl<Scalar>::CostModelContainer::const_iterator
              it = model->get_costs().begin();
          it != model->get_costs().end(); ++it) {
       const boost::shared_ptr<CostItem>& item = it->second;
       costs.insert(std::make_pair(item->name, item->cost->createData(data)));
     }
+    cost_datas.reserve(costs.size());
+    for (typename CostModelSumTpl<Scalar>::CostDataContainer::const_iterator
+             it = costs.begin();
+         it != costs.end(); ++it) {
+      cost_datas.push_back(it->second);
+    }
   }
 
   template <class ActionData>
@@ -406,6 +501,8 @@ struct CostDataSumTpl {
   MatrixXs Luu_internal;
 
   typename CostModelSumTpl<Scalar>::CostDataContainer costs;
+  std::vector<boost::shared_ptr<CostDataAbstractTpl<Scalar> > >
+      cost_datas;  //!< Cost datas ordered as the stack of cost items
   DataCollectorAbstract* shared;
   Scalar cost;
   Eigen::Map<VectorXs> Lx;
@@ -413,6 +510,10 @@ struct CostDataSumTpl {
   Eigen::Map<MatrixXs> Lxx;
   Eigen::Map<MatrixXs> Lxu;
   Eigen::Map<MatrixXs> Luu;
+  MatrixXs Rstack;      //!< Stacked residual Jacobians (fused mode)
+  MatrixXs Arr_Rstack;  //!< Stacked residual Jacobians weighted by the
+                        //!< activation Hessians (fused mode)
+  MatrixXs Lstack;      //!< Hessian of the stacked residuals (fused mode)
 };
 
 }  // namespace crocoddyl
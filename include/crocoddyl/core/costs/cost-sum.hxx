@@ -16,11 +16,15 @@ namespace crocoddyl {
 template <typename Scalar>
 CostModelSumTpl<Scalar>::CostModelSumTpl(boost::shared_ptr<StateAbstract> state,
                                          const std::size_t nu)
-    : state_(state), nu_(nu), nr_(0), nr_total_(0) {}
+    : state_(state), nu_(nu), nr_(0), nr_total_(0), fused_(false) {}
 
 template <typename Scalar>
 CostModelSumTpl<Scalar>::CostModelSumTpl(boost::shared_ptr<StateAbstract> state)
-    : state_(state), nu_(state->get_nv()), nr_(0), nr_total_(0) {}
+    : state_(state),
+      nu_(state->get_nv()),
+      nr_(0),
+      nr_total_(0),
+      fused_(false) {}
 
 template <typename Scalar>
 CostModelSumTpl<Scalar>::~CostModelSumTpl() {}
@@ -49,6 +53,7 @@ void CostModelSumTpl<Scalar>::addCost(const std::string& name,
     nr_total_ += cost->get_activation()->get_nr();
     inactive_set_.insert(name);
   }
+  updateItems();
 }
 
 template <typename Scalar>
@@ -60,6 +65,7 @@ void CostModelSumTpl<Scalar>::removeCost(const std::string& name) {
     costs_.erase(it);
     active_set_.erase(name);
     inactive_set_.erase(name);
+    updateItems();
   } else {
     std::cerr << "Warning: we couldn't remove the " << name
               << " cost item, it doesn't exist." << std::endl;
@@ -88,6 +94,16 @@ void CostModelSumTpl<Scalar>::changeCostStatus(const std::string& name,
   }
 }
 
+template <typename Scalar>
+void CostModelSumTpl<Scalar>::updateItems() {
+  items_.clear();
+  items_.reserve(costs_.size());
+  for (typename CostModelContainer::const_iterator it = costs_.begin();
+       it != costs_.end(); ++it) {
+    items_.push_back(it->second);
+  }
+}
+
 template <typename Scalar>
 void CostModelSumTpl<Scalar>::calc(const boost::shared_ptr<CostDataSum>& data,
                                    const Eigen::Ref<const VectorXs>& x,
@@ -108,18 +124,14 @@ void CostModelSumTpl<Scalar>::calc(const boost::shared_ptr<CostDataSum>& data,
   }
   data->cost = Scalar(0.);
 
-  typename CostModelContainer::iterator it_m, end_m;
-  typename CostDataContainer::iterator it_d, end_d;
-  for (it_m = costs_.begin(), end_m = costs_.end(), it_d = data->costs.begin(),
-      end_d = data->costs.end();
-       it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-    const boost::shared_ptr<CostItem>& m_i = it_m->second;
+  for (std::size_t i = 0; i < items_.size(); ++i) {
+    const boost::shared_ptr<CostItem>& m_i = items_[i];
     if (m_i->active) {
-      const boost::shared_ptr<CostDataAbstract>& d_i = it_d->second;
-      assert_pretty(it_m->first == it_d->first,
+      const boost::shared_ptr<CostDataAbstract>& d_i = data->cost_datas[i];
+      assert_pretty(data->costs.find(m_i->name) != data->costs.end() &&
+                        data->costs.find(m_i->name)->second == d_i,
                     "it doesn't match the cost name between model and data ("
-                        << it_m->first << " != " << it_d->first << ")");
-
+                        << m_i->name << ")");
       m_i->cost->calc(d_i, x, u);
       data->cost += m_i->weight * d_i->cost;
     }
@@ -140,18 +152,14 @@ void CostModelSumTpl<Scalar>::calc(const boost::shared_ptr<CostDataSum>& data,
   }
   data->cost = Scalar(0.);
 
-  typename CostModelContainer::iterator it_m, end_m;
-  typename CostDataContainer::iterator it_d, end_d;
-  for (it_m = costs_.begin(), end_m = costs_.end(), it_d = data->costs.begin(),
-      end_d = data->costs.end();
-       it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-    const boost::shared_ptr<CostItem>& m_i = it_m->second;
+  for (std::size_t i = 0; i < items_.size(); ++i) {
+    const boost::shared_ptr<CostItem>& m_i = items_[i];
     if (m_i->active) {
-      const boost::shared_ptr<CostDataAbstract>& d_i = it_d->second;
-      assert_pretty(it_m->first == it_d->first,
+      const boost::shared_ptr<CostDataAbstract>& d_i = data->cost_datas[i];
+      assert_pretty(data->costs.find(m_i->name) != data->costs.end() &&
+                        data->costs.find(m_i->name)->second == d_i,
                     "it doesn't match the cost name between model and data ("
-                        << it_m->first << " != " << it_d->first << ")");
-
+                        << m_i->name << ")");
       m_i->cost->calc(d_i, x);
       data->cost += m_i->weight * d_i->cost;
     }
@@ -176,32 +184,44 @@ void CostModelSumTpl<Scalar>::calcDiff(
     throw_pretty("Invalid argument: "
                  << "it doesn't match the number of cost datas and models");
   }
+  if (fused_ && data->Lstack.cols() == 0) {
+    throw_pretty("Invalid argument: "
+                 << "the data was created before enabling the fused mode (it "
+                    "should be created again)");
+  }
   data->Lx.setZero();
   data->Lu.setZero();
   data->Lxx.setZero();
   data->Lxu.setZero();
   data->Luu.setZero();
 
-  typename CostModelContainer::iterator it_m, end_m;
-  typename CostDataContainer::iterator it_d, end_d;
-  for (it_m = costs_.begin(), end_m = costs_.end(), it_d = data->costs.begin(),
-      end_d = data->costs.end();
-       it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-    const boost::shared_ptr<CostItem>& m_i = it_m->second;
+  std::size_t nr = 0;
+  for (std::size_t i = 0; i < items_.size(); ++i) {
+    const boost::shared_ptr<CostItem>& m_i = items_[i];
     if (m_i->active) {
-      const boost::shared_ptr<CostDataAbstract>& d_i = it_d->second;
-      assert_pretty(it_m->first == it_d->first,
+      const boost::shared_ptr<CostDataAbstract>& d_i = data->cost_datas[i];
+      assert_pretty(data->costs.find(m_i->name) != data->costs.end() &&
+                        data->costs.find(m_i->name)->second == d_i,
                     "it doesn't match the cost name between model and data ("
-                        << it_m->first << " != " << it_d->first << ")");
-
-      m_i->cost->calcDiff(d_i, x, u);
-      data->Lx += m_i->weight * d_i->Lx;
-      data->Lu += m_i->weight * d_i->Lu;
-      data->Lxx += m_i->weight * d_i->Lxx;
-      data->Lxu += m_i->weight * d_i->Lxu;
-      data->Luu += m_i->weight * d_i->Luu;
+                        << m_i->name << ")");
+      if (fused_ && m_i->cost->get_residual_based()) {
+        // Stack the residual Jacobian instead of computing the cost Hessians
+        m_i->cost->get_residual()->calcDiff(d_i->residual, x, u);
+        m_i->cost->get_activation()->calcDiff(d_i->activation,
+                                              d_i->residual->r);
+        stackResidual(data, m_i, d_i, nr, true);
+        nr += m_i->cost->get_residual()->get_nr();
+        data->Lx += m_i->weight * d_i->Lx;
+        data->Lu += m_i->weight * d_i->Lu;
+      } else {
+        m_i->cost->calcDiff(d_i, x, u);
+        addCostDiff(data, m_i, d_i, true);
+      }
     }
   }
+  if (nr != 0) {
+    addStackedHessian(data, nr, true);
+  }
 }
 
 template <typename Scalar>
@@ -217,28 +237,147 @@ void CostModelSumTpl<Scalar>::calcDiff(
     throw_pretty("Invalid argument: "
                  << "it doesn't match the number of cost datas and models");
   }
+  if (fused_ && data->Lstack.cols() == 0) {
+    throw_pretty("Invalid argument: "
+                 << "the data was created before enabling the fused mode (it "
+                    "should be created again)");
+  }
   data->Lx.setZero();
   data->Lxx.setZero();
 
-  typename CostModelContainer::iterator it_m, end_m;
-  typename CostDataContainer::iterator it_d, end_d;
-  for (it_m = costs_.begin(), end_m = costs_.end(), it_d = data->costs.begin(),
-      end_d = data->costs.end();
-       it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-    const boost::shared_ptr<CostItem>& m_i = it_m->second;
+  std::size_t nr = 0;
+  for (std::size_t i = 0; i < items_.size(); ++i) {
+    const boost::shared_ptr<CostItem>& m_i = items_[i];
     if (m_i->active) {
-      const boost::shared_ptr<CostDataAbstract>& d_i = it_d->second;
-      assert_pretty(it_m->first == it_d->first,
+      const boost::shared_ptr<CostDataAbstract>& d_i = data->cost_datas[i];
+      assert_pretty(data->costs.find(m_i->name) != data->costs.end() &&
+                        data->costs.find(m_i->name)->second == d_i,
                     "it doesn't match the cost name between model and data ("
-                        << it_m->first << " != " << it_d->first << ")");
+                        << m_i->name << ")");
+      const boost::shared_ptr<ResidualModelAbstractTpl<Scalar> >& residual =
+          m_i->cost->get_residual();
+      if (fused_ && m_i->cost->get_residual_based() &&
+          (residual->get_q_dependent() || residual->get_v_dependent())) {
+        // Stack the residual Jacobian instead of computing the cost Hessian
+        residual->calcDiff(d_i->residual, x);
+        m_i->cost->get_activation()->calcDiff(d_i->activation,
+                                              d_i->residual->r);
+        stackResidual(data, m_i, d_i, nr, false);
+        nr += residual->get_nr();
+        data->Lx += m_i->weight * d_i->Lx;
+      } else {
+        m_i->cost->calcDiff(d_i, x);
+        addCostDiff(data, m_i, d_i, false);
+      }
+    }
+  }
+  if (nr != 0) {
+    addStackedHessian(data, nr, false);
+  }
+}
 
-      m_i->cost->calcDiff(d_i, x);
-      data->Lx += m_i->weight * d_i->Lx;
-      data->Lxx += m_i->weight * d_i->Lxx;
+template <typename Scalar>
+void CostModelSumTpl<Scalar>::addCostDiff(
+    const boost::shared_ptr<CostDataSum>& data,
+    const boost::shared_ptr<CostItem>& item,
+    const boost::shared_ptr<CostDataAbstract>& cdata, const bool update_u) {
+  const Scalar w = item->weight;
+  const typename ResidualModelAbstractTpl<Scalar>::ColumnBlocks& support =
+      item->cost->get_residual()->get_x_support();
+  if (update_u) {
+    data->Lu += w * cdata->Lu;
+    data->Luu += w * cdata->Luu;
+  }
+  if (support.empty() || !item->cost->get_residual_based()) {
+    data->Lx += w * cdata->Lx;
+    data->Lxx += w * cdata->Lxx;
+    if (update_u) {
+      data->Lxu += w * cdata->Lxu;
+    }
+    return;
+  }
+  // Accumulate only the blocks related to the columns supported by the
+  // residual, as the remaining ones are always zero
+  const std::size_t nb = support.size();
+  for (std::size_t i = 0; i < nb; ++i) {
+    const std::size_t ci = support[i].first;
+    const std::size_t ni = support[i].second;
+    data->Lx.segment(ci, ni) += w * cdata->Lx.segment(ci, ni);
+    if (update_u) {
+      data->Lxu.middleRows(ci, ni) += w * cdata->Lxu.middleRows(ci, ni);
+    }
+    for (std::size_t j = 0; j < nb; ++j) {
+      const std::size_t cj = support[j].first;
+      const std::size_t nj = support[j].second;
+      data->Lxx.block(ci, cj, ni, nj) += w * cdata->Lxx.block(ci, cj, ni, nj);
     }
   }
 }
 
+template <typename Scalar>
+void CostModelSumTpl<Scalar>::stackResidual(
+    const boost::shared_ptr<CostDataSum>& data,
+    const boost::shared_ptr<CostItem>& item,
+    const boost::shared_ptr<CostDataAbstract>& cdata, const std::size_t ir,
+    const bool update_u) {
+  const boost::shared_ptr<ResidualModelAbstractTpl<Scalar> >& residual =
+      item->cost->get_residual();
+  const boost::shared_ptr<ResidualDataAbstractTpl<Scalar> >& rdata =
+      cdata->residual;
+  const boost::shared_ptr<ActivationDataAbstractTpl<Scalar> >& adata =
+      cdata->activation;
+  const std::size_t nr = residual->get_nr();
+  const std::size_t ndx = state_->get_ndx();
+  const std::size_t nv = state_->get_nv();
+  const std::size_t nc = update_u ? ndx + nu_ : ndx;
+  const bool is_rq = residual->get_q_dependent();
+  const bool is_rv = residual->get_v_dependent();
+  const bool is_ru = residual->get_u_dependent() && nu_ != 0 && update_u;
+
+  // Stack the residual Jacobian, as in ResidualModelAbstract::calcCostDiff()
+  Eigen::Block<MatrixXs> R = data->Rstack.block(ir, 0, nr, nc);
+  if (is_rq && is_rv) {
+    R.leftCols(ndx) = rdata->Rx;
+  } else {
+    R.leftCols(ndx).setZero();
+    if (is_rq) {
+      R.leftCols(nv) = rdata->Rx.leftCols(nv);
+    } else if (is_rv) {
+      R.middleCols(ndx - nv, nv) = rdata->Rx.rightCols(nv);
+    }
+  }
+  if (update_u) {
+    if (is_ru) {
+      R.rightCols(nu_) = rdata->Ru;
+    } else {
+      R.rightCols(nu_).setZero();
+    }
+    cdata->Lu.noalias() = R.rightCols(nu_).transpose() * adata->Ar;
+  }
+  cdata->Lx.noalias() = R.leftCols(ndx).transpose() * adata->Ar;
+  data->Arr_Rstack.block(ir, 0, nr, nc).noalias() =
+      (item->weight * adata->Arr.diagonal()).asDiagonal() * R;
+}
+
+template <typename Scalar>
+void CostModelSumTpl<Scalar>::addStackedHessian(
+    const boost::shared_ptr<CostDataSum>& data, const std::size_t nr,
+    const bool update_u) {
+  const std::size_t ndx = state_->get_ndx();
+  const std::size_t nc = update_u ? ndx + nu_ : ndx;
+  Eigen::Block<MatrixXs> L = data->Lstack.topLeftCorner(nc, nc);
+  // Compute the lower-triangular part only, as the Hessian is symmetric
+  L.template triangularView<Eigen::Lower>() =
+      data->Rstack.topLeftCorner(nr, nc).transpose() *
+      data->Arr_Rstack.topLeftCorner(nr, nc);
+  L.template triangularView<Eigen::StrictlyUpper>() = L.transpose();
+  data->Lxx += L.topLeftCorner(ndx, ndx);
+  if (update_u) {
+    data->Lxu += L.topRightCorner(ndx, nu_);
+    data->Luu += L.bottomRightCorner(nu_, nu_);
+  }
+}
+
 template <typename Scalar>
 boost::shared_ptr<CostDataSumTpl<Scalar> > CostModelSumTpl<Scalar>::createData(
     DataCollectorAbstract* const data) {
@@ -295,6 +434,16 @@ bool CostModelSumTpl<Scalar>::getCostStatus(const std::string& name) const {
   }
 }
 
+template <typename Scalar>
+bool CostModelSumTpl<Scalar>::get_fused() const {
+  return fused_;
+}
+
+template <typename Scalar>
+void CostModelSumTpl<Scalar>::set_fused(const bool fused) {
+  fused_ = fused;
+}
+
 template <typename Scalar>
 std::ostream& operator<<(std::ostream& os,
                          const CostModelSumTpl<Scalar>& model) {
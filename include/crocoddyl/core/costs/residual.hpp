@@ -128,6 +128,12 @@ class CostModelResidualTpl : public CostModelAbstractTpl<_Scalar> {
   virtual boost::shared_ptr<CostDataAbstract> createData(
       DataCollectorAbstract* const data);
 
+  /**
+   * @brief Return true, as the derivatives of the residual cost only follow
+   * from its residual and activation
+   */
+  virtual bool get_residual_based() const;
+
   /**
    * @brief Print relevant information of the cost-residual model
    *
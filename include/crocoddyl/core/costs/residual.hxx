@@ -100,6 +100,11 @@ CostModelResidualTpl<Scalar>::createData(DataCollectorAbstract* const data) {
                                       data);
 }
 
+template <typename Scalar>
+bool CostModelResidualTpl<Scalar>::get_residual_based() const {
+  return true;
+}
+
 template <typename Scalar>
 void CostModelResidualTpl<Scalar>::print(std::ostream& os) const {
   os << "CostModelResidual {" << *residual_ << ", " << *activation_ << "}";
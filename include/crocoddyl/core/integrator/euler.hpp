@@ -163,6 +163,29 @@ class IntegratedActionModelEulerTpl
                            const std::size_t maxiter = 100,
                            const Scalar tol = Scalar(1e-9));
 
+  /**
+   * @brief Return the time step if the Euler block structure is declared,
+   * and zero otherwise
+   */
+  virtual Scalar get_structure_timestep() const;
+
+  /**
+   * @brief Return true if the Euler block structure of the Jacobians is
+   * declared
+   */
+  bool get_euler_structure() const;
+
+  /**
+   * @brief Declare the Euler block structure of the Jacobians
+   *
+   * It holds when the state integration is Euclidean (e.g., `StateVector` or
+   * a fixed-base multibody without unbounded or spherical joints), since
+   * `Jintegrate` is the identity. It is disabled by default.
+   *
+   * @param[in] euler_structure  true for declaring the structure
+   */
+  void set_euler_structure(const bool euler_structure);
+
   /**
    * @brief Print relevant information of the Euler integrator model
    *
@@ -181,6 +204,9 @@ class IntegratedActionModelEulerTpl
   using Base::time_step_;     //!< Time step used for integration
   using Base::with_cost_residual_;  //!< Flag indicating whether a cost residual
                                     //!< is used
+
+ private:
+  bool euler_structure_;  //!< True if the Euler block structure is declared
 };
 
 template <typename _Scalar>
@@ -21,13 +21,14 @@ IntegratedActionModelEulerTpl<Scalar>::IntegratedActionModelEulerTpl(
     boost::shared_ptr<DifferentialActionModelAbstract> model,
     boost::shared_ptr<ControlParametrizationModelAbstract> control,
     const Scalar time_step, const bool with_cost_residual)
-    : Base(model, control, time_step, with_cost_residual) {}
+    : Base(model, control, time_step, with_cost_residual),
+      euler_structure_(false) {}
 
 template <typename Scalar>
 IntegratedActionModelEulerTpl<Scalar>::IntegratedActionModelEulerTpl(
     boost::shared_ptr<DifferentialActionModelAbstract> model,
     const Scalar time_step, const bool with_cost_residual)
-    : Base(model, time_step, with_cost_residual) {}
+    : Base(model, time_step, with_cost_residual), euler_structure_(false) {}
 
 template <typename Scalar>
 IntegratedActionModelEulerTpl<Scalar>::~IntegratedActionModelEulerTpl() {}
@@ -200,6 +201,27 @@ void IntegratedActionModelEulerTpl<Scalar>::quasiStatic(
   u = d->control->u;
 }
 
+template <typename Scalar>
+Scalar IntegratedActionModelEulerTpl<Scalar>::get_structure_timestep() const {
+  return euler_structure_ ? time_step_ : Scalar(0.);
+}
+
+template <typename Scalar>
+bool IntegratedActionModelEulerTpl<Scalar>::get_euler_structure() const {
+  return euler_structure_;
+}
+
+template <typename Scalar>
+void IntegratedActionModelEulerTpl<Scalar>::set_euler_structure(
+    const bool euler_structure) {
+  if (euler_structure && state_->get_nq() != state_->get_nv()) {
+    throw_pretty("Invalid argument: "
+                 << "the Euler structure requires a Euclidean state (nq "
+                    "should be equal to nv)");
+  }
+  euler_structure_ = euler_structure;
+}
+
 template <typename Scalar>
 void IntegratedActionModelEulerTpl<Scalar>::print(std::ostream& os) const {
   os << "IntegratedActionModelEuler {dt=" << time_step_ << ", "
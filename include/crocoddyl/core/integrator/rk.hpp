@@ -48,8 +48,12 @@ class IntegratedActionModelRKTpl
   typedef ActionDataAbstractTpl<Scalar> ActionDataAbstract;
   typedef DifferentialActionModelAbstractTpl<Scalar>
       DifferentialActionModelAbstract;
+  typedef DifferentialActionDataAbstractTpl<Scalar>
+      DifferentialActionDataAbstract;
   typedef ControlParametrizationModelAbstractTpl<Scalar>
       ControlParametrizationModelAbstract;
+  typedef ControlParametrizationDataAbstractTpl<Scalar>
+      ControlParametrizationDataAbstract;
   typedef typename MathBase::VectorXs VectorXs;
   typedef typename MathBase::MatrixXs MatrixXs;
 
@@ -98,10 +98,10 @@ void CostModelNumDiffTpl<Scalar>::calcDiff(
   }
 
   if (get_with_gauss_approx()) {
-    const MatrixXs& Arr = d->data_0->activation->Arr;
-    d->Lxx = d->residual->Rx.transpose() * Arr * d->residual->Rx;
-    d->Lxu = d->residual->Rx.transpose() * Arr * d->residual->Ru;
-    d->Luu = d->residual->Ru.transpose() * Arr * d->residual->Ru;
+    const VectorXs& Arr = d->data_0->activation->Arr.diagonal();
+    d->Lxx = d->residual->Rx.transpose() * Arr.asDiagonal() * d->residual->Rx;
+    d->Lxu = d->residual->Rx.transpose() * Arr.asDiagonal() * d->residual->Ru;
+    d->Luu = d->residual->Ru.transpose() * Arr.asDiagonal() * d->residual->Ru;
   } else {
     d->Lxx.fill(0.0);
     d->Lxu.fill(0.0);
@@ -143,8 +143,8 @@ void CostModelNumDiffTpl<Scalar>::calcDiff(
   }
 
   if (get_with_gauss_approx()) {
-    const MatrixXs& Arr = d->data_0->activation->Arr;
-    d->Lxx = d->residual->Rx.transpose() * Arr * d->residual->Rx;
+    const VectorXs& Arr = d->data_0->activation->Arr.diagonal();
+    d->Lxx = d->residual->Rx.transpose() * Arr.asDiagonal() * d->residual->Rx;
   } else {
     d->Lxx.fill(0.0);
   }
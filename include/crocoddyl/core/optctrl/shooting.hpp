@@ -19,6 +19,27 @@
 
 namespace crocoddyl {
 
+/**
+ * @brief Policy used for distributing the nodes among the threads
+ *
+ * The static policy splits the nodes in equal chunks, and it has the lowest
+ * overhead when all nodes have a similar computational cost. Instead, the
+ * dynamic and guided policies assign the chunks on demand, which balances the
+ * load when the nodes have different costs (e.g., contact and impulse nodes).
+ * Finally, the balanced policy measures the computation time of each node, and
+ * it partitions the nodes among the threads with the longest-processing-time-
+ * first rule. It balances the load without the on-demand overhead, which is
+ * convenient when the node costs are stable across iterations. Indeed, the
+ * partition is only recomputed when the measured times drift by more than 20%
+ * from the ones used for computing it.
+ */
+enum ParallelSchedule {
+  StaticSchedule = 0,
+  DynamicSchedule,
+  GuidedSchedule,
+  BalancedSchedule
+};
+
 /**
  * @brief This class encapsulates a shooting problem
  *
@@ -193,6 +214,23 @@ class ShootingProblemTpl {
   void updateModel(const std::size_t i,
                    boost::shared_ptr<ActionModelAbstract> model);
 
+  /**
+   * @brief Swap the running and terminal data with external ones
+   *
+   * It is used to adopt data computed outside the shooting problem (e.g.,
+   * by a line-search trial) without evaluating the nodes again. The input
+   * data must be created by the running and terminal models of this problem,
+   * which remain unchanged. The data previously stored in the problem are
+   * returned in the input arguments, and the total cost is updated from the
+   * swapped data.
+   *
+   * @param[in,out] running_datas  running action data
+   * @param[in,out] terminal_data  terminal action data
+   */
+  void swapDatas(
+      std::vector<boost::shared_ptr<ActionDataAbstract> >& running_datas,
+      boost::shared_ptr<ActionDataAbstract>& terminal_data);
+
   /**
    * @brief Return the number of running nodes
    */
@@ -249,6 +287,18 @@ class ShootingProblemTpl {
    */
   void set_nthreads(const int nthreads);
 
+  /**
+   * @brief Modify the policy used for distributing the nodes among the threads
+   */
+  void set_schedule(const ParallelSchedule schedule);
+
+  /**
+   * @brief Modify the number of nodes per chunk used by the scheduling policy
+   *
+   * For a zero value, it uses the default value of the scheduling policy.
+   */
+  void set_chunksize(const std::size_t chunksize);
+
   /**
    * @brief Return the dimension of the state tuple
    */
@@ -270,6 +320,36 @@ class ShootingProblemTpl {
    */
   std::size_t get_nthreads() const;
 
+  /**
+   * @brief Return the policy used for distributing the nodes among the threads
+   */
+  ParallelSchedule get_schedule() const;
+
+  /**
+   * @brief Return the number of nodes per chunk used by the scheduling policy
+   */
+  std::size_t get_chunksize() const;
+
+  /**
+   * @brief Return the smoothed computation time (in milliseconds) of `calc`
+   * for each node
+   *
+   * The last element corresponds to the terminal node. The times are only
+   * measured under the `BalancedSchedule` policy, and unmeasured nodes have
+   * zero time.
+   */
+  const Eigen::VectorXd& get_calc_timings() const;
+
+  /**
+   * @brief Return the smoothed computation time (in milliseconds) of
+   * `calcDiff` for each node
+   *
+   * The last element corresponds to the terminal node. The times are only
+   * measured under the `BalancedSchedule` policy, and unmeasured nodes have
+   * zero time.
+   */
+  const Eigen::VectorXd& get_calcDiff_timings() const;
+
   /**
    * @brief Return only once true is the shooting problem has been changed,
    * otherwise false
@@ -301,9 +381,34 @@ class ShootingProblemTpl {
   std::size_t nthreads_;  //!< Number of threads launch by the multi-threading
                           //!< application
   bool is_updated_;
+  ParallelSchedule schedule_;     //!< Policy used for distributing the nodes
+  std::size_t chunksize_;         //!< Number of nodes per chunk
+  Eigen::VectorXd calc_timings_;  //!< Computation time of `calc` per node
+  Eigen::VectorXd calcDiff_timings_;  //!< Computation time of `calcDiff` per
+                                      //!< node
 
  private:
   void allocateData();
+  void runBalanced(const std::vector<VectorXs>& xs,
+                   const std::vector<VectorXs>& us, const bool diff);
+  void partitionNodes(const Eigen::VectorXd& timings,
+                      std::vector<std::vector<std::size_t> >& partition,
+                      Eigen::VectorXd& partition_timings);
+  void resetTimings();
+  void resetTimings(const std::size_t i);
+
+  std::vector<std::vector<std::size_t> >
+      calc_partition_;  //!< Nodes assigned to each thread in `calc`
+  std::vector<std::vector<std::size_t> >
+      calcDiff_partition_;  //!< Nodes assigned to each thread in `calcDiff`
+  Eigen::VectorXd calc_partition_timings_;      //!< Computation times used for
+                                                //!< the `calc` partition
+  Eigen::VectorXd calcDiff_partition_timings_;  //!< Computation times used
+                                                //!< for the `calcDiff`
+                                                //!< partition
+  std::vector<std::size_t> nodes_;  //!< Nodes sorted by computation time
+  std::vector<double> loads_;       //!< Computation time assigned to each
+                                    //!< thread
 };
 
 }  // namespace crocoddyl
@@ -7,14 +7,53 @@
 // All rights reserved.
 ///////////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
 #include <iostream>
+#include <limits>
 #ifdef CROCODDYL_WITH_MULTITHREADING
 #include <omp.h>
 #endif  // CROCODDYL_WITH_MULTITHREADING
 #include "crocoddyl/core/utils/stop-watch.hpp"
+#include "crocoddyl/core/utils/timer.hpp"
 
 namespace crocoddyl {
 
+#ifdef CROCODDYL_WITH_MULTITHREADING
+/**
+ * @brief Scope that defines the runtime schedule of the OpenMP loops
+ *
+ * The runtime schedule is shared by every `schedule(runtime)` loop launched
+ * from the calling thread, including the ones of the host program. Therefore,
+ * the previous schedule is restored when leaving the scope.
+ */
+class ScopedRuntimeSchedule {
+ public:
+  ScopedRuntimeSchedule(const ParallelSchedule schedule,
+                        const std::size_t chunksize) {
+    omp_get_schedule(&kind_, &chunksize_);
+    omp_sched_t kind = omp_sched_static;
+    switch (schedule) {
+      case DynamicSchedule:
+        kind = omp_sched_dynamic;
+        break;
+      case GuidedSchedule:
+        kind = omp_sched_guided;
+        break;
+      default:
+        // The balanced policy only affects calc and calcDiff, the other loops
+        // are statically distributed
+        break;
+    }
+    omp_set_schedule(kind, static_cast<int>(chunksize));
+  }
+  ~ScopedRuntimeSchedule() { omp_set_schedule(kind_, chunksize_); }
+
+ private:
+  omp_sched_t kind_;  //!< Previous runtime schedule
+  int chunksize_;     //!< Previous chunk size
+};
+#endif  // CROCODDYL_WITH_MULTITHREADING
+
 template <typename Scalar>
 ShootingProblemTpl<Scalar>::ShootingProblemTpl(
     const VectorXs& x0,
@@ -29,7 +68,11 @@ ShootingProblemTpl<Scalar>::ShootingProblemTpl(
       ndx_(running_models[0]->get_state()->get_ndx()),
       nu_max_(running_models[0]->get_nu()),
       nthreads_(1),
-      is_updated_(false) {
+      is_updated_(false),
+      schedule_(StaticSchedule),
+      chunksize_(0),
+      calc_timings_(Eigen::VectorXd::Zero(T_ + 1)),
+      calcDiff_timings_(Eigen::VectorXd::Zero(T_ + 1)) {
   for (std::size_t i = 1; i < T_; ++i) {
     const boost::shared_ptr<ActionModelAbstract>& model = running_models_[i];
     const std::size_t nu = model->get_nu();
@@ -91,7 +134,12 @@ ShootingProblemTpl<Scalar>::ShootingProblemTpl(
       nx_(running_models[0]->get_state()->get_nx()),
       ndx_(running_models[0]->get_state()->get_ndx()),
       nu_max_(running_models[0]->get_nu()),
-      nthreads_(1) {
+      nthreads_(1),
+      is_updated_(false),
+      schedule_(StaticSchedule),
+      chunksize_(0),
+      calc_timings_(Eigen::VectorXd::Zero(T_ + 1)),
+      calcDiff_timings_(Eigen::VectorXd::Zero(T_ + 1)) {
   for (std::size_t i = 1; i < T_; ++i) {
     const boost::shared_ptr<ActionModelAbstract>& model = running_models_[i];
     const std::size_t nu = model->get_nu();
@@ -155,7 +203,13 @@ ShootingProblemTpl<Scalar>::ShootingProblemTpl(
       running_datas_(problem.get_runningDatas()),
       nx_(problem.get_nx()),
       ndx_(problem.get_ndx()),
-      nu_max_(problem.get_nu_max()) {}
+      nu_max_(problem.get_nu_max()),
+      nthreads_(problem.nthreads_),
+      is_updated_(false),
+      schedule_(problem.get_schedule()),
+      chunksize_(problem.get_chunksize()),
+      calc_timings_(problem.get_calc_timings()),
+      calcDiff_timings_(problem.get_calcDiff_timings()) {}
 
 template <typename Scalar>
 ShootingProblemTpl<Scalar>::~ShootingProblemTpl() {}
@@ -175,13 +229,23 @@ Scalar ShootingProblemTpl<Scalar>::calc(const std::vector<VectorXs>& xs,
   }
   START_PROFILER("ShootingProblem::calc");
 
+  // The terminal node is evaluated inside the parallel loop, so it does not
+  // wait for the running nodes
+  if (schedule_ == BalancedSchedule) {
+    runBalanced(xs, us, false);
+  } else {
 #ifdef CROCODDYL_WITH_MULTITHREADING
-#pragma omp parallel for num_threads(nthreads_)
+    ScopedRuntimeSchedule runtime_schedule(schedule_, chunksize_);
+#pragma omp parallel for num_threads(nthreads_) schedule(runtime)
 #endif
-  for (std::size_t i = 0; i < T_; ++i) {
-    running_models_[i]->calc(running_datas_[i], xs[i], us[i]);
+    for (std::size_t i = 0; i < T_ + 1; ++i) {
+      if (i < T_) {
+        running_models_[i]->calc(running_datas_[i], xs[i], us[i]);
+      } else {
+        terminal_model_->calc(terminal_data_, xs.back());
+      }
+    }
   }
-  terminal_model_->calc(terminal_data_, xs.back());
 
   cost_ = Scalar(0.);
 #ifdef CROCODDYL_WITH_MULTITHREADING
@@ -210,13 +274,23 @@ Scalar ShootingProblemTpl<Scalar>::calcDiff(const std::vector<VectorXs>& xs,
   }
   START_PROFILER("ShootingProblem::calcDiff");
 
+  // The terminal node is evaluated inside the parallel loop, so it does not
+  // wait for the running nodes
+  if (schedule_ == BalancedSchedule) {
+    runBalanced(xs, us, true);
+  } else {
 #ifdef CROCODDYL_WITH_MULTITHREADING
-#pragma omp parallel for num_threads(nthreads_)
+    ScopedRuntimeSchedule runtime_schedule(schedule_, chunksize_);
+#pragma omp parallel for num_threads(nthreads_) schedule(runtime)
 #endif
-  for (std::size_t i = 0; i < T_; ++i) {
-    running_models_[i]->calcDiff(running_datas_[i], xs[i], us[i]);
+    for (std::size_t i = 0; i < T_ + 1; ++i) {
+      if (i < T_) {
+        running_models_[i]->calcDiff(running_datas_[i], xs[i], us[i]);
+      } else {
+        terminal_model_->calcDiff(terminal_data_, xs.back());
+      }
+    }
   }
-  terminal_model_->calcDiff(terminal_data_, xs.back());
 
   cost_ = Scalar(0.);
 #ifdef CROCODDYL_WITH_MULTITHREADING
@@ -280,7 +354,8 @@ void ShootingProblemTpl<Scalar>::quasiStatic(std::vector<VectorXs>& us,
   }
 
 #ifdef CROCODDYL_WITH_MULTITHREADING
-#pragma omp parallel for num_threads(nthreads_)
+  ScopedRuntimeSchedule runtime_schedule(schedule_, chunksize_);
+#pragma omp parallel for num_threads(nthreads_) schedule(runtime)
 #endif
   for (std::size_t i = 0; i < T_; ++i) {
     running_models_[i]->quasiStatic(running_datas_[i], us[i], xs[i]);
@@ -319,7 +394,10 @@ void ShootingProblemTpl<Scalar>::circularAppend(
   for (std::size_t i = 0; i < T_ - 1; ++i) {
     running_models_[i] = running_models_[i + 1];
     running_datas_[i] = running_datas_[i + 1];
+    calc_timings_[i] = calc_timings_[i + 1];
+    calcDiff_timings_[i] = calcDiff_timings_[i + 1];
   }
+  resetTimings(T_ - 1);
   running_models_.back() = model;
   running_datas_.back() = data;
 }
@@ -339,7 +417,10 @@ void ShootingProblemTpl<Scalar>::circularAppend(
   for (std::size_t i = 0; i < T_ - 1; ++i) {
     running_models_[i] = running_models_[i + 1];
     running_datas_[i] = running_datas_[i + 1];
+    calc_timings_[i] = calc_timings_[i + 1];
+    calcDiff_timings_[i] = calcDiff_timings_[i + 1];
   }
+  resetTimings(T_ - 1);
   running_models_.back() = model;
   running_datas_.back() = model->createData();
 }
@@ -367,6 +448,7 @@ void ShootingProblemTpl<Scalar>::updateNode(
                  << "ndx node is not consistent with the other nodes")
   }
   is_updated_ = true;
+  resetTimings(i);
   if (i == T_) {
     terminal_model_ = model;
     terminal_data_ = data;
@@ -394,6 +476,7 @@ void ShootingProblemTpl<Scalar>::updateModel(
                  << "ndx is not consistent with the other nodes")
   }
   is_updated_ = true;
+  resetTimings(i);
   if (i == T_) {
     terminal_model_ = model;
     terminal_data_ = terminal_model_->createData();
@@ -403,6 +486,24 @@ void ShootingProblemTpl<Scalar>::updateModel(
   }
 }
 
+template <typename Scalar>
+void ShootingProblemTpl<Scalar>::swapDatas(
+    std::vector<boost::shared_ptr<ActionDataAbstract> >& running_datas,
+    boost::shared_ptr<ActionDataAbstract>& terminal_data) {
+  if (running_datas.size() != T_) {
+    throw_pretty("Invalid argument: "
+                 << "running_datas has wrong dimension (it should be " +
+                        std::to_string(T_) + ")");
+  }
+  running_datas_.swap(running_datas);
+  terminal_data_.swap(terminal_data);
+  cost_ = Scalar(0.);
+  for (std::size_t i = 0; i < T_; ++i) {
+    cost_ += running_datas_[i]->cost;
+  }
+  cost_ += terminal_data_->cost;
+}
+
 template <typename Scalar>
 std::size_t ShootingProblemTpl<Scalar>::get_T() const {
   return T_;
@@ -424,6 +525,123 @@ void ShootingProblemTpl<Scalar>::allocateData() {
   terminal_data_ = terminal_model_->createData();
 }
 
+template <typename Scalar>
+void ShootingProblemTpl<Scalar>::runBalanced(const std::vector<VectorXs>& xs,
+                                             const std::vector<VectorXs>& us,
+                                             const bool diff) {
+  // Weight of the last measurement in the smoothed computation time
+  const double alpha = 0.2;
+  Eigen::VectorXd& timings = diff ? calcDiff_timings_ : calc_timings_;
+  std::vector<std::vector<std::size_t> >& partition =
+      diff ? calcDiff_partition_ : calc_partition_;
+  partitionNodes(timings, partition,
+                 diff ? calcDiff_partition_timings_ : calc_partition_timings_);
+  const std::size_t nparts = partition.size();
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#pragma omp parallel num_threads(nthreads_)
+#endif
+  {
+#ifdef CROCODDYL_WITH_MULTITHREADING
+    // The runtime might provide fewer threads than requested, in which case
+    // a thread processes more than one partition
+    const std::size_t tid = static_cast<std::size_t>(omp_get_thread_num());
+    const std::size_t nteam = static_cast<std::size_t>(omp_get_num_threads());
+#else
+    const std::size_t tid = 0;
+    const std::size_t nteam = 1;
+#endif
+    Timer timer;
+    for (std::size_t p = tid; p < nparts; p += nteam) {
+      const std::vector<std::size_t>& nodes = partition[p];
+      for (std::size_t k = 0; k < nodes.size(); ++k) {
+        const std::size_t i = nodes[k];
+        timer.reset();
+        if (i < T_) {
+          if (diff) {
+            running_models_[i]->calcDiff(running_datas_[i], xs[i], us[i]);
+          } else {
+            running_models_[i]->calc(running_datas_[i], xs[i], us[i]);
+          }
+        } else {
+          if (diff) {
+            terminal_model_->calcDiff(terminal_data_, xs.back());
+          } else {
+            terminal_model_->calc(terminal_data_, xs.back());
+          }
+        }
+        const double time = timer.get_duration();
+        if (timings[i] == 0.) {
+          timings[i] = time;
+        } else {
+          timings[i] += alpha * (time - timings[i]);
+        }
+      }
+    }
+  }
+}
+
+template <typename Scalar>
+void ShootingProblemTpl<Scalar>::partitionNodes(
+    const Eigen::VectorXd& timings,
+    std::vector<std::vector<std::size_t> >& partition,
+    Eigen::VectorXd& partition_timings) {
+  // Relative drift of the computation times that triggers a new partition
+  const double th_drift = 0.2;
+  const std::size_t N = T_ + 1;
+  const std::size_t nparts = std::min(nthreads_, N);
+  // The partition is kept while the computation times remain close to the
+  // ones used for computing it, as sorting the nodes is not free
+  if (partition.size() == nparts &&
+      static_cast<std::size_t>(partition_timings.size()) == N &&
+      (timings - partition_timings).lpNorm<1>() <=
+          th_drift * partition_timings.sum()) {
+    return;
+  }
+  // Longest-processing-time-first rule: the nodes are sorted by decreasing
+  // computation time, and each of them is assigned to the least loaded thread.
+  // Unmeasured nodes have a negligible time, so they are assigned in a
+  // round-robin fashion.
+  const double eps = std::numeric_limits<double>::epsilon();
+  nodes_.resize(N);
+  for (std::size_t i = 0; i < N; ++i) {
+    nodes_[i] = i;
+  }
+  std::sort(nodes_.begin(), nodes_.end(),
+            [&timings](const std::size_t a, const std::size_t b) {
+              return timings[a] > timings[b] ||
+                     (timings[a] == timings[b] && a < b);
+            });
+  partition.resize(nparts);
+  loads_.assign(nparts, 0.);
+  for (std::size_t p = 0; p < nparts; ++p) {
+    partition[p].clear();
+  }
+  for (std::size_t k = 0; k < N; ++k) {
+    const std::size_t i = nodes_[k];
+    const std::size_t p = static_cast<std::size_t>(
+        std::min_element(loads_.begin(), loads_.end()) - loads_.begin());
+    partition[p].push_back(i);
+    loads_[p] += timings[i] + eps;
+  }
+  partition_timings = timings;
+}
+
+template <typename Scalar>
+void ShootingProblemTpl<Scalar>::resetTimings() {
+  calc_timings_.setZero(T_ + 1);
+  calcDiff_timings_.setZero(T_ + 1);
+  calc_partition_.clear();
+  calcDiff_partition_.clear();
+}
+
+template <typename Scalar>
+void ShootingProblemTpl<Scalar>::resetTimings(const std::size_t i) {
+  calc_timings_[i] = 0.;
+  calcDiff_timings_[i] = 0.;
+  calc_partition_.clear();
+  calcDiff_partition_.clear();
+}
+
 template <typename Scalar>
 const std::vector<
     boost::shared_ptr<crocoddyl::ActionModelAbstractTpl<Scalar> > >&
@@ -478,6 +696,7 @@ void ShootingProblemTpl<Scalar>::set_runningModels(
   }
   is_updated_ = true;
   T_ = models.size();
+  resetTimings();
   running_models_.clear();
   running_datas_.clear();
   for (std::size_t i = 0; i < T_; ++i) {
@@ -498,6 +717,7 @@ void ShootingProblemTpl<Scalar>::set_terminalModel(
                  << "ndx is not consistent with the other nodes")
   }
   is_updated_ = true;
+  resetTimings(T_);
   terminal_model_ = model;
   terminal_data_ = terminal_model_->createData();
 }
@@ -526,6 +746,16 @@ void ShootingProblemTpl<Scalar>::set_nthreads(const int nthreads) {
 #endif
 }
 
+template <typename Scalar>
+void ShootingProblemTpl<Scalar>::set_schedule(const ParallelSchedule schedule) {
+  schedule_ = schedule;
+}
+
+template <typename Scalar>
+void ShootingProblemTpl<Scalar>::set_chunksize(const std::size_t chunksize) {
+  chunksize_ = chunksize;
+}
+
 template <typename Scalar>
 std::size_t ShootingProblemTpl<Scalar>::get_nx() const {
   return nx_;
@@ -552,6 +782,27 @@ std::size_t ShootingProblemTpl<Scalar>::get_nthreads() const {
   return nthreads_;
 }
 
+template <typename Scalar>
+const Eigen::VectorXd& ShootingProblemTpl<Scalar>::get_calc_timings() const {
+  return calc_timings_;
+}
+
+template <typename Scalar>
+const Eigen::VectorXd& ShootingProblemTpl<Scalar>::get_calcDiff_timings()
+    const {
+  return calcDiff_timings_;
+}
+
+template <typename Scalar>
+ParallelSchedule ShootingProblemTpl<Scalar>::get_schedule() const {
+  return schedule_;
+}
+
+template <typename Scalar>
+std::size_t ShootingProblemTpl<Scalar>::get_chunksize() const {
+  return chunksize_;
+}
+
 template <typename Scalar>
 bool ShootingProblemTpl<Scalar>::is_updated() {
   const bool status = is_updated_;
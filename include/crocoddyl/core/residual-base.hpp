@@ -11,6 +11,8 @@
 
 #include <boost/make_shared.hpp>
 #include <boost/shared_ptr.hpp>
+#include <utility>
+#include <vector>
 
 #include "crocoddyl/core/activation-base.hpp"
 #include "crocoddyl/core/cost-base.hpp"
@@ -38,6 +40,11 @@ namespace crocoddyl {
  * `calcDiff()` computes the Jacobians using the latest stored values by
  * `calc()`. Thus, we need to first run `calc()`.
  *
+ * A residual model can also declare the columns of its state Jacobian
+ * \f$\mathbf{r_x}\f$ that might be nonzero (see `set_x_support()`), e.g., the
+ * joints that support a frame. In that case, `calcCostDiff()` only computes
+ * the blocks of the cost derivatives related to these columns.
+ *
  * \sa `StateAbstractTpl`, `calc()`, `calcDiff()`, `createData()`
  */
 template <typename _Scalar>
@@ -55,6 +62,7 @@ class ResidualModelAbstractTpl {
   typedef typename MathBase::VectorXs VectorXs;
   typedef typename MathBase::MatrixXs MatrixXs;
   typedef typename MathBase::DiagonalMatrixXs DiagonalMatrixXs;
+  typedef std::vector<std::pair<std::size_t, std::size_t> > ColumnBlocks;
 
   /**
    * @brief Initialize the residual model
@@ -207,6 +215,15 @@ class ResidualModelAbstractTpl {
    */
   bool get_u_dependent() const;
 
+  /**
+   * @brief Return the blocks of columns of \f$\mathbf{r_x}\f$ that might be
+   * nonzero
+   *
+   * Each block is described by its first column and number of columns. An
+   * empty list means that the Jacobian is dense.
+   */
+  const ColumnBlocks& get_x_support() const;
+
   /**
    * @brief Print information on the residual model
    */
@@ -222,6 +239,18 @@ class ResidualModelAbstractTpl {
   virtual void print(std::ostream& os) const;
 
  protected:
+  /**
+   * @brief Modify the columns of \f$\mathbf{r_x}\f$ that might be nonzero
+   *
+   * The columns are grouped into contiguous blocks. The derived classes should
+   * call this function in their constructors if their Jacobians are sparse.
+   * The support can be modified later, e.g., when the frame of a residual
+   * changes, as `calcCostDiff()` clears the stale blocks of the cost data.
+   *
+   * @param[in] columns  Indexes of the columns (empty for a dense Jacobian)
+   */
+  void set_x_support(std::vector<std::size_t> columns);
+
   boost::shared_ptr<StateAbstract> state_;  //!< State description
   std::size_t nr_;                          //!< Residual vector dimension
   std::size_t nu_;                          //!< Control dimension
@@ -232,6 +261,9 @@ class ResidualModelAbstractTpl {
                       //!< on v
   bool u_dependent_;  //!< Label that indicates if the residual function depends
                       //!< on u
+  ColumnBlocks x_support_;  //!< Blocks of columns of the state Jacobian that
+                            //!< might be nonzero
+  std::size_t x_support_stamp_;  //!< Number of modifications of the support
 };
 
 template <typename _Scalar>
@@ -252,7 +284,8 @@ struct ResidualDataAbstractTpl {
         Rx(model->get_nr(), model->get_state()->get_ndx()),
         Ru(model->get_nr(), model->get_nu()),
         Arr_Rx(model->get_nr(), model->get_state()->get_ndx()),
-        Arr_Ru(model->get_nr(), model->get_nu()) {
+        Arr_Ru(model->get_nr(), model->get_nu()),
+        x_support_stamp(0) {
     r.setZero();
     Rx.setZero();
     Ru.setZero();
@@ -265,8 +298,12 @@ struct ResidualDataAbstractTpl {
   VectorXs r;                     //!< Residual vector
   MatrixXs Rx;  //!< Jacobian of the residual vector with respect the state
   MatrixXs Ru;  //!< Jacobian of the residual vector with respect the control
-  MatrixXs Arr_Rx;
-  MatrixXs Arr_Ru;
+  MatrixXs Arr_Rx;  //!< Product of the activation Hessian and `Rx` (released
+                    //!< by the cost data for scalar activation Hessians)
+  MatrixXs Arr_Ru;  //!< Product of the activation Hessian and `Ru` (released
+                    //!< by the cost data for scalar activation Hessians)
+  std::size_t x_support_stamp;  //!< Support stamp of the latest cost
+                                //!< derivatives (see `calcCostDiff()`)
 };
 
 }  // namespace crocoddyl
@@ -6,6 +6,7 @@
 // All rights reserved.
 ///////////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
 #include <boost/core/demangle.hpp>
 
 namespace crocoddyl {
@@ -21,7 +22,8 @@ ResidualModelAbstractTpl<Scalar>::ResidualModelAbstractTpl(
       unone_(VectorXs::Zero(nu)),
       q_dependent_(q_dependent),
       v_dependent_(v_dependent),
-      u_dependent_(u_dependent) {}
+      u_dependent_(u_dependent),
+      x_support_stamp_(0) {}
 
 template <typename Scalar>
 ResidualModelAbstractTpl<Scalar>::ResidualModelAbstractTpl(
@@ -33,7 +35,8 @@ ResidualModelAbstractTpl<Scalar>::ResidualModelAbstractTpl(
       unone_(VectorXs::Zero(state->get_nv())),
       q_dependent_(q_dependent),
       v_dependent_(v_dependent),
-      u_dependent_(u_dependent) {}
+      u_dependent_(u_dependent),
+      x_support_stamp_(0) {}
 
 template <typename Scalar>
 ResidualModelAbstractTpl<Scalar>::~ResidualModelAbstractTpl() {}
@@ -80,39 +83,122 @@ void ResidualModelAbstractTpl<Scalar>::calcCostDiff(
   // Gauss-Newton approximation
   const bool is_ru = u_dependent_ && nu_ != 0 && update_u;
   const std::size_t nv = state_->get_nv();
+  // A scalar Hessian, i.e., Arr = alpha * I, is applied as a factor of the
+  // products. It avoids scaling the rows of the residual Jacobians
+  const bool is_scalar = adata->hessian_type == ScalarHessian && nr_ != 0;
+  const Scalar alpha = is_scalar ? adata->Arr.diagonal()[0] : Scalar(1.);
+  if (!is_scalar && rdata->Arr_Rx.rows() != rdata->Rx.rows()) {
+    throw_pretty("Invalid argument: "
+                 << "the residual data belongs to a cost with a scalar "
+                    "activation Hessian (Arr_Rx and Arr_Ru are not allocated)");
+  }
+  const MatrixXs& Arr_Rx = is_scalar ? rdata->Rx : rdata->Arr_Rx;
+  const MatrixXs& Arr_Ru = is_scalar ? rdata->Ru : rdata->Arr_Ru;
   if (is_ru) {
     cdata->Lu.noalias() = rdata->Ru.transpose() * adata->Ar;
-    rdata->Arr_Ru.noalias() = adata->Arr.diagonal().asDiagonal() * rdata->Ru;
-    cdata->Luu.noalias() = rdata->Ru.transpose() * rdata->Arr_Ru;
+    if (!is_scalar) {
+      rdata->Arr_Ru.noalias() = adata->Arr.diagonal().asDiagonal() * rdata->Ru;
+    }
+    cdata->Luu.noalias() = alpha * rdata->Ru.transpose() * Arr_Ru;
+  }
+  if (rdata->x_support_stamp != x_support_stamp_) {
+    // The support changed since the last call, so the blocks outside the new
+    // support are cleared as they are not written below
+    cdata->Lx.setZero();
+    cdata->Lxx.setZero();
+    cdata->Lxu.setZero();
+    rdata->x_support_stamp = x_support_stamp_;
   }
-  if (q_dependent_ && v_dependent_) {
+  if (!x_support_.empty()) {
+    // Only the blocks related to the supported columns are computed, the
+    // remaining ones are always zero
+    const std::size_t nb = x_support_.size();
+    for (std::size_t i = 0; i < nb; ++i) {
+      const std::size_t ci = x_support_[i].first;
+      const std::size_t ni = x_support_[i].second;
+      Eigen::Block<MatrixXs, Eigen::Dynamic, Eigen::Dynamic, true> Rxi =
+          rdata->Rx.middleCols(ci, ni);
+      cdata->Lx.segment(ci, ni).noalias() = Rxi.transpose() * adata->Ar;
+      if (!is_scalar) {
+        rdata->Arr_Rx.middleCols(ci, ni).noalias() =
+            adata->Arr.diagonal().asDiagonal() * Rxi;
+      }
+      if (is_ru) {
+        cdata->Lxu.middleRows(ci, ni).noalias() =
+            alpha * Rxi.transpose() * Arr_Ru;
+      }
+    }
+    for (std::size_t i = 0; i < nb; ++i) {
+      const std::size_t ci = x_support_[i].first;
+      const std::size_t ni = x_support_[i].second;
+      for (std::size_t j = 0; j < nb; ++j) {
+        const std::size_t cj = x_support_[j].first;
+        const std::size_t nj = x_support_[j].second;
+        cdata->Lxx.block(ci, cj, ni, nj).noalias() =
+            alpha * rdata->Rx.middleCols(ci, ni).transpose() *
+            Arr_Rx.middleCols(cj, nj);
+      }
+    }
+  } else if (q_dependent_ && v_dependent_) {
     cdata->Lx.noalias() = rdata->Rx.transpose() * adata->Ar;
-    rdata->Arr_Rx.noalias() = adata->Arr.diagonal().asDiagonal() * rdata->Rx;
-    cdata->Lxx.noalias() = rdata->Rx.transpose() * rdata->Arr_Rx;
+    if (!is_scalar) {
+      rdata->Arr_Rx.noalias() = adata->Arr.diagonal().asDiagonal() * rdata->Rx;
+    }
+    cdata->Lxx.noalias() = alpha * rdata->Rx.transpose() * Arr_Rx;
     if (is_ru) {
-      cdata->Lxu.noalias() = rdata->Rx.transpose() * rdata->Arr_Ru;
+      cdata->Lxu.noalias() = alpha * rdata->Rx.transpose() * Arr_Ru;
     }
   } else if (q_dependent_) {
     Eigen::Block<MatrixXs, Eigen::Dynamic, Eigen::Dynamic, true> Rq =
         rdata->Rx.leftCols(nv);
     cdata->Lx.head(nv).noalias() = Rq.transpose() * adata->Ar;
-    rdata->Arr_Rx.leftCols(nv).noalias() =
-        adata->Arr.diagonal().asDiagonal() * Rq;
+    if (!is_scalar) {
+      rdata->Arr_Rx.leftCols(nv).noalias() =
+          adata->Arr.diagonal().asDiagonal() * Rq;
+    }
     cdata->Lxx.topLeftCorner(nv, nv).noalias() =
-        Rq.transpose() * rdata->Arr_Rx.leftCols(nv);
+        alpha * Rq.transpose() * Arr_Rx.leftCols(nv);
     if (is_ru) {
-      cdata->Lxu.topRows(nv).noalias() = Rq.transpose() * rdata->Arr_Ru;
+      cdata->Lxu.topRows(nv).noalias() = alpha * Rq.transpose() * Arr_Ru;
     }
   } else if (v_dependent_) {
     Eigen::Block<MatrixXs, Eigen::Dynamic, Eigen::Dynamic, true> Rv =
         rdata->Rx.rightCols(nv);
     cdata->Lx.tail(nv).noalias() = Rv.transpose() * adata->Ar;
-    rdata->Arr_Rx.rightCols(nv).noalias() =
-        adata->Arr.diagonal().asDiagonal() * Rv;
+    if (!is_scalar) {
+      rdata->Arr_Rx.rightCols(nv).noalias() =
+          adata->Arr.diagonal().asDiagonal() * Rv;
+    }
     cdata->Lxx.bottomRightCorner(nv, nv).noalias() =
-        Rv.transpose() * rdata->Arr_Rx.rightCols(nv);
+        alpha * Rv.transpose() * Arr_Rx.rightCols(nv);
     if (is_ru) {
-      cdata->Lxu.bottomRows(nv).noalias() = Rv.transpose() * rdata->Arr_Ru;
+      cdata->Lxu.bottomRows(nv).noalias() = alpha * Rv.transpose() * Arr_Ru;
+    }
+  }
+}
+
+template <typename Scalar>
+void ResidualModelAbstractTpl<Scalar>::set_x_support(
+    std::vector<std::size_t> columns) {
+  const std::size_t ndx = state_->get_ndx();
+  std::sort(columns.begin(), columns.end());
+  columns.erase(std::unique(columns.begin(), columns.end()), columns.end());
+  if (!columns.empty() && columns.back() >= ndx) {
+    throw_pretty("Invalid argument: "
+                 << "the support columns should be lower than ndx (" +
+                        std::to_string(ndx) + ")");
+  }
+  x_support_.clear();
+  ++x_support_stamp_;
+  if (columns.size() == ndx) {
+    return;  // the Jacobian is dense
+  }
+  for (std::size_t k = 0; k < columns.size(); ++k) {
+    if (!x_support_.empty() &&
+        x_support_.back().first + x_support_.back().second == columns[k]) {
+      ++x_support_.back().second;
+    } else {
+      x_support_.push_back(std::make_pair(columns[k], std::size_t(1)));
     }
   }
 }
@@ -153,6 +239,12 @@ bool ResidualModelAbstractTpl<Scalar>::get_u_dependent() const {
   return u_dependent_;
 }
 
+template <typename Scalar>
+const typename ResidualModelAbstractTpl<Scalar>::ColumnBlocks&
+ResidualModelAbstractTpl<Scalar>::get_x_support() const {
+  return x_support_;
+}
+
 template <typename Scalar>
 std::ostream& operator<<(std::ostream& os,
                          const ResidualModelAbstractTpl<Scalar>& model) {
@@ -14,6 +14,7 @@
 
 #include "crocoddyl/core/optctrl/shooting.hpp"
 #include "crocoddyl/core/utils/stop-watch.hpp"
+#include "crocoddyl/core/utils/timer.hpp"
 
 namespace crocoddyl {
 
@@ -22,6 +23,18 @@ static std::vector<Eigen::VectorXd> DEFAULT_VECTOR;
 
 enum FeasibilityNorm { LInf = 0, L1 };
 
+/**
+ * @brief Reason why the solver stopped its last resolution
+ */
+enum SolverStatus {
+  Unsolved = 0,    //!< The solver has not run yet
+  Converged,       //!< The stopping criteria is below its tolerance
+  MaxIterReached,  //!< The maximum number of iterations was reached
+  MaxTimeReached,  //!< The time budget was exhausted
+  MaxRegReached,   //!< The regularization reached its maximum value
+  Failed           //!< The resolution raised an exception (e.g., in batches)
+};
+
 /**
  * @brief Abstract class for optimal control solvers
  *
@@ -62,6 +75,8 @@ class SolverAbstract {
  public:
   EIGEN_MAKE_ALIGNED_OPERATOR_NEW
 
+  typedef MathBaseTpl<double>::MatrixXsRowMajor MatrixXdRowMajor;
+
   /**
    * @brief Initialize the solver
    *
@@ -155,6 +170,22 @@ class SolverAbstract {
    */
   virtual void resizeData();
 
+  /**
+   * @brief Shift the solver trajectories one node backwards in time
+   *
+   * This function is used for warm-starting receding-horizon problems. It
+   * rotates in place the state and control trajectories, and the solver
+   * buffers, as \f$\mathbf{x}_k\leftarrow\mathbf{x}_{k+1}\f$ and
+   * \f$\mathbf{u}_k\leftarrow\mathbf{u}_{k+1}\f$. The last node is
+   * extrapolated by keeping the last state and control (if its dimension is
+   * consistent with the last running model, otherwise the control is set to
+   * zero). The solver data is only resized via `resizeData()` when the
+   * control dimension of the appended node is different. This function is
+   * meant to be paired with `ShootingProblem::circularAppend()`, i.e., it
+   * should be called after appending the new node.
+   */
+  virtual void shift();
+
   /**
    * @brief Compute the dynamic feasibility
    * \f$\|\mathbf{f}_{\mathbf{s}}\|_{\infty,1}\f$ for the current guess
@@ -191,6 +222,20 @@ class SolverAbstract {
    */
   double computeEqualityFeasibility();
 
+  /**
+   * @brief Check if there is enough time budget for running a phase
+   *
+   * The time budget is defined by `set_max_time()`, and it is counted since
+   * the beginning of the `solve()` call. Solvers use this function between
+   * their phases (e.g., derivatives computation, backward pass, line-search
+   * trials) to stop before exceeding the budget. When the budget is exhausted,
+   * it sets the solver status to `MaxTimeReached`.
+   *
+   * @param[in] duration  expected duration of the next phase (in milliseconds)
+   * @return true if the next phase can run within the budget
+   */
+  bool checkTimeBudget(const double duration = 0.);
+
   /**
    * @brief Set the solver candidate trajectories
    * \f$(\mathbf{x}_s,\mathbf{u}_s)\f$
@@ -248,6 +293,37 @@ class SolverAbstract {
    */
   const std::vector<Eigen::VectorXd>& get_fs() const;
 
+  /**
+   * @brief Return the state trajectory stacked in a contiguous buffer
+   *
+   * The \f$k\f$-th row of the returned \f$(T+1)\times n_x\f$ matrix is the
+   * state \f$\mathbf{x}_k\f$. The buffer is owned by the solver and it is
+   * only reallocated when the problem dimensions change. It is refreshed on
+   * every call, so later modifications of the state trajectory are not
+   * reflected until this function is called again. The returned reference
+   * is valid until the problem dimensions change or the solver is destroyed.
+   * The Python bindings return a numpy view of it that keeps the solver
+   * alive, so it has to be read again after changing the problem dimensions.
+   */
+  const MatrixXdRowMajor& get_stacked_xs() const;
+
+  /**
+   * @brief Return the control trajectory stacked in a contiguous buffer
+   *
+   * The \f$k\f$-th row of the returned \f$T\times n_u\f$ matrix is the
+   * control \f$\mathbf{u}_k\f$. All the running nodes must have the same
+   * control dimension.
+   */
+  const MatrixXdRowMajor& get_stacked_us() const;
+
+  /**
+   * @brief Return the dynamic infeasibility stacked in a contiguous buffer
+   *
+   * The \f$k\f$-th row of the returned \f$(T+1)\times n_{dx}\f$ matrix is
+   * the gap \f$\mathbf{f}_k\f$.
+   */
+  const MatrixXdRowMajor& get_stacked_fs() const;
+
   /**
    * @brief Return the feasibility status of the
    * \f$(\mathbf{x}_s,\mathbf{u}_s)\f$ trajectory
@@ -382,6 +458,16 @@ class SolverAbstract {
    */
   std::size_t get_iter() const;
 
+  /**
+   * @brief Return the time budget of the solver (in milliseconds)
+   */
+  double get_max_time() const;
+
+  /**
+   * @brief Return the reason why the solver stopped its last resolution
+   */
+  SolverStatus get_status() const;
+
   /**
    * @brief Modify the state trajectory \f$\mathbf{x}_s\f$
    */
@@ -428,6 +514,15 @@ class SolverAbstract {
    */
   void set_feasnorm(const FeasibilityNorm feas_norm);
 
+  /**
+   * @brief Modify the time budget of the solver (in milliseconds)
+   *
+   * Once this budget would be exceeded, the solver stops and returns the last
+   * accepted iterate. This budget is used by the DDP-based solvers. By
+   * default, there is not time budget (i.e., its value is infinity).
+   */
+  void set_max_time(const double max_time);
+
  protected:
   boost::shared_ptr<ShootingProblem> problem_;  //!< optimal control problem
   std::vector<Eigen::VectorXd> xs_;             //!< State trajectory
@@ -474,8 +569,26 @@ class SolverAbstract {
                                    //!< dynamics and constraints feasibility
   std::size_t iter_;  //!< Number of iteration performed by the solver
   double tmp_feas_;   //!< Temporal variables used for computed the feasibility
+  double max_time_;   //!< Time budget of the solver (in milliseconds)
+  Timer timer_;       //!< Timer used for bounding the solver time
+  SolverStatus status_;  //!< Reason why the solver stopped its last resolution
+  mutable MatrixXdRowMajor stacked_xs_;  //!< Contiguous copy of `xs_`
+  mutable MatrixXdRowMajor stacked_us_;  //!< Contiguous copy of `us_`
+  mutable MatrixXdRowMajor stacked_fs_;  //!< Contiguous copy of `fs_`
 };
 
+/**
+ * @brief Copy a list of vectors, row by row, into a contiguous matrix
+ *
+ * All the vectors must have the same dimension. The matrix is resized only if
+ * its dimensions do not match the list.
+ *
+ * @param[in] vs    list of vectors
+ * @param[out] out  stacked matrix
+ */
+void stackVectors(const std::vector<Eigen::VectorXd>& vs,
+                  SolverAbstract::MatrixXdRowMajor& out);
+
 /**
  * @brief Abstract class for solver callbacks
  *
@@ -0,0 +1,135 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, Heriot-Watt University, University of Edinburgh
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#ifndef CROCODDYL_CORE_SOLVERS_BATCH_HPP_
+#define CROCODDYL_CORE_SOLVERS_BATCH_HPP_
+
+#include <string>
+#include <vector>
+
+#include "crocoddyl/core/solver-base.hpp"
+
+namespace crocoddyl {
+
+/**
+ * @brief Batch of independent optimal control solvers
+ *
+ * It solves a set of independent optimal control problems concurrently. Each
+ * problem is solved by its own solver (e.g., `SolverFDDP`), which is warm
+ * started from its current state and control trajectories (see
+ * `SolverAbstract::setCandidate()`). The problems are distributed among the
+ * threads, and each solver runs within a single thread. Therefore, we
+ * recommend to define a single thread in each shooting problem. Note that the
+ * solvers cannot share a shooting problem, as they would write its data
+ * concurrently.
+ *
+ * A solver that raises an exception does not abort the batch. Instead, its
+ * problem is reported with the `Failed` status and its error message.
+ *
+ * \sa `solve()`, `get_converged()`, `get_costs()` and `get_statuses()`
+ */
+class SolverBatch {
+ public:
+  EIGEN_MAKE_ALIGNED_OPERATOR_NEW
+
+  typedef Eigen::Matrix<bool, Eigen::Dynamic, 1> VectorXb;
+
+  /**
+   * @brief Initialize the batch of solvers
+   *
+   * @param[in] solvers  independent solvers, each one with its own shooting
+   * problem
+   */
+  explicit SolverBatch(
+      const std::vector<boost::shared_ptr<SolverAbstract> >& solvers);
+  ~SolverBatch();
+
+  /**
+   * @brief Solve all the optimal control problems
+   *
+   * @param[in] maxiter      maximum allowed number of iterations per problem
+   * (default 100)
+   * @param[in] is_feasible  true if the current trajectories of the solvers are
+   * obtained from a rollout (default false)
+   * @param[in] init_reg     initial guess for the regularization value
+   * @return the number of problems that have converged
+   */
+  std::size_t solve(const std::size_t maxiter = 100,
+                    const bool is_feasible = false,
+                    const double init_reg = NAN);
+
+  /**
+   * @brief Solve all the optimal control problems with per-problem iteration
+   * limits
+   *
+   * @param[in] maxiters     maximum allowed number of iterations of each
+   * problem
+   * @param[in] is_feasible  true if the current trajectories of the solvers are
+   * obtained from a rollout (default false)
+   * @param[in] init_reg     initial guess for the regularization value
+   * @return the number of problems that have converged
+   */
+  std::size_t solve(const std::vector<std::size_t>& maxiters,
+                    const bool is_feasible = false,
+                    const double init_reg = NAN);
+
+  /**
+   * @brief Return the solvers
+   */
+  const std::vector<boost::shared_ptr<SolverAbstract> >& get_solvers() const;
+
+  /**
+   * @brief Return the convergence status of each problem
+   */
+  const VectorXb& get_converged() const;
+
+  /**
+   * @brief Return the total cost of each problem
+   */
+  const Eigen::VectorXd& get_costs() const;
+
+  /**
+   * @brief Return the status of each problem
+   *
+   * It is the solver status, or `Failed` if the solver raised an exception.
+   */
+  const std::vector<SolverStatus>& get_statuses() const;
+
+  /**
+   * @brief Return the error message of each problem
+   *
+   * The message is empty if the solver did not raise an exception.
+   */
+  const std::vector<std::string>& get_errors() const;
+
+  /**
+   * @brief Return the number of threads
+   */
+  std::size_t get_nthreads() const;
+
+  /**
+   * @brief Modify the number of threads used for solving the problems
+   *
+   * If the number of threads is lower than one, then it uses the default
+   * number of threads.
+   */
+  void set_nthreads(const int nthreads);
+
+ private:
+  std::vector<boost::shared_ptr<SolverAbstract> > solvers_;  //!< Solvers
+  VectorXb converged_;                  //!< Convergence status of each problem
+  Eigen::VectorXd costs_;               //!< Total cost of each problem
+  std::vector<SolverStatus> statuses_;  //!< Status of each problem
+  std::size_t nthreads_;                //!< Number of threads
+  std::vector<std::string>
+      errors_;  //!< Error messages raised while solving each problem
+};
+
+}  // namespace crocoddyl
+
+#endif  // CROCODDYL_CORE_SOLVERS_BATCH_HPP_
@@ -26,13 +26,23 @@ class SolverBoxDDP : public SolverDDP {
 
   virtual void allocateData();
   virtual void computeGains(const std::size_t t);
-  virtual void forwardPass(const double steplength);
+  virtual bool parallelBackwardPass();
   virtual void resizeData();
+  virtual void shift();
 
   const std::vector<Eigen::MatrixXd>& get_Quu_inv() const;
 
  protected:
+  virtual double rolloutPolicy(
+      const double steplength, std::vector<Eigen::VectorXd>& xs_try,
+      std::vector<Eigen::VectorXd>& us_try, std::vector<Eigen::VectorXd>& dx,
+      Eigen::VectorXd& xnext,
+      const std::vector<boost::shared_ptr<ActionDataAbstract> >& running_datas,
+      const boost::shared_ptr<ActionDataAbstract>& terminal_data);
+
   BoxQP qp_;
+  std::vector<BoxQPSolution>
+      qp_sols_;  //!< Box-QP solution of each node used for warm-starting
   std::vector<Eigen::MatrixXd> Quu_inv_;
   std::vector<Eigen::VectorXd> du_lb_;
   std::vector<Eigen::VectorXd> du_ub_;
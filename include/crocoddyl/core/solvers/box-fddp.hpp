@@ -26,13 +26,18 @@ class SolverBoxFDDP : public SolverFDDP {
 
   virtual void allocateData();
   virtual void computeGains(const std::size_t t);
+  virtual bool parallelBackwardPass();
   virtual void forwardPass(const double steplength);
+  virtual void set_multiple_shooting(const bool multiple_shooting);
   virtual void resizeData();
+  virtual void shift();
 
   const std::vector<Eigen::MatrixXd>& get_Quu_inv() const;
 
  protected:
   BoxQP qp_;
+  std::vector<BoxQPSolution>
+      qp_sols_;  //!< Box-QP solution of each node used for warm-starting
   std::vector<Eigen::MatrixXd> Quu_inv_;
   std::vector<Eigen::VectorXd> du_lb_;
   std::vector<Eigen::VectorXd> du_ub_;
@@ -70,7 +70,8 @@ struct BoxQPSolution {
  * The algorithm procees by iteratively identifying the active bounds, and then
  * performing a projected Newton step in the free sub-space.
  * The projection uses the Hessian of the free sub-space and is computed
- * efficiently using a Cholesky decomposition.
+ * efficiently using a Cholesky decomposition. This decomposition is reused
+ * across iterations while the free sub-space does not change.
  * It uses a line search procedure with polynomial step length values in a
  * backtracking fashion.
  * The steps are checked using an Armijo condition together L2-norm gradient.
@@ -117,6 +118,31 @@ class BoxQP {
                              const Eigen::VectorXd& ub,
                              const Eigen::VectorXd& xinit);
 
+  /**
+   * @brief Compute the solution of bound-constrained QP warm-started from a
+   * previous solution
+   *
+   * The decision vector of the previous solution, projected onto the bounds,
+   * is used as initial guess. Furthermore, the clamped variables of the
+   * previous solution start at their nearest bound, which seeds the initial
+   * active set even if the bounds have changed. If this active set is still
+   * optimal, then the algorithm converges after a single Newton step (i.e.,
+   * with a single Cholesky decomposition). This is typically the case when a
+   * sequence of similar QP problems is solved, e.g., for a given node across
+   * the iterations of a box-DDP solver.
+   *
+   * @param[in] H          Hessian (dimension nx * nx)
+   * @param[in] q          Gradient (dimension nx)
+   * @param[in] lb         Lower bound (dimension nx)
+   * @param[in] ub         Upper bound (dimension nx)
+   * @param[in] warmstart  Previous solution
+   * @return The solution of the problem
+   */
+  const BoxQPSolution& solve(const Eigen::MatrixXd& H, const Eigen::VectorXd& q,
+                             const Eigen::VectorXd& lb,
+                             const Eigen::VectorXd& ub,
+                             const BoxQPSolution& warmstart);
+
   /**
    * @brief Return the stored solution
    */
@@ -197,10 +223,12 @@ class BoxQP {
   std::size_t nc_;  //!< Constrained space dimension
   std::vector<double>
       alphas_;  //!< Set of step lengths using by the line-search procedure
-  Eigen::VectorXd x_;     //!< Guess of the decision variable
-  Eigen::VectorXd xnew_;  //!< New decision vector
-  Eigen::VectorXd g_;     //!< Current gradient
-  Eigen::VectorXd dx_;    //!< Current search direction
+  Eigen::VectorXd x_;      //!< Guess of the decision variable
+  Eigen::VectorXd xinit_;  //!< Initial guess seeded from a warm start
+  Eigen::VectorXd xnew_;   //!< New decision vector
+  Eigen::VectorXd g_;      //!< Current gradient
+  Eigen::VectorXd dx_;     //!< Current search direction
+  Eigen::VectorXd Hx_;     //!< Hessian-vector product for the cost evaluation
 
   Eigen::VectorXd xo_;  //!< Organized decision
   Eigen::VectorXd
@@ -208,8 +236,10 @@ class BoxQP {
   Eigen::VectorXd
       qo_;  //!< Gradient organized by free and constrained subspaces
   Eigen::MatrixXd Ho_;  //!< Hessian organized by free and constrained subspaces
+  std::vector<size_t>
+      free_idx_prev_;  //!< Free space indexes of the previous iteration
 
-  Eigen::LLT<Eigen::MatrixXd> Hff_inv_llt_;  //!< Cholesky solver
+  Eigen::MatrixXd Lo_;  //!< Cholesky factor of the free space Hessian
 };
 
 }  // namespace crocoddyl
@@ -11,6 +11,7 @@
 #define CROCODDYL_CORE_SOLVERS_DDP_HPP_
 
 #include <Eigen/Cholesky>
+#include <Eigen/LU>
 #include <vector>
 
 #include "crocoddyl/core/mathbase.hpp"
@@ -19,6 +20,118 @@
 
 namespace crocoddyl {
 
+/**
+ * @brief Condensed linear-quadratic segment used by the parallel backward pass
+ *
+ * It describes the conditional value function between the first and last
+ * nodes of a horizon segment through the element
+ * \f$(\mathbf{A},\mathbf{b},\mathbf{C},\boldsymbol{\eta},\mathbf{J})\f$, i.e.,
+ * \f{equation*}{
+ * V(\mathbf{x}_a,\mathbf{x}_b) = \frac{1}{2}\mathbf{x}_a^\top\mathbf{J}
+ * \mathbf{x}_a - \boldsymbol{\eta}^\top\mathbf{x}_a +
+ * \max_{\boldsymbol{\lambda}}
+ * -\frac{1}{2}\boldsymbol{\lambda}^\top\mathbf{C}\boldsymbol{\lambda} -
+ * \boldsymbol{\lambda}^\top(\mathbf{x}_b - \mathbf{A}\mathbf{x}_a -
+ * \mathbf{b}).
+ * \f}
+ * These elements are combined with an associative operator, which allows us to
+ * condense each segment independently. For more details see: S. Särkkä and Á.
+ * F. García-Fernández, "Temporal Parallelization of Dynamic Programming and
+ * Linear Quadratic Control".
+ */
+struct RiccatiSegment {
+  EIGEN_MAKE_ALIGNED_OPERATOR_NEW
+
+  /**
+   * @brief Initialize the segment data
+   *
+   * @param[in] ndx  dimension of the tangent space of the state manifold
+   */
+  explicit RiccatiSegment(const std::size_t ndx)
+      : A(Eigen::MatrixXd::Zero(ndx, ndx)),
+        C(Eigen::MatrixXd::Zero(ndx, ndx)),
+        J(Eigen::MatrixXd::Zero(ndx, ndx)),
+        b(Eigen::VectorXd::Zero(ndx)),
+        eta(Eigen::VectorXd::Zero(ndx)),
+        Ak(Eigen::MatrixXd::Zero(ndx, ndx)),
+        Ck(Eigen::MatrixXd::Zero(ndx, ndx)),
+        Jk(Eigen::MatrixXd::Zero(ndx, ndx)),
+        bk(Eigen::VectorXd::Zero(ndx)),
+        etak(Eigen::VectorXd::Zero(ndx)),
+        M(Eigen::MatrixXd::Zero(ndx, ndx)),
+        M_lu(ndx),
+        GT(Eigen::MatrixXd::Zero(ndx, ndx)),
+        H(Eigen::MatrixXd::Zero(ndx, ndx)),
+        tmp(Eigen::MatrixXd::Zero(ndx, ndx)),
+        g(Eigen::VectorXd::Zero(ndx)),
+        r(Eigen::VectorXd::Zero(ndx)) {}
+
+  Eigen::MatrixXd A;     //!< Condensed state transition
+  Eigen::MatrixXd C;     //!< Condensed control-reachability Gramian
+  Eigen::MatrixXd J;     //!< Condensed Hessian of the conditional value
+  Eigen::VectorXd b;     //!< Condensed drift (gaps) of the dynamics
+  Eigen::VectorXd eta;   //!< Condensed (negative) gradient of the conditional
+                         //!< value
+  Eigen::MatrixXd Ak;    //!< State transition of the current node
+  Eigen::MatrixXd Ck;    //!< Control-reachability Gramian of the current node
+  Eigen::MatrixXd Jk;    //!< Hessian of the conditional value of the node
+  Eigen::VectorXd bk;    //!< Drift (gaps) of the current node
+  Eigen::VectorXd etak;  //!< (Negative) gradient of the conditional value of
+                         //!< the current node
+  Eigen::MatrixXd M;     //!< Temporary matrix I + J C
+  Eigen::PartialPivLU<Eigen::MatrixXd> M_lu;  //!< LU solver of M
+  Eigen::MatrixXd GT;                         //!< Temporary matrix M^-1 A^T
+  Eigen::MatrixXd H;                          //!< Temporary matrix M^-1 J
+  Eigen::MatrixXd tmp;                        //!< Temporary matrix
+  Eigen::VectorXd g;                          //!< Temporary vector
+  Eigen::VectorXd r;                          //!< Temporary vector
+};
+
+/**
+ * @brief Rollout buffers of a line-search trial
+ *
+ * Each trial owns its state and control trajectories together with its own
+ * action data. This allows us to evaluate several step lengths concurrently
+ * without modifying the data stored in the shooting problem.
+ */
+struct LineSearchTrial {
+  EIGEN_MAKE_ALIGNED_OPERATOR_NEW
+
+  /**
+   * @brief Initialize the trial buffers
+   *
+   * @param[in] problem  shooting problem
+   */
+  explicit LineSearchTrial(boost::shared_ptr<ShootingProblem> problem);
+
+  /**
+   * @brief Update the trial buffers after modifying the shooting problem
+   *
+   * It resizes the control buffers, and it creates new action data only for
+   * the nodes whose model has changed.
+   *
+   * @param[in] problem  shooting problem
+   */
+  void resize(const boost::shared_ptr<ShootingProblem>& problem);
+
+  std::vector<Eigen::VectorXd> xs_try;  //!< State trajectory of the trial
+  std::vector<Eigen::VectorXd> us_try;  //!< Control trajectory of the trial
+  std::vector<Eigen::VectorXd>
+      dx;                 //!< State error during the roll-out (size T)
+  Eigen::VectorXd xnext;  //!< Next state \f$\mathbf{x}^{'}\f$
+  std::vector<boost::shared_ptr<ActionModelAbstract> >
+      running_models;  //!< Running models used to create the trial data
+  boost::shared_ptr<ActionModelAbstract>
+      terminal_model;  //!< Terminal model used to create the trial data
+  std::vector<boost::shared_ptr<ActionDataAbstract> >
+      running_datas;  //!< Running action data of the trial
+  boost::shared_ptr<ActionDataAbstract>
+      terminal_data;  //!< Terminal action data of the trial
+  double steplength;  //!< Step length applied in the trial
+  double cost_try;    //!< Total cost computed by the trial
+  double dV;  //!< Reduction in the cost function (NaN if the rollout failed)
+};
+
 /**
  * @brief Differential Dynamic Programming (DDP) solver
  *
@@ -78,6 +191,50 @@ class SolverDDP : public SolverAbstract {
   virtual const Eigen::Vector2d& expectedImprovement();
   virtual void resizeData();
 
+  /**
+   * @copybrief SolverAbstract::shift
+   *
+   * Additionally, it rotates the feedback gains, the feed-forward terms and the
+   * value-function buffers. Then, the gains of the last node are extrapolated
+   * as in the control trajectory.
+   */
+  virtual void shift();
+
+  /**
+   * @brief Prepare the next real-time iteration
+   *
+   * It defines the solver candidate and computes the derivatives of the optimal
+   * control problem around it, i.e., the expensive half of an iteration that
+   * does not depend on the initial state. It is meant to be run before the new
+   * initial state arrives. Then, `feedback()` completes the iteration once the
+   * initial state has been updated in the shooting problem.
+   *
+   * @param[in] init_xs      initial guess for state trajectory with \f$T+1\f$
+   * elements (default [])
+   * @param[in] init_us      initial guess for control trajectory with \f$T\f$
+   * elements (default [])
+   * @param[in] is_feasible  true if the \p init_xs are obtained from
+   * integrating the \p init_us (rollout) (default false)
+   * @return the total cost around the guess trajectory
+   */
+  double prepare(const std::vector<Eigen::VectorXd>& init_xs = DEFAULT_VECTOR,
+                 const std::vector<Eigen::VectorXd>& init_us = DEFAULT_VECTOR,
+                 const bool is_feasible = false);
+
+  /**
+   * @brief Run the feedback phase of a real-time iteration
+   *
+   * It runs the backward pass and the line search from the derivatives
+   * computed by `prepare()`. The initial gap is updated with the current
+   * initial state of the shooting problem. The following iterations (if any)
+   * are run as in `solve()`.
+   *
+   * @param[in] maxiter   maximum allowed number of iterations (default 1)
+   * @param[in] init_reg  initial guess for the regularization value
+   * @return A boolean that describes if convergence was reached.
+   */
+  bool feedback(const std::size_t maxiter = 1, const double init_reg = NAN);
+
   /**
    * @brief Update the Jacobian, Hessian and feasibility of the optimal control
    * problem
@@ -138,6 +295,32 @@ class SolverDDP : public SolverAbstract {
    */
   virtual void forwardPass(const double stepLength);
 
+  /**
+   * @brief Run the forward pass of a line-search trial
+   *
+   * It rollouts the policy as `forwardPass()` does, but it stores the
+   * resulting trajectory, cost and action data in the trial buffers. Neither
+   * the solver nor the shooting problem data are modified, and this function
+   * can be called concurrently for different trials.
+   *
+   * @param[in,out] trial  line-search trial (it defines the step length)
+   */
+  virtual void trialForwardPass(LineSearchTrial& trial);
+
+  /**
+   * @brief Run the line search by evaluating several step lengths
+   * concurrently
+   *
+   * The step lengths are evaluated in batches of as many trials as threads
+   * defined in the shooting problem. Then, the largest accepted step length
+   * of the batch is chosen, and the solver candidate is updated accordingly.
+   * The action data of an accepted trial is swapped into the shooting
+   * problem, so the nodes are not evaluated again.
+   *
+   * @return true if a step length was accepted
+   */
+  bool parallelLineSearch();
+
   /**
    * @brief Compute the linear-quadratic approximation of the control
    * Hamiltonian function
@@ -150,6 +333,24 @@ class SolverDDP : public SolverAbstract {
       const std::size_t t, const boost::shared_ptr<ActionModelAbstract>& model,
       const boost::shared_ptr<ActionDataAbstract>& data);
 
+  /**
+   * @brief Compute the linear-quadratic approximation of the control
+   * Hamiltonian function for models with the Euler block structure
+   *
+   * It is called by `computeActionValueFunction()` when the action model
+   * declares the Euler block structure of its Jacobians (see
+   * `ActionModelAbstractTpl::get_structure_timestep()`). Then, the products
+   * with \f$\mathbf{F_x}\f$ and \f$\mathbf{F_u}\f$ only involve their
+   * velocity rows, which roughly halves the flops of the dense products.
+   *
+   * @param[in] t     Time instance
+   * @param[in] data  Action data in the given time instance
+   * @param[in] dt    Time step of the Euler block structure
+   */
+  void computeStructuredActionValueFunction(
+      const std::size_t t, const boost::shared_ptr<ActionDataAbstract>& data,
+      const double dt);
+
   /**
    * @brief Compute the linear-quadratic approximation of the Value function
    *
@@ -178,6 +379,26 @@ class SolverDDP : public SolverAbstract {
    */
   virtual void computeGains(const std::size_t t);
 
+  /**
+   * @brief Run the backward pass in parallel over horizon segments
+   *
+   * The horizon is split into as many segments as threads defined in the
+   * shooting problem. First, each segment is condensed into an element of the
+   * associative Riccati operator (see `RiccatiSegment`). Second, the Value
+   * function at the segment boundaries is propagated through these elements.
+   * Finally, the Riccati sweep of each segment runs independently from its
+   * boundary Value function. This procedure produces the same feedback and
+   * feedforward terms than the serial sweep.
+   *
+   * Solvers whose gains are not described by an unconstrained Riccati
+   * recursion (e.g., box-constrained or equality-constrained solvers) overload
+   * this function to disable it.
+   *
+   * @return true if the backward pass was computed, false if it cannot be
+   * applied and the serial backward pass is needed
+   */
+  virtual bool parallelBackwardPass();
+
   /**
    * @brief Increase the state and control regularization values by a
    * `regfactor_` factor
@@ -244,6 +465,16 @@ class SolverDDP : public SolverAbstract {
    */
   double get_th_grad() const;
 
+  /**
+   * @brief Return true if the parallel-in-time backward pass is enabled
+   */
+  bool get_parallel_backward() const;
+
+  /**
+   * @brief Return true if the concurrent line search is enabled
+   */
+  bool get_parallel_linesearch() const;
+
   /**
    * @brief Return the Hessian of the Value function \f$V_{\mathbf{xx}_s}\f$
    */
@@ -294,6 +525,25 @@ class SolverDDP : public SolverAbstract {
    */
   const std::vector<Eigen::VectorXd>& get_k() const;
 
+  /**
+   * @brief Return the feedback gains stacked in a contiguous buffer
+   *
+   * The gains are stored as a \f$(T\,n_u)\times n_{dx}\f$ row-major matrix,
+   * where the rows \f$[k\,n_u, (k+1)\,n_u)\f$ correspond to
+   * \f$\mathbf{K}_k\f$. Therefore, its memory layout is the one of a
+   * \f$T\times n_u\times n_{dx}\f$ C-ordered array. All the running nodes
+   * must have the same control dimension.
+   */
+  const MatrixXdRowMajor& get_stacked_K() const;
+
+  /**
+   * @brief Return the feedforward gains stacked in a contiguous buffer
+   *
+   * The \f$k\f$-th row of the returned \f$T\times n_u\f$ matrix is
+   * \f$\mathbf{k}_k\f$.
+   */
+  const MatrixXdRowMajor& get_stacked_k() const;
+
   /**
    * @brief Modify the regularization factor used to increase the damping value
    */
@@ -343,6 +593,22 @@ class SolverDDP : public SolverAbstract {
    */
   void set_th_grad(const double th_grad);
 
+  /**
+   * @brief Enable / disable the parallel-in-time backward pass
+   *
+   * It requires to compile Crocoddyl with multithreading support, and it
+   * uses the number of threads defined in the shooting problem.
+   */
+  void set_parallel_backward(const bool parallel_backward);
+
+  /**
+   * @brief Enable / disable the concurrent line search
+   *
+   * It evaluates as many step lengths as threads defined in the shooting
+   * problem at once.
+   */
+  virtual void set_parallel_linesearch(const bool parallel_linesearch);
+
  protected:
   double reg_incfactor_;  //!< Regularization factor used to increase the
                           //!< damping value
@@ -376,12 +642,16 @@ class SolverDDP : public SolverAbstract {
       Qx_;  //!< Gradient of the Hamiltonian \f$\mathbf{Q_x}\f$
   std::vector<Eigen::VectorXd>
       Qu_;  //!< Gradient of the Hamiltonian \f$\mathbf{Q_u}\f$
-  std::vector<MatrixXdRowMajor> K_;  //!< Feedback gains \f$\mathbf{K}\f$
-  std::vector<Eigen::VectorXd> k_;   //!< Feed-forward terms \f$\mathbf{l}\f$
+  std::vector<MatrixXdRowMajor> K_;     //!< Feedback gains \f$\mathbf{K}\f$
+  std::vector<Eigen::VectorXd> k_;      //!< Feed-forward terms \f$\mathbf{l}\f$
+  mutable MatrixXdRowMajor stacked_K_;  //!< Contiguous copy of `K_`
+  mutable MatrixXdRowMajor stacked_k_;  //!< Contiguous copy of `k_`
 
-  Eigen::VectorXd xnext_;      //!< Next state \f$\mathbf{x}^{'}\f$
-  MatrixXdRowMajor FxTVxx_p_;  //!< Store the value of
-                               //!< \f$\mathbf{f_x}^T\mathbf{V_{xx}}^{'}\f$
+  Eigen::VectorXd xnext_;  //!< Next state \f$\mathbf{x}^{'}\f$
+  std::vector<MatrixXdRowMajor>
+      FxTVxx_p_;  //!< Store the values of
+                  //!< \f$\mathbf{f_x}^T\mathbf{V_{xx}}^{'}\f$
+                  //!< per each running node
   std::vector<MatrixXdRowMajor>
       FuTVxx_p_;             //!< Store the values of
                              //!< \f$\mathbf{f_u}^T\mathbf{V_{xx}}^{'}\f$
@@ -400,6 +670,44 @@ class SolverDDP : public SolverAbstract {
       th_stepdec_;  //!< Step-length threshold used to decrease regularization
   double
       th_stepinc_;  //!< Step-length threshold used to increase regularization
+  bool parallel_backward_;  //!< Enable the parallel-in-time backward pass
+  std::vector<RiccatiSegment>
+      segments_;  //!< Condensed segments used by the parallel backward pass
+  bool parallel_linesearch_;  //!< Enable the concurrent line search
+  std::vector<LineSearchTrial>
+      trials_;        //!< Trials used by the concurrent line search
+  bool is_prepared_;  //!< True if the derivatives were computed by `prepare()`
+  double direction_time_;  //!< Last duration of the search direction
+                           //!< computation (in milliseconds)
+  double trial_time_;      //!< Last duration of a line-search trial (in
+                           //!< milliseconds)
+
+  /**
+   * @brief Rollout the policy for a given step length
+   *
+   * It is shared by `forwardPass()` and `trialForwardPass()`, which provide
+   * the trajectory buffers and the action data used in the roll-out.
+   * Derived solvers that modify the roll-out (e.g., by clamping the controls)
+   * only need to override this function.
+   *
+   * @param[in] steplength     applied step length (\f$0\leq\alpha\leq1\f$)
+   * @param[out] xs_try        state trajectory
+   * @param[out] us_try        control trajectory
+   * @param[out] dx            state error during the roll-out
+   * @param[out] xnext         next state
+   * @param[in] running_datas  running action data
+   * @param[in] terminal_data  terminal action data
+   * @return the total cost of the roll-out
+   */
+  virtual double rolloutPolicy(
+      const double steplength, std::vector<Eigen::VectorXd>& xs_try,
+      std::vector<Eigen::VectorXd>& us_try, std::vector<Eigen::VectorXd>& dx,
+      Eigen::VectorXd& xnext,
+      const std::vector<boost::shared_ptr<ActionDataAbstract> >& running_datas,
+      const boost::shared_ptr<ActionDataAbstract>& terminal_data);
+
+ private:
+  void allocateLineSearchTrials();
 };
 
 }  // namespace crocoddyl
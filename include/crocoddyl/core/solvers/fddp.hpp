@@ -94,23 +94,82 @@ class SolverFDDP : public SolverDDP {
    */
   void updateExpectedImprovement();
   virtual void forwardPass(const double stepLength);
+  virtual void resizeData();
+
+  /**
+   * @brief Allocate all the internal data needed for the solver
+   */
+  virtual void allocateData();
+
+  /**
+   * @brief Run the multiple-shooting forward pass
+   *
+   * Instead of simulating the nonlinear dynamics node by node, it builds the
+   * candidate trajectory from the linearized dynamics, i.e.,
+   * \f{eqnarray}
+   *   \delta\mathbf{x}_0 &=& \alpha\mathbf{\bar{f}}_0,\\
+   *   \mathbf{\hat{u}}_k &=& \mathbf{u}_k - \alpha\mathbf{k}_k -
+   * \mathbf{K}_k\delta\mathbf{x}_k,\\
+   *   \delta\mathbf{x}_{k+1} &=& \mathbf{f}_{\mathbf{x}_k}\delta\mathbf{x}_k +
+   * \mathbf{f}_{\mathbf{u}_k}(\mathbf{\hat{u}}_k - \mathbf{u}_k) +
+   * \alpha\mathbf{\bar{f}}_{k+1},
+   * \f}
+   * with \f$\mathbf{\hat{x}}_k = \mathbf{x}_k\oplus\delta\mathbf{x}_k\f$.
+   * Then, it evaluates the nodes and the new gaps in parallel through the
+   * shooting problem. The resulting candidate is considered feasible only if
+   * its gaps are lower than `th_gaptol`.
+   *
+   * @param[in] steplength  applied step length (\f$0\leq\alpha\leq1\f$)
+   */
+  void multipleShootingForwardPass(const double steplength);
+
+  /**
+   * @brief Return true if the trial trajectory closes the gaps of the dynamics
+   */
+  bool isTrialFeasible() const;
 
   /**
    * @brief Return the threshold used for accepting step along ascent direction
    */
   double get_th_acceptnegstep() const;
 
+  /**
+   * @brief Return true if the multiple-shooting forward pass is enabled
+   */
+  bool get_multiple_shooting() const;
+
   /**
    * @brief Modify the threshold used for accepting step along ascent direction
    */
   void set_th_acceptnegstep(const double th_acceptnegstep);
 
+  /**
+   * @brief Enable / disable the multiple-shooting forward pass
+   *
+   * Note that the candidates are considered feasible if their gaps are lower
+   * than `th_gaptol`. Therefore, this threshold needs to be defined according
+   * to the desired accuracy.
+   */
+  virtual void set_multiple_shooting(const bool multiple_shooting);
+
+  /**
+   * @brief Enable / disable the concurrent line search
+   *
+   * The FDDP line search accepts the step lengths based on the gaps of each
+   * trial, which is not supported by the concurrent line search. Therefore,
+   * it throws an exception when enabling it.
+   */
+  virtual void set_parallel_linesearch(const bool parallel_linesearch);
+
  protected:
   double dg_;  //!< Internal data for computing the expected improvement
   double dq_;  //!< Internal data for computing the expected improvement
   double dv_;  //!< Internal data for computing the expected improvement
   double th_acceptnegstep_;  //!< Threshold used for accepting step along ascent
                              //!< direction
+  bool multiple_shooting_;   //!< Enable the multiple-shooting forward pass
+  std::vector<Eigen::VectorXd>
+      fs_try_;  //!< Gaps of the trial trajectory (size T+1)
 };
 
 }  // namespace crocoddyl
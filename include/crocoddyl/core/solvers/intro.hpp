@@ -37,10 +37,22 @@ class SolverIntro : public SolverFDDP {
   virtual double tryStep(const double step_length = 1);
   virtual double stoppingCriteria();
   virtual void resizeData();
+  virtual void shift();
   virtual double calcDiff();
   virtual void computeValueFunction(
       const std::size_t t, const boost::shared_ptr<ActionModelAbstract>& model);
   virtual void computeGains(const std::size_t t);
+  virtual bool parallelBackwardPass();
+
+  /**
+   * @brief Enable / disable the multiple-shooting forward pass
+   *
+   * The merit function of INTRO only accounts for the feasibility of the
+   * equality constraints, and it does not weight the gaps of the dynamics.
+   * Therefore, the multiple-shooting forward pass is not supported and it
+   * throws an exception when enabling it.
+   */
+  virtual void set_multiple_shooting(const bool multiple_shooting);
 
   /**
    * @brief Return the type of solver used for handling the equality constraints
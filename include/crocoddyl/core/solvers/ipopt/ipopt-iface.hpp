@@ -54,6 +54,15 @@ struct IpoptInterfaceData;
  * Initial condition: \f$ \mathbf{x}(0) \ominus (\mathbf{x}_{k}^0 \oplus
  * \mathbf{\Delta x}_{k}) = \mathbf{0}\f$
  *
+ * The sparsity structures of the constraint Jacobian and Hessian of the
+ * Lagrangian are built once in `get_nlp_info()`, together with the offset of
+ * each node in their arrays of values. This allows us to compute and fill the
+ * values of each node in parallel. Furthermore, the action models are only
+ * evaluated when %Ipopt provides a new decision vector, i.e., the `eval_*`
+ * methods reuse the values and derivatives of the previous call when `new_x`
+ * is false.
+ *
+ *
  * Documentation of the methods has been extracted from Ipopt::TNLP.hpp file
  *
  *  \sa `get_nlp_info()`, `get_bounds_info()`, `eval_f()`, `eval_g()`,
@@ -460,6 +469,34 @@ class IpoptInterface : public Ipopt::TNLP {
   void set_us(const std::vector<Eigen::VectorXd>& us);
 
  private:
+  /**
+   * @brief Build the sparsity structures of the constraint Jacobian and
+   * Hessian of the Lagrangian, and the offsets of each node
+   */
+  void computeSparsity();
+
+  /**
+   * @brief Compute the costs and constraint residuals for a decision vector
+   *
+   * It does nothing if they were already computed for this decision vector.
+   *
+   * @param[in] x      Values for the primal variables \f$x\f$
+   * @param[in] new_x  False if any evaluation method (`eval_*`) was previously
+   * called with the same values in x, true otherwise
+   */
+  void updateCalc(const Ipopt::Number* x, const bool new_x);
+
+  /**
+   * @brief Compute the cost and constraint derivatives for a decision vector
+   *
+   * It does nothing if they were already computed for this decision vector.
+   *
+   * @param[in] x      Values for the primal variables \f$x\f$
+   * @param[in] new_x  False if any evaluation method (`eval_*`) was previously
+   * called with the same values in x, true otherwise
+   */
+  void updateCalcDiff(const Ipopt::Number* x, const bool new_x);
+
   boost::shared_ptr<crocoddyl::ShootingProblem>
       problem_;                      //!< Optimal control problem
   std::vector<Eigen::VectorXd> xs_;  //!< Vector of states
@@ -470,6 +507,17 @@ class IpoptInterface : public Ipopt::TNLP {
   std::vector<boost::shared_ptr<IpoptInterfaceData>>
       datas_;    //!< Vector of Datas
   double cost_;  //!< Total cost
+  std::vector<std::size_t>
+      ijac_;  //!< Offset of each node in the Jacobian values
+  std::vector<std::size_t>
+      ihess_;  //!< Offset of each node in the Hessian values
+  std::vector<Ipopt::Index> jac_irow_;   //!< Row indexes of the Jacobian
+  std::vector<Ipopt::Index> jac_jcol_;   //!< Column indexes of the Jacobian
+  std::vector<Ipopt::Index> hess_irow_;  //!< Row indexes of the Hessian
+  std::vector<Ipopt::Index> hess_jcol_;  //!< Column indexes of the Hessian
+  Eigen::VectorXd x0_diff_;              //!< Residual of the initial condition
+  bool calc_updated_;      //!< True if the costs and constraints are updated
+  bool calcdiff_updated_;  //!< True if the derivatives are updated
 
   IpoptInterface(const IpoptInterface&);
 
@@ -13,15 +13,32 @@
 
 #include <Eigen/Cholesky>
 #include <Eigen/Dense>
+#include <Eigen/SparseCore>
+#include <Eigen/SparseLU>
+#include <boost/make_shared.hpp>
 
 #include "crocoddyl/core/solver-base.hpp"
 
 namespace crocoddyl {
 
+/**
+ * @brief KKT solver
+ *
+ * The KKT solver computes the primal and dual search directions by solving the
+ * KKT system of the whole optimal control problem. This system is stored as a
+ * sparse matrix, whose sparsity pattern (i.e., the per-node blocks of the cost
+ * Hessians and dynamics Jacobians) is defined once when allocating the data.
+ * It allows us to compute the symbolic analysis of the sparse LU factorization
+ * only once. Therefore, each iteration only needs to update the values of the
+ * KKT matrix and to run its numerical factorization, which scales linearly
+ * with the horizon length.
+ */
 class SolverKKT : public SolverAbstract {
  public:
   EIGEN_MAKE_ALIGNED_OPERATOR_NEW
 
+  typedef Eigen::SparseMatrix<double> SparseMatrixXd;
+
   explicit SolverKKT(boost::shared_ptr<ShootingProblem> problem);
   virtual ~SolverKKT();
 
@@ -35,7 +52,17 @@ class SolverKKT : public SolverAbstract {
   virtual double stoppingCriteria();
   virtual const Eigen::Vector2d& expectedImprovement();
 
-  const Eigen::MatrixXd& get_kkt() const;
+  /**
+   * @brief Return the KKT matrix as a dense matrix
+   *
+   * Note that this matrix is built from the sparse KKT matrix on demand.
+   */
+  Eigen::MatrixXd get_kkt() const;
+
+  /**
+   * @brief Return the sparse KKT matrix
+   */
+  const SparseMatrixXd& get_kkt_sparse() const;
   const Eigen::VectorXd& get_kktref() const;
   const Eigen::VectorXd& get_primaldual() const;
   const std::vector<Eigen::VectorXd>& get_dxs() const;
@@ -53,13 +80,49 @@ class SolverKKT : public SolverAbstract {
   double cost_try_;
   std::vector<Eigen::VectorXd> xs_try_;
   std::vector<Eigen::VectorXd> us_try_;
+  double direction_time_;  //!< Last duration of the search direction
+                           //!< computation (in milliseconds)
+  double trial_time_;      //!< Last duration of a line-search trial (in
+                           //!< milliseconds)
 
  private:
+  typedef Eigen::SparseLU<SparseMatrixXd, Eigen::COLAMDOrdering<int> > SparseLU;
+
+  /**
+   * @brief Sparse LU factorization that is rebuilt on copy
+   *
+   * Eigen's sparse LU cannot be copied. Instead, each copy of the solver owns
+   * a new factorization, which analyzes the sparsity pattern before its first
+   * factorization.
+   */
+  struct SparseLUPtr {
+    SparseLUPtr() : lu(boost::make_shared<SparseLU>()), is_analyzed(false) {}
+    SparseLUPtr(const SparseLUPtr&)
+        : lu(boost::make_shared<SparseLU>()), is_analyzed(false) {}
+    SparseLUPtr& operator=(const SparseLUPtr&) {
+      lu = boost::make_shared<SparseLU>();
+      is_analyzed = false;
+      return *this;
+    }
+
+    boost::shared_ptr<SparseLU> lu;  //!< Sparse LU factorization
+    bool is_analyzed;  //!< True if the sparsity pattern was analyzed
+  };
+
   double calcDiff();
   void computePrimalDual();
   void increaseRegularization();
   void decreaseRegularization();
   void allocateData();
+  void addKKTBlockPattern(std::vector<Eigen::Triplet<double> >& triplets,
+                          const std::size_t row, const std::size_t col,
+                          const std::size_t nrows, const std::size_t ncols,
+                          const bool symmetric);
+  void addKKTBlockOffsets(const std::size_t row, const std::size_t col,
+                          const std::size_t nrows, const std::size_t ncols,
+                          const bool symmetric);
+  void updateKKTBlock(const Eigen::Ref<const Eigen::MatrixXd>& block,
+                      const double scale, const bool symmetric, std::size_t& k);
 
   std::size_t nx_;
   std::size_t ndx_;
@@ -67,9 +130,13 @@ class SolverKKT : public SolverAbstract {
   std::vector<Eigen::VectorXd> dxs_;
   std::vector<Eigen::VectorXd> dus_;
   std::vector<Eigen::VectorXd> lambdas_;
+  Eigen::VectorXd dx_try_;  //!< Scaled state direction of the trial step
 
   // allocate data
-  Eigen::MatrixXd kkt_;
+  SparseMatrixXd kkt_;
+  std::vector<Eigen::Index>
+      kkt_offsets_;  //!< Offsets in the values of kkt_ of each block column
+  SparseLUPtr kkt_lu_;
   Eigen::VectorXd kktref_;
   Eigen::VectorXd primaldual_;
   Eigen::VectorXd primal_;
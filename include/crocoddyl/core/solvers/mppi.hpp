@@ -0,0 +1,194 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, Heriot-Watt University, University of Edinburgh
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#ifndef CROCODDYL_CORE_SOLVERS_MPPI_HPP_
+#define CROCODDYL_CORE_SOLVERS_MPPI_HPP_
+
+#include <random>
+#include <vector>
+
+#include "crocoddyl/core/solver-base.hpp"
+
+namespace crocoddyl {
+
+/**
+ * @brief Model predictive path integral (MPPI) solver
+ *
+ * This sampling-based solver does not require the derivatives of the action
+ * models. In each iteration, it draws \f$K\f$ control sequences around the
+ * current control trajectory \f$\mathbf{u}_s\f$ by adding Gaussian noise
+ * \f$\boldsymbol{\epsilon}^k_t\sim\mathcal{N}(\mathbf{0},\sigma^2\mathbf{I})\f$,
+ * and it rolls out the dynamics and costs of each sample to obtain its total
+ * cost \f$S_k\f$. The search direction is the exponentially-weighted average of
+ * the perturbations, i.e.,
+ * \f{equation*}{
+ * \delta\mathbf{u}_t = \sum_{k=1}^K w_k\boldsymbol{\epsilon}^k_t,\quad
+ * w_k \propto \exp\left(-\frac{1}{\lambda}(S_k - \min_j S_j)\right),
+ * \f}
+ * where \f$\lambda\f$ is the temperature. The first sample is always the
+ * noise-free control trajectory, and the perturbed controls are saturated by
+ * the control limits of the action models. The update is accepted only if it
+ * decreases the total cost, and the state trajectory is always obtained from a
+ * rollout. Therefore, the resulting trajectories are dynamically feasible and
+ * they can be used to warm start a gradient-based solver (e.g., `SolverFDDP`).
+ *
+ * The samples are distributed among the threads. Each thread owns a copy of the
+ * action data and a random-number generator, so the rollouts do not share
+ * memory. The sampled costs are reproducible for a given seed and number of
+ * threads.
+ *
+ * \sa `solve()`, `computeDirection()`, `tryStep()`, `stoppingCriteria()`
+ */
+class SolverMPPI : public SolverAbstract {
+ public:
+  EIGEN_MAKE_ALIGNED_OPERATOR_NEW
+
+  /**
+   * @brief Initialize the MPPI solver
+   *
+   * @param[in] problem   shooting problem
+   * @param[in] nsamples  number of sampled control trajectories (default 100)
+   */
+  explicit SolverMPPI(boost::shared_ptr<ShootingProblem> problem,
+                      const std::size_t nsamples = 100);
+  virtual ~SolverMPPI();
+
+  virtual bool solve(
+      const std::vector<Eigen::VectorXd>& init_xs = DEFAULT_VECTOR,
+      const std::vector<Eigen::VectorXd>& init_us = DEFAULT_VECTOR,
+      const std::size_t maxiter = 100, const bool is_feasible = false,
+      const double init_reg = NAN);
+
+  /**
+   * @brief Sample and roll out the control trajectories, and compute the
+   * weighted control update
+   *
+   * The derivatives of the action models are not required, so the \p recalc
+   * argument is ignored.
+   */
+  virtual void computeDirection(const bool recalc = true);
+
+  /**
+   * @brief Roll out the weighted control update scaled by the step length, and
+   * return its cost reduction
+   */
+  virtual double tryStep(const double steplength = 1);
+
+  /**
+   * @brief Return the squared norm of the weighted control update
+   */
+  virtual double stoppingCriteria();
+
+  /**
+   * @brief Return a null expected improvement
+   *
+   * This solver does not build a local model of the problem.
+   */
+  virtual const Eigen::Vector2d& expectedImprovement();
+
+  virtual void resizeData();
+
+  /**
+   * @brief Allocate the per-sample and per-thread data
+   */
+  void allocateData();
+
+  /**
+   * @brief Return the number of sampled control trajectories
+   */
+  std::size_t get_nsamples() const;
+
+  /**
+   * @brief Return the temperature \f$\lambda\f$
+   */
+  double get_lambda() const;
+
+  /**
+   * @brief Return the standard deviation \f$\sigma\f$ of the control noise
+   */
+  double get_noise_std() const;
+
+  /**
+   * @brief Return the seed of the random-number generators
+   */
+  unsigned int get_seed() const;
+
+  /**
+   * @brief Return the number of threads
+   */
+  std::size_t get_nthreads() const;
+
+  /**
+   * @brief Return the control update \f$\delta\mathbf{u}_s\f$
+   */
+  const std::vector<Eigen::VectorXd>& get_dus() const;
+
+  /**
+   * @brief Return the total cost of each sample computed in the last iteration
+   */
+  const Eigen::VectorXd& get_sample_costs() const;
+
+  /**
+   * @brief Return the weight of each sample computed in the last iteration
+   */
+  const Eigen::VectorXd& get_weights() const;
+
+  /**
+   * @brief Modify the number of sampled control trajectories
+   */
+  void set_nsamples(const std::size_t nsamples);
+
+  /**
+   * @brief Modify the temperature \f$\lambda\f$
+   */
+  void set_lambda(const double lambda);
+
+  /**
+   * @brief Modify the standard deviation \f$\sigma\f$ of the control noise
+   */
+  void set_noise_std(const double noise_std);
+
+  /**
+   * @brief Modify the seed and reset the random-number generators
+   */
+  void set_seed(const unsigned int seed);
+
+  /**
+   * @brief Modify the number of threads used for rolling out the samples
+   *
+   * If the number of threads is lower than one, then it uses the default
+   * number of threads.
+   */
+  void set_nthreads(const int nthreads);
+
+ protected:
+  std::size_t nsamples_;  //!< Number of sampled control trajectories
+  double lambda_;         //!< Temperature
+  double noise_std_;      //!< Standard deviation of the control noise
+  unsigned int seed_;     //!< Seed of the random-number generators
+  std::size_t nthreads_;  //!< Number of threads
+  double cost_try_;       //!< Total cost computed by the line-search procedure
+  std::vector<Eigen::VectorXd>
+      xs_try_;  //!< State trajectory computed by the line-search procedure
+  std::vector<Eigen::VectorXd>
+      us_try_;  //!< Control trajectory computed by the line-search procedure
+  std::vector<Eigen::VectorXd> dus_;  //!< Weighted control update
+  std::vector<std::vector<Eigen::VectorXd> >
+      noises_;                      //!< Control perturbation of each sample
+  Eigen::VectorXd costs_;           //!< Total cost of each sample
+  Eigen::VectorXd weights_;         //!< Weight of each sample
+  std::vector<std::mt19937> rngs_;  //!< Random-number generator of each thread
+  std::vector<std::vector<boost::shared_ptr<ActionDataAbstract> > >
+      thread_datas_;  //!< Action data of each thread
+  std::vector<std::vector<Eigen::VectorXd> >
+      thread_us_;  //!< Perturbed control trajectory of each thread
+};
+
+}  // namespace crocoddyl
+
+#endif  // CROCODDYL_CORE_SOLVERS_MPPI_HPP_
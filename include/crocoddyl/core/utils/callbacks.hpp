@@ -12,6 +12,7 @@
 
 #include <iomanip>
 #include <iostream>
+#include <vector>
 
 #include "crocoddyl/core/solver-base.hpp"
 
@@ -52,6 +53,142 @@ class CallbackVerbose : public CallbackAbstract {
   void update_header();
 };
 
+/**
+ * @brief Callback function for logging the solver values
+ *
+ * It records the iteration, cost, stopping criteria, gradient, regularization,
+ * step length and feasibility values of each iteration into preallocated ring
+ * buffers of fixed capacity. When the capacity is reached, the oldest
+ * iterations are overwritten. Optionally, it also records the state, control
+ * and gap trajectories of each iteration, where each column stores the
+ * stacked trajectory of an iteration. The returned values are ordered from the
+ * oldest to the newest iteration. They are views of the buffers, which are
+ * valid until the next record, `reset()` or modification of the logger.
+ *
+ * \sa `get_costs()`, `get_xs_log()`
+ */
+class CallbackLogger : public CallbackAbstract {
+ public:
+  typedef Eigen::Matrix<int, Eigen::Dynamic, 1> VectorXi;
+
+  /**
+   * @brief Initialize the logger callback
+   *
+   * @param[in] capacity           maximum number of recorded iterations
+   * (default 1000)
+   * @param[in] with_trajectories  true for recording the trajectories of each
+   * iteration (default false)
+   */
+  explicit CallbackLogger(const std::size_t capacity = 1000,
+                          const bool with_trajectories = false);
+  ~CallbackLogger() override;
+
+  void operator()(SolverAbstract& solver) override;
+
+  /**
+   * @brief Remove the recorded iterations
+   */
+  void reset();
+
+  /**
+   * @brief Return the number of recorded iterations
+   */
+  std::size_t get_size() const;
+
+  /**
+   * @brief Return the maximum number of recorded iterations
+   */
+  std::size_t get_capacity() const;
+
+  /**
+   * @brief Return true if the trajectories are recorded
+   */
+  bool get_with_trajectories() const;
+
+  Eigen::Ref<const VectorXi> get_iters() const;
+  Eigen::Ref<const Eigen::VectorXd> get_costs() const;
+  Eigen::Ref<const Eigen::VectorXd> get_stops() const;
+  Eigen::Ref<const Eigen::VectorXd> get_grads() const;
+  Eigen::Ref<const Eigen::VectorXd> get_pregs() const;
+  Eigen::Ref<const Eigen::VectorXd> get_dregs() const;
+  Eigen::Ref<const Eigen::VectorXd> get_steps() const;
+  Eigen::Ref<const Eigen::VectorXd> get_ffeass() const;
+  Eigen::Ref<const Eigen::VectorXd> get_hfeass() const;
+
+  /**
+   * @brief Return the state trajectory of the last iteration
+   */
+  const std::vector<Eigen::VectorXd>& get_xs() const;
+
+  /**
+   * @brief Return the control trajectory of the last iteration
+   */
+  const std::vector<Eigen::VectorXd>& get_us() const;
+
+  /**
+   * @brief Return the stacked state trajectory of each iteration
+   */
+  Eigen::Ref<const Eigen::MatrixXd> get_xs_log() const;
+
+  /**
+   * @brief Return the stacked control trajectory of each iteration
+   */
+  Eigen::Ref<const Eigen::MatrixXd> get_us_log() const;
+
+  /**
+   * @brief Return the stacked gap trajectory of each iteration
+   */
+  Eigen::Ref<const Eigen::MatrixXd> get_fs_log() const;
+
+  /**
+   * @brief Return the gap trajectory of each iteration
+   *
+   * It splits the stacked gap trajectories into the gaps of each node. It
+   * requires to record the trajectories.
+   */
+  std::vector<std::vector<Eigen::VectorXd> > get_fs() const;
+
+  /**
+   * @brief Modify the maximum number of recorded iterations
+   *
+   * It reallocates the buffers and removes the recorded iterations.
+   */
+  void set_capacity(const std::size_t capacity);
+
+  /**
+   * @brief Enable or disable the recording of the trajectories
+   *
+   * It removes the recorded iterations.
+   */
+  void set_with_trajectories(const bool with_trajectories);
+
+ private:
+  void unwrap() const;
+  void allocateTrajectories(const SolverAbstract& solver);
+
+  std::size_t capacity_;             //!< Maximum number of recorded iterations
+  bool with_trajectories_;           //!< True for recording the trajectories
+  std::size_t size_;                 //!< Number of recorded iterations
+  mutable std::size_t head_;         //!< Position of the next record
+  mutable VectorXi iters_;           //!< Iteration numbers
+  mutable Eigen::VectorXd costs_;    //!< Total costs
+  mutable Eigen::VectorXd stops_;    //!< Stopping-criteria values
+  mutable Eigen::VectorXd grads_;    //!< Expected gradients
+  mutable Eigen::VectorXd pregs_;    //!< Primal-variable regularizations
+  mutable Eigen::VectorXd dregs_;    //!< Dual-variable regularizations
+  mutable Eigen::VectorXd steps_;    //!< Step lengths
+  mutable Eigen::VectorXd ffeass_;   //!< Dynamic feasibilities
+  mutable Eigen::VectorXd hfeass_;   //!< Inequality feasibilities
+  mutable Eigen::MatrixXd xs_log_;   //!< Stacked state trajectories
+  mutable Eigen::MatrixXd us_log_;   //!< Stacked control trajectories
+  mutable Eigen::MatrixXd fs_log_;   //!< Stacked gap trajectories
+  std::vector<Eigen::Index> ndxs_;   //!< Dimension of the gap of each node
+  std::vector<Eigen::VectorXd> xs_;  //!< State trajectory of the last
+                                     //!< iteration
+  std::vector<Eigen::VectorXd> us_;  //!< Control trajectory of the last
+                                     //!< iteration
+};
+
 }  // namespace crocoddyl
 
 #endif  // CROCODDYL_CORE_UTILS_CALLBACKS_HPP_
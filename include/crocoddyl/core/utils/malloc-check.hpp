@@ -0,0 +1,177 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, Heriot-Watt University, University of Edinburgh
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#ifndef CROCODDYL_CORE_UTILS_MALLOC_CHECK_HPP_
+#define CROCODDYL_CORE_UTILS_MALLOC_CHECK_HPP_
+
+#include <Eigen/Core>
+
+#ifdef CROCODDYL_WITH_CHECK_RUNTIME_MALLOC
+#ifndef EIGEN_RUNTIME_NO_MALLOC
+#error "CROCODDYL_WITH_CHECK_RUNTIME_MALLOC requires EIGEN_RUNTIME_NO_MALLOC"
+#endif
+#include <atomic>
+#include <mutex>
+#include <thread>
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#include <omp.h>
+#endif  // CROCODDYL_WITH_MULTITHREADING
+#define CROCODDYL_EIGEN_MALLOC(allowed) \
+  ::Eigen::internal::set_is_malloc_allowed(allowed)
+#define CROCODDYL_EIGEN_MALLOC_ALLOWED() CROCODDYL_EIGEN_MALLOC(true)
+#define CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED() CROCODDYL_EIGEN_MALLOC(false)
+#else
+#define CROCODDYL_EIGEN_MALLOC(allowed)
+#define CROCODDYL_EIGEN_MALLOC_ALLOWED()
+#define CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED()
+#endif
+
+namespace crocoddyl {
+
+/**
+ * @brief Scope that allows or forbids the heap allocations of Eigen objects
+ *
+ * When Crocoddyl is built with the `CHECK_RUNTIME_MALLOC` option, any heap
+ * allocation of an Eigen object inside a forbidden scope triggers an assertion
+ * failure, whose backtrace points to the allocation. The previous state is
+ * restored on destruction, so scopes can be nested. Without this option, it
+ * does nothing.
+ *
+ * Eigen keeps a single allocation flag for the whole process. For this reason,
+ * the check is restricted to single-threaded sections: only one thread (the
+ * owner of the outermost scope) forbids the allocations at a time, and scopes
+ * that forbid them inside an OpenMP parallel region (e.g., the solvers of a
+ * `SolverBatch`) or while another thread owns the check do nothing. The
+ * parallel regions opened by the owner (e.g., the multithreaded `calc` and
+ * `calcDiff` of the problem) are still checked, and the scopes that allow the
+ * allocations inside them are shared among their threads. Other threads must
+ * not allocate Eigen objects during a checked section.
+ */
+class MallocCheckScope {
+ public:
+  /**
+   * @brief Allow or forbid the heap allocations of Eigen objects
+   *
+   * @param[in] allowed  true for allowing the heap allocations
+   */
+  explicit MallocCheckScope(const bool allowed) {
+#ifdef CROCODDYL_WITH_CHECK_RUNTIME_MALLOC
+    owner_ = false;
+    shared_ = false;
+    if (in_parallel()) {
+      if (allowed) {
+        shared_ = true;
+        std::lock_guard<std::mutex> lock(get_shared_mutex());
+        if (get_shared_scopes()++ == 0) {
+          get_shared_previous() = Eigen::internal::is_malloc_allowed();
+          CROCODDYL_EIGEN_MALLOC(true);
+        }
+      }
+    } else if (acquire()) {
+      owner_ = true;
+      previous_ = Eigen::internal::is_malloc_allowed();
+      CROCODDYL_EIGEN_MALLOC(allowed);
+    }
+#endif
+    (void)allowed;
+  }
+  ~MallocCheckScope() {
+#ifdef CROCODDYL_WITH_CHECK_RUNTIME_MALLOC
+    if (shared_) {
+      std::lock_guard<std::mutex> lock(get_shared_mutex());
+      if (--get_shared_scopes() == 0) {
+        CROCODDYL_EIGEN_MALLOC(get_shared_previous());
+      }
+    } else if (owner_) {
+      CROCODDYL_EIGEN_MALLOC(previous_);
+      release();
+    }
+#endif
+  }
+
+ private:
+  MallocCheckScope(const MallocCheckScope&);
+  MallocCheckScope& operator=(const MallocCheckScope&);
+
+#ifdef CROCODDYL_WITH_CHECK_RUNTIME_MALLOC
+  /**
+   * @brief Return true inside an active OpenMP parallel region
+   */
+  static bool in_parallel() {
+#ifdef CROCODDYL_WITH_MULTITHREADING
+    return omp_in_parallel();
+#else
+    return false;
+#endif
+  }
+
+  /**
+   * @brief Return the thread that owns the check
+   */
+  static std::atomic<std::thread::id>& get_owner() {
+    static std::atomic<std::thread::id> owner{std::thread::id()};
+    return owner;
+  }
+
+  /**
+   * @brief Return the number of nested scopes opened by the owner
+   */
+  static std::size_t& get_depth() {
+    static std::size_t depth = 0;
+    return depth;
+  }
+
+  /**
+   * @brief Take the ownership of the check if this is a single-threaded
+   * section
+   */
+  static bool acquire() {
+    const std::thread::id self = std::this_thread::get_id();
+    std::thread::id none;
+    if (!get_owner().compare_exchange_strong(none, self) && none != self) {
+      return false;
+    }
+    ++get_depth();
+    return true;
+  }
+
+  /**
+   * @brief Release the ownership of the check after its outermost scope
+   */
+  static void release() {
+    if (--get_depth() == 0) {
+      get_owner().store(std::thread::id());
+    }
+  }
+
+  /**
+   * @brief Return the mutex, number and previous allocation state of the
+   * scopes shared inside parallel regions
+   */
+  static std::mutex& get_shared_mutex() {
+    static std::mutex mutex;
+    return mutex;
+  }
+  static std::size_t& get_shared_scopes() {
+    static std::size_t scopes = 0;
+    return scopes;
+  }
+  static bool& get_shared_previous() {
+    static bool previous = true;
+    return previous;
+  }
+
+  bool owner_;     //!< True if this scope owns the check
+  bool shared_;    //!< True if this scope is shared inside a parallel region
+  bool previous_;  //!< Allocation state before entering the scope
+#endif
+};
+
+}  // namespace crocoddyl
+
+#endif  // CROCODDYL_CORE_UTILS_MALLOC_CHECK_HPP_
@@ -145,6 +145,8 @@ void DifferentialActionModelContactFwdDynamicsTpl<Scalar>::calc(
   contacts_->updateForce(d->multibody.contacts, d->pinocchio.lambda_c);
   d->multibody.joint->a = d->pinocchio.ddq;
   d->multibody.joint->tau = u;
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x, u);
   d->cost = d->costs->cost;
   if (constraints_ != nullptr) {
@@ -171,6 +173,8 @@ void DifferentialActionModelContactFwdDynamicsTpl<Scalar>::calc(
 
   pinocchio::computeAllTerms(pinocchio_, d->pinocchio, q, v);
   pinocchio::computeCentroidalMomentum(pinocchio_, d->pinocchio);
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x);
   d->cost = d->costs->cost;
   if (constraints_ != nullptr) {
@@ -248,6 +252,8 @@ void DifferentialActionModelContactFwdDynamicsTpl<Scalar>::calcDiff(
     contacts_->updateForceDiff(d->multibody.contacts, d->df_dx.topRows(nc),
                                d->df_du.topRows(nc));
   }
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x, u);
   if (constraints_ != nullptr) {
     constraints_->calcDiff(d->constraints, x, u);
@@ -264,6 +270,8 @@ void DifferentialActionModelContactFwdDynamicsTpl<Scalar>::calcDiff(
                         std::to_string(state_->get_nx()) + ")");
   }
   Data* d = static_cast<Data*>(data.get());
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x);
   if (constraints_ != nullptr) {
     constraints_->calcDiff(d->constraints, x);
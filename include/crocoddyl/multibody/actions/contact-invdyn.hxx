@@ -165,6 +165,8 @@ void DifferentialActionModelContactInvDynamicsTpl<Scalar>::calc(
   d->multibody.joint->a = a;
   d->multibody.joint->tau = d->multibody.actuation->u;
   actuation_->calc(d->multibody.actuation, x, d->multibody.joint->tau);
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x, u);
   d->cost = d->costs->cost;
   for (std::string name : contacts_->get_active_set()) {
@@ -197,6 +199,8 @@ void DifferentialActionModelContactInvDynamicsTpl<Scalar>::calc(
 
   pinocchio::computeAllTerms(pinocchio_, d->pinocchio, q, v);
   pinocchio::computeCentroidalMomentum(pinocchio_, d->pinocchio);
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x);
   d->cost = d->costs->cost;
   d->constraints->resize(this, d);
@@ -247,6 +251,8 @@ void DifferentialActionModelContactInvDynamicsTpl<Scalar>::calcDiff(
       -d->multibody.actuation->Mtau *
       d->multibody.contacts->Jc.topRows(nc).transpose();
   contacts_->calcDiff(d->multibody.contacts, x);
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x, u);
   for (std::string name : contacts_->get_active_set()) {
     constraints_->changeConstraintStatus(name + "_acc", true);
@@ -270,6 +276,8 @@ void DifferentialActionModelContactInvDynamicsTpl<Scalar>::calcDiff(
                         std::to_string(state_->get_nx()) + ")");
   }
   Data* d = static_cast<Data*>(data.get());
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x);
   if (constraints_ != nullptr) {
     constraints_->calcDiff(d->constraints, x);
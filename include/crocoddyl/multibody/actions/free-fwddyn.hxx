@@ -89,6 +89,8 @@ void DifferentialActionModelFreeFwdDynamicsTpl<Scalar>::calc(
   }
   d->multibody.joint->a = d->xout;
   d->multibody.joint->tau = u;
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x, u);
   d->cost = d->costs->cost;
   if (constraints_ != nullptr) {
@@ -115,6 +117,8 @@ void DifferentialActionModelFreeFwdDynamicsTpl<Scalar>::calc(
 
   pinocchio::computeAllTerms(pinocchio_, d->pinocchio, q, v);
 
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x);
   d->cost = d->costs->cost;
   if (constraints_ != nullptr) {
@@ -166,6 +170,8 @@ void DifferentialActionModelFreeFwdDynamicsTpl<Scalar>::calcDiff(
   }
   d->multibody.joint->da_dx = d->Fx;
   d->multibody.joint->da_du = d->Fu;
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x, u);
   if (constraints_ != nullptr) {
     constraints_->calcDiff(d->constraints, x, u);
@@ -183,6 +189,8 @@ void DifferentialActionModelFreeFwdDynamicsTpl<Scalar>::calcDiff(
   }
   Data* d = static_cast<Data*>(data.get());
 
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x);
   if (constraints_ != nullptr) {
     constraints_->calcDiff(d->constraints, x);
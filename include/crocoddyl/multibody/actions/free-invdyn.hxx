@@ -113,6 +113,8 @@ void DifferentialActionModelFreeInvDynamicsTpl<Scalar>::calc(
   d->multibody.joint->a = u;
   d->multibody.joint->tau = d->multibody.actuation->u;
   actuation_->calc(d->multibody.actuation, x, d->multibody.joint->tau);
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x, u);
   d->cost = d->costs->cost;
   d->constraints->resize(this, d);
@@ -137,6 +139,8 @@ void DifferentialActionModelFreeInvDynamicsTpl<Scalar>::calc(
 
   pinocchio::computeAllTerms(pinocchio_, d->pinocchio, q, v);
 
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x);
   d->cost = d->costs->cost;
   d->constraints->resize(this, d);
@@ -177,6 +181,8 @@ void DifferentialActionModelFreeInvDynamicsTpl<Scalar>::calcDiff(
       d->multibody.actuation->Mtau * d->pinocchio.dtau_dv;
   d->multibody.joint->dtau_du.noalias() =
       d->multibody.actuation->Mtau * d->pinocchio.M;
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x, u);
   constraints_->calcDiff(d->constraints, x, u);
 }
@@ -192,6 +198,8 @@ void DifferentialActionModelFreeInvDynamicsTpl<Scalar>::calcDiff(
   }
   Data* d = static_cast<Data*>(data.get());
 
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x);
   constraints_->calcDiff(d->constraints, x);
 }
@@ -78,6 +78,8 @@ void ActionModelImpulseFwdDynamicsTpl<Scalar>::calc(
   initCalc(d, x);
 
   // Computing the cost and constraints
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x, u);
   d->cost = d->costs->cost;
   if (constraints_ != nullptr) {
@@ -96,6 +98,8 @@ void ActionModelImpulseFwdDynamicsTpl<Scalar>::calc(
   initCalc(d, x);
 
   // Computing the cost and constraints
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calc(d->costs, x);
   d->cost = d->costs->cost;
   if (constraints_ != nullptr) {
@@ -114,6 +118,8 @@ void ActionModelImpulseFwdDynamicsTpl<Scalar>::calcDiff(
   initCalcDiff(d, x);
 
   // Computing derivatives of cost and constraints
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x, u);
   if (constraints_ != nullptr) {
     constraints_->calcDiff(d->constraints, x, u);
@@ -130,6 +136,8 @@ void ActionModelImpulseFwdDynamicsTpl<Scalar>::calcDiff(
   initCalcDiff(d, x);
 
   // Computing derivatives of cost and constraints
+  const FrameKinematicsCacheGuardTpl<Scalar> cache_guard(
+      d->multibody.frame_cache);
   costs_->calcDiff(d->costs, x);
   if (constraints_ != nullptr) {
     constraints_->calcDiff(d->constraints, x);
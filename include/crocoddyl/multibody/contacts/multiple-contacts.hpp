@@ -45,7 +45,7 @@ struct ContactItemTpl {
 
   std::string name;
   boost::shared_ptr<ContactModelAbstract> contact;
-  bool active;
+  bool active;  //!< Contact status (change it with `changeContactStatus()`)
 };
 
 /**
@@ -122,6 +122,10 @@ class ContactModelMultipleTpl {
   /**
    * @brief Change the contact status
    *
+   * The status of the contact items has to be changed through this function,
+   * as it rebuilds the list of active contact items used in `calc()` and
+   * `calcDiff()`.
+   *
    * @param[in] name     Contact name
    * @param[in] active   Contact status (True for active)
    */
@@ -277,6 +281,14 @@ class ContactModelMultipleTpl {
                                   const ContactModelMultipleTpl<Scalar>& model);
 
  private:
+  /**
+   * @brief Update the list of active contact items
+   *
+   * It is called every time a contact item is added or removed, or when its
+   * status changes.
+   */
+  void updateActiveItems();
+
   boost::shared_ptr<StateMultibody> state_;
   ContactModelContainer contacts_;
   std::size_t nc_;
@@ -285,6 +297,11 @@ class ContactModelMultipleTpl {
   std::set<std::string> active_set_;
   std::set<std::string> inactive_set_;
   bool compute_all_contacts_;
+  std::vector<boost::shared_ptr<ContactItem> >
+      active_items_;  //!< Active contact items, ordered by name
+  std::vector<std::size_t>
+      active_ids_;  //!< Positions of the active contact items in the stack
+                    //!< (in increasing order)
 };
 
 /**
@@ -331,6 +348,12 @@ struct ContactDataMultipleTpl {
       contacts.insert(
           std::make_pair(item->name, item->contact->createData(data)));
     }
+    contact_datas.reserve(contacts.size());
+    for (typename ContactModelMultiple::ContactDataContainer::const_iterator
+             it = contacts.begin();
+         it != contacts.end(); ++it) {
+      contact_datas.push_back(it->second);
+    }
   }
 
   MatrixXs Jc;  //!< Contact Jacobian in frame coordinate
@@ -353,6 +376,8 @@ struct ContactDataMultipleTpl {
                //!< ndx}\f$
   typename ContactModelMultiple::ContactDataContainer
       contacts;  //!< Stack of contact data
+  std::vector<boost::shared_ptr<ContactDataAbstractTpl<Scalar> > >
+      contact_datas;  //!< Contact datas ordered as the stack of contact items
   pinocchio::container::aligned_vector<pinocchio::ForceTpl<Scalar> >
       fext;  //!< External spatial forces in body coordinates
 };
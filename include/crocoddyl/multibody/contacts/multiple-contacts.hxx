@@ -54,6 +54,7 @@ void ContactModelMultipleTpl<Scalar>::addContact(
     nc_total_ += contact->get_nc();
     inactive_set_.insert(name);
   }
+  updateActiveItems();
 }
 
 template <typename Scalar>
@@ -65,6 +66,7 @@ void ContactModelMultipleTpl<Scalar>::removeContact(const std::string& name) {
     contacts_.erase(it);
     active_set_.erase(name);
     inactive_set_.erase(name);
+    updateActiveItems();
   } else {
     std::cerr << "Warning: we couldn't remove the " << name
               << " contact item, it doesn't exist." << std::endl;
@@ -87,12 +89,27 @@ void ContactModelMultipleTpl<Scalar>::changeContactStatus(
     }
     // "else" case: Contact status unchanged - already in desired state
     it->second->active = active;
+    updateActiveItems();
   } else {
     std::cerr << "Warning: we couldn't change the status of the " << name
               << " contact item, it doesn't exist." << std::endl;
   }
 }
 
+template <typename Scalar>
+void ContactModelMultipleTpl<Scalar>::updateActiveItems() {
+  active_items_.clear();
+  active_ids_.clear();
+  std::size_t i = 0;
+  for (typename ContactModelContainer::const_iterator it = contacts_.begin();
+       it != contacts_.end(); ++it, ++i) {
+    if (it->second->active) {
+      active_items_.push_back(it->second);
+      active_ids_.push_back(i);
+    }
+  }
+}
+
 template <typename Scalar>
 void ContactModelMultipleTpl<Scalar>::calc(
     const boost::shared_ptr<ContactDataMultiple>& data,
@@ -104,20 +121,16 @@ void ContactModelMultipleTpl<Scalar>::calc(
 
   std::size_t nc = 0;
   const std::size_t nv = state_->get_nv();
-  typename ContactModelContainer::iterator it_m, end_m;
-  typename ContactDataContainer::iterator it_d, end_d;
   if (compute_all_contacts_) {
-    for (it_m = contacts_.begin(), end_m = contacts_.end(),
-        it_d = data->contacts.begin(), end_d = data->contacts.end();
-         it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
+    std::size_t i = 0, j = 0;
+    for (typename ContactModelContainer::iterator it_m = contacts_.begin();
+         it_m != contacts_.end(); ++it_m, ++i) {
       const boost::shared_ptr<ContactItem>& m_i = it_m->second;
       const std::size_t nc_i = m_i->contact->get_nc();
-      if (m_i->active) {
-        const boost::shared_ptr<ContactDataAbstract>& d_i = it_d->second;
-        assert_pretty(
-            it_m->first == it_d->first,
-            "it doesn't match the contact name between model and data ("
-                << it_m->first << " != " << it_d->first << ")");
+      if (j < active_ids_.size() && active_ids_[j] == i) {
+        ++j;
+        const boost::shared_ptr<ContactDataAbstract>& d_i =
+            data->contact_datas[i];
         m_i->contact->calc(d_i, x);
         data->a0.segment(nc, nc_i) = d_i->a0;
         data->Jc.block(nc, 0, nc_i, nv) = d_i->Jc;
@@ -128,23 +141,15 @@ void ContactModelMultipleTpl<Scalar>::calc(
       nc += nc_i;
     }
   } else {
-    for (it_m = contacts_.begin(), end_m = contacts_.end(),
-        it_d = data->contacts.begin(), end_d = data->contacts.end();
-         it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-      const boost::shared_ptr<ContactItem>& m_i = it_m->second;
-      if (m_i->active) {
-        const boost::shared_ptr<ContactDataAbstract>& d_i = it_d->second;
-        assert_pretty(
-            it_m->first == it_d->first,
-            "it doesn't match the contact name between model and data ("
-                << it_m->first << " != " << it_d->first << ")");
-
-        m_i->contact->calc(d_i, x);
-        const std::size_t nc_i = m_i->contact->get_nc();
-        data->a0.segment(nc, nc_i) = d_i->a0;
-        data->Jc.block(nc, 0, nc_i, nv) = d_i->Jc;
-        nc += nc_i;
-      }
+    for (std::size_t i = 0; i < active_items_.size(); ++i) {
+      const boost::shared_ptr<ContactItem>& m_i = active_items_[i];
+      const boost::shared_ptr<ContactDataAbstract>& d_i =
+          data->contact_datas[active_ids_[i]];
+      m_i->contact->calc(d_i, x);
+      const std::size_t nc_i = m_i->contact->get_nc();
+      data->a0.segment(nc, nc_i) = d_i->a0;
+      data->Jc.block(nc, 0, nc_i, nv) = d_i->Jc;
+      nc += nc_i;
     }
   }
 }
@@ -160,21 +165,16 @@ void ContactModelMultipleTpl<Scalar>::calcDiff(
 
   std::size_t nc = 0;
   const std::size_t ndx = state_->get_ndx();
-  typename ContactModelContainer::iterator it_m, end_m;
-  typename ContactDataContainer::iterator it_d, end_d;
   if (compute_all_contacts_) {
-    for (it_m = contacts_.begin(), end_m = contacts_.end(),
-        it_d = data->contacts.begin(), end_d = data->contacts.end();
-         it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
+    std::size_t i = 0, j = 0;
+    for (typename ContactModelContainer::iterator it_m = contacts_.begin();
+         it_m != contacts_.end(); ++it_m, ++i) {
       const boost::shared_ptr<ContactItem>& m_i = it_m->second;
       const std::size_t nc_i = m_i->contact->get_nc();
-      if (m_i->active) {
-        assert_pretty(
-            it_m->first == it_d->first,
-            "it doesn't match the contact name between model and data ("
-                << it_m->first << " != " << it_d->first << ")");
-        const boost::shared_ptr<ContactDataAbstract>& d_i = it_d->second;
-
+      if (j < active_ids_.size() && active_ids_[j] == i) {
+        ++j;
+        const boost::shared_ptr<ContactDataAbstract>& d_i =
+            data->contact_datas[i];
         m_i->contact->calcDiff(d_i, x);
         data->da0_dx.block(nc, 0, nc_i, ndx) = d_i->da0_dx;
       } else {
@@ -183,22 +183,14 @@ void ContactModelMultipleTpl<Scalar>::calcDiff(
       nc += nc_i;
     }
   } else {
-    for (it_m = contacts_.begin(), end_m = contacts_.end(),
-        it_d = data->contacts.begin(), end_d = data->contacts.end();
-         it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-      const boost::shared_ptr<ContactItem>& m_i = it_m->second;
-      if (m_i->active) {
-        const boost::shared_ptr<ContactDataAbstract>& d_i = it_d->second;
-        assert_pretty(
-            it_m->first == it_d->first,
-            "it doesn't match the contact name between model and data ("
-                << it_m->first << " != " << it_d->first << ")");
-
-        m_i->contact->calcDiff(d_i, x);
-        const std::size_t nc_i = m_i->contact->get_nc();
-        data->da0_dx.block(nc, 0, nc_i, ndx) = d_i->da0_dx;
-        nc += nc_i;
-      }
+    for (std::size_t i = 0; i < active_items_.size(); ++i) {
+      const boost::shared_ptr<ContactItem>& m_i = active_items_[i];
+      const boost::shared_ptr<ContactDataAbstract>& d_i =
+          data->contact_datas[active_ids_[i]];
+      m_i->contact->calcDiff(d_i, x);
+      const std::size_t nc_i = m_i->contact->get_nc();
+      data->da0_dx.block(nc, 0, nc_i, ndx) = d_i->da0_dx;
+      nc += nc_i;
     }
   }
 }
@@ -234,19 +226,17 @@ void ContactModelMultipleTpl<Scalar>::updateForce(
     *it = pinocchio::ForceTpl<Scalar>::Zero();
   }
 
-  std::size_t nc = 0;
-  typename ContactModelContainer::iterator it_m, end_m;
-  typename ContactDataContainer::iterator it_d, end_d;
+  std::size_t nc = 0, i = 0, j = 0;
   if (compute_all_contacts_) {
-    for (it_m = contacts_.begin(), end_m = contacts_.end(),
-        it_d = data->contacts.begin(), end_d = data->contacts.end();
-         it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
+    for (typename ContactModelContainer::const_iterator it_m =
+             contacts_.begin();
+         it_m != contacts_.end(); ++it_m, ++i) {
       const boost::shared_ptr<ContactItem>& m_i = it_m->second;
-      const boost::shared_ptr<ContactDataAbstract>& d_i = it_d->second;
-      assert_pretty(it_m->first == it_d->first,
-                    "it doesn't match the contact name between data and model");
+      const boost::shared_ptr<ContactDataAbstract>& d_i =
+          data->contact_datas[i];
       const std::size_t nc_i = m_i->contact->get_nc();
-      if (m_i->active) {
+      if (j < active_ids_.size() && active_ids_[j] == i) {
+        ++j;
         const Eigen::VectorBlock<const VectorXs, Eigen::Dynamic> force_i =
             force.segment(nc, nc_i);
         m_i->contact->updateForce(d_i, force_i);
@@ -259,14 +249,14 @@ void ContactModelMultipleTpl<Scalar>::updateForce(
       nc += nc_i;
     }
   } else {
-    for (it_m = contacts_.begin(), end_m = contacts_.end(),
-        it_d = data->contacts.begin(), end_d = data->contacts.end();
-         it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
+    for (typename ContactModelContainer::const_iterator it_m =
+             contacts_.begin();
+         it_m != contacts_.end(); ++it_m, ++i) {
       const boost::shared_ptr<ContactItem>& m_i = it_m->second;
-      const boost::shared_ptr<ContactDataAbstract>& d_i = it_d->second;
-      assert_pretty(it_m->first == it_d->first,
-                    "it doesn't match the contact name between data and model");
-      if (m_i->active) {
+      const boost::shared_ptr<ContactDataAbstract>& d_i =
+          data->contact_datas[i];
+      if (j < active_ids_.size() && active_ids_[j] == i) {
+        ++j;
         const std::size_t nc_i = m_i->contact->get_nc();
         const Eigen::VectorBlock<const VectorXs, Eigen::Dynamic> force_i =
             force.segment(nc, nc_i);
@@ -324,19 +314,17 @@ void ContactModelMultipleTpl<Scalar>::updateForceDiff(
                  << "it doesn't match the number of contact datas and models");
   }
 
-  std::size_t nc = 0;
-  typename ContactModelContainer::const_iterator it_m, end_m;
-  typename ContactDataContainer::const_iterator it_d, end_d;
+  std::size_t nc = 0, i = 0, j = 0;
   if (compute_all_contacts_) {
-    for (it_m = contacts_.begin(), end_m = contacts_.end(),
-        it_d = data->contacts.begin(), end_d = data->contacts.end();
-         it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
+    for (typename ContactModelContainer::const_iterator it_m =
+             contacts_.begin();
+         it_m != contacts_.end(); ++it_m, ++i) {
       const boost::shared_ptr<ContactItem>& m_i = it_m->second;
-      const boost::shared_ptr<ContactDataAbstract>& d_i = it_d->second;
-      assert_pretty(it_m->first == it_d->first,
-                    "it doesn't match the contact name between data and model");
+      const boost::shared_ptr<ContactDataAbstract>& d_i =
+          data->contact_datas[i];
       const std::size_t nc_i = m_i->contact->get_nc();
-      if (m_i->active) {
+      if (j < active_ids_.size() && active_ids_[j] == i) {
+        ++j;
         const Eigen::Block<const MatrixXs> df_dx_i =
             df_dx.block(nc, 0, nc_i, ndx);
         const Eigen::Block<const MatrixXs> df_du_i =
@@ -348,14 +336,14 @@ void ContactModelMultipleTpl<Scalar>::updateForceDiff(
       nc += nc_i;
     }
   } else {
-    for (it_m = contacts_.begin(), end_m = contacts_.end(),
-        it_d = data->contacts.begin(), end_d = data->contacts.end();
-         it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
+    for (typename ContactModelContainer::const_iterator it_m =
+             contacts_.begin();
+         it_m != contacts_.end(); ++it_m, ++i) {
       const boost::shared_ptr<ContactItem>& m_i = it_m->second;
-      const boost::shared_ptr<ContactDataAbstract>& d_i = it_d->second;
-      assert_pretty(it_m->first == it_d->first,
-                    "it doesn't match the contact name between data and model");
-      if (m_i->active) {
+      const boost::shared_ptr<ContactDataAbstract>& d_i =
+          data->contact_datas[i];
+      if (j < active_ids_.size() && active_ids_[j] == i) {
+        ++j;
         const std::size_t nc_i = m_i->contact->get_nc();
         const Eigen::Block<const MatrixXs> df_dx_i =
             df_dx.block(nc, 0, nc_i, ndx);
@@ -379,24 +367,17 @@ void ContactModelMultipleTpl<Scalar>::updateRneaDiff(
     throw_pretty("Invalid argument: "
                  << "it doesn't match the number of contact datas and models");
   }
-  typename ContactModelContainer::const_iterator it_m, end_m;
-  typename ContactDataContainer::const_iterator it_d, end_d;
-  for (it_m = contacts_.begin(), end_m = contacts_.end(),
-      it_d = data->contacts.begin(), end_d = data->contacts.end();
-       it_m != end_m || it_d != end_d; ++it_m, ++it_d) {
-    const boost::shared_ptr<ContactItem>& m_i = it_m->second;
-    const boost::shared_ptr<ContactDataAbstract>& d_i = it_d->second;
-    assert_pretty(it_m->first == it_d->first,
-                  "it doesn't match the contact name between data and model");
-    if (m_i->active) {
-      switch (m_i->contact->get_type()) {
-        case pinocchio::ReferenceFrame::LOCAL:
-          break;
-        case pinocchio::ReferenceFrame::WORLD:
-        case pinocchio::ReferenceFrame::LOCAL_WORLD_ALIGNED:
-          pinocchio.dtau_dq += d_i->dtau_dq;
-          break;
-      }
+  for (std::size_t i = 0; i < active_items_.size(); ++i) {
+    const boost::shared_ptr<ContactItem>& m_i = active_items_[i];
+    const boost::shared_ptr<ContactDataAbstract>& d_i =
+        data->contact_datas[active_ids_[i]];
+    switch (m_i->contact->get_type()) {
+      case pinocchio::ReferenceFrame::LOCAL:
+        break;
+      case pinocchio::ReferenceFrame::WORLD:
+      case pinocchio::ReferenceFrame::LOCAL_WORLD_ALIGNED:
+        pinocchio.dtau_dq += d_i->dtau_dq;
+        break;
     }
   }
 }
@@ -9,24 +9,186 @@
 #ifndef CROCODDYL_CORE_DATA_MULTIBODY_HPP_
 #define CROCODDYL_CORE_DATA_MULTIBODY_HPP_
 
+#include <pinocchio/algorithm/frames.hpp>
 #include <pinocchio/multibody/data.hpp>
+#include <vector>
 
 #include "crocoddyl/core/data-collector-base.hpp"
 #include "crocoddyl/core/data/actuation.hpp"
 #include "crocoddyl/core/data/joint.hpp"
+#include "crocoddyl/core/mathbase.hpp"
 #include "crocoddyl/multibody/fwd.hpp"
 
 namespace crocoddyl {
 
+/**
+ * @brief Per-node cache of frame kinematics
+ *
+ * Several residuals of the same node often depend on the same frame (e.g., the
+ * placement and rotation of a foot). This cache computes the frame placement
+ * \f${}^o\mathbf{M}_f\f$ and the local frame Jacobian \f${}^f\mathbf{J}_f\f$
+ * only once per frame and evaluation. Each cached quantity is stored with the
+ * stamp of the evaluation that computed it, and it is valid while this stamp
+ * matches the current one. The cache is enabled for a single evaluation: the
+ * action model that owns the Pinocchio data calls `invalidate()` once it has
+ * updated the kinematics for a new \f$(\mathbf{x},\mathbf{u})\f$, and
+ * `release()` once its costs and constraints are evaluated (see
+ * `FrameKinematicsCacheGuardTpl`). Outside this
+ * evaluation, the stamp is null and the frame kinematics are computed on every
+ * request, as the Pinocchio data might be updated by someone else.
+ *
+ * The storage of the frame Jacobians is allocated by `registerFrame()` when the
+ * residual data are created. Non-registered frames always compute the Jacobian
+ * in the buffer provided by the residual.
+ */
+template <typename _Scalar>
+struct FrameKinematicsCacheTpl {
+  EIGEN_MAKE_ALIGNED_OPERATOR_NEW
+
+  typedef _Scalar Scalar;
+  typedef MathBaseTpl<Scalar> MathBase;
+  typedef pinocchio::ModelTpl<Scalar> PinocchioModel;
+  typedef pinocchio::DataTpl<Scalar> PinocchioData;
+  typedef pinocchio::SE3Tpl<Scalar> SE3;
+  typedef typename MathBase::Matrix6xs Matrix6xs;
+
+  explicit FrameKinematicsCacheTpl(const std::size_t nframes = 0)
+      : stamp(0),
+        last_stamp(0),
+        placement_stamps(nframes, 0),
+        jacobian_stamps(nframes, 0),
+        jacobian_slots(nframes, -1) {}
+
+  /**
+   * @brief Invalidate the cached frame kinematics
+   *
+   * It has to be called after updating the kinematics of the Pinocchio data,
+   * and it enables the cache until `release()` is called.
+   */
+  void invalidate() {
+    ++last_stamp;
+    if (last_stamp == 0) {  // skip the stamp that disables the cache
+      ++last_stamp;
+    }
+    stamp = last_stamp;
+  }
+
+  /**
+   * @brief Disable the cache once the current evaluation is finished
+   */
+  void release() { stamp = 0; }
+
+  /**
+   * @brief Allocate the storage of the local Jacobian of a frame
+   *
+   * @param[in] id  Frame index
+   * @param[in] nv  Dimension of the tangent space of the configuration
+   */
+  void registerFrame(const pinocchio::FrameIndex id, const std::size_t nv) {
+    if (id >= jacobian_slots.size() || jacobian_slots[id] >= 0) {
+      return;
+    }
+    jacobian_slots[id] = static_cast<int>(jacobians.size());
+    jacobians.push_back(Matrix6xs::Zero(6, nv));
+  }
+
+  /**
+   * @brief Return the placement of a frame w.r.t. the world frame
+   *
+   * @param[in] model  Pinocchio model
+   * @param[in] data   Pinocchio data
+   * @param[in] id     Frame index
+   * @return the updated placement `data.oMf[id]`
+   */
+  const SE3& getFramePlacement(const PinocchioModel& model, PinocchioData& data,
+                               const pinocchio::FrameIndex id) {
+    if (stamp == 0 || id >= placement_stamps.size()) {
+      return pinocchio::updateFramePlacement(model, data, id);
+    }
+    if (placement_stamps[id] != stamp) {
+      pinocchio::updateFramePlacement(model, data, id);
+      placement_stamps[id] = stamp;
+    }
+    return data.oMf[id];
+  }
+
+  /**
+   * @brief Return the Jacobian of a frame expressed in the local frame
+   *
+   * It also updates the frame placement `data.oMf[id]`.
+   *
+   * @param[in] model  Pinocchio model
+   * @param[in] data   Pinocchio data
+   * @param[in] id     Frame index
+   * @param[out] J     Buffer used if the frame is not cached
+   * @return the cached Jacobian, or `J` if the frame is not cached
+   */
+  const Matrix6xs& getFrameJacobian(const PinocchioModel& model,
+                                    PinocchioData& data,
+                                    const pinocchio::FrameIndex id,
+                                    Matrix6xs& J) {
+    if (stamp == 0 || id >= jacobian_slots.size() || jacobian_slots[id] < 0) {
+      pinocchio::getFrameJacobian(model, data, id, pinocchio::LOCAL, J);
+      return J;
+    }
+    Matrix6xs& fJf = jacobians[static_cast<std::size_t>(jacobian_slots[id])];
+    if (jacobian_stamps[id] != stamp) {
+      pinocchio::getFrameJacobian(model, data, id, pinocchio::LOCAL, fJf);
+      jacobian_stamps[id] = stamp;
+      placement_stamps[id] = stamp;
+    }
+    return fJf;
+  }
+
+  std::size_t stamp;  //!< Stamp of the current evaluation (zero if disabled)
+  std::size_t last_stamp;                     //!< Stamp of the last evaluation
+  std::vector<std::size_t> placement_stamps;  //!< Stamp of each placement
+  std::vector<std::size_t> jacobian_stamps;   //!< Stamp of each Jacobian
+  std::vector<int> jacobian_slots;   //!< Storage index of each Jacobian
+  std::vector<Matrix6xs> jacobians;  //!< Cached local frame Jacobians
+};
+
+/**
+ * @brief Scope guard of the frame kinematics cache
+ *
+ * It enables the cache for the evaluation that happens in its scope: the
+ * constructor calls `invalidate()` and the destructor calls `release()`. In
+ * consequence, the cache is also disabled when the evaluation throws an
+ * exception.
+ */
+template <typename _Scalar>
+class FrameKinematicsCacheGuardTpl {
+ public:
+  typedef _Scalar Scalar;
+
+  /**
+   * @brief Invalidate and enable the frame kinematics cache
+   *
+   * @param[in] cache  Frame kinematics cache
+   */
+  explicit FrameKinematicsCacheGuardTpl(FrameKinematicsCacheTpl<Scalar>& cache)
+      : cache_(cache) {
+    cache_.invalidate();
+  }
+  ~FrameKinematicsCacheGuardTpl() { cache_.release(); }
+
+ private:
+  FrameKinematicsCacheGuardTpl(const FrameKinematicsCacheGuardTpl&);
+  FrameKinematicsCacheGuardTpl& operator=(const FrameKinematicsCacheGuardTpl&);
+
+  FrameKinematicsCacheTpl<Scalar>& cache_;  //!< Guarded cache
+};
+
 template <typename Scalar>
 struct DataCollectorMultibodyTpl : virtual DataCollectorAbstractTpl<Scalar> {
   EIGEN_MAKE_ALIGNED_OPERATOR_NEW
 
   DataCollectorMultibodyTpl(pinocchio::DataTpl<Scalar>* const data)
-      : pinocchio(data) {}
+      : pinocchio(data), frame_cache(data != NULL ? data->oMf.size() : 0) {}
   virtual ~DataCollectorMultibodyTpl() {}
 
   pinocchio::DataTpl<Scalar>* pinocchio;
+  FrameKinematicsCacheTpl<Scalar> frame_cache;  //!< Frame kinematics cache
 };
 
 template <typename Scalar>
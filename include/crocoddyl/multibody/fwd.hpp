@@ -199,6 +199,12 @@ template <typename Scalar>
 class StateMultibodyTpl;
 
 // data collector
+template <typename Scalar>
+struct FrameKinematicsCacheTpl;
+
+template <typename Scalar>
+class FrameKinematicsCacheGuardTpl;
+
 template <typename Scalar>
 struct DataCollectorMultibodyTpl;
 
@@ -354,6 +360,8 @@ typedef ContactData6DTpl<double> ContactData6D;
 
 typedef StateMultibodyTpl<double> StateMultibody;
 
+typedef FrameKinematicsCacheTpl<double> FrameKinematicsCache;
+typedef FrameKinematicsCacheGuardTpl<double> FrameKinematicsCacheGuard;
 typedef DataCollectorMultibodyTpl<double> DataCollectorMultibody;
 typedef DataCollectorActMultibodyTpl<double> DataCollectorActMultibody;
 typedef DataCollectorJointActMultibodyTpl<double>
@@ -49,6 +49,7 @@ class ResidualModelFramePlacementTpl
   typedef ResidualDataAbstractTpl<Scalar> ResidualDataAbstract;
   typedef DataCollectorAbstractTpl<Scalar> DataCollectorAbstract;
   typedef typename MathBase::VectorXs VectorXs;
+  typedef typename MathBase::Matrix6xs Matrix6xs;
   typedef pinocchio::SE3Tpl<Scalar> SE3;
 
   /**
@@ -117,6 +118,8 @@ class ResidualModelFramePlacementTpl
 
   /**
    * @brief Modify the reference frame id
+   *
+   * It also updates the columns of the Jacobian that might be nonzero.
    */
   void set_id(const pinocchio::FrameIndex id);
 
@@ -134,6 +137,7 @@ class ResidualModelFramePlacementTpl
 
  protected:
   using Base::nu_;
+  using Base::set_x_support;
   using Base::state_;
   using Base::u_dependent_;
   using Base::unone_;
@@ -155,6 +159,7 @@ struct ResidualDataFramePlacementTpl : public ResidualDataAbstractTpl<_Scalar> {
   typedef MathBaseTpl<Scalar> MathBase;
   typedef ResidualDataAbstractTpl<Scalar> Base;
   typedef DataCollectorAbstractTpl<Scalar> DataCollectorAbstract;
+  typedef FrameKinematicsCacheTpl<Scalar> FrameKinematicsCache;
   typedef typename MathBase::Matrix6xs Matrix6xs;
   typedef typename MathBase::Matrix6s Matrix6s;
   typedef typename MathBase::Vector6s Vector6s;
@@ -177,9 +182,12 @@ struct ResidualDataFramePlacementTpl : public ResidualDataAbstractTpl<_Scalar> {
 
     // Avoids data casting at runtime
     pinocchio = d->pinocchio;
+    frame_cache = &d->frame_cache;
+    frame_cache->registerFrame(model->get_id(), model->get_state()->get_nv());
   }
 
   pinocchio::DataTpl<Scalar>* pinocchio;  //!< Pinocchio data
+  FrameKinematicsCache* frame_cache;      //!< Frame kinematics cache
   pinocchio::SE3Tpl<Scalar> rMf;  //!< Error frame placement of the frame
   Matrix6s rJf;                   //!< Error Jacobian of the frame
   Matrix6xs fJf;                  //!< Local Jacobian of the frame
@@ -9,6 +9,7 @@
 #include <pinocchio/algorithm/frames.hpp>
 
 #include "crocoddyl/multibody/residuals/frame-placement.hpp"
+#include "crocoddyl/multibody/utils/frame-support.hpp"
 
 namespace crocoddyl {
 
@@ -27,6 +28,7 @@ ResidualModelFramePlacementTpl<Scalar>::ResidualModelFramePlacementTpl(
         "Invalid argument: "
         << "the frame index is wrong (it does not exist in the robot)");
   }
+  set_x_support(getFrameSupport(*pin_model_.get(), id_));
 }
 
 template <typename Scalar>
@@ -44,6 +46,7 @@ ResidualModelFramePlacementTpl<Scalar>::ResidualModelFramePlacementTpl(
         "Invalid argument: "
         << "the frame index is wrong (it does not exist in the robot)");
   }
+  set_x_support(getFrameSupport(*pin_model_.get(), id_));
 }
 
 template <typename Scalar>
@@ -56,7 +59,7 @@ void ResidualModelFramePlacementTpl<Scalar>::calc(
   Data* d = static_cast<Data*>(data.get());
 
   // Compute the frame placement w.r.t. the reference frame
-  pinocchio::updateFramePlacement(*pin_model_.get(), *d->pinocchio, id_);
+  d->frame_cache->getFramePlacement(*pin_model_.get(), *d->pinocchio, id_);
   d->rMf = oMf_inv_ * d->pinocchio->oMf[id_];
   data->r = pinocchio::log6(d->rMf).toVector();
 }
@@ -70,9 +73,9 @@ void ResidualModelFramePlacementTpl<Scalar>::calcDiff(
   // Compute the derivatives of the frame placement
   const std::size_t nv = state_->get_nv();
   pinocchio::Jlog6(d->rMf, d->rJf);
-  pinocchio::getFrameJacobian(*pin_model_.get(), *d->pinocchio, id_,
-                              pinocchio::LOCAL, d->fJf);
-  data->Rx.leftCols(nv).noalias() = d->rJf * d->fJf;
+  const Matrix6xs& fJf = d->frame_cache->getFrameJacobian(
+      *pin_model_.get(), *d->pinocchio, id_, d->fJf);
+  data->Rx.leftCols(nv).noalias() = d->rJf * fJf;
 }
 
 template <typename Scalar>
@@ -109,6 +112,7 @@ template <typename Scalar>
 void ResidualModelFramePlacementTpl<Scalar>::set_id(
     const pinocchio::FrameIndex id) {
   id_ = id;
+  set_x_support(getFrameSupport(*pin_model_.get(), id_));
 }
 
 template <typename Scalar>
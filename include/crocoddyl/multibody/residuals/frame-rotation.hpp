@@ -47,6 +47,7 @@ class ResidualModelFrameRotationTpl : public ResidualModelAbstractTpl<_Scalar> {
   typedef ResidualDataAbstractTpl<Scalar> ResidualDataAbstract;
   typedef DataCollectorAbstractTpl<Scalar> DataCollectorAbstract;
   typedef typename MathBase::VectorXs VectorXs;
+  typedef typename MathBase::Matrix6xs Matrix6xs;
   typedef typename MathBase::Matrix3s Matrix3s;
 
   /**
@@ -115,6 +116,8 @@ class ResidualModelFrameRotationTpl : public ResidualModelAbstractTpl<_Scalar> {
 
   /**
    * @brief Modify the reference frame id
+   *
+   * It also updates the columns of the Jacobian that might be nonzero.
    */
   void set_id(const pinocchio::FrameIndex id);
 
@@ -132,6 +135,7 @@ class ResidualModelFrameRotationTpl : public ResidualModelAbstractTpl<_Scalar> {
 
  protected:
   using Base::nu_;
+  using Base::set_x_support;
   using Base::state_;
   using Base::u_dependent_;
   using Base::unone_;
@@ -153,6 +157,7 @@ struct ResidualDataFrameRotationTpl : public ResidualDataAbstractTpl<_Scalar> {
   typedef MathBaseTpl<Scalar> MathBase;
   typedef ResidualDataAbstractTpl<Scalar> Base;
   typedef DataCollectorAbstractTpl<Scalar> DataCollectorAbstract;
+  typedef FrameKinematicsCacheTpl<Scalar> FrameKinematicsCache;
   typedef typename MathBase::Vector3s Vector3s;
   typedef typename MathBase::Matrix3s Matrix3s;
   typedef typename MathBase::Matrix3xs Matrix3xs;
@@ -177,9 +182,12 @@ struct ResidualDataFrameRotationTpl : public ResidualDataAbstractTpl<_Scalar> {
 
     // Avoids data casting at runtime
     pinocchio = d->pinocchio;
+    frame_cache = &d->frame_cache;
+    frame_cache->registerFrame(model->get_id(), model->get_state()->get_nv());
   }
 
   pinocchio::DataTpl<Scalar>* pinocchio;  //!< Pinocchio data
+  FrameKinematicsCache* frame_cache;      //!< Frame kinematics cache
   Matrix3s rRf;                           //!< Rotation error of the frame
   Matrix3s rJf;                           //!< Error Jacobian of the frame
   Matrix6xs fJf;                          //!< Local Jacobian of the frame
@@ -9,6 +9,7 @@
 #include <pinocchio/algorithm/frames.hpp>
 
 #include "crocoddyl/multibody/residuals/frame-rotation.hpp"
+#include "crocoddyl/multibody/utils/frame-support.hpp"
 
 namespace crocoddyl {
 
@@ -27,6 +28,7 @@ ResidualModelFrameRotationTpl<Scalar>::ResidualModelFrameRotationTpl(
         "Invalid argument: "
         << "the frame index is wrong (it does not exist in the robot)");
   }
+  set_x_support(getFrameSupport(*pin_model_.get(), id_));
 }
 
 template <typename Scalar>
@@ -44,6 +46,7 @@ ResidualModelFrameRotationTpl<Scalar>::ResidualModelFrameRotationTpl(
         "Invalid argument: "
         << "the frame index is wrong (it does not exist in the robot)");
   }
+  set_x_support(getFrameSupport(*pin_model_.get(), id_));
 }
 
 template <typename Scalar>
@@ -56,7 +59,7 @@ void ResidualModelFrameRotationTpl<Scalar>::calc(
   Data* d = static_cast<Data*>(data.get());
 
   // Compute the frame rotation w.r.t. the reference frame
-  pinocchio::updateFramePlacement(*pin_model_.get(), *d->pinocchio, id_);
+  d->frame_cache->getFramePlacement(*pin_model_.get(), *d->pinocchio, id_);
   d->rRf.noalias() = oRf_inv_ * d->pinocchio->oMf[id_].rotation();
   data->r = pinocchio::log3(d->rRf);
 }
@@ -69,12 +72,12 @@ void ResidualModelFrameRotationTpl<Scalar>::calcDiff(
 
   // Compute the frame Jacobian at the error point
   pinocchio::Jlog3(d->rRf, d->rJf);
-  pinocchio::getFrameJacobian(*pin_model_.get(), *d->pinocchio, id_,
-                              pinocchio::LOCAL, d->fJf);
+  const Matrix6xs& fJf = d->frame_cache->getFrameJacobian(
+      *pin_model_.get(), *d->pinocchio, id_, d->fJf);
 
   // Compute the derivatives of the frame rotation
   const std::size_t nv = state_->get_nv();
-  data->Rx.leftCols(nv).noalias() = d->rJf * d->fJf.template bottomRows<3>();
+  data->Rx.leftCols(nv).noalias() = d->rJf * fJf.template bottomRows<3>();
 }
 
 template <typename Scalar>
@@ -110,6 +113,7 @@ template <typename Scalar>
 void ResidualModelFrameRotationTpl<Scalar>::set_id(
     const pinocchio::FrameIndex id) {
   id_ = id;
+  set_x_support(getFrameSupport(*pin_model_.get(), id_));
 }
 
 template <typename Scalar>
@@ -49,6 +49,7 @@ class ResidualModelFrameTranslationTpl
   typedef ResidualDataAbstractTpl<Scalar> ResidualDataAbstract;
   typedef DataCollectorAbstractTpl<Scalar> DataCollectorAbstract;
   typedef typename MathBase::VectorXs VectorXs;
+  typedef typename MathBase::Matrix6xs Matrix6xs;
   typedef typename MathBase::Vector3s Vector3s;
 
   /**
@@ -117,6 +118,8 @@ class ResidualModelFrameTranslationTpl
 
   /**
    * @brief Modify the reference frame id
+   *
+   * It also updates the columns of the Jacobian that might be nonzero.
    */
   void set_id(const pinocchio::FrameIndex id);
 
@@ -134,6 +137,7 @@ class ResidualModelFrameTranslationTpl
 
  protected:
   using Base::nu_;
+  using Base::set_x_support;
   using Base::state_;
   using Base::u_dependent_;
   using Base::unone_;
@@ -155,6 +159,7 @@ struct ResidualDataFrameTranslationTpl
   typedef MathBaseTpl<Scalar> MathBase;
   typedef ResidualDataAbstractTpl<Scalar> Base;
   typedef DataCollectorAbstractTpl<Scalar> DataCollectorAbstract;
+  typedef FrameKinematicsCacheTpl<Scalar> FrameKinematicsCache;
   typedef typename MathBase::Matrix6xs Matrix6xs;
 
   template <template <typename Scalar> class Model>
@@ -173,9 +178,12 @@ struct ResidualDataFrameTranslationTpl
 
     // Avoids data casting at runtime
     pinocchio = d->pinocchio;
+    frame_cache = &d->frame_cache;
+    frame_cache->registerFrame(model->get_id(), model->get_state()->get_nv());
   }
 
   pinocchio::DataTpl<Scalar>* pinocchio;  //!< Pinocchio data
+  FrameKinematicsCache* frame_cache;      //!< Frame kinematics cache
   Matrix6xs fJf;                          //!< Local Jacobian of the frame
 
   using Base::r;
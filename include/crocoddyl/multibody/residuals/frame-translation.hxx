@@ -9,6 +9,7 @@
 #include <pinocchio/algorithm/frames.hpp>
 
 #include "crocoddyl/multibody/residuals/frame-translation.hpp"
+#include "crocoddyl/multibody/utils/frame-support.hpp"
 
 namespace crocoddyl {
 
@@ -26,6 +27,7 @@ ResidualModelFrameTranslationTpl<Scalar>::ResidualModelFrameTranslationTpl(
         "Invalid argument: "
         << "the frame index is wrong (it does not exist in the robot)");
   }
+  set_x_support(getFrameSupport(*pin_model_.get(), id_));
 }
 
 template <typename Scalar>
@@ -42,6 +44,7 @@ ResidualModelFrameTranslationTpl<Scalar>::ResidualModelFrameTranslationTpl(
         "Invalid argument: "
         << "the frame index is wrong (it does not exist in the robot)");
   }
+  set_x_support(getFrameSupport(*pin_model_.get(), id_));
 }
 
 template <typename Scalar>
@@ -53,7 +56,7 @@ void ResidualModelFrameTranslationTpl<Scalar>::calc(
     const Eigen::Ref<const VectorXs>&, const Eigen::Ref<const VectorXs>&) {
   // Compute the frame translation w.r.t. the reference frame
   Data* d = static_cast<Data*>(data.get());
-  pinocchio::updateFramePlacement(*pin_model_.get(), *d->pinocchio, id_);
+  d->frame_cache->getFramePlacement(*pin_model_.get(), *d->pinocchio, id_);
   data->r = d->pinocchio->oMf[id_].translation() - xref_;
 }
 
@@ -65,10 +68,10 @@ void ResidualModelFrameTranslationTpl<Scalar>::calcDiff(
 
   // Compute the derivatives of the frame translation
   const std::size_t nv = state_->get_nv();
-  pinocchio::getFrameJacobian(*pin_model_.get(), *d->pinocchio, id_,
-                              pinocchio::LOCAL, d->fJf);
+  const Matrix6xs& fJf = d->frame_cache->getFrameJacobian(
+      *pin_model_.get(), *d->pinocchio, id_, d->fJf);
   d->Rx.leftCols(nv).noalias() =
-      d->pinocchio->oMf[id_].rotation() * d->fJf.template topRows<3>();
+      d->pinocchio->oMf[id_].rotation() * fJf.template topRows<3>();
   ;
 }
 
@@ -103,6 +106,7 @@ template <typename Scalar>
 void ResidualModelFrameTranslationTpl<Scalar>::set_id(
     const pinocchio::FrameIndex id) {
   id_ = id;
+  set_x_support(getFrameSupport(*pin_model_.get(), id_));
 }
 
 template <typename Scalar>
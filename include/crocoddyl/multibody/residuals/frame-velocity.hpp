@@ -129,6 +129,8 @@ class ResidualModelFrameVelocityTpl : public ResidualModelAbstractTpl<_Scalar> {
 
   /**
    * @brief Modify reference frame id
+   *
+   * It also updates the columns of the Jacobian that might be nonzero.
    */
   void set_id(const pinocchio::FrameIndex id);
 
@@ -152,6 +154,7 @@ class ResidualModelFrameVelocityTpl : public ResidualModelAbstractTpl<_Scalar> {
  protected:
   using Base::nr_;
   using Base::nu_;
+  using Base::set_x_support;
   using Base::state_;
   using Base::u_dependent_;
   using Base::unone_;
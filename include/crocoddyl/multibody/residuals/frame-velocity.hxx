@@ -11,6 +11,7 @@
 #include <pinocchio/algorithm/kinematics-derivatives.hpp>
 
 #include "crocoddyl/multibody/residuals/frame-velocity.hpp"
+#include "crocoddyl/multibody/utils/frame-support.hpp"
 
 namespace crocoddyl {
 
@@ -30,6 +31,7 @@ ResidualModelFrameVelocityTpl<Scalar>::ResidualModelFrameVelocityTpl(
         "Invalid argument: "
         << "the frame index is wrong (it does not exist in the robot)");
   }
+  set_x_support(getFrameSupport(*pin_model_.get(), id_, true));
 }
 
 template <typename Scalar>
@@ -47,6 +49,7 @@ ResidualModelFrameVelocityTpl<Scalar>::ResidualModelFrameVelocityTpl(
         "Invalid argument: "
         << "the frame index is wrong (it does not exist in the robot)");
   }
+  set_x_support(getFrameSupport(*pin_model_.get(), id_, true));
 }
 
 template <typename Scalar>
@@ -114,6 +117,7 @@ template <typename Scalar>
 void ResidualModelFrameVelocityTpl<Scalar>::set_id(
     const pinocchio::FrameIndex id) {
   id_ = id;
+  set_x_support(getFrameSupport(*pin_model_.get(), id_, true));
 }
 
 template <typename Scalar>
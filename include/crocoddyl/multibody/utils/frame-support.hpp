@@ -0,0 +1,59 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, Heriot-Watt University
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#ifndef CROCODDYL_MULTIBODY_UTILS_FRAME_SUPPORT_HPP_
+#define CROCODDYL_MULTIBODY_UTILS_FRAME_SUPPORT_HPP_
+
+#include <pinocchio/multibody/model.hpp>
+#include <vector>
+
+namespace crocoddyl {
+
+/**
+ * @brief Return the tangent-space columns that affect the kinematics of a frame
+ *
+ * These columns correspond to the velocity indexes of the joints that support
+ * the parent joint of the frame, i.e., the joints of its kinematic chain. The
+ * Jacobians of the frame kinematics are zero in the remaining columns.
+ *
+ * @param[in] model        Pinocchio model
+ * @param[in] id           Frame index
+ * @param[in] v_dependent  True for including the columns related to the
+ * velocity, i.e., shifted by nv (default false)
+ * @return the sorted column indexes
+ */
+template <typename Scalar>
+std::vector<std::size_t> getFrameSupport(
+    const pinocchio::ModelTpl<Scalar>& model, const pinocchio::FrameIndex id,
+    const bool v_dependent = false) {
+  const pinocchio::JointIndex parent = model.frames[id].parent;
+  const std::vector<pinocchio::JointIndex>& supports = model.supports[parent];
+  std::vector<std::size_t> columns;
+  for (std::size_t k = 0; k < supports.size(); ++k) {
+    const pinocchio::JointIndex joint = supports[k];
+    if (joint == 0) {
+      continue;  // the universe joint does not have velocity indexes
+    }
+    const std::size_t idx_v = model.joints[joint].idx_v();
+    const std::size_t nv = model.joints[joint].nv();
+    for (std::size_t i = 0; i < nv; ++i) {
+      columns.push_back(idx_v + i);
+    }
+  }
+  if (v_dependent) {
+    const std::size_t ncols = columns.size();
+    for (std::size_t k = 0; k < ncols; ++k) {
+      columns.push_back(columns[k] + model.nv);
+    }
+  }
+  return columns;
+}
+
+}  // namespace crocoddyl
+
+#endif  // CROCODDYL_MULTIBODY_UTILS_FRAME_SUPPORT_HPP_
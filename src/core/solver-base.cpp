@@ -11,6 +11,9 @@
 #include <omp.h>
 #endif  // CROCODDYL_WITH_MULTITHREADING
 
+#include <algorithm>
+#include <limits>
+
 #include "crocoddyl/core/solver-base.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
 
@@ -43,7 +46,9 @@ SolverAbstract::SolverAbstract(boost::shared_ptr<ShootingProblem> problem)
       th_gaptol_(1e-16),
       feasnorm_(LInf),
       iter_(0),
-      tmp_feas_(0.) {
+      tmp_feas_(0.),
+      max_time_(std::numeric_limits<double>::infinity()),
+      status_(Unsolved) {
   // Allocate common data
   const std::size_t ndx = problem_->get_ndx();
   const std::size_t T = problem_->get_T();
@@ -76,6 +81,27 @@ void SolverAbstract::resizeData() {
   }
 }
 
+void SolverAbstract::shift() {
+  const std::size_t T = problem_->get_T();
+  std::rotate(xs_.begin(), xs_.begin() + 1, xs_.end());
+  std::rotate(us_.begin(), us_.begin() + 1, us_.end());
+  std::rotate(fs_.begin(), fs_.begin() + 1, fs_.end());
+  // The buffers are rotated in place, and they are only resized when the
+  // appended node has a different control dimension
+  const std::size_t nu = problem_->get_runningModels().back()->get_nu();
+  if (static_cast<std::size_t>(us_.back().size()) != nu) {
+    resizeData();
+  }
+  xs_.back() = xs_[T - 1];
+  if (T > 1 && us_[T - 2].size() == us_.back().size()) {
+    us_.back() = us_[T - 2];
+  } else {
+    us_.back().setZero();
+  }
+  fs_.back().setZero();
+  is_feasible_ = false;
+}
+
 double SolverAbstract::computeDynamicFeasibility() {
   tmp_feas_ = 0.;
   if (!is_feasible_) {
@@ -188,6 +214,14 @@ double SolverAbstract::computeEqualityFeasibility() {
   return tmp_feas_;
 }
 
+bool SolverAbstract::checkTimeBudget(const double duration) {
+  if (std::isinf(max_time_) || timer_.get_duration() + duration <= max_time_) {
+    return true;
+  }
+  status_ = MaxTimeReached;
+  return false;
+}
+
 void SolverAbstract::setCandidate(const std::vector<Eigen::VectorXd>& xs_warm,
                                   const std::vector<Eigen::VectorXd>& us_warm,
                                   bool is_feasible) {
@@ -286,6 +320,21 @@ const std::vector<Eigen::VectorXd>& SolverAbstract::get_fs() const {
   return fs_;
 }
 
+const SolverAbstract::MatrixXdRowMajor& SolverAbstract::get_stacked_xs() const {
+  stackVectors(xs_, stacked_xs_);
+  return stacked_xs_;
+}
+
+const SolverAbstract::MatrixXdRowMajor& SolverAbstract::get_stacked_us() const {
+  stackVectors(us_, stacked_us_);
+  return stacked_us_;
+}
+
+const SolverAbstract::MatrixXdRowMajor& SolverAbstract::get_stacked_fs() const {
+  stackVectors(fs_, stacked_fs_);
+  return stacked_fs_;
+}
+
 bool SolverAbstract::get_is_feasible() const { return is_feasible_; }
 
 double SolverAbstract::get_cost() const { return cost_; }
@@ -344,6 +393,10 @@ FeasibilityNorm SolverAbstract::get_feasnorm() const { return feasnorm_; }
 
 std::size_t SolverAbstract::get_iter() const { return iter_; }
 
+double SolverAbstract::get_max_time() const { return max_time_; }
+
+SolverStatus SolverAbstract::get_status() const { return status_; }
+
 void SolverAbstract::set_xs(const std::vector<Eigen::VectorXd>& xs) {
   const std::size_t T = problem_->get_T();
   if (xs.size() != T + 1) {
@@ -438,6 +491,14 @@ void SolverAbstract::set_th_acceptstep(const double th_acceptstep) {
   th_acceptstep_ = th_acceptstep;
 }
 
+void SolverAbstract::set_max_time(const double max_time) {
+  if (max_time <= 0.) {
+    throw_pretty("Invalid argument: "
+                 << "max_time value has to higher than 0.");
+  }
+  max_time_ = max_time;
+}
+
 void SolverAbstract::set_th_stop(const double th_stop) {
   if (th_stop <= 0.) {
     throw_pretty("Invalid argument: "
@@ -458,6 +519,27 @@ void SolverAbstract::set_feasnorm(const FeasibilityNorm feasnorm) {
   feasnorm_ = feasnorm;
 }
 
+void stackVectors(const std::vector<Eigen::VectorXd>& vs,
+                  SolverAbstract::MatrixXdRowMajor& out) {
+  const Eigen::Index n = vs.empty() ? 0 : vs[0].size();
+  for (std::size_t i = 1; i < vs.size(); ++i) {
+    if (vs[i].size() != n) {
+      throw_pretty("Invalid argument: "
+                   << "vectors have different dimensions (" +
+                          std::to_string(n) + " and " +
+                          std::to_string(vs[i].size()) +
+                          "), they cannot be stacked");
+    }
+  }
+  const Eigen::Index rows = static_cast<Eigen::Index>(vs.size());
+  if (out.rows() != rows || out.cols() != n) {
+    out.resize(rows, n);
+  }
+  for (std::size_t i = 0; i < vs.size(); ++i) {
+    out.row(static_cast<Eigen::Index>(i)) = vs[i].transpose();
+  }
+}
+
 bool raiseIfNaN(const double value) {
   if (std::isnan(value) || std::isinf(value) || value >= 1e30) {
     return true;
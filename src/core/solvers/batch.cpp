@@ -0,0 +1,140 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, Heriot-Watt University, University of Edinburgh
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#include <omp.h>
+#endif  // CROCODDYL_WITH_MULTITHREADING
+
+#include "crocoddyl/core/solvers/batch.hpp"
+#include "crocoddyl/core/utils/exception.hpp"
+
+namespace crocoddyl {
+
+SolverBatch::SolverBatch(
+    const std::vector<boost::shared_ptr<SolverAbstract> >& solvers)
+    : solvers_(solvers),
+      converged_(VectorXb::Constant(solvers.size(), false)),
+      costs_(Eigen::VectorXd::Constant(solvers.size(), NAN)),
+      statuses_(solvers.size(), Unsolved),
+      nthreads_(1),
+      errors_(solvers.size()) {
+  for (std::size_t i = 0; i < solvers_.size(); ++i) {
+    if (!solvers_[i]) {
+      throw_pretty("Invalid argument: "
+                   << "solver " << i << " is not defined");
+    }
+    // The solvers write the data of their problems concurrently
+    for (std::size_t j = 0; j < i; ++j) {
+      if (solvers_[i]->get_problem() == solvers_[j]->get_problem()) {
+        throw_pretty("Invalid argument: "
+                     << "solvers " << j << " and " << i
+                     << " share the same shooting problem");
+      }
+    }
+  }
+#ifdef CROCODDYL_WITH_MULTITHREADING
+  if (enableMultithreading()) {
+    nthreads_ = CROCODDYL_WITH_NTHREADS;
+  }
+#endif
+}
+
+SolverBatch::~SolverBatch() {}
+
+std::size_t SolverBatch::solve(const std::size_t maxiter,
+                               const bool is_feasible, const double init_reg) {
+  return solve(std::vector<std::size_t>(solvers_.size(), maxiter), is_feasible,
+               init_reg);
+}
+
+std::size_t SolverBatch::solve(const std::vector<std::size_t>& maxiters,
+                               const bool is_feasible, const double init_reg) {
+  START_PROFILER("SolverBatch::solve");
+  const std::size_t N = solvers_.size();
+  if (maxiters.size() != N) {
+    throw_pretty("Invalid argument: "
+                 << "maxiters has wrong dimension (it should be " +
+                        std::to_string(N) + ")");
+  }
+  // We cannot throw exceptions inside the parallel region, so we record the
+  // failure of each problem without aborting the others
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#pragma omp parallel for num_threads(nthreads_) schedule(dynamic)
+#endif
+  for (std::size_t i = 0; i < N; ++i) {
+    SolverAbstract& solver = *solvers_[i];
+    errors_[i].clear();
+    try {
+      converged_[i] = solver.solve(solver.get_xs(), solver.get_us(),
+                                   maxiters[i], is_feasible, init_reg);
+      costs_[i] = solver.get_cost();
+      statuses_[i] = solver.get_status();
+    } catch (std::exception& e) {
+      converged_[i] = false;
+      costs_[i] = NAN;
+      statuses_[i] = Failed;
+      errors_[i] = e.what();
+    }
+  }
+  STOP_PROFILER("SolverBatch::solve");
+  return static_cast<std::size_t>(converged_.count());
+}
+
+const std::vector<boost::shared_ptr<SolverAbstract> >&
+SolverBatch::get_solvers() const {
+  return solvers_;
+}
+
+const SolverBatch::VectorXb& SolverBatch::get_converged() const {
+  return converged_;
+}
+
+const Eigen::VectorXd& SolverBatch::get_costs() const { return costs_; }
+
+const std::vector<SolverStatus>& SolverBatch::get_statuses() const {
+  return statuses_;
+}
+
+const std::vector<std::string>& SolverBatch::get_errors() const {
+  return errors_;
+}
+
+std::size_t SolverBatch::get_nthreads() const {
+#ifndef CROCODDYL_WITH_MULTITHREADING
+  std::cerr << "Warning: the number of threads won't affect the computational "
+               "performance as multithreading "
+               "support is not enabled."
+            << std::endl;
+#endif
+  return nthreads_;
+}
+
+void SolverBatch::set_nthreads(const int nthreads) {
+#ifndef CROCODDYL_WITH_MULTITHREADING
+  (void)nthreads;
+  std::cerr << "Warning: the number of threads won't affect the computational "
+               "performance as multithreading "
+               "support is not enabled."
+            << std::endl;
+#else
+  if (nthreads < 1) {
+    nthreads_ = CROCODDYL_WITH_NTHREADS;
+  } else {
+    nthreads_ = static_cast<std::size_t>(nthreads);
+  }
+  if (!enableMultithreading()) {
+    std::cerr << "Warning: the number of threads won't affect the "
+                 "computational performance as multithreading "
+                 "support is not enabled."
+              << std::endl;
+    nthreads_ = 1;
+  }
+#endif
+}
+
+}  // namespace crocoddyl
@@ -8,6 +8,7 @@
 
 #include "crocoddyl/core/solvers/box-ddp.hpp"
 
+#include <algorithm>
 #include <iostream>
 
 #include "crocoddyl/core/utils/exception.hpp"
@@ -46,10 +47,33 @@ void SolverBoxDDP::resizeData() {
     Quu_inv_[t].conservativeResize(nu, nu);
     du_lb_[t].conservativeResize(nu);
     du_ub_[t].conservativeResize(nu);
+    qp_sols_[t].x.conservativeResize(nu);
+    qp_sols_[t].free_idx.reserve(nu);
+    qp_sols_[t].clamped_idx.reserve(nu);
   }
   STOP_PROFILER("SolverBoxDDP::resizeData");
 }
 
+void SolverBoxDDP::shift() {
+  START_PROFILER("SolverBoxDDP::shift");
+  const std::size_t T = problem_->get_T();
+  std::rotate(Quu_inv_.begin(), Quu_inv_.begin() + 1, Quu_inv_.end());
+  std::rotate(du_lb_.begin(), du_lb_.begin() + 1, du_lb_.end());
+  std::rotate(du_ub_.begin(), du_ub_.begin() + 1, du_ub_.end());
+  std::rotate(qp_sols_.begin(), qp_sols_.begin() + 1, qp_sols_.end());
+  SolverDDP::shift();
+  if (T > 1 && qp_sols_[T - 2].x.size() == qp_sols_.back().x.size()) {
+    qp_sols_.back().x = qp_sols_[T - 2].x;
+    qp_sols_.back().free_idx = qp_sols_[T - 2].free_idx;
+    qp_sols_.back().clamped_idx = qp_sols_[T - 2].clamped_idx;
+  } else {
+    qp_sols_.back().x.setZero();
+    qp_sols_.back().free_idx.clear();
+    qp_sols_.back().clamped_idx.clear();
+  }
+  STOP_PROFILER("SolverBoxDDP::shift");
+}
+
 void SolverBoxDDP::allocateData() {
   SolverDDP::allocateData();
 
@@ -57,6 +81,7 @@ void SolverBoxDDP::allocateData() {
   Quu_inv_.resize(T);
   du_lb_.resize(T);
   du_ub_.resize(T);
+  qp_sols_.resize(T);
   const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
       problem_->get_runningModels();
   for (std::size_t t = 0; t < T; ++t) {
@@ -65,6 +90,9 @@ void SolverBoxDDP::allocateData() {
     Quu_inv_[t] = Eigen::MatrixXd::Zero(nu, nu);
     du_lb_[t] = Eigen::VectorXd::Zero(nu);
     du_ub_[t] = Eigen::VectorXd::Zero(nu);
+    qp_sols_[t].x = Eigen::VectorXd::Zero(nu);
+    qp_sols_[t].free_idx.reserve(nu);
+    qp_sols_[t].clamped_idx.reserve(nu);
   }
 }
 
@@ -84,7 +112,7 @@ void SolverBoxDDP::computeGains(const std::size_t t) {
 
     START_PROFILER("SolverBoxDDP::boxQP");
     const BoxQPSolution& boxqp_sol =
-        qp_.solve(Quu_[t], Qu_[t], du_lb_[t], du_ub_[t], k_[t]);
+        qp_.solve(Quu_[t], Qu_[t], du_lb_[t], du_ub_[t], qp_sols_[t]);
     START_PROFILER("SolverBoxDDP::boxQP");
 
     // Compute controls
@@ -101,6 +129,12 @@ void SolverBoxDDP::computeGains(const std::size_t t) {
     K_[t].noalias() = Quu_inv_[t] * Qxu_[t].transpose();
     STOP_PROFILER("SolverBoxDDP::Quu_invproj_Qxu");
     k_[t] = -boxqp_sol.x;
+    // Keep the solution for warm-starting this node in the next iteration.
+    // The active set is copied into reserved storage, while the inverse of
+    // the free-space Hessian is not needed for warm-starting
+    qp_sols_[t].x = boxqp_sol.x;
+    qp_sols_[t].free_idx = boxqp_sol.free_idx;
+    qp_sols_[t].clamped_idx = boxqp_sol.clamped_idx;
 
     // The box-QP clamped the gradient direction; this is important for
     // accounting the algorithm advancement (i.e. stopping criteria)
@@ -113,64 +147,66 @@ void SolverBoxDDP::computeGains(const std::size_t t) {
   STOP_PROFILER("SolverBoxDDP::computeGains");
 }
 
-void SolverBoxDDP::forwardPass(double steplength) {
-  if (steplength > 1. || steplength < 0.) {
-    throw_pretty("Invalid argument: "
-                 << "invalid step length, value is between 0. to 1.");
-  }
-  START_PROFILER("SolverBoxDDP::forwardPass");
-  cost_try_ = 0.;
-  xnext_ = problem_->get_x0();
+bool SolverBoxDDP::parallelBackwardPass() {
+  // The gains depend on the box-QP solution, which is not captured by the
+  // unconstrained Riccati elements
+  return false;
+}
+
+double SolverBoxDDP::rolloutPolicy(
+    const double steplength, std::vector<Eigen::VectorXd>& xs_try,
+    std::vector<Eigen::VectorXd>& us_try, std::vector<Eigen::VectorXd>& dx,
+    Eigen::VectorXd& xnext,
+    const std::vector<boost::shared_ptr<ActionDataAbstract> >& running_datas,
+    const boost::shared_ptr<ActionDataAbstract>& terminal_data) {
+  double cost = 0.;
+  xnext = problem_->get_x0();
   const std::size_t T = problem_->get_T();
   const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
       problem_->get_runningModels();
-  const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
-      problem_->get_runningDatas();
   for (std::size_t t = 0; t < T; ++t) {
     const boost::shared_ptr<ActionModelAbstract>& m = models[t];
-    const boost::shared_ptr<ActionDataAbstract>& d = datas[t];
+    const boost::shared_ptr<ActionDataAbstract>& d = running_datas[t];
     const std::size_t nu = m->get_nu();
 
-    xs_try_[t] = xnext_;
-    m->get_state()->diff(xs_[t], xs_try_[t], dx_[t]);
+    xs_try[t] = xnext;
+    m->get_state()->diff(xs_[t], xs_try[t], dx[t]);
     if (nu != 0) {
-      us_try_[t].noalias() = us_[t] - k_[t] * steplength - K_[t] * dx_[t];
+      us_try[t].noalias() = us_[t] - k_[t] * steplength - K_[t] * dx[t];
       if (m->get_has_control_limits()) {  // clamp control
-        us_try_[t] = us_try_[t].cwiseMax(m->get_u_lb()).cwiseMin(m->get_u_ub());
+        us_try[t] = us_try[t].cwiseMax(m->get_u_lb()).cwiseMin(m->get_u_ub());
       }
-      m->calc(d, xs_try_[t], us_try_[t]);
+      m->calc(d, xs_try[t], us_try[t]);
     } else {
-      m->calc(d, xs_try_[t]);
+      m->calc(d, xs_try[t]);
     }
-    xnext_ = d->xnext;
-    cost_try_ += d->cost;
+    xnext = d->xnext;
+    cost += d->cost;
 
-    if (raiseIfNaN(cost_try_)) {
-      STOP_PROFILER("SolverBoxDDP::forwardPass");
+    if (raiseIfNaN(cost)) {
       throw_pretty("forward_error");
     }
-    if (raiseIfNaN(xnext_.lpNorm<Eigen::Infinity>())) {
-      STOP_PROFILER("SolverBoxDDP::forwardPass");
+    if (raiseIfNaN(xnext.lpNorm<Eigen::Infinity>())) {
       throw_pretty("forward_error");
     }
   }
 
   const boost::shared_ptr<ActionModelAbstract>& m =
       problem_->get_terminalModel();
-  const boost::shared_ptr<ActionDataAbstract>& d = problem_->get_terminalData();
   if ((is_feasible_) || (steplength == 1)) {
-    xs_try_.back() = xnext_;
+    xs_try.back() = xnext;
   } else {
-    m->get_state()->integrate(xnext_, fs_.back() * (steplength - 1),
-                              xs_try_.back());
+    // dx stores the scaled gap to avoid allocating a temporary vector
+    dx.back() = fs_.back() * (steplength - 1);
+    m->get_state()->integrate(xnext, dx.back(), xs_try.back());
   }
-  m->calc(d, xs_try_.back());
-  cost_try_ += d->cost;
+  m->calc(terminal_data, xs_try.back());
+  cost += terminal_data->cost;
 
-  if (raiseIfNaN(cost_try_)) {
-    STOP_PROFILER("SolverBoxDDP::forwardPass");
+  if (raiseIfNaN(cost)) {
     throw_pretty("forward_error");
   }
+  return cost;
 }
 
 const std::vector<Eigen::MatrixXd>& SolverBoxDDP::get_Quu_inv() const {
@@ -8,6 +8,7 @@
 
 #include "crocoddyl/core/solvers/box-fddp.hpp"
 
+#include <algorithm>
 #include <iostream>
 
 #include "crocoddyl/core/utils/exception.hpp"
@@ -46,10 +47,33 @@ void SolverBoxFDDP::resizeData() {
     Quu_inv_[t].conservativeResize(nu, nu);
     du_lb_[t].conservativeResize(nu);
     du_ub_[t].conservativeResize(nu);
+    qp_sols_[t].x.conservativeResize(nu);
+    qp_sols_[t].free_idx.reserve(nu);
+    qp_sols_[t].clamped_idx.reserve(nu);
   }
   STOP_PROFILER("SolverBoxFDDP::resizeData");
 }
 
+void SolverBoxFDDP::shift() {
+  START_PROFILER("SolverBoxFDDP::shift");
+  const std::size_t T = problem_->get_T();
+  std::rotate(Quu_inv_.begin(), Quu_inv_.begin() + 1, Quu_inv_.end());
+  std::rotate(du_lb_.begin(), du_lb_.begin() + 1, du_lb_.end());
+  std::rotate(du_ub_.begin(), du_ub_.begin() + 1, du_ub_.end());
+  std::rotate(qp_sols_.begin(), qp_sols_.begin() + 1, qp_sols_.end());
+  SolverFDDP::shift();
+  if (T > 1 && qp_sols_[T - 2].x.size() == qp_sols_.back().x.size()) {
+    qp_sols_.back().x = qp_sols_[T - 2].x;
+    qp_sols_.back().free_idx = qp_sols_[T - 2].free_idx;
+    qp_sols_.back().clamped_idx = qp_sols_[T - 2].clamped_idx;
+  } else {
+    qp_sols_.back().x.setZero();
+    qp_sols_.back().free_idx.clear();
+    qp_sols_.back().clamped_idx.clear();
+  }
+  STOP_PROFILER("SolverBoxFDDP::shift");
+}
+
 void SolverBoxFDDP::allocateData() {
   SolverFDDP::allocateData();
 
@@ -57,6 +81,7 @@ void SolverBoxFDDP::allocateData() {
   Quu_inv_.resize(T);
   du_lb_.resize(T);
   du_ub_.resize(T);
+  qp_sols_.resize(T);
   const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
       problem_->get_runningModels();
   for (std::size_t t = 0; t < T; ++t) {
@@ -65,6 +90,9 @@ void SolverBoxFDDP::allocateData() {
     Quu_inv_[t] = Eigen::MatrixXd::Zero(nu, nu);
     du_lb_[t] = Eigen::VectorXd::Zero(nu);
     du_ub_[t] = Eigen::VectorXd::Zero(nu);
+    qp_sols_[t].x = Eigen::VectorXd::Zero(nu);
+    qp_sols_[t].free_idx.reserve(nu);
+    qp_sols_[t].clamped_idx.reserve(nu);
   }
 }
 
@@ -82,7 +110,7 @@ void SolverBoxFDDP::computeGains(const std::size_t t) {
     du_ub_[t] = problem_->get_runningModels()[t]->get_u_ub() - us_[t];
 
     const BoxQPSolution& boxqp_sol =
-        qp_.solve(Quu_[t], Qu_[t], du_lb_[t], du_ub_[t], k_[t]);
+        qp_.solve(Quu_[t], Qu_[t], du_lb_[t], du_ub_[t], qp_sols_[t]);
 
     // Compute controls
     Quu_inv_[t].setZero();
@@ -94,6 +122,12 @@ void SolverBoxFDDP::computeGains(const std::size_t t) {
     }
     K_[t].noalias() = Quu_inv_[t] * Qxu_[t].transpose();
     k_[t] = -boxqp_sol.x;
+    // Keep the solution for warm-starting this node in the next iteration.
+    // The active set is copied into reserved storage, while the inverse of
+    // the free-space Hessian is not needed for warm-starting
+    qp_sols_[t].x = boxqp_sol.x;
+    qp_sols_[t].free_idx = boxqp_sol.free_idx;
+    qp_sols_[t].clamped_idx = boxqp_sol.clamped_idx;
 
     // The box-QP clamped the gradient direction; this is important for
     // accounting the algorithm advancement (i.e. stopping criteria)
@@ -103,6 +137,12 @@ void SolverBoxFDDP::computeGains(const std::size_t t) {
   }
 }
 
+bool SolverBoxFDDP::parallelBackwardPass() {
+  // The gains depend on the box-QP solution, which is not captured by the
+  // unconstrained Riccati elements
+  return false;
+}
+
 void SolverBoxFDDP::forwardPass(const double steplength) {
   if (steplength > 1. || steplength < 0.) {
     throw_pretty("Invalid argument: "
@@ -160,7 +200,9 @@ void SolverBoxFDDP::forwardPass(const double steplength) {
       const boost::shared_ptr<ActionModelAbstract>& m = models[t];
       const boost::shared_ptr<ActionDataAbstract>& d = datas[t];
       const std::size_t nu = m->get_nu();
-      m->get_state()->integrate(xnext_, fs_[t] * (steplength - 1), xs_try_[t]);
+      // dx_ stores the scaled gap to avoid allocating a temporary vector
+      dx_[t] = fs_[t] * (steplength - 1);
+      m->get_state()->integrate(xnext_, dx_[t], xs_try_[t]);
       m->get_state()->diff(xs_[t], xs_try_[t], dx_[t]);
       if (nu != 0) {
         us_try_[t].noalias() = us_[t] - k_[t] * steplength - K_[t] * dx_[t];
@@ -187,8 +229,8 @@ void SolverBoxFDDP::forwardPass(const double steplength) {
         problem_->get_terminalModel();
     const boost::shared_ptr<ActionDataAbstract>& d =
         problem_->get_terminalData();
-    m->get_state()->integrate(xnext_, fs_.back() * (steplength - 1),
-                              xs_try_.back());
+    dx_.back() = fs_.back() * (steplength - 1);
+    m->get_state()->integrate(xnext_, dx_.back(), xs_try_.back());
     m->calc(d, xs_try_.back());
     cost_try_ += d->cost;
 
@@ -198,6 +240,16 @@ void SolverBoxFDDP::forwardPass(const double steplength) {
   }
 }
 
+void SolverBoxFDDP::set_multiple_shooting(const bool multiple_shooting) {
+  if (multiple_shooting) {
+    // The box-QP gains are computed only for feasible guesses, whereas the
+    // multiple-shooting rollout keeps the linearization gaps
+    throw_pretty("Invalid argument: "
+                 << "the multiple-shooting forward pass is not supported");
+  }
+  multiple_shooting_ = multiple_shooting;
+}
+
 const std::vector<Eigen::MatrixXd>& SolverBoxFDDP::get_Quu_inv() const {
   return Quu_inv_;
 }
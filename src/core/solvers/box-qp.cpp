@@ -11,6 +11,7 @@
 #include <iostream>
 
 #include "crocoddyl/core/utils/exception.hpp"
+#include "crocoddyl/core/utils/malloc-check.hpp"
 
 namespace crocoddyl {
 
@@ -24,13 +25,16 @@ BoxQP::BoxQP(const std::size_t nx, const std::size_t maxiter,
       fold_(0.),
       fnew_(0.),
       x_(nx),
+      xinit_(nx),
       xnew_(nx),
       g_(nx),
       dx_(nx),
+      Hx_(nx),
       xo_(nx),
       dxo_(nx),
       qo_(nx),
-      Ho_(nx, nx) {
+      Ho_(nx, nx),
+      Lo_(nx, nx) {
   // Check if values have a proper range
   if (0. >= th_acceptstep && th_acceptstep >= 0.5) {
     std::cerr << "Warning: th_acceptstep value should between 0 and 0.5"
@@ -45,18 +49,22 @@ BoxQP::BoxQP(const std::size_t nx, const std::size_t maxiter,
 
   // Initialized the values of vectors
   x_.setZero();
+  xinit_.setZero();
   xnew_.setZero();
   g_.setZero();
   dx_.setZero();
+  Hx_.setZero();
   xo_.setZero();
   dxo_.setZero();
   qo_.setZero();
   Ho_.setZero();
+  Lo_.setZero();
 
   // Reserve the space and compute alphas
   solution_.x = Eigen::VectorXd::Zero(nx);
   solution_.clamped_idx.reserve(nx_);
   solution_.free_idx.reserve(nx_);
+  free_idx_prev_.reserve(nx_);
   const std::size_t n_alphas_ = 10;
   alphas_.resize(n_alphas_);
   for (std::size_t n = 0; n < n_alphas_; ++n) {
@@ -104,7 +112,9 @@ const BoxQPSolution& BoxQP::solve(const Eigen::MatrixXd& H,
   }
 
   // Start the numerical iterations
+  bool factorized = false;
   for (std::size_t k = 0; k < maxiter_; ++k) {
+    free_idx_prev_.swap(solution_.free_idx);
     solution_.clamped_idx.clear();
     solution_.free_idx.clear();
     // Compute the Cauchy point and active set
@@ -122,7 +132,10 @@ const BoxQPSolution& BoxQP::solve(const Eigen::MatrixXd& H,
       }
     }
 
-    // Compute the search direction as Newton step along the free space
+    // Compute the search direction as Newton step along the free space. The
+    // Cholesky decomposition is reused if the free space has not changed
+    const bool refactorize =
+        !factorized || solution_.free_idx != free_idx_prev_;
     nf_ = solution_.free_idx.size();
     nc_ = solution_.clamped_idx.size();
     Eigen::VectorBlock<Eigen::VectorXd> xf = xo_.head(nf_);
@@ -131,12 +144,15 @@ const BoxQPSolution& BoxQP::solve(const Eigen::MatrixXd& H,
     Eigen::VectorBlock<Eigen::VectorXd> qf = qo_.head(nf_);
     Eigen::Block<Eigen::MatrixXd> Hff = Ho_.topLeftCorner(nf_, nf_);
     Eigen::Block<Eigen::MatrixXd> Hfc = Ho_.topRightCorner(nf_, nc_);
+    Eigen::Block<Eigen::MatrixXd> Lff = Lo_.topLeftCorner(nf_, nf_);
     for (std::size_t i = 0; i < nf_; ++i) {
       const std::size_t fi = solution_.free_idx[i];
       qf(i) = q(fi);
       xf(i) = x_(fi);
-      for (std::size_t j = 0; j < nf_; ++j) {
-        Hff(i, j) = H(fi, solution_.free_idx[j]);
+      if (refactorize) {
+        for (std::size_t j = 0; j < nf_; ++j) {
+          Hff(i, j) = H(fi, solution_.free_idx[j]);
+        }
       }
       for (std::size_t j = 0; j < nc_; ++j) {
         const std::size_t cj = solution_.clamped_idx[j];
@@ -144,22 +160,25 @@ const BoxQPSolution& BoxQP::solve(const Eigen::MatrixXd& H,
         Hfc(i, j) = H(fi, cj);
       }
     }
-    if (reg_ != 0.) {
-      Hff.diagonal().array() += reg_;
-    }
-    Hff_inv_llt_.compute(Hff);
-    const Eigen::ComputationInfo& info = Hff_inv_llt_.info();
-    if (info != Eigen::Success) {
-      throw_pretty("backward_error");
+    if (refactorize) {
+      if (reg_ != 0.) {
+        Hff.diagonal().array() += reg_;
+      }
+      // The factorization is computed in place to avoid allocating memory
+      Lff = Hff;
+      Eigen::LLT<Eigen::Ref<Eigen::MatrixXd> > Hff_llt(Lff);
+      if (Hff_llt.info() != Eigen::Success) {
+        throw_pretty("backward_error");
+      }
+      factorized = true;
     }
-    solution_.Hff_inv.setIdentity(nf_, nf_);
-    Hff_inv_llt_.solveInPlace(solution_.Hff_inv);
     qf.noalias() += Hff * xf;
     if (nc_ != 0) {
       qf.noalias() += Hfc * xc;
     }
     dxf = -qf;
-    Hff_inv_llt_.solveInPlace(dxf);
+    Lff.triangularView<Eigen::Lower>().solveInPlace(dxf);
+    Lff.triangularView<Eigen::Lower>().adjoint().solveInPlace(dxf);
     dx_.setZero();
     for (std::size_t i = 0; i < nf_; ++i) {
       dx_(solution_.free_idx[i]) = dxf(i);
@@ -167,7 +186,8 @@ const BoxQPSolution& BoxQP::solve(const Eigen::MatrixXd& H,
     }
 
     // Try different step lengths
-    fold_ = 0.5 * x_.dot(H * x_) + q.dot(x_);
+    Hx_.noalias() = H * x_;
+    fold_ = 0.5 * x_.dot(Hx_) + q.dot(x_);
     for (std::vector<double>::const_iterator it = alphas_.begin();
          it != alphas_.end(); ++it) {
       double steplength = *it;
@@ -175,7 +195,8 @@ const BoxQPSolution& BoxQP::solve(const Eigen::MatrixXd& H,
         xnew_(i) =
             std::max(std::min(x_(i) + steplength * dx_(i), ub(i)), lb(i));
       }
-      fnew_ = 0.5 * xnew_.dot(H * xnew_) + q.dot(xnew_);
+      Hx_.noalias() = H * xnew_;
+      fnew_ = 0.5 * xnew_.dot(Hx_) + q.dot(xnew_);
       if (fold_ - fnew_ > th_acceptstep_ * g_.dot(x_ - xnew_)) {
         x_ = xnew_;
         break;
@@ -184,14 +205,63 @@ const BoxQPSolution& BoxQP::solve(const Eigen::MatrixXd& H,
 
     // Check convergence
     if (qf.lpNorm<Eigen::Infinity>() <= th_grad_) {
-      solution_.x = x_;
-      return solution_;
+      break;
+    }
+  }
+
+  // The inverse of the free space Hessian is only computed for the returned
+  // solution
+  if (factorized) {
+    const Eigen::Block<Eigen::MatrixXd> Lff = Lo_.topLeftCorner(nf_, nf_);
+    if (static_cast<std::size_t>(solution_.Hff_inv.rows()) != nf_) {
+      // It only happens when the dimension of the free space changes
+      MallocCheckScope malloc_allowed(true);
+      solution_.Hff_inv.resize(nf_, nf_);
     }
+    solution_.Hff_inv.setIdentity();
+    Lff.triangularView<Eigen::Lower>().solveInPlace(solution_.Hff_inv);
+    Lff.triangularView<Eigen::Lower>().adjoint().solveInPlace(
+        solution_.Hff_inv);
   }
   solution_.x = x_;
   return solution_;
 }
 
+const BoxQPSolution& BoxQP::solve(const Eigen::MatrixXd& H,
+                                  const Eigen::VectorXd& q,
+                                  const Eigen::VectorXd& lb,
+                                  const Eigen::VectorXd& ub,
+                                  const BoxQPSolution& warmstart) {
+  if (static_cast<std::size_t>(warmstart.x.size()) != nx_) {
+    throw_pretty("Invalid argument: "
+                 << "warmstart.x has wrong dimension (it should be " +
+                        std::to_string(nx_) + ")");
+  }
+  if (static_cast<std::size_t>(lb.size()) != nx_ ||
+      static_cast<std::size_t>(ub.size()) != nx_ ||
+      warmstart.free_idx.size() + warmstart.clamped_idx.size() != nx_) {
+    // There is no active set to seed from, or the bounds have wrong
+    // dimension (reported by the solver below)
+    return solve(H, q, lb, ub, warmstart.x);
+  }
+
+  // The clamped variables of the previous solution start at their nearest
+  // bound. Then, the first Cauchy point keeps them clamped if the gradient
+  // still pushes them outside the box, even when the bounds have changed
+  xinit_ = warmstart.x;
+  for (std::size_t i = 0; i < warmstart.clamped_idx.size(); ++i) {
+    const std::size_t j = warmstart.clamped_idx[i];
+    if (j >= nx_) {
+      throw_pretty("Invalid argument: "
+                   << "warmstart.clamped_idx has a wrong index (it should be "
+                      "lower than " +
+                          std::to_string(nx_) + ")");
+    }
+    xinit_(j) = (xinit_(j) - lb(j) <= ub(j) - xinit_(j)) ? lb(j) : ub(j);
+  }
+  return solve(H, q, lb, ub, xinit_);
+}
+
 const BoxQPSolution& BoxQP::get_solution() const { return solution_; }
 
 std::size_t BoxQP::get_nx() const { return nx_; }
@@ -209,13 +279,16 @@ const std::vector<double>& BoxQP::get_alphas() const { return alphas_; }
 void BoxQP::set_nx(const std::size_t nx) {
   nx_ = nx;
   x_.conservativeResize(nx);
+  xinit_.conservativeResize(nx);
   xnew_.conservativeResize(nx);
   g_.conservativeResize(nx);
   dx_.conservativeResize(nx);
+  Hx_.conservativeResize(nx);
   xo_.conservativeResize(nx);
   dxo_.conservativeResize(nx);
   qo_.conservativeResize(nx);
   Ho_.conservativeResize(nx, nx);
+  Lo_.conservativeResize(nx, nx);
 }
 
 void BoxQP::set_maxiter(const std::size_t maxiter) { maxiter_ = maxiter; }
@@ -9,9 +9,11 @@
 
 #include "crocoddyl/core/solvers/ddp.hpp"
 
+#include <algorithm>
 #include <iostream>
 
 #include "crocoddyl/core/utils/exception.hpp"
+#include "crocoddyl/core/utils/malloc-check.hpp"
 
 namespace crocoddyl {
 
@@ -24,7 +26,12 @@ SolverDDP::SolverDDP(boost::shared_ptr<ShootingProblem> problem)
       cost_try_(0.),
       th_grad_(1e-12),
       th_stepdec_(0.5),
-      th_stepinc_(0.01) {
+      th_stepinc_(0.01),
+      parallel_backward_(false),
+      parallel_linesearch_(false),
+      is_prepared_(false),
+      direction_time_(0.),
+      trial_time_(0.) {
   allocateData();
 
   const std::size_t n_alphas = 10;
@@ -47,12 +54,15 @@ bool SolverDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
                       const std::size_t maxiter, const bool is_feasible,
                       const double init_reg) {
   START_PROFILER("SolverDDP::solve");
+  timer_.reset();
   if (problem_->is_updated()) {
     resizeData();
   }
   xs_try_[0] =
       problem_->get_x0();  // it is needed in case that init_xs[0] is infeasible
   setCandidate(init_xs, init_us, is_feasible);
+  // The data is already allocated, so the iterations must not allocate memory
+  MallocCheckScope malloc_check(false);
 
   if (std::isnan(init_reg)) {
     preg_ = reg_min_;
@@ -63,8 +73,17 @@ bool SolverDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
   }
   was_feasible_ = false;
 
-  bool recalcDiff = true;
+  // The derivatives were already computed if the solver has been prepared
+  bool recalcDiff = !is_prepared_;
+  is_prepared_ = false;
+  Timer phase_timer;
   for (iter_ = 0; iter_ < maxiter; ++iter_) {
+    if (!checkTimeBudget(recalcDiff ? direction_time_ : 0.)) {
+      STOP_PROFILER("SolverDDP::solve");
+      return false;
+    }
+    phase_timer.reset();
+    const bool timed_direction = recalcDiff;
     while (true) {
       try {
         computeDirection(recalcDiff);
@@ -72,6 +91,11 @@ bool SolverDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
         recalcDiff = false;
         increaseRegularization();
         if (preg_ == reg_max_) {
+          status_ = MaxRegReached;
+          STOP_PROFILER("SolverDDP::solve");
+          return false;
+        } else if (!checkTimeBudget()) {
+          STOP_PROFILER("SolverDDP::solve");
           return false;
         } else {
           continue;
@@ -79,29 +103,54 @@ bool SolverDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
       }
       break;
     }
+    if (timed_direction) {
+      direction_time_ = phase_timer.get_duration();
+    }
+    // The first search direction of a fresh solver is not budgeted as its
+    // duration is unknown, so we check the budget again once it is measured
+    if (!checkTimeBudget()) {
+      STOP_PROFILER("SolverDDP::solve");
+      return false;
+    }
     expectedImprovement();
 
     // We need to recalculate the derivatives when the step length passes
     recalcDiff = false;
-    for (std::vector<double>::const_iterator it = alphas_.begin();
-         it != alphas_.end(); ++it) {
-      steplength_ = *it;
-
-      try {
-        dV_ = tryStep(steplength_);
-      } catch (std::exception& e) {
-        continue;
+    if (parallel_linesearch_) {
+      if (!checkTimeBudget(trial_time_)) {
+        STOP_PROFILER("SolverDDP::solve");
+        return false;
       }
-      dVexp_ = steplength_ * (d_[0] + 0.5 * steplength_ * d_[1]);
+      phase_timer.reset();
+      recalcDiff = parallelLineSearch();
+      trial_time_ = phase_timer.get_duration();
+    } else {
+      for (std::vector<double>::const_iterator it = alphas_.begin();
+           it != alphas_.end(); ++it) {
+        steplength_ = *it;
+        if (!checkTimeBudget(trial_time_)) {
+          STOP_PROFILER("SolverDDP::solve");
+          return false;
+        }
 
-      if (dVexp_ >= 0) {  // descend direction
-        if (std::abs(d_[0]) < th_grad_ || !is_feasible_ ||
-            dV_ > th_acceptstep_ * dVexp_) {
-          was_feasible_ = is_feasible_;
-          setCandidate(xs_try_, us_try_, true);
-          cost_ = cost_try_;
-          recalcDiff = true;
-          break;
+        phase_timer.reset();
+        try {
+          dV_ = tryStep(steplength_);
+        } catch (std::exception& e) {
+          continue;
+        }
+        trial_time_ = phase_timer.get_duration();
+        dVexp_ = steplength_ * (d_[0] + 0.5 * steplength_ * d_[1]);
+
+        if (dVexp_ >= 0) {  // descend direction
+          if (std::abs(d_[0]) < th_grad_ || !is_feasible_ ||
+              dV_ > th_acceptstep_ * dVexp_) {
+            was_feasible_ = is_feasible_;
+            setCandidate(xs_try_, us_try_, true);
+            cost_ = cost_try_;
+            recalcDiff = true;
+            break;
+          }
         }
       }
     }
@@ -112,27 +161,63 @@ bool SolverDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
     if (steplength_ <= th_stepinc_) {
       increaseRegularization();
       if (preg_ == reg_max_) {
+        status_ = MaxRegReached;
         STOP_PROFILER("SolverDDP::solve");
         return false;
       }
     }
     stoppingCriteria();
 
-    const std::size_t n_callbacks = callbacks_.size();
-    for (std::size_t c = 0; c < n_callbacks; ++c) {
-      CallbackAbstract& callback = *callbacks_[c];
-      callback(*this);
+    {
+      // User callbacks are free to allocate memory
+      MallocCheckScope malloc_allowed(true);
+      const std::size_t n_callbacks = callbacks_.size();
+      for (std::size_t c = 0; c < n_callbacks; ++c) {
+        CallbackAbstract& callback = *callbacks_[c];
+        callback(*this);
+      }
     }
 
     if (was_feasible_ && stop_ < th_stop_) {
+      status_ = Converged;
       STOP_PROFILER("SolverDDP::solve");
       return true;
     }
   }
+  status_ = MaxIterReached;
   STOP_PROFILER("SolverDDP::solve");
   return false;
 }
 
+double SolverDDP::prepare(const std::vector<Eigen::VectorXd>& init_xs,
+                          const std::vector<Eigen::VectorXd>& init_us,
+                          const bool is_feasible) {
+  START_PROFILER("SolverDDP::prepare");
+  if (problem_->is_updated()) {
+    resizeData();
+  }
+  setCandidate(init_xs, init_us, is_feasible);
+  iter_ = 0;
+  calcDiff();
+  is_prepared_ = true;
+  STOP_PROFILER("SolverDDP::prepare");
+  return cost_;
+}
+
+bool SolverDDP::feedback(const std::size_t maxiter, const double init_reg) {
+  if (!is_prepared_) {
+    throw_pretty("Invalid argument: "
+                 << "the solver has not been prepared, run prepare() first");
+  }
+  // Update the initial gap as the initial state might have changed after
+  // preparing the solver
+  if (!is_feasible_) {
+    problem_->get_runningModels()[0]->get_state()->diff(
+        xs_[0], problem_->get_x0(), fs_[0]);
+  }
+  return solve(xs_, us_, maxiter, is_feasible_, init_reg);
+}
+
 void SolverDDP::computeDirection(const bool recalcDiff) {
   START_PROFILER("SolverDDP::computeDirection");
   if (recalcDiff) {
@@ -196,9 +281,54 @@ void SolverDDP::resizeData() {
       FuTVxx_p_[t].setZero();
     }
   }
+  for (std::size_t i = 0; i < trials_.size(); ++i) {
+    trials_[i].resize(problem_);
+  }
+  if (parallel_linesearch_) {
+    allocateLineSearchTrials();
+  }
   STOP_PROFILER("SolverDDP::resizeData");
 }
 
+void SolverDDP::shift() {
+  START_PROFILER("SolverDDP::shift");
+  const std::size_t T = problem_->get_T();
+  std::rotate(Vxx_.begin(), Vxx_.begin() + 1, Vxx_.end());
+  std::rotate(Vx_.begin(), Vx_.begin() + 1, Vx_.end());
+  std::rotate(Qxx_.begin(), Qxx_.begin() + 1, Qxx_.end());
+  std::rotate(Qxu_.begin(), Qxu_.begin() + 1, Qxu_.end());
+  std::rotate(Quu_.begin(), Quu_.begin() + 1, Quu_.end());
+  std::rotate(Qx_.begin(), Qx_.begin() + 1, Qx_.end());
+  std::rotate(Qu_.begin(), Qu_.begin() + 1, Qu_.end());
+  std::rotate(K_.begin(), K_.begin() + 1, K_.end());
+  std::rotate(k_.begin(), k_.begin() + 1, k_.end());
+  std::rotate(us_try_.begin(), us_try_.begin() + 1, us_try_.end());
+  std::rotate(FuTVxx_p_.begin(), FuTVxx_p_.begin() + 1, FuTVxx_p_.end());
+  std::rotate(Quuk_.begin(), Quuk_.begin() + 1, Quuk_.end());
+  for (std::size_t i = 0; i < trials_.size(); ++i) {
+    // Only the data of the appended node is created again
+    LineSearchTrial& trial = trials_[i];
+    std::rotate(trial.us_try.begin(), trial.us_try.begin() + 1,
+                trial.us_try.end());
+    std::rotate(trial.running_models.begin(), trial.running_models.begin() + 1,
+                trial.running_models.end());
+    std::rotate(trial.running_datas.begin(), trial.running_datas.begin() + 1,
+                trial.running_datas.end());
+    trial.resize(problem_);
+  }
+  SolverAbstract::shift();
+  Vxx_.back() = Vxx_[T - 1];
+  Vx_.back() = Vx_[T - 1];
+  if (T > 1 && K_[T - 2].rows() == K_.back().rows()) {
+    K_.back() = K_[T - 2];
+    k_.back() = k_[T - 2];
+  } else {
+    K_.back().setZero();
+    k_.back().setZero();
+  }
+  STOP_PROFILER("SolverDDP::shift");
+}
+
 double SolverDDP::calcDiff() {
   START_PROFILER("SolverDDP::calcDiff");
   if (iter_ == 0) {
@@ -227,6 +357,12 @@ void SolverDDP::backwardPass() {
   if (!is_feasible_) {
     Vx_.back().noalias() += Vxx_.back() * fs_.back();
   }
+#ifdef CROCODDYL_WITH_MULTITHREADING
+  if (parallel_backward_ && parallelBackwardPass()) {
+    STOP_PROFILER("SolverDDP::backwardPass");
+    return;
+  }
+#endif
   const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
       problem_->get_runningModels();
   const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
@@ -261,49 +397,149 @@ void SolverDDP::forwardPass(const double steplength) {
                  << "invalid step length, value is between 0. to 1.");
   }
   START_PROFILER("SolverDDP::forwardPass");
-  cost_try_ = 0.;
+  try {
+    cost_try_ = rolloutPolicy(steplength, xs_try_, us_try_, dx_, xnext_,
+                              problem_->get_runningDatas(),
+                              problem_->get_terminalData());
+  } catch (std::exception& e) {
+    STOP_PROFILER("SolverDDP::forwardPass");
+    throw;
+  }
+  STOP_PROFILER("SolverDDP::forwardPass");
+}
+
+void SolverDDP::trialForwardPass(LineSearchTrial& trial) {
+  const double steplength = trial.steplength;
+  if (steplength > 1. || steplength < 0.) {
+    throw_pretty("Invalid argument: "
+                 << "invalid step length, value is between 0. to 1.");
+  }
+  trial.cost_try =
+      rolloutPolicy(steplength, trial.xs_try, trial.us_try, trial.dx,
+                    trial.xnext, trial.running_datas, trial.terminal_data);
+}
+
+double SolverDDP::rolloutPolicy(
+    const double steplength, std::vector<Eigen::VectorXd>& xs_try,
+    std::vector<Eigen::VectorXd>& us_try, std::vector<Eigen::VectorXd>& dx,
+    Eigen::VectorXd& xnext,
+    const std::vector<boost::shared_ptr<ActionDataAbstract> >& running_datas,
+    const boost::shared_ptr<ActionDataAbstract>& terminal_data) {
+  double cost = 0.;
+  xnext = problem_->get_x0();
   const std::size_t T = problem_->get_T();
   const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
       problem_->get_runningModels();
-  const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
-      problem_->get_runningDatas();
   for (std::size_t t = 0; t < T; ++t) {
     const boost::shared_ptr<ActionModelAbstract>& m = models[t];
-    const boost::shared_ptr<ActionDataAbstract>& d = datas[t];
+    const boost::shared_ptr<ActionDataAbstract>& d = running_datas[t];
 
-    m->get_state()->diff(xs_[t], xs_try_[t], dx_[t]);
+    xs_try[t] = xnext;
+    m->get_state()->diff(xs_[t], xs_try[t], dx[t]);
     if (m->get_nu() != 0) {
-      us_try_[t].noalias() = us_[t];
-      us_try_[t].noalias() -= k_[t] * steplength;
-      us_try_[t].noalias() -= K_[t] * dx_[t];
-      m->calc(d, xs_try_[t], us_try_[t]);
+      us_try[t].noalias() = us_[t];
+      us_try[t].noalias() -= k_[t] * steplength;
+      us_try[t].noalias() -= K_[t] * dx[t];
+      m->calc(d, xs_try[t], us_try[t]);
     } else {
-      m->calc(d, xs_try_[t]);
+      m->calc(d, xs_try[t]);
     }
-    xs_try_[t + 1] = d->xnext;
-    cost_try_ += d->cost;
+    xnext = d->xnext;
+    cost += d->cost;
 
-    if (raiseIfNaN(cost_try_)) {
-      STOP_PROFILER("SolverDDP::forwardPass");
+    if (raiseIfNaN(cost)) {
       throw_pretty("forward_error");
     }
-    if (raiseIfNaN(xs_try_[t + 1].lpNorm<Eigen::Infinity>())) {
-      STOP_PROFILER("SolverDDP::forwardPass");
+    if (raiseIfNaN(xnext.lpNorm<Eigen::Infinity>())) {
       throw_pretty("forward_error");
     }
   }
 
   const boost::shared_ptr<ActionModelAbstract>& m =
       problem_->get_terminalModel();
-  const boost::shared_ptr<ActionDataAbstract>& d = problem_->get_terminalData();
-  m->calc(d, xs_try_.back());
-  cost_try_ += d->cost;
+  xs_try.back() = xnext;
+  m->calc(terminal_data, xs_try.back());
+  cost += terminal_data->cost;
 
-  if (raiseIfNaN(cost_try_)) {
-    STOP_PROFILER("SolverDDP::forwardPass");
+  if (raiseIfNaN(cost)) {
     throw_pretty("forward_error");
   }
-  STOP_PROFILER("SolverDDP::forwardPass");
+  return cost;
+}
+
+bool SolverDDP::parallelLineSearch() {
+  START_PROFILER("SolverDDP::parallelLineSearch");
+#ifdef CROCODDYL_WITH_MULTITHREADING
+  const std::size_t nthreads = problem_->get_nthreads();
+#else
+  const std::size_t nthreads = 1;
+#endif
+  const std::size_t n_alphas = alphas_.size();
+  const std::size_t n_batch = std::min(nthreads, n_alphas);
+  if (trials_.size() + 1 < n_batch) {
+    // It only happens when the number of threads has changed after
+    // allocating the trials
+    MallocCheckScope malloc_allowed(true);
+    allocateLineSearchTrials();
+  }
+  for (std::size_t i = 0; i < n_alphas; i += n_batch) {
+    const std::size_t n = std::min(n_batch, n_alphas - i);
+    double dV = NAN;
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#pragma omp parallel for num_threads(n)
+#endif
+    for (std::size_t j = 0; j < n; ++j) {
+      if (j == 0) {
+        try {
+          dV = tryStep(alphas_[i]);
+        } catch (std::exception& e) {
+          dV = NAN;
+        }
+      } else {
+        LineSearchTrial& trial = trials_[j - 1];
+        trial.steplength = alphas_[i + j];
+        try {
+          trialForwardPass(trial);
+          trial.dV = cost_ - trial.cost_try;
+        } catch (std::exception& e) {
+          trial.dV = NAN;
+        }
+      }
+    }
+
+    // Accept the largest step length of the batch
+    for (std::size_t j = 0; j < n; ++j) {
+      steplength_ = alphas_[i + j];
+      dV_ = j == 0 ? dV : trials_[j - 1].dV;
+      if (std::isnan(dV_)) {
+        continue;
+      }
+      dVexp_ = steplength_ * (d_[0] + 0.5 * steplength_ * d_[1]);
+
+      if (dVexp_ >= 0) {  // descend direction
+        if (std::abs(d_[0]) < th_grad_ || !is_feasible_ ||
+            dV_ > th_acceptstep_ * dVexp_) {
+          was_feasible_ = is_feasible_;
+          if (j == 0) {
+            setCandidate(xs_try_, us_try_, true);
+            cost_ = cost_try_;
+          } else {
+            LineSearchTrial& trial = trials_[j - 1];
+            setCandidate(trial.xs_try, trial.us_try, true);
+            cost_try_ = trial.cost_try;
+            cost_ = cost_try_;
+            // The trial data already describes the accepted trajectory, so we
+            // hand it to the problem for the next calcDiff()
+            problem_->swapDatas(trial.running_datas, trial.terminal_data);
+          }
+          STOP_PROFILER("SolverDDP::parallelLineSearch");
+          return true;
+        }
+      }
+    }
+  }
+  STOP_PROFILER("SolverDDP::parallelLineSearch");
+  return false;
 }
 
 void SolverDDP::computeActionValueFunction(
@@ -312,18 +548,30 @@ void SolverDDP::computeActionValueFunction(
   assert_pretty(t < problem_->get_T(),
                 "Invalid argument: t should be between 0 and " +
                     std::to_string(problem_->get_T()););
+  assert_pretty(data->Lxx.isApprox(data->Lxx.transpose()),
+                "Invalid argument: Lxx should be symmetric");
+  assert_pretty(data->Luu.isApprox(data->Luu.transpose()),
+                "Invalid argument: Luu should be symmetric");
   const std::size_t nu = model->get_nu();
   const Eigen::MatrixXd& Vxx_p = Vxx_[t + 1];
   const Eigen::VectorXd& Vx_p = Vx_[t + 1];
 
-  FxTVxx_p_.noalias() = data->Fx.transpose() * Vxx_p;
+  const double dt = model->get_structure_timestep();
+  if (dt > 0.) {
+    computeStructuredActionValueFunction(t, data, dt);
+    return;
+  }
+  FxTVxx_p_[t].noalias() = data->Fx.transpose() * Vxx_p;
   START_PROFILER("SolverDDP::Qx");
   Qx_[t] = data->Lx;
   Qx_[t].noalias() += data->Fx.transpose() * Vx_p;
   STOP_PROFILER("SolverDDP::Qx");
   START_PROFILER("SolverDDP::Qxx");
+  // Qxx and Quu are symmetric, so we only compute their lower triangular part
+  // and then mirror it. This roughly halves the flops of these products.
   Qxx_[t] = data->Lxx;
-  Qxx_[t].noalias() += FxTVxx_p_ * data->Fx;
+  Qxx_[t].triangularView<Eigen::Lower>() += FxTVxx_p_[t] * data->Fx;
+  Qxx_[t] = Qxx_[t].selfadjointView<Eigen::Lower>();
   STOP_PROFILER("SolverDDP::Qxx");
   if (nu != 0) {
     FuTVxx_p_[t].noalias() = data->Fu.transpose() * Vxx_p;
@@ -333,16 +581,83 @@ void SolverDDP::computeActionValueFunction(
     STOP_PROFILER("SolverDDP::Qu");
     START_PROFILER("SolverDDP::Quu");
     Quu_[t] = data->Luu;
-    Quu_[t].noalias() += FuTVxx_p_[t] * data->Fu;
+    Quu_[t].triangularView<Eigen::Lower>() += FuTVxx_p_[t] * data->Fu;
+    Quu_[t] = Quu_[t].selfadjointView<Eigen::Lower>();
+    STOP_PROFILER("SolverDDP::Quu");
+    START_PROFILER("SolverDDP::Qxu");
+    Qxu_[t] = data->Lxu;
+    Qxu_[t].noalias() += FxTVxx_p_[t] * data->Fu;
+    STOP_PROFILER("SolverDDP::Qxu");
+    if (!std::isnan(preg_)) {
+      Quu_[t].diagonal().array() += preg_;
+    }
+  }
+}
+
+void SolverDDP::computeStructuredActionValueFunction(
+    const std::size_t t, const boost::shared_ptr<ActionDataAbstract>& data,
+    const double dt) {
+  const Eigen::Index ndx = data->Fx.cols();
+  const Eigen::Index nv = ndx / 2;
+  const Eigen::Index nu = data->Fu.cols();
+  assert_pretty(2 * nv == ndx,
+                "Invalid argument: the Euler structure requires ndx = 2 nv");
+  const Eigen::MatrixXd& Vxx_p = Vxx_[t + 1];
+  const Eigen::VectorXd& Vx_p = Vx_[t + 1];
+  // With Fx = [I 0; 0 0] + c Bx, Fu = c Bu and c = [dt I; I], the products
+  // with Fx and Fu reduce to products with their velocity rows Bx and Bu.
+  // The buffer of Fx' Vxx' is not needed, so it stores S = c' Vxx' and
+  // c' Vxx' c, while the one of Fu' Vxx' stores c' Vxx' c Bu.
+  const Eigen::MatrixXd& Fx = data->Fx;
+  const Eigen::MatrixXd& Fu = data->Fu;
+  const Eigen::MatrixXd::ConstRowsBlockXpr Bx = Fx.bottomRows(nv);
+  const Eigen::MatrixXd::ConstRowsBlockXpr Bu = Fu.bottomRows(nv);
+  Eigen::Map<MatrixXdRowMajor> S(FxTVxx_p_[t].data(), nv, ndx);
+  Eigen::Map<MatrixXdRowMajor> cTVc(FxTVxx_p_[t].data() + nv * ndx, nv, nv);
+  S = dt * Vxx_p.topRows(nv) + Vxx_p.bottomRows(nv);
+  cTVc = dt * S.leftCols(nv) + S.rightCols(nv);
+  START_PROFILER("SolverDDP::Qx");
+  Qx_[t] = data->Lx;
+  Qx_[t].head(nv) += Vx_p.head(nv);
+  Qx_[t].noalias() += dt * Bx.transpose() * Vx_p.head(nv);
+  Qx_[t].noalias() += Bx.transpose() * Vx_p.tail(nv);
+  STOP_PROFILER("SolverDDP::Qx");
+  if (nu != 0) {
+    Eigen::Map<MatrixXdRowMajor> cTVcBu(FuTVxx_p_[t].data(), nv, nu);
+    cTVcBu.noalias() = cTVc * Bu;
+    START_PROFILER("SolverDDP::Qu");
+    Qu_[t] = data->Lu;
+    Qu_[t].noalias() += dt * Bu.transpose() * Vx_p.head(nv);
+    Qu_[t].noalias() += Bu.transpose() * Vx_p.tail(nv);
+    STOP_PROFILER("SolverDDP::Qu");
+    START_PROFILER("SolverDDP::Quu");
+    Quu_[t] = data->Luu;
+    Quu_[t].triangularView<Eigen::Lower>() += Bu.transpose() * cTVcBu;
+    Quu_[t] = Quu_[t].selfadjointView<Eigen::Lower>();
     STOP_PROFILER("SolverDDP::Quu");
     START_PROFILER("SolverDDP::Qxu");
+    // Fx' Vxx' Fu = [S_q' Bu; 0] + Bx' c' Vxx' c Bu
     Qxu_[t] = data->Lxu;
-    Qxu_[t].noalias() += FxTVxx_p_ * data->Fu;
+    Qxu_[t].topRows(nv).noalias() += S.leftCols(nv).transpose() * Bu;
+    Qxu_[t].noalias() += Bx.transpose() * cTVcBu;
     STOP_PROFILER("SolverDDP::Qxu");
     if (!std::isnan(preg_)) {
       Quu_[t].diagonal().array() += preg_;
     }
   }
+  START_PROFILER("SolverDDP::Qxx");
+  // Fx' Vxx' Fx = [Vxx'_qq + S_q' Bx_q, *; 0, 0] + Bx' (S [I 0; 0 0] +
+  // c' Vxx' c Bx), where * lies in the upper triangular part. We compute the
+  // lower triangular part and then mirror it, as in the dense case.
+  Qxx_[t] = data->Lxx;
+  Qxx_[t].topLeftCorner(nv, nv) += Vxx_p.topLeftCorner(nv, nv);
+  Qxx_[t].topLeftCorner(nv, nv).triangularView<Eigen::Lower>() +=
+      S.leftCols(nv).transpose() * Bx.leftCols(nv);
+  S.leftCols(nv).noalias() += cTVc * Bx.leftCols(nv);
+  S.rightCols(nv).noalias() = cTVc * Bx.rightCols(nv);
+  Qxx_[t].triangularView<Eigen::Lower>() += Bx.transpose() * S;
+  Qxx_[t] = Qxx_[t].selfadjointView<Eigen::Lower>();
+  STOP_PROFILER("SolverDDP::Qxx");
 }
 
 void SolverDDP::computeValueFunction(
@@ -359,11 +674,14 @@ void SolverDDP::computeValueFunction(
     Vx_[t].noalias() -= K_[t].transpose() * Qu_[t];
     STOP_PROFILER("SolverDDP::Vx");
     START_PROFILER("SolverDDP::Vxx");
-    Vxx_[t].noalias() -= Qxu_[t] * K_[t];
+    // Qxu * K = Qxu * Quu^{-1} * Qux is symmetric, so we only update the lower
+    // triangular part of Vxx
+    Vxx_[t].triangularView<Eigen::Lower>() -= Qxu_[t] * K_[t];
     STOP_PROFILER("SolverDDP::Vxx");
   }
-  Vxx_tmp_ = 0.5 * (Vxx_[t] + Vxx_[t].transpose());
-  Vxx_[t] = Vxx_tmp_;
+  // Mirror the lower triangular part in place, so nodes can be processed
+  // concurrently
+  Vxx_[t] = Vxx_[t].selfadjointView<Eigen::Lower>();
 
   if (!std::isnan(preg_)) {
     Vxx_[t].diagonal().array() += preg_;
@@ -401,6 +719,173 @@ void SolverDDP::computeGains(const std::size_t t) {
   STOP_PROFILER("SolverDDP::computeGains");
 }
 
+bool SolverDDP::parallelBackwardPass() {
+#ifdef CROCODDYL_WITH_MULTITHREADING
+  const std::size_t T = problem_->get_T();
+  const std::size_t nseg = std::min(problem_->get_nthreads(), T / 2);
+  if (nseg < 2) {
+    return false;
+  }
+  START_PROFILER("SolverDDP::parallelBackwardPass");
+  const std::size_t ndx = problem_->get_ndx();
+  if (segments_.size() != nseg ||
+      static_cast<std::size_t>(segments_[0].A.rows()) != ndx) {
+    // It only happens when the number of threads has changed after allocating
+    // the data
+    MallocCheckScope malloc_allowed(true);
+    segments_.assign(nseg, RiccatiSegment(ndx));
+  }
+  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+      problem_->get_runningModels();
+  const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
+      problem_->get_runningDatas();
+  const double reg = std::isnan(preg_) ? 0. : preg_;
+
+  // Condense the segments (except the first one) into their Riccati elements.
+  // The node gains are used as temporary variables.
+  int failed = 0;
+#pragma omp parallel for num_threads(nseg) reduction(+ : failed)
+  for (std::size_t s = 1; s < nseg; ++s) {
+    RiccatiSegment& seg = segments_[s];
+    const std::size_t t0 = s * T / nseg;
+    const std::size_t tf = (s + 1) * T / nseg;
+    for (std::size_t t = tf; t-- > t0;) {
+      const boost::shared_ptr<ActionDataAbstract>& d = datas[t];
+      seg.Ak = d->Fx;
+      if (is_feasible_) {
+        seg.bk.setZero();
+      } else {
+        seg.bk = fs_[t + 1];
+      }
+      seg.Jk = d->Lxx;
+      seg.Jk.diagonal().array() += reg;
+      seg.etak = -d->Lx;
+      if (models[t]->get_nu() != 0) {
+        Quu_[t] = d->Luu;
+        Quu_[t].diagonal().array() += reg;
+        Quu_llt_[t].compute(Quu_[t]);
+        if (Quu_llt_[t].info() != Eigen::Success) {
+          ++failed;
+          break;
+        }
+        K_[t] = d->Lxu.transpose();
+        Quu_llt_[t].solveInPlace(K_[t]);
+        k_[t] = d->Lu;
+        Quu_llt_[t].solveInPlace(k_[t]);
+        FuTVxx_p_[t] = d->Fu.transpose();
+        Quu_llt_[t].solveInPlace(FuTVxx_p_[t]);
+        seg.Ak.noalias() -= d->Fu * K_[t];
+        seg.bk.noalias() -= d->Fu * k_[t];
+        seg.Ck.noalias() = d->Fu * FuTVxx_p_[t];
+        seg.Jk.noalias() -= d->Lxu * K_[t];
+        seg.etak.noalias() += d->Lxu * k_[t];
+      } else {
+        seg.Ck.setZero();
+      }
+      if (t == tf - 1) {
+        seg.A = seg.Ak;
+        seg.b = seg.bk;
+        seg.C = seg.Ck;
+        seg.J = seg.Jk;
+        seg.eta = seg.etak;
+        continue;
+      }
+      // Combine the node element with the condensed element of later nodes
+      seg.M.setIdentity();
+      seg.M.noalias() += seg.J * seg.Ck;
+      seg.M_lu.compute(seg.M);
+      seg.GT = seg.M_lu.solve(seg.A.transpose());
+      seg.H = seg.M_lu.solve(seg.J);
+      seg.r = seg.eta;
+      seg.r.noalias() -= seg.J * seg.bk;
+      seg.g = seg.M_lu.solve(seg.r);
+      seg.tmp.noalias() = seg.Ck * seg.A.transpose();
+      seg.C.noalias() += seg.GT.transpose() * seg.tmp;
+      seg.r = seg.bk;
+      seg.r.noalias() += seg.Ck * seg.eta;
+      seg.b.noalias() += seg.GT.transpose() * seg.r;
+      seg.A.noalias() = seg.GT.transpose() * seg.Ak;
+      seg.tmp.noalias() = seg.H * seg.Ak;
+      seg.J = seg.Jk;
+      seg.J.noalias() += seg.Ak.transpose() * seg.tmp;
+      seg.eta = seg.etak;
+      seg.eta.noalias() += seg.Ak.transpose() * seg.g;
+    }
+  }
+  if (failed != 0) {
+    STOP_PROFILER("SolverDDP::parallelBackwardPass");
+    return false;
+  }
+
+  // Propagate the Value function through the segment boundaries
+  for (std::size_t s = nseg - 1; s > 0; --s) {
+    RiccatiSegment& seg = segments_[s];
+    const std::size_t t0 = s * T / nseg;
+    const std::size_t tf = (s + 1) * T / nseg;
+    seg.M.setIdentity();
+    seg.M.noalias() += Vxx_[tf] * seg.C;
+    seg.M_lu.compute(seg.M);
+    seg.H = seg.M_lu.solve(Vxx_[tf]);
+    seg.tmp.noalias() = seg.H * seg.A;
+    Vxx_[t0] = seg.J;
+    Vxx_[t0].noalias() += seg.A.transpose() * seg.tmp;
+    Vxx_[t0].triangularView<Eigen::StrictlyUpper>() =
+        0.5 * (Vxx_[t0] + Vxx_[t0].transpose());
+    Vxx_[t0] = Vxx_[t0].selfadjointView<Eigen::Upper>();
+    seg.r = Vx_[tf];
+    if (!is_feasible_) {
+      seg.r.noalias() -= Vxx_[tf] * fs_[tf];
+    }
+    seg.r.noalias() += Vxx_[tf] * seg.b;
+    seg.g = seg.M_lu.solve(seg.r);
+    Vx_[t0] = -seg.eta;
+    Vx_[t0].noalias() += seg.A.transpose() * seg.g;
+    if (!is_feasible_) {
+      Vx_[t0].noalias() += Vxx_[t0] * fs_[t0];
+    }
+    if (raiseIfNaN(Vx_[t0].lpNorm<Eigen::Infinity>()) ||
+        raiseIfNaN(Vxx_[t0].lpNorm<Eigen::Infinity>())) {
+      STOP_PROFILER("SolverDDP::parallelBackwardPass");
+      return false;
+    }
+  }
+
+  // Run the Riccati sweep of each segment from its boundary Value function.
+  // The last node of each segment is computed first, so the Value function at
+  // the segment boundaries is not overwritten while it is being read.
+  for (std::size_t pass = 0; pass < 2; ++pass) {
+#pragma omp parallel for num_threads(nseg) reduction(+ : failed)
+    for (std::size_t s = 0; s < nseg; ++s) {
+      const std::size_t tf = (s + 1) * T / nseg;
+      const std::size_t t0 = pass == 0 ? tf - 1 : s * T / nseg;
+      const std::size_t t1 = pass == 0 ? tf : tf - 1;
+      try {
+        for (std::size_t t = t1; t-- > t0;) {
+          const boost::shared_ptr<ActionModelAbstract>& m = models[t];
+          computeActionValueFunction(t, m, datas[t]);
+          computeGains(t);
+          computeValueFunction(t, m);
+          if (raiseIfNaN(Vx_[t].lpNorm<Eigen::Infinity>()) ||
+              raiseIfNaN(Vxx_[t].lpNorm<Eigen::Infinity>())) {
+            ++failed;
+            break;
+          }
+        }
+      } catch (std::exception& e) {
+        ++failed;
+      }
+    }
+  }
+  STOP_PROFILER("SolverDDP::parallelBackwardPass");
+  if (failed != 0) {
+    throw_pretty("backward_error");
+  }
+  return true;
+#else
+  return false;
+#endif
+}
+
 void SolverDDP::increaseRegularization() {
   preg_ *= reg_incfactor_;
   if (preg_ > reg_max_) {
@@ -433,6 +918,7 @@ void SolverDDP::allocateData() {
   us_try_.resize(T);
   dx_.resize(T);
 
+  FxTVxx_p_.resize(T);
   FuTVxx_p_.resize(T);
   Quu_llt_.resize(T);
   Quuk_.resize(T);
@@ -461,6 +947,7 @@ void SolverDDP::allocateData() {
     us_try_[t] = Eigen::VectorXd::Zero(nu);
     dx_[t] = Eigen::VectorXd::Zero(ndx);
 
+    FxTVxx_p_[t] = MatrixXdRowMajor::Zero(ndx, ndx);
     FuTVxx_p_[t] = MatrixXdRowMajor::Zero(nu, ndx);
     Quu_llt_[t] = Eigen::LLT<Eigen::MatrixXd>(nu);
     Quuk_[t] = Eigen::VectorXd(nu);
@@ -470,8 +957,14 @@ void SolverDDP::allocateData() {
   Vx_.back() = Eigen::VectorXd::Zero(ndx);
   xs_try_.back() = problem_->get_terminalModel()->get_state()->zero();
 
-  FxTVxx_p_ = MatrixXdRowMajor::Zero(ndx, ndx);
   fTVxx_p_ = Eigen::VectorXd::Zero(ndx);
+  xnext_ = Eigen::VectorXd::Zero(problem_->get_nx());
+#ifdef CROCODDYL_WITH_MULTITHREADING
+  const std::size_t nseg = std::min(problem_->get_nthreads(), T / 2);
+  if (nseg >= 2) {
+    segments_.assign(nseg, RiccatiSegment(ndx));
+  }
+#endif
 }
 
 double SolverDDP::get_reg_incfactor() const { return reg_incfactor_; }
@@ -496,6 +989,10 @@ double SolverDDP::get_th_stepinc() const { return th_stepinc_; }
 
 double SolverDDP::get_th_grad() const { return th_grad_; }
 
+bool SolverDDP::get_parallel_backward() const { return parallel_backward_; }
+
+bool SolverDDP::get_parallel_linesearch() const { return parallel_linesearch_; }
+
 const std::vector<Eigen::MatrixXd>& SolverDDP::get_Vxx() const { return Vxx_; }
 
 const std::vector<Eigen::VectorXd>& SolverDDP::get_Vx() const { return Vx_; }
@@ -517,6 +1014,31 @@ SolverDDP::get_K() const {
 
 const std::vector<Eigen::VectorXd>& SolverDDP::get_k() const { return k_; }
 
+const SolverDDP::MatrixXdRowMajor& SolverDDP::get_stacked_K() const {
+  const Eigen::Index nu = K_.empty() ? 0 : K_[0].rows();
+  const Eigen::Index ndx = K_.empty() ? 0 : K_[0].cols();
+  for (std::size_t t = 1; t < K_.size(); ++t) {
+    if (K_[t].rows() != nu || K_[t].cols() != ndx) {
+      throw_pretty("Invalid argument: "
+                   << "feedback gains have different dimensions, they cannot "
+                      "be stacked");
+    }
+  }
+  const Eigen::Index rows = static_cast<Eigen::Index>(K_.size()) * nu;
+  if (stacked_K_.rows() != rows || stacked_K_.cols() != ndx) {
+    stacked_K_.resize(rows, ndx);
+  }
+  for (std::size_t t = 0; t < K_.size(); ++t) {
+    stacked_K_.middleRows(static_cast<Eigen::Index>(t) * nu, nu) = K_[t];
+  }
+  return stacked_K_;
+}
+
+const SolverDDP::MatrixXdRowMajor& SolverDDP::get_stacked_k() const {
+  stackVectors(k_, stacked_k_);
+  return stacked_k_;
+}
+
 void SolverDDP::set_reg_incfactor(const double regfactor) {
   if (regfactor <= 1.) {
     throw_pretty("Invalid argument: "
@@ -618,4 +1140,92 @@ void SolverDDP::set_th_grad(const double th_grad) {
   th_grad_ = th_grad;
 }
 
+void SolverDDP::set_parallel_backward(const bool parallel_backward) {
+#ifndef CROCODDYL_WITH_MULTITHREADING
+  if (parallel_backward) {
+    std::cerr << "Warning: the parallel backward pass won't be used as "
+                 "multithreading support is not enabled."
+              << std::endl;
+  }
+#endif
+  parallel_backward_ = parallel_backward;
+}
+
+void SolverDDP::set_parallel_linesearch(const bool parallel_linesearch) {
+#ifndef CROCODDYL_WITH_MULTITHREADING
+  if (parallel_linesearch) {
+    std::cerr << "Warning: the step lengths will be evaluated sequentially as "
+                 "multithreading support is not enabled."
+              << std::endl;
+  }
+#endif
+  parallel_linesearch_ = parallel_linesearch;
+  if (parallel_linesearch_) {
+    allocateLineSearchTrials();
+  }
+}
+
+void SolverDDP::allocateLineSearchTrials() {
+#ifdef CROCODDYL_WITH_MULTITHREADING
+  const std::size_t nthreads = problem_->get_nthreads();
+#else
+  const std::size_t nthreads = 1;
+#endif
+  const std::size_t n_batch = std::min(nthreads, alphas_.size());
+  // The first step length of each batch uses the solver and problem data,
+  // while the rest of them use their own trial buffers
+  while (trials_.size() + 1 < n_batch) {
+    trials_.push_back(LineSearchTrial(problem_));
+  }
+}
+
+LineSearchTrial::LineSearchTrial(boost::shared_ptr<ShootingProblem> problem)
+    : xnext(problem->get_x0()),
+      running_models(problem->get_runningModels()),
+      terminal_model(problem->get_terminalModel()),
+      terminal_data(problem->get_terminalModel()->createData()),
+      steplength(1.),
+      cost_try(0.),
+      dV(0.) {
+  const std::size_t T = problem->get_T();
+  const std::size_t ndx = problem->get_ndx();
+  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+      problem->get_runningModels();
+  xs_try.resize(T + 1);
+  us_try.resize(T);
+  dx.resize(T);
+  running_datas.resize(T);
+  for (std::size_t t = 0; t < T; ++t) {
+    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
+    if (t == 0) {
+      xs_try[t] = problem->get_x0();
+    } else {
+      xs_try[t] = model->get_state()->zero();
+    }
+    us_try[t] = Eigen::VectorXd::Zero(model->get_nu());
+    dx[t] = Eigen::VectorXd::Zero(ndx);
+    running_datas[t] = model->createData();
+  }
+  xs_try.back() = problem->get_terminalModel()->get_state()->zero();
+}
+
+void LineSearchTrial::resize(
+    const boost::shared_ptr<ShootingProblem>& problem) {
+  const std::size_t T = problem->get_T();
+  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+      problem->get_runningModels();
+  for (std::size_t t = 0; t < T; ++t) {
+    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
+    us_try[t].conservativeResize(model->get_nu());
+    if (running_models[t] != model) {
+      running_models[t] = model;
+      running_datas[t] = model->createData();
+    }
+  }
+  if (terminal_model != problem->get_terminalModel()) {
+    terminal_model = problem->get_terminalModel();
+    terminal_data = terminal_model->createData();
+  }
+}
+
 }  // namespace crocoddyl
@@ -13,11 +13,19 @@
 
 #include "crocoddyl/core/solvers/fddp.hpp"
 #include "crocoddyl/core/utils/exception.hpp"
+#include "crocoddyl/core/utils/malloc-check.hpp"
 
 namespace crocoddyl {
 
 SolverFDDP::SolverFDDP(boost::shared_ptr<ShootingProblem> problem)
-    : SolverDDP(problem), dg_(0), dq_(0), dv_(0), th_acceptnegstep_(2) {}
+    : SolverDDP(problem),
+      dg_(0),
+      dq_(0),
+      dv_(0),
+      th_acceptnegstep_(2),
+      multiple_shooting_(false) {
+  allocateData();
+}
 
 SolverFDDP::~SolverFDDP() {}
 
@@ -26,12 +34,15 @@ bool SolverFDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
                        const std::size_t maxiter, const bool is_feasible,
                        const double init_reg) {
   START_PROFILER("SolverFDDP::solve");
+  timer_.reset();
   if (problem_->is_updated()) {
     resizeData();
   }
   xs_try_[0] =
       problem_->get_x0();  // it is needed in case that init_xs[0] is infeasible
   setCandidate(init_xs, init_us, is_feasible);
+  // The data is already allocated, so the iterations must not allocate memory
+  MallocCheckScope malloc_check(false);
 
   if (std::isnan(init_reg)) {
     preg_ = reg_min_;
@@ -42,8 +53,17 @@ bool SolverFDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
   }
   was_feasible_ = false;
 
-  bool recalcDiff = true;
+  // The derivatives were already computed if the solver has been prepared
+  bool recalcDiff = !is_prepared_;
+  is_prepared_ = false;
+  Timer phase_timer;
   for (iter_ = 0; iter_ < maxiter; ++iter_) {
+    if (!checkTimeBudget(recalcDiff ? direction_time_ : 0.)) {
+      STOP_PROFILER("SolverFDDP::solve");
+      return false;
+    }
+    phase_timer.reset();
+    const bool timed_direction = recalcDiff;
     while (true) {
       try {
         computeDirection(recalcDiff);
@@ -51,6 +71,11 @@ bool SolverFDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
         recalcDiff = false;
         increaseRegularization();
         if (preg_ == reg_max_) {
+          status_ = MaxRegReached;
+          STOP_PROFILER("SolverFDDP::solve");
+          return false;
+        } else if (!checkTimeBudget()) {
+          STOP_PROFILER("SolverFDDP::solve");
           return false;
         } else {
           continue;
@@ -58,6 +83,15 @@ bool SolverFDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
       }
       break;
     }
+    if (timed_direction) {
+      direction_time_ = phase_timer.get_duration();
+    }
+    // The first search direction of a fresh solver is not budgeted as its
+    // duration is unknown, so we check the budget again once it is measured
+    if (!checkTimeBudget()) {
+      STOP_PROFILER("SolverFDDP::solve");
+      return false;
+    }
     updateExpectedImprovement();
 
     // We need to recalculate the derivatives when the step length passes
@@ -65,19 +99,25 @@ bool SolverFDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
     for (std::vector<double>::const_iterator it = alphas_.begin();
          it != alphas_.end(); ++it) {
       steplength_ = *it;
+      if (!checkTimeBudget(trial_time_)) {
+        STOP_PROFILER("SolverFDDP::solve");
+        return false;
+      }
 
+      phase_timer.reset();
       try {
         dV_ = tryStep(steplength_);
       } catch (std::exception& e) {
         continue;
       }
+      trial_time_ = phase_timer.get_duration();
       expectedImprovement();
       dVexp_ = steplength_ * (d_[0] + 0.5 * steplength_ * d_[1]);
 
       if (dVexp_ >= 0) {  // descend direction
         if (std::abs(d_[0]) < th_grad_ || dV_ > th_acceptstep_ * dVexp_) {
           was_feasible_ = is_feasible_;
-          setCandidate(xs_try_, us_try_, (was_feasible_) || (steplength_ == 1));
+          setCandidate(xs_try_, us_try_, isTrialFeasible());
           cost_ = cost_try_;
           recalcDiff = true;
           break;
@@ -86,7 +126,7 @@ bool SolverFDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
                 // value
         if (!is_feasible_ && dV_ > th_acceptnegstep_ * dVexp_) {
           was_feasible_ = is_feasible_;
-          setCandidate(xs_try_, us_try_, (was_feasible_) || (steplength_ == 1));
+          setCandidate(xs_try_, us_try_, isTrialFeasible());
           cost_ = cost_try_;
           recalcDiff = true;
           break;
@@ -100,23 +140,30 @@ bool SolverFDDP::solve(const std::vector<Eigen::VectorXd>& init_xs,
     if (steplength_ <= th_stepinc_) {
       increaseRegularization();
       if (preg_ == reg_max_) {
+        status_ = MaxRegReached;
         STOP_PROFILER("SolverFDDP::solve");
         return false;
       }
     }
     stoppingCriteria();
 
-    const std::size_t n_callbacks = callbacks_.size();
-    for (std::size_t c = 0; c < n_callbacks; ++c) {
-      CallbackAbstract& callback = *callbacks_[c];
-      callback(*this);
+    {
+      // User callbacks are free to allocate memory
+      MallocCheckScope malloc_allowed(true);
+      const std::size_t n_callbacks = callbacks_.size();
+      for (std::size_t c = 0; c < n_callbacks; ++c) {
+        CallbackAbstract& callback = *callbacks_[c];
+        callback(*this);
+      }
     }
 
     if (was_feasible_ && stop_ < th_stop_) {
+      status_ = Converged;
       STOP_PROFILER("SolverFDDP::solve");
       return true;
     }
   }
+  status_ = MaxIterReached;
   STOP_PROFILER("SolverFDDP::solve");
   return false;
 }
@@ -178,6 +225,10 @@ void SolverFDDP::forwardPass(const double steplength) {
     throw_pretty("Invalid argument: "
                  << "invalid step length, value is between 0. to 1.");
   }
+  if (multiple_shooting_) {
+    multipleShootingForwardPass(steplength);
+    return;
+  }
   START_PROFILER("SolverFDDP::forwardPass");
   cost_try_ = 0.;
   xnext_ = problem_->get_x0();
@@ -230,7 +281,9 @@ void SolverFDDP::forwardPass(const double steplength) {
       const boost::shared_ptr<ActionModelAbstract>& m = models[t];
       const boost::shared_ptr<ActionDataAbstract>& d = datas[t];
       const std::size_t nu = m->get_nu();
-      m->get_state()->integrate(xnext_, fs_[t] * (steplength - 1), xs_try_[t]);
+      // dx_ stores the scaled gap to avoid allocating a temporary vector
+      dx_[t] = fs_[t] * (steplength - 1);
+      m->get_state()->integrate(xnext_, dx_[t], xs_try_[t]);
       m->get_state()->diff(xs_[t], xs_try_[t], dx_[t]);
       if (nu != 0) {
         us_try_[t].noalias() = us_[t] - k_[t] * steplength - K_[t] * dx_[t];
@@ -255,8 +308,8 @@ void SolverFDDP::forwardPass(const double steplength) {
         problem_->get_terminalModel();
     const boost::shared_ptr<ActionDataAbstract>& d =
         problem_->get_terminalData();
-    m->get_state()->integrate(xnext_, fs_.back() * (steplength - 1),
-                              xs_try_.back());
+    dx_.back() = fs_.back() * (steplength - 1);
+    m->get_state()->integrate(xnext_, dx_.back(), xs_try_.back());
     m->calc(d, xs_try_.back());
     cost_try_ += d->cost;
 
@@ -268,6 +321,108 @@ void SolverFDDP::forwardPass(const double steplength) {
   STOP_PROFILER("SolverFDDP::forwardPass");
 }
 
+void SolverFDDP::multipleShootingForwardPass(const double steplength) {
+  if (steplength > 1. || steplength < 0.) {
+    throw_pretty("Invalid argument: "
+                 << "invalid step length, value is between 0. to 1.");
+  }
+  START_PROFILER("SolverFDDP::multipleShootingForwardPass");
+  const std::size_t T = problem_->get_T();
+  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+      problem_->get_runningModels();
+  const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
+      problem_->get_runningDatas();
+
+  // Build the candidate from the linearized dynamics
+  if (is_feasible_) {
+    dx_[0].setZero();
+  } else {
+    dx_[0] = fs_[0] * steplength;
+  }
+  for (std::size_t t = 0; t < T; ++t) {
+    const boost::shared_ptr<ActionModelAbstract>& m = models[t];
+    const boost::shared_ptr<ActionDataAbstract>& d = datas[t];
+    const std::size_t nu = m->get_nu();
+    m->get_state()->integrate(xs_[t], dx_[t], xs_try_[t]);
+    xnext_.noalias() = d->Fx * dx_[t];
+    if (nu != 0) {
+      us_try_[t].noalias() = us_[t] - k_[t] * steplength - K_[t] * dx_[t];
+      xnext_.noalias() += d->Fu * us_try_[t];
+      xnext_.noalias() -= d->Fu * us_[t];
+    }
+    if (!is_feasible_) {
+      xnext_.noalias() += fs_[t + 1] * steplength;
+    }
+    if (t + 1 < T) {
+      dx_[t + 1] = xnext_;
+    }
+  }
+  problem_->get_terminalModel()->get_state()->integrate(xs_.back(), xnext_,
+                                                        xs_try_.back());
+
+  // Evaluate the nodes and the new gaps in parallel
+  cost_try_ = problem_->calc(xs_try_, us_try_);
+  if (raiseIfNaN(cost_try_)) {
+    STOP_PROFILER("SolverFDDP::multipleShootingForwardPass");
+    throw_pretty("forward_error");
+  }
+  models[0]->get_state()->diff(xs_try_[0], problem_->get_x0(), fs_try_[0]);
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#pragma omp parallel for num_threads(problem_->get_nthreads())
+#endif
+  for (std::size_t t = 0; t < T; ++t) {
+    models[t]->get_state()->diff(xs_try_[t + 1], datas[t]->xnext,
+                                 fs_try_[t + 1]);
+  }
+  ffeas_try_ = 0.;
+  switch (feasnorm_) {
+    case LInf:
+      for (std::size_t t = 0; t < T + 1; ++t) {
+        ffeas_try_ = std::max(ffeas_try_, fs_try_[t].lpNorm<Eigen::Infinity>());
+      }
+      break;
+    case L1:
+      for (std::size_t t = 0; t < T + 1; ++t) {
+        ffeas_try_ += fs_try_[t].lpNorm<1>();
+      }
+      break;
+  }
+  if (raiseIfNaN(ffeas_try_)) {
+    STOP_PROFILER("SolverFDDP::multipleShootingForwardPass");
+    throw_pretty("forward_error");
+  }
+  STOP_PROFILER("SolverFDDP::multipleShootingForwardPass");
+}
+
+void SolverFDDP::resizeData() {
+  START_PROFILER("SolverFDDP::resizeData");
+  SolverDDP::resizeData();
+
+  const std::size_t ndx = problem_->get_ndx();
+  for (std::size_t t = 0; t < fs_try_.size(); ++t) {
+    fs_try_[t].conservativeResize(ndx);
+  }
+  STOP_PROFILER("SolverFDDP::resizeData");
+}
+
+void SolverFDDP::allocateData() {
+  SolverDDP::allocateData();
+
+  const std::size_t T = problem_->get_T();
+  const std::size_t ndx = problem_->get_ndx();
+  fs_try_.resize(T + 1);
+  for (std::size_t t = 0; t < T + 1; ++t) {
+    fs_try_[t] = Eigen::VectorXd::Zero(ndx);
+  }
+}
+
+bool SolverFDDP::isTrialFeasible() const {
+  if (multiple_shooting_) {
+    return ffeas_try_ <= th_gaptol_;
+  }
+  return is_feasible_ || steplength_ == 1;
+}
+
 double SolverFDDP::get_th_acceptnegstep() const { return th_acceptnegstep_; }
 
 void SolverFDDP::set_th_acceptnegstep(const double th_acceptnegstep) {
@@ -278,4 +433,18 @@ void SolverFDDP::set_th_acceptnegstep(const double th_acceptnegstep) {
   th_acceptnegstep_ = th_acceptnegstep;
 }
 
+bool SolverFDDP::get_multiple_shooting() const { return multiple_shooting_; }
+
+void SolverFDDP::set_multiple_shooting(const bool multiple_shooting) {
+  multiple_shooting_ = multiple_shooting;
+}
+
+void SolverFDDP::set_parallel_linesearch(const bool parallel_linesearch) {
+  if (parallel_linesearch) {
+    throw_pretty("Invalid argument: "
+                 << "the concurrent line search is not supported by FDDP");
+  }
+  parallel_linesearch_ = false;
+}
+
 }  // namespace crocoddyl
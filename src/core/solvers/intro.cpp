@@ -8,9 +8,11 @@
 
 #include "crocoddyl/core/solvers/intro.hpp"
 
+#include <algorithm>
 #include <iostream>
 
 #include "crocoddyl/core/utils/exception.hpp"
+#include "crocoddyl/core/utils/malloc-check.hpp"
 #include "crocoddyl/core/utils/stop-watch.hpp"
 
 namespace crocoddyl {
@@ -75,12 +77,15 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
                         const std::size_t maxiter, const bool is_feasible,
                         const double init_reg) {
   START_PROFILER("SolverIntro::solve");
+  timer_.reset();
   if (problem_->is_updated()) {
     resizeData();
   }
   xs_try_[0] =
       problem_->get_x0();  // it is needed in case that init_xs[0] is infeasible
   setCandidate(init_xs, init_us, is_feasible);
+  // The data is already allocated, so the iterations must not allocate memory
+  MallocCheckScope malloc_check(false);
 
   if (std::isnan(init_reg)) {
     preg_ = reg_min_;
@@ -94,8 +99,17 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
     upsilon_ = 0.;
   }
 
-  bool recalcDiff = true;
+  // The derivatives were already computed if the solver has been prepared
+  bool recalcDiff = !is_prepared_;
+  is_prepared_ = false;
+  Timer phase_timer;
   for (iter_ = 0; iter_ < maxiter; ++iter_) {
+    if (!checkTimeBudget(recalcDiff ? direction_time_ : 0.)) {
+      STOP_PROFILER("SolverIntro::solve");
+      return false;
+    }
+    phase_timer.reset();
+    const bool timed_direction = recalcDiff;
     while (true) {
       try {
         computeDirection(recalcDiff);
@@ -103,6 +117,11 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
         recalcDiff = false;
         increaseRegularization();
         if (preg_ == reg_max_) {
+          status_ = MaxRegReached;
+          STOP_PROFILER("SolverIntro::solve");
+          return false;
+        } else if (!checkTimeBudget()) {
+          STOP_PROFILER("SolverIntro::solve");
           return false;
         } else {
           continue;
@@ -110,6 +129,15 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
       }
       break;
     }
+    if (timed_direction) {
+      direction_time_ = phase_timer.get_duration();
+    }
+    // The first search direction of a fresh solver is not budgeted as its
+    // duration is unknown, so we check the budget again once it is measured
+    if (!checkTimeBudget()) {
+      STOP_PROFILER("SolverIntro::solve");
+      return false;
+    }
     updateExpectedImprovement();
     expectedImprovement();
 
@@ -126,6 +154,12 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
     for (std::vector<double>::const_iterator it = alphas_.begin();
          it != alphas_.end(); ++it) {
       steplength_ = *it;
+      if (!checkTimeBudget(trial_time_)) {
+        STOP_PROFILER("SolverIntro::solve");
+        return false;
+      }
+
+      phase_timer.reset();
       try {
         dV_ = tryStep(steplength_);
         dfeas_ = hfeas_ - hfeas_try_;
@@ -133,13 +167,14 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
       } catch (std::exception& e) {
         continue;
       }
+      trial_time_ = phase_timer.get_duration();
       expectedImprovement();
       dVexp_ = steplength_ * (d_[0] + 0.5 * steplength_ * d_[1]);
       dPhiexp_ = dVexp_ + steplength_ * upsilon_ * dfeas_;
       if (dPhiexp_ >= 0) {  // descend direction
         if (std::abs(d_[0]) < th_grad_ || dPhi_ > th_acceptstep_ * dPhiexp_) {
           was_feasible_ = is_feasible_;
-          setCandidate(xs_try_, us_try_, (was_feasible_) || (steplength_ == 1));
+          setCandidate(xs_try_, us_try_, isTrialFeasible());
           cost_ = cost_try_;
           hfeas_ = hfeas_try_;
           merit_ = cost_ + upsilon_ * hfeas_;
@@ -150,7 +185,7 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
                 // value
         if (dV_ > th_acceptnegstep_ * dVexp_) {
           was_feasible_ = is_feasible_;
-          setCandidate(xs_try_, us_try_, (was_feasible_) || (steplength_ == 1));
+          setCandidate(xs_try_, us_try_, isTrialFeasible());
           cost_ = cost_try_;
           hfeas_ = hfeas_try_;
           merit_ = cost_ + upsilon_ * hfeas_;
@@ -161,10 +196,14 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
     }
 
     stoppingCriteria();
-    const std::size_t n_callbacks = callbacks_.size();
-    for (std::size_t c = 0; c < n_callbacks; ++c) {
-      CallbackAbstract& callback = *callbacks_[c];
-      callback(*this);
+    {
+      // User callbacks are free to allocate memory
+      MallocCheckScope malloc_allowed(true);
+      const std::size_t n_callbacks = callbacks_.size();
+      for (std::size_t c = 0; c < n_callbacks; ++c) {
+        CallbackAbstract& callback = *callbacks_[c];
+        callback(*this);
+      }
     }
 
     if (steplength_ > th_stepdec_ && dV_ >= 0.) {
@@ -172,6 +211,7 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
     }
     if (steplength_ <= th_stepinc_ || std::abs(d_[1]) <= th_feas_) {
       if (preg_ == reg_max_) {
+        status_ = MaxRegReached;
         STOP_PROFILER("SolverIntro::solve");
         return false;
       }
@@ -179,10 +219,12 @@ bool SolverIntro::solve(const std::vector<Eigen::VectorXd>& init_xs,
     }
 
     if (is_feasible_ && stop_ < th_stop_) {
+      status_ = Converged;
       STOP_PROFILER("SolverIntro::solve");
       return true;
     }
   }
+  status_ = MaxIterReached;
   STOP_PROFILER("SolverIntro::solve");
   return false;
 }
@@ -210,6 +252,13 @@ void SolverIntro::resizeData() {
     const boost::shared_ptr<ActionModelAbstract>& model = models[t];
     const std::size_t nu = model->get_nu();
     const std::size_t nh = model->get_nh();
+    if (static_cast<std::size_t>(Hy_[t].rows()) != nh ||
+        static_cast<std::size_t>(YZ_[t].rows()) != nu) {
+      Qzz_llt_[t] = Eigen::LLT<Eigen::MatrixXd>(nh);
+      Hu_lu_[t] = Eigen::FullPivLU<Eigen::MatrixXd>(nh, nu);
+      Hu_qr_[t] = Eigen::ColPivHouseholderQR<Eigen::MatrixXd>(nu, nh);
+      Hy_lu_[t] = Eigen::PartialPivLU<Eigen::MatrixXd>(nh);
+    }
     KQuu_tmp_[t].conservativeResize(ndx, nu);
     YZ_[t].conservativeResize(nu, nu);
     Hy_[t].conservativeResize(nh, nh);
@@ -226,6 +275,43 @@ void SolverIntro::resizeData() {
   STOP_PROFILER("SolverIntro::resizeData");
 }
 
+void SolverIntro::shift() {
+  START_PROFILER("SolverIntro::shift");
+  std::rotate(Hu_rank_.begin(), Hu_rank_.begin() + 1, Hu_rank_.end());
+  std::rotate(KQuu_tmp_.begin(), KQuu_tmp_.begin() + 1, KQuu_tmp_.end());
+  std::rotate(YZ_.begin(), YZ_.begin() + 1, YZ_.end());
+  std::rotate(Hy_.begin(), Hy_.begin() + 1, Hy_.end());
+  std::rotate(Qz_.begin(), Qz_.begin() + 1, Qz_.end());
+  std::rotate(Qzz_.begin(), Qzz_.begin() + 1, Qzz_.end());
+  std::rotate(Qxz_.begin(), Qxz_.begin() + 1, Qxz_.end());
+  std::rotate(Quz_.begin(), Quz_.begin() + 1, Quz_.end());
+  std::rotate(kz_.begin(), kz_.begin() + 1, kz_.end());
+  std::rotate(Kz_.begin(), Kz_.begin() + 1, Kz_.end());
+  std::rotate(ks_.begin(), ks_.begin() + 1, ks_.end());
+  std::rotate(Ks_.begin(), Ks_.begin() + 1, Ks_.end());
+  std::rotate(QuuinvHuT_.begin(), QuuinvHuT_.begin() + 1, QuuinvHuT_.end());
+  std::rotate(Qzz_llt_.begin(), Qzz_llt_.begin() + 1, Qzz_llt_.end());
+  std::rotate(Hu_lu_.begin(), Hu_lu_.begin() + 1, Hu_lu_.end());
+  std::rotate(Hu_qr_.begin(), Hu_qr_.begin() + 1, Hu_qr_.end());
+  std::rotate(Hy_lu_.begin(), Hy_lu_.begin() + 1, Hy_lu_.end());
+  SolverFDDP::shift();
+  // The buffers of the equality constraints are also resized when only the
+  // number of equality constraints of the appended node is different
+  const std::size_t nh = problem_->get_runningModels().back()->get_nh();
+  if (static_cast<std::size_t>(Hy_.back().rows()) != nh) {
+    resizeData();
+  }
+  STOP_PROFILER("SolverIntro::shift");
+}
+
+void SolverIntro::set_multiple_shooting(const bool multiple_shooting) {
+  if (multiple_shooting) {
+    throw_pretty("Invalid argument: "
+                 << "the multiple-shooting forward pass is not supported");
+  }
+  multiple_shooting_ = multiple_shooting;
+}
+
 double SolverIntro::calcDiff() {
   START_PROFILER("SolverIntro::calcDiff");
   SolverFDDP::calcDiff();
@@ -245,17 +331,19 @@ double SolverIntro::calcDiff() {
         const boost::shared_ptr<crocoddyl::ActionDataAbstract>& data = datas[t];
         if (model->get_nu() > 0 && model->get_nh() > 0) {
           Hu_lu_[t].compute(data->Hu);
-          YZ_[t] << Hu_lu_[t].matrixLU().transpose(), Hu_lu_[t].kernel();
+          {
+            // Eigen evaluates the kernel with temporaries
+            MallocCheckScope malloc_allowed(true);
+            YZ_[t] << Hu_lu_[t].matrixLU().transpose(), Hu_lu_[t].kernel();
+          }
           Hu_rank_[t] = Hu_lu_[t].rank();
           const Eigen::Block<Eigen::MatrixXd, Eigen::Dynamic, Eigen::Dynamic,
                              Eigen::RowMajor>
               Y = YZ_[t].leftCols(Hu_lu_[t].rank());
           Hy_[t].noalias() = data->Hu * Y;
           Hy_lu_[t].compute(Hy_[t]);
-          const Eigen::Inverse<Eigen::PartialPivLU<Eigen::MatrixXd> > Hy_inv =
-              Hy_lu_[t].inverse();
-          ks_[t].noalias() = Hy_inv * data->h;
-          Ks_[t].noalias() = Hy_inv * data->Hx;
+          ks_[t].noalias() = Hy_lu_[t].solve(data->h);
+          Ks_[t].noalias() = Hy_lu_[t].solve(data->Hx);
           kz_[t].noalias() = Y * ks_[t];
           Kz_[t].noalias() = Y * Ks_[t];
         }
@@ -271,17 +359,19 @@ double SolverIntro::calcDiff() {
         const boost::shared_ptr<crocoddyl::ActionDataAbstract>& data = datas[t];
         if (model->get_nu() > 0 && model->get_nh() > 0) {
           Hu_qr_[t].compute(data->Hu.transpose());
-          YZ_[t] = Hu_qr_[t].householderQ();
+          {
+            // Eigen evaluates the Householder sequence with a workspace
+            MallocCheckScope malloc_allowed(true);
+            YZ_[t] = Hu_qr_[t].householderQ();
+          }
           Hu_rank_[t] = Hu_qr_[t].rank();
           const Eigen::Block<Eigen::MatrixXd, Eigen::Dynamic, Eigen::Dynamic,
                              Eigen::RowMajor>
               Y = YZ_[t].leftCols(Hu_qr_[t].rank());
           Hy_[t].noalias() = data->Hu * Y;
           Hy_lu_[t].compute(Hy_[t]);
-          const Eigen::Inverse<Eigen::PartialPivLU<Eigen::MatrixXd> > Hy_inv =
-              Hy_lu_[t].inverse();
-          ks_[t].noalias() = Hy_inv * data->h;
-          Ks_[t].noalias() = Hy_inv * data->Hx;
+          ks_[t].noalias() = Hy_lu_[t].solve(data->h);
+          Ks_[t].noalias() = Hy_lu_[t].solve(data->Hx);
           kz_[t].noalias() = Y * ks_[t];
           Kz_[t].noalias() = Y * Ks_[t];
         }
@@ -327,6 +417,12 @@ void SolverIntro::computeValueFunction(
   }
 }
 
+bool SolverIntro::parallelBackwardPass() {
+  // The gains depend on the equality constraints, which are not captured by
+  // the unconstrained Riccati elements
+  return false;
+}
+
 void SolverIntro::computeGains(const std::size_t t) {
   START_PROFILER("SolverIntro::computeGains");
   const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model =
@@ -343,6 +439,16 @@ void SolverIntro::computeGains(const std::size_t t) {
         START_PROFILER("SolverIntro::Qzz_inv");
         const std::size_t rank = Hu_rank_[t];
         const std::size_t nullity = data->Hu.cols() - rank;
+        if (static_cast<std::size_t>(Qz_[t].size()) != nullity) {
+          // It only happens when the dimension of the null space changes
+          MallocCheckScope malloc_allowed(true);
+          const std::size_t ndx = model->get_state()->get_ndx();
+          Qz_[t].resize(nullity);
+          Qzz_[t].resize(nullity, nullity);
+          Qxz_[t].resize(ndx, nullity);
+          Quz_[t].resize(nu, nullity);
+          Qzz_llt_[t] = Eigen::LLT<Eigen::MatrixXd>(nullity);
+        }
         const Eigen::Block<Eigen::MatrixXd, Eigen::Dynamic, Eigen::Dynamic,
                            Eigen::RowMajor>
             Z = YZ_[t].rightCols(nullity);
@@ -376,6 +482,12 @@ void SolverIntro::computeGains(const std::size_t t) {
       SolverFDDP::computeGains(t);
       if (nu > 0 && nh > 0) {
         START_PROFILER("SolverIntro::Qzz_inv");
+        if (static_cast<std::size_t>(Qzz_[t].rows()) != nh) {
+          // It only happens after changing the equality solver
+          MallocCheckScope malloc_allowed(true);
+          Qzz_[t].resize(nh, nh);
+          Qzz_llt_[t] = Eigen::LLT<Eigen::MatrixXd>(nh);
+        }
         QuuinvHuT_[t] = data->Hu.transpose();
         Quu_llt_[t].solveInPlace(QuuinvHuT_[t]);
         Qzz_[t].noalias() = data->Hu * QuuinvHuT_[t];
@@ -392,7 +504,7 @@ void SolverIntro::computeGains(const std::size_t t) {
         Ks_[t] = data->Hx;
         Ks_[t].noalias() -= data->Hu * K_[t];
         k_[t].noalias() += QuuinvHuT_[t] * ks_[t];
-        K_[t] += QuuinvHuT_[t] * Ks_[t];
+        K_[t].noalias() += QuuinvHuT_[t] * Ks_[t];
       }
       break;
   }
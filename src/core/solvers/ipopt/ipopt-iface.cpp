@@ -6,6 +6,7 @@
 // All rights reserved.
 ///////////////////////////////////////////////////////////////////////////////
 
+#include <algorithm>
 #include <cmath>
 #include <iostream>
 #ifdef CROCODDYL_WITH_MULTITHREADING
@@ -53,10 +54,14 @@ IpoptInterface::IpoptInterface(
   nvar_ += ndxi;  // final node
   xs_[T] = model->get_state()->zero();
   datas_[T] = createData(nxi, ndxi, 0);
+  x0_diff_ = Eigen::VectorXd::Zero(models[0]->get_state()->get_ndx());
+  calc_updated_ = false;
+  calcdiff_updated_ = false;
 }
 
 void IpoptInterface::resizeData() {
   const std::size_t T = problem_->get_T();
+  nconst_ = 0;
   nvar_ = 0;
   const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
       problem_->get_runningModels();
@@ -84,6 +89,9 @@ void IpoptInterface::resizeData() {
   nvar_ += ndxi;  // final node
   xs_[T].conservativeResize(nxi);
   datas_[T]->resize(nxi, ndxi, 0);
+  x0_diff_.conservativeResize(models[0]->get_state()->get_ndx());
+  calc_updated_ = false;
+  calcdiff_updated_ = false;
 }
 
 IpoptInterface::~IpoptInterface() {}
@@ -95,39 +103,11 @@ bool IpoptInterface::get_nlp_info(Ipopt::Index& n, Ipopt::Index& m,
   n = static_cast<Ipopt::Index>(nvar_);    // number of variables
   m = static_cast<Ipopt::Index>(nconst_);  // number of constraints
 
-  nnz_jac_g = 0;  // Jacobian nonzeros for dynamic constraints
-  nnz_h_lag = 0;  // Hessian nonzeros (only lower triangular part)
-  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
-      problem_->get_runningModels();
-  const std::size_t T = problem_->get_T();
-  for (std::size_t t = 0; t < T; ++t) {
-    const std::size_t ndxi = models[t]->get_state()->get_ndx();
-    const std::size_t ndxi_next =
-        t + 1 == T ? problem_->get_terminalModel()->get_state()->get_ndx()
-                   : models[t + 1]->get_state()->get_ndx();
-    const std::size_t nui = models[t]->get_nu();
-    nnz_jac_g += ndxi * (ndxi + ndxi_next + nui);
-
-    // Hessian
-    std::size_t nonzero = 0;
-    for (std::size_t i = 1; i <= (ndxi + nui); ++i) {
-      nonzero += i;
-    }
-    nnz_h_lag += nonzero;
-  }
-
-  // Initial condition
-  nnz_jac_g +=
-      models[0]->get_state()->get_ndx() * models[0]->get_state()->get_ndx();
-
-  // Hessian nonzero for the terminal cost
-  const std::size_t ndxi =
-      problem_->get_terminalModel()->get_state()->get_ndx();
-  std::size_t nonzero = 0;
-  for (std::size_t i = 1; i <= ndxi; ++i) {
-    nonzero += i;
-  }
-  nnz_h_lag += nonzero;
+  // The sparsity structures are computed once, and they are reused by
+  // eval_jac_g and eval_h
+  computeSparsity();
+  nnz_jac_g = static_cast<Ipopt::Index>(jac_irow_.size());
+  nnz_h_lag = static_cast<Ipopt::Index>(hess_irow_.size());
 
   // use the C style indexing (0-based)
   index_style = Ipopt::TNLP::C_STYLE;
@@ -232,292 +212,133 @@ bool IpoptInterface::get_starting_point(Ipopt::Index, bool /*init_x*/,
   for (std::size_t j = 0; j < ndxi; j++) {
     x[ixu_.back() + j] = 0;
   }
+  calc_updated_ = false;
+  calcdiff_updated_ = false;
 
   return true;
 }
 
 #ifndef NDEBUG
-bool IpoptInterface::eval_f(Ipopt::Index n, const Ipopt::Number* x,
-                            bool /*new_x*/, Ipopt::Number& obj_value) {
+bool IpoptInterface::eval_f(Ipopt::Index n, const Ipopt::Number* x, bool new_x,
+                            Ipopt::Number& obj_value) {
 #else
-bool IpoptInterface::eval_f(Ipopt::Index, const Ipopt::Number* x, bool,
+bool IpoptInterface::eval_f(Ipopt::Index, const Ipopt::Number* x, bool new_x,
                             Ipopt::Number& obj_value) {
 #endif
   assert_pretty(n == static_cast<Ipopt::Index>(nvar_),
                 "Inconsistent number of decision variables");
 
-  // Running costs
-  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
-      problem_->get_runningModels();
+  updateCalc(x, new_x);
+
+  // Running and terminal costs
   const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
       problem_->get_runningDatas();
   const std::size_t T = problem_->get_T();
-#ifdef CROCODDYL_WITH_MULTITHREADING
-#pragma omp parallel for num_threads(problem_->get_nthreads())
-#endif
-  for (std::size_t t = 0; t < T; ++t) {
-    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
-    const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
-    const std::size_t ndxi = model->get_state()->get_ndx();
-    const std::size_t nui = model->get_nu();
-
-    datas_[t]->dx = Eigen::VectorXd::Map(x + ixu_[t], ndxi);
-    datas_[t]->u = Eigen::VectorXd::Map(x + ixu_[t] + ndxi, nui);
-    model->get_state()->integrate(xs_[t], datas_[t]->dx, datas_[t]->x);
-    model->calc(data, datas_[t]->x, datas_[t]->u);
-  }
-
-#ifdef CROCODDYL_WITH_MULTITHREADING
-#pragma omp simd reduction(+ : obj_value)
-#endif
+  obj_value = 0.;
   for (std::size_t t = 0; t < T; ++t) {
-    const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
-    obj_value += data->cost;
+    obj_value += datas[t]->cost;
   }
-
-  // Terminal costs
-  const boost::shared_ptr<ActionModelAbstract>& model =
-      problem_->get_terminalModel();
-  const boost::shared_ptr<ActionDataAbstract>& data =
-      problem_->get_terminalData();
-  const std::size_t ndxi = model->get_state()->get_ndx();
-
-  datas_[T]->dx = Eigen::VectorXd::Map(x + ixu_.back(), ndxi);
-  model->get_state()->integrate(xs_[T], datas_[T]->dx, datas_[T]->x);
-  model->calc(data, datas_[T]->x);
-  obj_value += data->cost;
+  obj_value += problem_->get_terminalData()->cost;
 
   return true;
 }
 
 #ifndef NDEBUG
 bool IpoptInterface::eval_grad_f(Ipopt::Index n, const Ipopt::Number* x,
-                                 bool /*new_x*/, Ipopt::Number* grad_f) {
+                                 bool new_x, Ipopt::Number* grad_f) {
 #else
-bool IpoptInterface::eval_grad_f(Ipopt::Index, const Ipopt::Number* x, bool,
-                                 Ipopt::Number* grad_f) {
+bool IpoptInterface::eval_grad_f(Ipopt::Index, const Ipopt::Number* x,
+                                 bool new_x, Ipopt::Number* grad_f) {
 #endif
   assert_pretty(n == static_cast<Ipopt::Index>(nvar_),
                 "Inconsistent number of decision variables");
 
+  updateCalcDiff(x, new_x);
+
   const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
       problem_->get_runningModels();
   const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
       problem_->get_runningDatas();
   const std::size_t T = problem_->get_T();
-#ifdef CROCODDYL_WITH_MULTITHREADING
-#pragma omp parallel for num_threads(problem_->get_nthreads())
-#endif
   for (std::size_t t = 0; t < T; ++t) {
-    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
-    const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
-    const std::size_t ndxi = model->get_state()->get_ndx();
-    const std::size_t nui = model->get_nu();
-
-    datas_[t]->dx = Eigen::VectorXd::Map(x + ixu_[t], ndxi);
-    datas_[t]->u = Eigen::VectorXd::Map(x + ixu_[t] + ndxi, nui);
-    model->get_state()->integrate(xs_[t], datas_[t]->dx, datas_[t]->x);
-    model->get_state()->Jintegrate(xs_[t], datas_[t]->dx, datas_[t]->Jint_dx,
-                                   datas_[t]->Jint_dx, second, setto);
-    model->calc(data, datas_[t]->x, datas_[t]->u);
-    model->calcDiff(data, datas_[t]->x, datas_[t]->u);
-    datas_[t]->Ldx.noalias() = datas_[t]->Jint_dx.transpose() * data->Lx;
-  }
-  for (std::size_t t = 0; t < T; ++t) {
-    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
-    const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
-    const std::size_t ndxi = model->get_state()->get_ndx();
-    const std::size_t nui = model->get_nu();
-    for (std::size_t j = 0; j < ndxi; ++j) {
-      grad_f[ixu_[t] + j] = datas_[t]->Ldx(j);
-    }
-    for (std::size_t j = 0; j < nui; ++j) {
-      grad_f[ixu_[t] + ndxi + j] = data->Lu(j);
-    }
+    const std::size_t ndxi = models[t]->get_state()->get_ndx();
+    const std::size_t nui = models[t]->get_nu();
+    Eigen::VectorXd::Map(grad_f + ixu_[t], ndxi) = datas_[t]->Ldx;
+    Eigen::VectorXd::Map(grad_f + ixu_[t] + ndxi, nui) = datas[t]->Lu;
   }
 
   // Terminal model
-  const boost::shared_ptr<ActionModelAbstract>& model =
-      problem_->get_terminalModel();
-  const boost::shared_ptr<ActionDataAbstract>& data =
-      problem_->get_terminalData();
-  const std::size_t ndxi = model->get_state()->get_ndx();
-
-  datas_[T]->dx = Eigen::VectorXd::Map(x + ixu_.back(), ndxi);
-  model->get_state()->integrate(xs_[T], datas_[T]->dx, datas_[T]->x);
-  model->get_state()->Jintegrate(xs_[T], datas_[T]->dx, datas_[T]->Jint_dx,
-                                 datas_[T]->Jint_dx, second, setto);
-  model->calc(data, datas_[T]->x);
-  model->calcDiff(data, datas_[T]->x);
-  datas_[T]->Ldx.noalias() = datas_[T]->Jint_dx.transpose() * data->Lx;
-  for (std::size_t j = 0; j < ndxi; ++j) {
-    grad_f[ixu_.back() + j] = datas_[T]->Ldx(j);
-  }
+  const std::size_t ndxi =
+      problem_->get_terminalModel()->get_state()->get_ndx();
+  Eigen::VectorXd::Map(grad_f + ixu_.back(), ndxi) = datas_[T]->Ldx;
 
   return true;
 }
 
 #ifndef NDEBUG
-bool IpoptInterface::eval_g(Ipopt::Index n, const Ipopt::Number* x,
-                            bool /*new_x*/, Ipopt::Index m, Ipopt::Number* g) {
+bool IpoptInterface::eval_g(Ipopt::Index n, const Ipopt::Number* x, bool new_x,
+                            Ipopt::Index m, Ipopt::Number* g) {
 #else
-bool IpoptInterface::eval_g(Ipopt::Index, const Ipopt::Number* x,
-                            bool /*new_x*/, Ipopt::Index, Ipopt::Number* g) {
+bool IpoptInterface::eval_g(Ipopt::Index, const Ipopt::Number* x, bool new_x,
+                            Ipopt::Index, Ipopt::Number* g) {
 #endif
   assert_pretty(n == static_cast<Ipopt::Index>(nvar_),
                 "Inconsistent number of decision variables");
   assert_pretty(m == static_cast<Ipopt::Index>(nconst_),
                 "Inconsistent number of constraints");
 
+  updateCalc(x, new_x);
+
   // Dynamic constraints
   const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
       problem_->get_runningModels();
-  const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
-      problem_->get_runningDatas();
   const std::size_t T = problem_->get_T();
-#ifdef CROCODDYL_WITH_MULTITHREADING
-#pragma omp parallel for num_threads(problem_->get_nthreads())
-#endif
-  for (std::size_t t = 0; t < T; ++t) {
-    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
-    const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
-    const std::size_t ndxi = model->get_state()->get_ndx();
-    const std::size_t nui = model->get_nu();
-    const boost::shared_ptr<ActionModelAbstract>& model_next =
-        t + 1 == T ? problem_->get_terminalModel() : models[t + 1];
-    const std::size_t ndxi_next = model_next->get_state()->get_ndx();
-
-    datas_[t]->dx = Eigen::VectorXd::Map(x + ixu_[t], ndxi);
-    datas_[t]->u = Eigen::VectorXd::Map(x + ixu_[t] + ndxi, nui);
-    datas_[t]->dxnext =
-        Eigen::VectorXd::Map(x + ixu_[t] + ndxi + nui, ndxi_next);
-    model->get_state()->integrate(xs_[t], datas_[t]->dx, datas_[t]->x);
-    model_next->get_state()->integrate(xs_[t + 1], datas_[t]->dxnext,
-                                       datas_[t]->xnext);
-    model->calc(data, datas_[t]->x, datas_[t]->u);
-    model->get_state()->diff(data->xnext, datas_[t]->xnext, datas_[t]->x_diff);
-  }
-
   std::size_t ix = 0;
   for (std::size_t t = 0; t < T; ++t) {
-    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
-    const std::size_t ndxi = model->get_state()->get_ndx();
-    for (std::size_t j = 0; j < ndxi; ++j) {
-      g[ix + j] = datas_[t]->x_diff[j];
-    }
+    const std::size_t ndxi = models[t]->get_state()->get_ndx();
+    Eigen::VectorXd::Map(g + ix, ndxi) = datas_[t]->x_diff;
     ix += ndxi;
   }
 
   // Initial conditions
-  const boost::shared_ptr<ActionModelAbstract>& model = models[0];
-  const std::size_t ndxi = model->get_state()->get_ndx();
-  datas_[0]->dx = Eigen::VectorXd::Map(x, ndxi);
-  model->get_state()->integrate(xs_[0], datas_[0]->dx, datas_[0]->x);
-  model->get_state()->diff(datas_[0]->x, problem_->get_x0(),
-                           datas_[0]->x_diff);  // x(0) - x_0
-  for (std::size_t j = 0; j < ndxi; j++) {
-    g[ix + j] = datas_[0]->x_diff[j];
-  }
+  Eigen::VectorXd::Map(g + ix, x0_diff_.size()) = x0_diff_;
 
   return true;
 }
 
 #ifndef NDEBUG
 bool IpoptInterface::eval_jac_g(Ipopt::Index n, const Ipopt::Number* x,
-                                bool /*new_x*/, Ipopt::Index m,
+                                bool new_x, Ipopt::Index m,
                                 Ipopt::Index nele_jac, Ipopt::Index* iRow,
                                 Ipopt::Index* jCol, Ipopt::Number* values) {
 #else
-bool IpoptInterface::eval_jac_g(Ipopt::Index, const Ipopt::Number* x, bool,
-                                Ipopt::Index, Ipopt::Index, Ipopt::Index* iRow,
-                                Ipopt::Index* jCol, Ipopt::Number* values) {
+bool IpoptInterface::eval_jac_g(Ipopt::Index, const Ipopt::Number* x,
+                                bool new_x, Ipopt::Index, Ipopt::Index,
+                                Ipopt::Index* iRow, Ipopt::Index* jCol,
+                                Ipopt::Number* values) {
 #endif
   assert_pretty(n == static_cast<Ipopt::Index>(nvar_),
                 "Inconsistent number of decision variables");
   assert_pretty(m == static_cast<Ipopt::Index>(nconst_),
                 "Inconsistent number of constraints");
 
-  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
-      problem_->get_runningModels();
   if (values == NULL) {
-    // Dynamic constraints
-    std::size_t idx = 0;
-    std::size_t ix = 0;
-    const std::size_t T = problem_->get_T();
-    for (std::size_t t = 0; t < T; ++t) {
-      const boost::shared_ptr<ActionModelAbstract>& model = models[t];
-      const std::size_t ndxi = model->get_state()->get_ndx();
-      const std::size_t nui = model->get_nu();
-      const std::size_t ndxi_next =
-          t + 1 == T ? problem_->get_terminalModel()->get_state()->get_ndx()
-                     : models[t + 1]->get_state()->get_ndx();
-      for (std::size_t idx_row = 0; idx_row < ndxi; ++idx_row) {
-        for (std::size_t idx_col = 0; idx_col < (ndxi + nui + ndxi_next);
-             ++idx_col) {
-          iRow[idx] = static_cast<Ipopt::Index>(ix + idx_row);
-          jCol[idx] = static_cast<Ipopt::Index>(ixu_[t] + idx_col);
-          idx++;
-        }
-      }
-      ix += ndxi;
-    }
-
-    // Initial condition
-    const std::size_t ndxi = models[0]->get_state()->get_ndx();
-    for (std::size_t idx_row = 0; idx_row < ndxi; ++idx_row) {
-      for (std::size_t idx_col = 0; idx_col < ndxi; ++idx_col) {
-        iRow[idx] = static_cast<Ipopt::Index>(ix + idx_row);
-        jCol[idx] = static_cast<Ipopt::Index>(idx_col);
-        idx++;
-      }
-    }
-
-    assert_pretty(nele_jac == static_cast<Ipopt::Index>(idx),
+    // Return the structure computed in get_nlp_info
+    assert_pretty(nele_jac == static_cast<Ipopt::Index>(jac_irow_.size()),
                   "Number of jacobian elements set does not coincide with the "
                   "total non-zero Jacobian values");
+    std::copy(jac_irow_.begin(), jac_irow_.end(), iRow);
+    std::copy(jac_jcol_.begin(), jac_jcol_.end(), jCol);
   } else {
-    const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
-        problem_->get_runningDatas();
-    // Dynamic constraints
+    updateCalcDiff(x, new_x);
+
+    // Dynamic constraints. Each node fills its values from its own offset
+    const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+        problem_->get_runningModels();
     const std::size_t T = problem_->get_T();
 #ifdef CROCODDYL_WITH_MULTITHREADING
 #pragma omp parallel for num_threads(problem_->get_nthreads())
 #endif
-    for (std::size_t t = 0; t < T; ++t) {
-      const boost::shared_ptr<ActionModelAbstract>& model = models[t];
-      const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
-      const boost::shared_ptr<ActionModelAbstract>& model_next =
-          t + 1 == T ? problem_->get_terminalModel() : models[t + 1];
-      const std::size_t ndxi = model->get_state()->get_ndx();
-      const std::size_t ndxi_next = model_next->get_state()->get_ndx();
-      const std::size_t nui = model->get_nu();
-      datas_[t]->dx = Eigen::VectorXd::Map(x + ixu_[t], ndxi);
-      datas_[t]->u = Eigen::VectorXd::Map(x + ixu_[t] + ndxi, nui);
-      datas_[t]->dxnext =
-          Eigen::VectorXd::Map(x + ixu_[t] + ndxi + nui, ndxi_next);
-
-      model->get_state()->integrate(xs_[t], datas_[t]->dx, datas_[t]->x);
-      model_next->get_state()->integrate(xs_[t + 1], datas_[t]->dxnext,
-                                         datas_[t]->xnext);
-      model->calcDiff(data, datas_[t]->x, datas_[t]->u);
-      model_next->get_state()->Jintegrate(
-          xs_[t + 1], datas_[t]->dxnext, datas_[t]->Jint_dxnext,
-          datas_[t]->Jint_dxnext, second,
-          setto);  // datas_[t]->Jsum_dxnext == eq. 81
-      model->get_state()->Jdiff(
-          data->xnext, datas_[t]->xnext, datas_[t]->Jdiff_x,
-          datas_[t]->Jdiff_xnext,
-          both);  // datas_[t+1]->Jdiff_x == eq. 83, datas_[t]->Jdiff_x == eq.82
-      model->get_state()->Jintegrate(xs_[t], datas_[t]->dx, datas_[t]->Jint_dx,
-                                     datas_[t]->Jint_dx, second,
-                                     setto);  // datas_[t]->Jsum_dx == eq. 81
-      datas_[t]->Jg_dxnext.noalias() =
-          datas_[t]->Jdiff_xnext * datas_[t]->Jint_dxnext;  // chain rule
-      datas_[t]->FxJint_dx.noalias() = data->Fx * datas_[t]->Jint_dx;
-      datas_[t]->Jg_dx.noalias() = datas_[t]->Jdiff_x * datas_[t]->FxJint_dx;
-      datas_[t]->Jg_u.noalias() = datas_[t]->Jdiff_x * data->Fu;
-    }
-    std::size_t idx = 0;
     for (std::size_t t = 0; t < T; ++t) {
       const boost::shared_ptr<ActionModelAbstract>& model = models[t];
       const boost::shared_ptr<ActionModelAbstract>& model_next =
@@ -525,6 +346,7 @@ bool IpoptInterface::eval_jac_g(Ipopt::Index, const Ipopt::Number* x, bool,
       const std::size_t ndxi = model->get_state()->get_ndx();
       const std::size_t nui = model->get_nu();
       const std::size_t ndxi_next = model_next->get_state()->get_ndx();
+      std::size_t idx = ijac_[t];
       for (std::size_t idx_row = 0; idx_row < ndxi; ++idx_row) {
         for (std::size_t idx_col = 0; idx_col < ndxi; ++idx_col) {
           values[idx] = datas_[t]->Jg_dx(idx_row, idx_col);
@@ -543,16 +365,8 @@ bool IpoptInterface::eval_jac_g(Ipopt::Index, const Ipopt::Number* x, bool,
     }
 
     // Initial condition
-    const boost::shared_ptr<ActionModelAbstract>& model = models[0];
-    const std::size_t ndxi = model->get_state()->get_ndx();
-    datas_[0]->dx = Eigen::VectorXd::Map(x, ndxi);
-
-    model->get_state()->integrate(xs_[0], datas_[0]->dx, datas_[0]->x);
-    model->get_state()->Jdiff(datas_[0]->x, problem_->get_x0(),
-                              datas_[0]->Jdiff_x, datas_[0]->Jdiff_x, first);
-    model->get_state()->Jintegrate(xs_[0], datas_[0]->dx, datas_[0]->Jint_dx,
-                                   datas_[0]->Jint_dx, second, setto);
-    datas_[0]->Jg_ic.noalias() = datas_[0]->Jdiff_x * datas_[0]->Jint_dx;
+    const std::size_t ndxi = models[0]->get_state()->get_ndx();
+    std::size_t idx = ijac_[T];
     for (std::size_t idx_row = 0; idx_row < ndxi; ++idx_row) {
       for (std::size_t idx_col = 0; idx_col < ndxi; ++idx_col) {
         values[idx] = datas_[0]->Jg_ic(idx_row, idx_col);
@@ -565,14 +379,14 @@ bool IpoptInterface::eval_jac_g(Ipopt::Index, const Ipopt::Number* x, bool,
 }
 
 #ifndef NDEBUG
-bool IpoptInterface::eval_h(Ipopt::Index n, const Ipopt::Number* x,
-                            bool /*new_x*/, Ipopt::Number obj_factor,
-                            Ipopt::Index m, const Ipopt::Number* /*lambda*/,
+bool IpoptInterface::eval_h(Ipopt::Index n, const Ipopt::Number* x, bool new_x,
+                            Ipopt::Number obj_factor, Ipopt::Index m,
+                            const Ipopt::Number* /*lambda*/,
                             bool /*new_lambda*/, Ipopt::Index nele_hess,
                             Ipopt::Index* iRow, Ipopt::Index* jCol,
                             Ipopt::Number* values) {
 #else
-bool IpoptInterface::eval_h(Ipopt::Index, const Ipopt::Number* x, bool,
+bool IpoptInterface::eval_h(Ipopt::Index, const Ipopt::Number* x, bool new_x,
                             Ipopt::Number obj_factor, Ipopt::Index,
                             const Ipopt::Number*, bool, Ipopt::Index,
                             Ipopt::Index* iRow, Ipopt::Index* jCol,
@@ -583,56 +397,24 @@ bool IpoptInterface::eval_h(Ipopt::Index, const Ipopt::Number* x, bool,
   assert_pretty(m == static_cast<Ipopt::Index>(nconst_),
                 "Inconsistent number of constraints");
 
-  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
-      problem_->get_runningModels();
-  const std::size_t T = problem_->get_T();
   if (values == NULL) {
-    // return the structure. This is a symmetric matrix, fill the lower left
-    // triangle only
-
-    // Running Costs
-    std::size_t idx = 0;
-    for (std::size_t t = 0; t < problem_->get_T(); ++t) {
-      const boost::shared_ptr<ActionModelAbstract> model = models[t];
-      const std::size_t ndxi = model->get_state()->get_ndx();
-      const std::size_t nui = model->get_nu();
-      for (std::size_t idx_row = 0; idx_row < ndxi + nui; ++idx_row) {
-        for (std::size_t idx_col = 0; idx_col < ndxi + nui; ++idx_col) {
-          // We need the lower triangular matrix
-          if (idx_col > idx_row) {
-            break;
-          }
-          iRow[idx] = static_cast<Ipopt::Index>(ixu_[t] + idx_row);
-          jCol[idx] = static_cast<Ipopt::Index>(ixu_[t] + idx_col);
-          idx++;
-        }
-      }
-    }
-
-    // Terminal costs
-    const std::size_t ndxi =
-        problem_->get_terminalModel()->get_state()->get_ndx();
-    for (std::size_t idx_row = 0; idx_row < ndxi; idx_row++) {
-      for (std::size_t idx_col = 0; idx_col < ndxi; idx_col++) {
-        // We need the lower triangular matrix
-        if (idx_col > idx_row) {
-          break;
-        }
-        iRow[idx] = static_cast<Ipopt::Index>(ixu_.back() + idx_row);
-        jCol[idx] = static_cast<Ipopt::Index>(ixu_.back() + idx_col);
-        idx++;
-      }
-    }
-
-    assert_pretty(nele_hess == static_cast<Ipopt::Index>(idx),
+    // Return the structure computed in get_nlp_info. This is a symmetric
+    // matrix, so it contains the lower left triangle only
+    assert_pretty(nele_hess == static_cast<Ipopt::Index>(hess_irow_.size()),
                   "Number of Hessian elements set does not coincide with the "
                   "total non-zero Hessian values");
+    std::copy(hess_irow_.begin(), hess_irow_.end(), iRow);
+    std::copy(hess_jcol_.begin(), hess_jcol_.end(), jCol);
   } else {
-    // return the values. This is a symmetric matrix, fill the lower left
-    // triangle only
-    // Running Costs
+    updateCalcDiff(x, new_x);
+
+    // Return the values. This is a symmetric matrix, fill the lower left
+    // triangle only. Each node fills its values from its own offset
+    const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+        problem_->get_runningModels();
     const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
         problem_->get_runningDatas();
+    const std::size_t T = problem_->get_T();
 #ifdef CROCODDYL_WITH_MULTITHREADING
 #pragma omp parallel for num_threads(problem_->get_nthreads())
 #endif
@@ -641,31 +423,9 @@ bool IpoptInterface::eval_h(Ipopt::Index, const Ipopt::Number* x, bool,
       const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
       const std::size_t ndxi = model->get_state()->get_ndx();
       const std::size_t nui = model->get_nu();
-      datas_[t]->dx = Eigen::VectorXd::Map(x + ixu_[t], ndxi);
-      datas_[t]->u = Eigen::VectorXd::Map(x + ixu_[t] + ndxi, nui);
-
-      model->get_state()->integrate(xs_[t], datas_[t]->dx, datas_[t]->x);
-      model->calcDiff(data, datas_[t]->x,
-                      datas_[t]->u);  // this might be removed
-      model->get_state()->Jintegrate(xs_[t], datas_[t]->dx, datas_[t]->Jint_dx,
-                                     datas_[t]->Jint_dx, second, setto);
-      datas_[t]->Ldxdx.noalias() =
-          datas_[t]->Jint_dx.transpose() * data->Lxx * datas_[t]->Jint_dx;
-      datas_[t]->Ldxu.noalias() = datas_[t]->Jint_dx.transpose() * data->Lxu;
-    }
-
-    std::size_t idx = 0;
-    for (std::size_t t = 0; t < T; ++t) {
-      const boost::shared_ptr<ActionModelAbstract>& model = models[t];
-      const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
-      const std::size_t ndxi = model->get_state()->get_ndx();
-      const std::size_t nui = model->get_nu();
+      std::size_t idx = ihess_[t];
       for (std::size_t idx_row = 0; idx_row < ndxi; ++idx_row) {
-        for (std::size_t idx_col = 0; idx_col < ndxi; ++idx_col) {
-          // We need the lower triangular matrix
-          if (idx_col > idx_row) {
-            break;
-          }
+        for (std::size_t idx_col = 0; idx_col <= idx_row; ++idx_col) {
           values[idx] = obj_factor * datas_[t]->Ldxdx(idx_row, idx_col);
           idx++;
         }
@@ -675,10 +435,7 @@ bool IpoptInterface::eval_h(Ipopt::Index, const Ipopt::Number* x, bool,
           values[idx] = obj_factor * datas_[t]->Ldxu(idx_col, idx_row);
           idx++;
         }
-        for (std::size_t idx_col = 0; idx_col < nui; ++idx_col) {
-          if (idx_col > idx_row) {
-            break;
-          }
+        for (std::size_t idx_col = 0; idx_col <= idx_row; ++idx_col) {
           values[idx] = obj_factor * data->Luu(idx_row, idx_col);
           idx++;
         }
@@ -686,27 +443,12 @@ bool IpoptInterface::eval_h(Ipopt::Index, const Ipopt::Number* x, bool,
     }
 
     // Terminal costs
-    const boost::shared_ptr<ActionModelAbstract>& model =
-        problem_->get_terminalModel();
-    const boost::shared_ptr<ActionDataAbstract>& data =
-        problem_->get_terminalData();
-    const std::size_t ndxi = model->get_state()->get_ndx();
-    datas_[T]->dx = Eigen::VectorXd::Map(x + ixu_.back(), ndxi);
-
-    model->get_state()->integrate(xs_[T], datas_[T]->dx, datas_[T]->x);
-    model->calc(data, datas_[T]->x);
-    model->calcDiff(data, datas_[T]->x);
-    model->get_state()->Jintegrate(xs_[T], datas_[T]->dx, datas_[T]->Jint_dx,
-                                   datas_[T]->Jint_dx, second, setto);
-    datas_[T]->Ldxdx.noalias() =
-        datas_[T]->Jint_dx.transpose() * data->Lxx * datas_[T]->Jint_dx;
-    for (std::size_t idx_row = 0; idx_row < ndxi; idx_row++) {
-      for (std::size_t idx_col = 0; idx_col < ndxi; idx_col++) {
-        // We need the lower triangular matrix
-        if (idx_col > idx_row) {
-          break;
-        }
-        values[idx] = datas_[T]->Ldxdx(idx_row, idx_col);
+    const std::size_t ndxi =
+        problem_->get_terminalModel()->get_state()->get_ndx();
+    std::size_t idx = ihess_[T];
+    for (std::size_t idx_row = 0; idx_row < ndxi; ++idx_row) {
+      for (std::size_t idx_col = 0; idx_col <= idx_row; ++idx_col) {
+        values[idx] = obj_factor * datas_[T]->Ldxdx(idx_row, idx_col);
         idx++;
       }
     }
@@ -715,6 +457,181 @@ bool IpoptInterface::eval_h(Ipopt::Index, const Ipopt::Number* x, bool,
   return true;
 }
 
+void IpoptInterface::computeSparsity() {
+  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+      problem_->get_runningModels();
+  const std::size_t T = problem_->get_T();
+  ijac_.resize(T + 1);
+  ihess_.resize(T + 1);
+  jac_irow_.clear();
+  jac_jcol_.clear();
+  hess_irow_.clear();
+  hess_jcol_.clear();
+
+  std::size_t ix = 0;
+  for (std::size_t t = 0; t < T; ++t) {
+    const std::size_t ndxi = models[t]->get_state()->get_ndx();
+    const std::size_t nui = models[t]->get_nu();
+    const std::size_t ndxi_next =
+        t + 1 == T ? problem_->get_terminalModel()->get_state()->get_ndx()
+                   : models[t + 1]->get_state()->get_ndx();
+    // Dynamic constraints
+    ijac_[t] = jac_irow_.size();
+    for (std::size_t idx_row = 0; idx_row < ndxi; ++idx_row) {
+      for (std::size_t idx_col = 0; idx_col < ndxi + nui + ndxi_next;
+           ++idx_col) {
+        jac_irow_.push_back(static_cast<Ipopt::Index>(ix + idx_row));
+        jac_jcol_.push_back(static_cast<Ipopt::Index>(ixu_[t] + idx_col));
+      }
+    }
+    ix += ndxi;
+
+    // Running costs (lower triangular part)
+    ihess_[t] = hess_irow_.size();
+    for (std::size_t idx_row = 0; idx_row < ndxi + nui; ++idx_row) {
+      for (std::size_t idx_col = 0; idx_col <= idx_row; ++idx_col) {
+        hess_irow_.push_back(static_cast<Ipopt::Index>(ixu_[t] + idx_row));
+        hess_jcol_.push_back(static_cast<Ipopt::Index>(ixu_[t] + idx_col));
+      }
+    }
+  }
+
+  // Initial condition
+  ijac_[T] = jac_irow_.size();
+  const std::size_t ndx0 = models[0]->get_state()->get_ndx();
+  for (std::size_t idx_row = 0; idx_row < ndx0; ++idx_row) {
+    for (std::size_t idx_col = 0; idx_col < ndx0; ++idx_col) {
+      jac_irow_.push_back(static_cast<Ipopt::Index>(ix + idx_row));
+      jac_jcol_.push_back(static_cast<Ipopt::Index>(idx_col));
+    }
+  }
+
+  // Terminal cost (lower triangular part)
+  ihess_[T] = hess_irow_.size();
+  const std::size_t ndxT =
+      problem_->get_terminalModel()->get_state()->get_ndx();
+  for (std::size_t idx_row = 0; idx_row < ndxT; ++idx_row) {
+    for (std::size_t idx_col = 0; idx_col <= idx_row; ++idx_col) {
+      hess_irow_.push_back(static_cast<Ipopt::Index>(ixu_.back() + idx_row));
+      hess_jcol_.push_back(static_cast<Ipopt::Index>(ixu_.back() + idx_col));
+    }
+  }
+}
+
+void IpoptInterface::updateCalc(const Ipopt::Number* x, const bool new_x) {
+  if (new_x) {
+    calc_updated_ = false;
+    calcdiff_updated_ = false;
+  }
+  if (calc_updated_) {
+    return;
+  }
+
+  // Running nodes: costs and dynamic constraints
+  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+      problem_->get_runningModels();
+  const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
+      problem_->get_runningDatas();
+  const std::size_t T = problem_->get_T();
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#pragma omp parallel for num_threads(problem_->get_nthreads())
+#endif
+  for (std::size_t t = 0; t < T; ++t) {
+    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
+    const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
+    const boost::shared_ptr<ActionModelAbstract>& model_next =
+        t + 1 == T ? problem_->get_terminalModel() : models[t + 1];
+    const std::size_t ndxi = model->get_state()->get_ndx();
+    const std::size_t nui = model->get_nu();
+    const std::size_t ndxi_next = model_next->get_state()->get_ndx();
+
+    datas_[t]->dx = Eigen::VectorXd::Map(x + ixu_[t], ndxi);
+    datas_[t]->u = Eigen::VectorXd::Map(x + ixu_[t] + ndxi, nui);
+    datas_[t]->dxnext =
+        Eigen::VectorXd::Map(x + ixu_[t] + ndxi + nui, ndxi_next);
+    model->get_state()->integrate(xs_[t], datas_[t]->dx, datas_[t]->x);
+    model_next->get_state()->integrate(xs_[t + 1], datas_[t]->dxnext,
+                                       datas_[t]->xnext);
+    model->calc(data, datas_[t]->x, datas_[t]->u);
+    model->get_state()->diff(data->xnext, datas_[t]->xnext, datas_[t]->x_diff);
+  }
+
+  // Terminal node
+  const boost::shared_ptr<ActionModelAbstract>& model =
+      problem_->get_terminalModel();
+  const std::size_t ndxi = model->get_state()->get_ndx();
+  datas_[T]->dx = Eigen::VectorXd::Map(x + ixu_.back(), ndxi);
+  model->get_state()->integrate(xs_[T], datas_[T]->dx, datas_[T]->x);
+  model->calc(problem_->get_terminalData(), datas_[T]->x);
+
+  // Initial condition
+  models[0]->get_state()->diff(datas_[0]->x, problem_->get_x0(),
+                               x0_diff_);  // x(0) - x_0
+  calc_updated_ = true;
+}
+
+void IpoptInterface::updateCalcDiff(const Ipopt::Number* x, const bool new_x) {
+  updateCalc(x, new_x);
+  if (calcdiff_updated_) {
+    return;
+  }
+
+  // Running nodes: derivatives of the costs and dynamic constraints
+  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+      problem_->get_runningModels();
+  const std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
+      problem_->get_runningDatas();
+  const std::size_t T = problem_->get_T();
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#pragma omp parallel for num_threads(problem_->get_nthreads())
+#endif
+  for (std::size_t t = 0; t < T; ++t) {
+    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
+    const boost::shared_ptr<ActionDataAbstract>& data = datas[t];
+    const boost::shared_ptr<ActionModelAbstract>& model_next =
+        t + 1 == T ? problem_->get_terminalModel() : models[t + 1];
+    const boost::shared_ptr<IpoptInterfaceData>& d = datas_[t];
+
+    model->calcDiff(data, d->x, d->u);
+    model_next->get_state()->Jintegrate(
+        xs_[t + 1], d->dxnext, d->Jint_dxnext, d->Jint_dxnext, second,
+        setto);  // datas_[t]->Jsum_dxnext == eq. 81
+    model->get_state()->Jdiff(
+        data->xnext, d->xnext, d->Jdiff_x, d->Jdiff_xnext,
+        both);  // datas_[t+1]->Jdiff_x == eq. 83, datas_[t]->Jdiff_x == eq.82
+    model->get_state()->Jintegrate(xs_[t], d->dx, d->Jint_dx, d->Jint_dx,
+                                   second,
+                                   setto);  // datas_[t]->Jsum_dx == eq. 81
+    d->Jg_dxnext.noalias() = d->Jdiff_xnext * d->Jint_dxnext;  // chain rule
+    d->FxJint_dx.noalias() = data->Fx * d->Jint_dx;
+    d->Jg_dx.noalias() = d->Jdiff_x * d->FxJint_dx;
+    d->Jg_u.noalias() = d->Jdiff_x * data->Fu;
+    d->Ldx.noalias() = d->Jint_dx.transpose() * data->Lx;
+    d->Ldxdx.noalias() = d->Jint_dx.transpose() * data->Lxx * d->Jint_dx;
+    d->Ldxu.noalias() = d->Jint_dx.transpose() * data->Lxu;
+  }
+
+  // Terminal node
+  const boost::shared_ptr<ActionModelAbstract>& model =
+      problem_->get_terminalModel();
+  const boost::shared_ptr<ActionDataAbstract>& data =
+      problem_->get_terminalData();
+  const boost::shared_ptr<IpoptInterfaceData>& d = datas_[T];
+  model->calcDiff(data, d->x);
+  model->get_state()->Jintegrate(xs_[T], d->dx, d->Jint_dx, d->Jint_dx, second,
+                                 setto);
+  d->Ldx.noalias() = d->Jint_dx.transpose() * data->Lx;
+  d->Ldxdx.noalias() = d->Jint_dx.transpose() * data->Lxx * d->Jint_dx;
+
+  // Initial condition. Note that the Jacobian of the first node's dynamics has
+  // already been computed, so we can overwrite Jdiff_x
+  const boost::shared_ptr<IpoptInterfaceData>& d0 = datas_[0];
+  models[0]->get_state()->Jdiff(d0->x, problem_->get_x0(), d0->Jdiff_x,
+                                d0->Jdiff_x, first);
+  d0->Jg_ic.noalias() = d0->Jdiff_x * d0->Jint_dx;
+  calcdiff_updated_ = true;
+}
+
 void IpoptInterface::finalize_solution(
     Ipopt::SolverReturn /*status*/, Ipopt::Index /*n*/, const Ipopt::Number* x,
     const Ipopt::Number* /*z_L*/, const Ipopt::Number* /*z_U*/,
@@ -743,6 +660,8 @@ void IpoptInterface::finalize_solution(
   datas_[T]->dx = Eigen::VectorXd::Map(x + ixu_.back(), ndxi);
   model->get_state()->integrate(xs_[T], datas_[T]->dx, datas_[T]->x);
   xs_[T] = datas_[T]->x;
+  calc_updated_ = false;
+  calcdiff_updated_ = false;
 
   cost_ = obj_value;
 }
@@ -766,6 +685,8 @@ boost::shared_ptr<IpoptInterfaceData> IpoptInterface::createData(
 
 void IpoptInterface::set_xs(const std::vector<Eigen::VectorXd>& xs) {
   xs_ = xs;
+  calc_updated_ = false;
+  calcdiff_updated_ = false;
 }
 
 void IpoptInterface::set_us(const std::vector<Eigen::VectorXd>& us) {
@@ -10,6 +10,10 @@
 
 #include "crocoddyl/core/solvers/kkt.hpp"
 
+#include <algorithm>
+
+#include "crocoddyl/core/utils/malloc-check.hpp"
+
 namespace crocoddyl {
 
 SolverKKT::SolverKKT(boost::shared_ptr<ShootingProblem> problem)
@@ -19,6 +23,8 @@ SolverKKT::SolverKKT(boost::shared_ptr<ShootingProblem> problem)
       reg_min_(1e-9),
       reg_max_(1e9),
       cost_try_(0.),
+      direction_time_(0.),
+      trial_time_(0.),
       th_grad_(1e-12),
       was_feasible_(false) {
   allocateData();
@@ -37,15 +43,26 @@ bool SolverKKT::solve(const std::vector<Eigen::VectorXd>& init_xs,
                       const std::vector<Eigen::VectorXd>& init_us,
                       const std::size_t maxiter, const bool is_feasible,
                       const double) {
+  timer_.reset();
   setCandidate(init_xs, init_us, is_feasible);
+  // The data is already allocated, so the iterations must not allocate memory
+  MallocCheckScope malloc_check(false);
   bool recalc = true;
+  Timer phase_timer;
   for (iter_ = 0; iter_ < maxiter; ++iter_) {
+    if (!checkTimeBudget(direction_time_)) {
+      return false;
+    }
+    phase_timer.reset();
     while (true) {
       try {
         computeDirection(recalc);
       } catch (std::exception& e) {
         recalc = false;
         if (preg_ == reg_max_) {
+          status_ = MaxRegReached;
+          return false;
+        } else if (!checkTimeBudget()) {
           return false;
         } else {
           continue;
@@ -53,16 +70,28 @@ bool SolverKKT::solve(const std::vector<Eigen::VectorXd>& init_xs,
       }
       break;
     }
+    direction_time_ = phase_timer.get_duration();
+    // The first search direction is not budgeted as its duration is unknown,
+    // so we check the budget again once it is measured
+    if (!checkTimeBudget()) {
+      return false;
+    }
 
     expectedImprovement();
     for (std::vector<double>::const_iterator it = alphas_.begin();
          it != alphas_.end(); ++it) {
       steplength_ = *it;
+      if (!checkTimeBudget(trial_time_)) {
+        return false;
+      }
+
+      phase_timer.reset();
       try {
         dV_ = tryStep(steplength_);
       } catch (std::exception& e) {
         continue;
       }
+      trial_time_ = phase_timer.get_duration();
       dVexp_ = steplength_ * d_[0] + 0.5 * steplength_ * steplength_ * d_[1];
       if (d_[0] < th_grad_ || !is_feasible_ || dV_ > th_acceptstep_ * dVexp_) {
         was_feasible_ = is_feasible_;
@@ -72,17 +101,21 @@ bool SolverKKT::solve(const std::vector<Eigen::VectorXd>& init_xs,
       }
     }
     stoppingCriteria();
-    const std::size_t n_callbacks = callbacks_.size();
-    if (n_callbacks != 0) {
+    {
+      // User callbacks are free to allocate memory
+      MallocCheckScope malloc_allowed(true);
+      const std::size_t n_callbacks = callbacks_.size();
       for (std::size_t c = 0; c < n_callbacks; ++c) {
         CallbackAbstract& callback = *callbacks_[c];
         callback(*this);
       }
     }
     if (was_feasible_ && stop_ < th_stop_) {
+      status_ = Converged;
       return true;
     }
   }
+  status_ = MaxIterReached;
   return false;
 }
 
@@ -123,7 +156,8 @@ double SolverKKT::tryStep(const double steplength) {
   for (std::size_t t = 0; t < T; ++t) {
     const boost::shared_ptr<ActionModelAbstract>& m = models[t];
 
-    m->get_state()->integrate(xs_[t], steplength * dxs_[t], xs_try_[t]);
+    dx_try_ = steplength * dxs_[t];
+    m->get_state()->integrate(xs_[t], dx_try_, xs_try_[t]);
     if (m->get_nu() != 0) {
       us_try_[t] = us_[t];
       us_try_[t] += steplength * dus_[t];
@@ -131,7 +165,8 @@ double SolverKKT::tryStep(const double steplength) {
   }
   const boost::shared_ptr<ActionModelAbstract> m =
       problem_->get_terminalModel();
-  m->get_state()->integrate(xs_[T], steplength * dxs_[T], xs_try_[T]);
+  dx_try_ = steplength * dxs_[T];
+  m->get_state()->integrate(xs_[T], dx_try_, xs_try_[T]);
   cost_try_ = problem_->calc(xs_try_, us_try_);
   return cost_ - cost_try_;
 }
@@ -168,12 +203,16 @@ const Eigen::Vector2d& SolverKKT::expectedImprovement() {
   // -grad^T.primal
   d_(0) = -kktref_.segment(0, ndx_ + nu_).dot(primal_);
   // -(hessian.primal)^T.primal
-  kkt_primal_.noalias() = kkt_.block(0, 0, ndx_ + nu_, ndx_ + nu_) * primal_;
+  kkt_primal_.noalias() = kkt_.topLeftCorner(ndx_ + nu_, ndx_ + nu_) * primal_;
   d_(1) = -kkt_primal_.dot(primal_);
   return d_;
 }
 
-const Eigen::MatrixXd& SolverKKT::get_kkt() const { return kkt_; }
+Eigen::MatrixXd SolverKKT::get_kkt() const { return Eigen::MatrixXd(kkt_); }
+
+const SolverKKT::SparseMatrixXd& SolverKKT::get_kkt_sparse() const {
+  return kkt_;
+}
 
 const Eigen::VectorXd& SolverKKT::get_kktref() const { return kktref_; }
 
@@ -203,8 +242,10 @@ double SolverKKT::calcDiff() {
 
   std::size_t ix = 0;
   std::size_t iu = 0;
+  // The blocks are updated in the same order as their offsets were computed
+  // in allocateData
+  std::size_t k = 0;
   const std::size_t T = problem_->get_T();
-  kkt_.block(ndx_ + nu_, 0, ndx_, ndx_).setIdentity();
   for (std::size_t t = 0; t < T; ++t) {
     const boost::shared_ptr<ActionModelAbstract>& m =
         problem_->get_runningModels()[t];
@@ -219,13 +260,12 @@ double SolverKKT::calcDiff() {
                            kktref_.segment(ndx_ + nu_, ndxi));
     }
 
-    // Filling KKT matrix
-    kkt_.block(ix, ix, ndxi, ndxi) = d->Lxx;
-    kkt_.block(ix, ndx_ + iu, ndxi, nui) = d->Lxu;
-    kkt_.block(ndx_ + iu, ix, nui, ndxi) = d->Lxu.transpose();
-    kkt_.block(ndx_ + iu, ndx_ + iu, nui, nui) = d->Luu;
-    kkt_.block(ndx_ + nu_ + cx0 + ix, ix, ndxi, ndxi) = -d->Fx;
-    kkt_.block(ndx_ + nu_ + cx0 + ix, ndx_ + iu, ndxi, nui) = -d->Fu;
+    // Filling KKT matrix (the identity blocks are defined in allocateData)
+    updateKKTBlock(d->Lxx, 1., false, k);
+    updateKKTBlock(d->Lxu, 1., true, k);
+    updateKKTBlock(d->Luu, 1., false, k);
+    updateKKTBlock(d->Fx, -1., true, k);
+    updateKKTBlock(d->Fu, -1., true, k);
 
     // Filling KKT vector
     kktref_.segment(ix, ndxi) = d->Lx;
@@ -240,15 +280,86 @@ double SolverKKT::calcDiff() {
       problem_->get_terminalData();
   const std::size_t ndxf =
       problem_->get_terminalModel()->get_state()->get_ndx();
-  kkt_.block(ix, ix, ndxf, ndxf) = df->Lxx;
+  updateKKTBlock(df->Lxx, 1., false, k);
   kktref_.segment(ix, ndxf) = df->Lx;
-  kkt_.block(0, ndx_ + nu_, ndx_ + nu_, ndx_) =
-      kkt_.block(ndx_ + nu_, 0, ndx_, ndx_ + nu_).transpose();
   return cost_;
 }
 
+void SolverKKT::addKKTBlockPattern(
+    std::vector<Eigen::Triplet<double> >& triplets, const std::size_t row,
+    const std::size_t col, const std::size_t nrows, const std::size_t ncols,
+    const bool symmetric) {
+  for (std::size_t j = 0; j < ncols; ++j) {
+    for (std::size_t i = 0; i < nrows; ++i) {
+      triplets.push_back(Eigen::Triplet<double>(row + i, col + j, 0.));
+      if (symmetric) {
+        triplets.push_back(Eigen::Triplet<double>(col + j, row + i, 0.));
+      }
+    }
+  }
+}
+
+void SolverKKT::addKKTBlockOffsets(const std::size_t row, const std::size_t col,
+                                   const std::size_t nrows,
+                                   const std::size_t ncols,
+                                   const bool symmetric) {
+  // The coefficients of each block column are stored contiguously, so we only
+  // need the offset of its first coefficient
+  const int* outer = kkt_.outerIndexPtr();
+  const int* inner = kkt_.innerIndexPtr();
+  for (std::size_t j = 0; j < ncols; ++j) {
+    const int* begin = inner + outer[col + j];
+    const int* end = inner + outer[col + j + 1];
+    const int* it = std::lower_bound(begin, end, static_cast<int>(row));
+    kkt_offsets_.push_back(it - inner);
+  }
+  if (symmetric) {
+    for (std::size_t i = 0; i < nrows; ++i) {
+      const int* begin = inner + outer[row + i];
+      const int* end = inner + outer[row + i + 1];
+      const int* it = std::lower_bound(begin, end, static_cast<int>(col));
+      kkt_offsets_.push_back(it - inner);
+    }
+  }
+}
+
+void SolverKKT::updateKKTBlock(const Eigen::Ref<const Eigen::MatrixXd>& block,
+                               const double scale, const bool symmetric,
+                               std::size_t& k) {
+  double* values = kkt_.valuePtr();
+  for (Eigen::Index j = 0; j < block.cols(); ++j) {
+    double* column = values + kkt_offsets_[k++];
+    for (Eigen::Index i = 0; i < block.rows(); ++i) {
+      column[i] = scale * block(i, j);
+    }
+  }
+  if (symmetric) {
+    for (Eigen::Index i = 0; i < block.rows(); ++i) {
+      double* column = values + kkt_offsets_[k++];
+      for (Eigen::Index j = 0; j < block.cols(); ++j) {
+        column[j] = scale * block(i, j);
+      }
+    }
+  }
+}
+
 void SolverKKT::computePrimalDual() {
-  primaldual_ = kkt_.lu().solve(-kktref_);
+  // The symbolic analysis is computed once, as the sparsity pattern of the KKT
+  // matrix does not change. Copies of the solver need to compute it again.
+  SparseLU& kkt_lu = *kkt_lu_.lu;
+  // The sparse LU manages the memory of its supernodes by itself, so its
+  // allocations are not checked
+  MallocCheckScope malloc_allowed(true);
+  if (!kkt_lu_.is_analyzed) {
+    kkt_lu.analyzePattern(kkt_);
+    kkt_lu_.is_analyzed = true;
+  }
+  kkt_lu.factorize(kkt_);
+  if (kkt_lu.info() != Eigen::Success) {
+    primaldual_.setConstant(NAN);
+  } else {
+    primaldual_ = kkt_lu.solve(-kktref_);
+  }
   primal_ = primaldual_.segment(0, ndx_ + nu_);
   dual_ = primaldual_.segment(ndx_ + nu_, ndx_);
 }
@@ -305,10 +416,51 @@ void SolverKKT::allocateData() {
   xs_try_.back() = problem_->get_terminalModel()->get_state()->zero();
   dxs_.back() = Eigen::VectorXd::Zero(ndx);
   lambdas_.back() = Eigen::VectorXd::Zero(ndx);
-
-  // Set dimensions for kkt matrix and kkt_ref vector
+  dx_try_ = Eigen::VectorXd::Zero(ndx);
+
+  // Define the sparsity pattern of the kkt matrix, i.e., the blocks of the cost
+  // Hessians, the dynamics Jacobians and the identities of the state
+  // constraints. Note that we store explicit zeros, so the coefficients of
+  // these blocks can be updated without reallocating the matrix.
+  const std::size_t cx0 = models[0]->get_state()->get_ndx();
+  std::vector<Eigen::Triplet<double> > triplets;
+  std::size_t ix = 0;
+  std::size_t iu = 0;
+  for (std::size_t t = 0; t < T; ++t) {
+    const std::size_t nu = models[t]->get_nu();
+    addKKTBlockPattern(triplets, ix, ix, ndx, ndx, false);
+    addKKTBlockPattern(triplets, ix, ndx_ + iu, ndx, nu, true);
+    addKKTBlockPattern(triplets, ndx_ + iu, ndx_ + iu, nu, nu, false);
+    addKKTBlockPattern(triplets, ndx_ + nu_ + cx0 + ix, ix, ndx, ndx, true);
+    addKKTBlockPattern(triplets, ndx_ + nu_ + cx0 + ix, ndx_ + iu, ndx, nu,
+                       true);
+    ix += ndx;
+    iu += nu;
+  }
+  addKKTBlockPattern(triplets, ix, ix, ndx, ndx, false);
+  for (std::size_t i = 0; i < ndx_; ++i) {
+    triplets.push_back(Eigen::Triplet<double>(ndx_ + nu_ + i, i, 1.));
+    triplets.push_back(Eigen::Triplet<double>(i, ndx_ + nu_ + i, 1.));
+  }
   kkt_.resize(2 * ndx_ + nu_, 2 * ndx_ + nu_);
-  kkt_.setZero();
+  kkt_.setFromTriplets(triplets.begin(), triplets.end());
+  kkt_.makeCompressed();
+  kkt_offsets_.clear();
+  ix = 0;
+  iu = 0;
+  for (std::size_t t = 0; t < T; ++t) {
+    const std::size_t nu = models[t]->get_nu();
+    addKKTBlockOffsets(ix, ix, ndx, ndx, false);
+    addKKTBlockOffsets(ix, ndx_ + iu, ndx, nu, true);
+    addKKTBlockOffsets(ndx_ + iu, ndx_ + iu, nu, nu, false);
+    addKKTBlockOffsets(ndx_ + nu_ + cx0 + ix, ix, ndx, ndx, true);
+    addKKTBlockOffsets(ndx_ + nu_ + cx0 + ix, ndx_ + iu, ndx, nu, true);
+    ix += ndx;
+    iu += nu;
+  }
+  addKKTBlockOffsets(ix, ix, ndx, ndx, false);
+  kkt_lu_.lu->analyzePattern(kkt_);
+  kkt_lu_.is_analyzed = true;
   kktref_.resize(2 * ndx_ + nu_);
   kktref_.setZero();
   primaldual_.resize(2 * ndx_ + nu_);
@@ -0,0 +1,324 @@
+///////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (C) 2023, Heriot-Watt University, University of Edinburgh
+// Copyright note valid unless otherwise stated in individual files.
+// All rights reserved.
+///////////////////////////////////////////////////////////////////////////////
+
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#include <omp.h>
+#endif  // CROCODDYL_WITH_MULTITHREADING
+
+#include <cmath>
+#include <limits>
+
+#include "crocoddyl/core/solvers/mppi.hpp"
+#include "crocoddyl/core/utils/exception.hpp"
+
+namespace crocoddyl {
+
+SolverMPPI::SolverMPPI(boost::shared_ptr<ShootingProblem> problem,
+                       const std::size_t nsamples)
+    : SolverAbstract(problem),
+      nsamples_(nsamples),
+      lambda_(1.),
+      noise_std_(0.1),
+      seed_(0),
+      nthreads_(1),
+      cost_try_(0.) {
+  if (nsamples_ == 0) {
+    throw_pretty("Invalid argument: "
+                 << "nsamples should be positive");
+  }
+#ifdef CROCODDYL_WITH_MULTITHREADING
+  if (enableMultithreading()) {
+    nthreads_ = CROCODDYL_WITH_NTHREADS;
+  }
+#endif
+  allocateData();
+}
+
+SolverMPPI::~SolverMPPI() {}
+
+bool SolverMPPI::solve(const std::vector<Eigen::VectorXd>& init_xs,
+                       const std::vector<Eigen::VectorXd>& init_us,
+                       const std::size_t maxiter, const bool is_feasible,
+                       const double) {
+  START_PROFILER("SolverMPPI::solve");
+  timer_.reset();
+  // The state trajectory is always obtained from a rollout
+  setCandidate(init_xs, init_us, is_feasible);
+  us_try_ = us_;
+  problem_->rollout(us_try_, xs_try_);
+  setCandidate(xs_try_, us_try_, true);
+  cost_ = problem_->calc(xs_, us_);
+  merit_ = cost_;
+  for (iter_ = 0; iter_ < maxiter; ++iter_) {
+    if (!checkTimeBudget()) {
+      STOP_PROFILER("SolverMPPI::solve");
+      return false;
+    }
+    computeDirection(false);
+    steplength_ = 1.;
+    dV_ = tryStep(steplength_);
+    dPhi_ = dV_;
+    if (dV_ > 0.) {
+      setCandidate(xs_try_, us_try_, true);
+      cost_ = cost_try_;
+      merit_ = cost_;
+    }
+    stoppingCriteria();
+
+    const std::size_t n_callbacks = callbacks_.size();
+    for (std::size_t c = 0; c < n_callbacks; ++c) {
+      CallbackAbstract& callback = *callbacks_[c];
+      callback(*this);
+    }
+
+    if (stop_ < th_stop_) {
+      status_ = Converged;
+      STOP_PROFILER("SolverMPPI::solve");
+      return true;
+    }
+  }
+  status_ = MaxIterReached;
+  STOP_PROFILER("SolverMPPI::solve");
+  return false;
+}
+
+void SolverMPPI::computeDirection(const bool) {
+  START_PROFILER("SolverMPPI::computeDirection");
+  const std::size_t T = problem_->get_T();
+  const Eigen::VectorXd& x0 = problem_->get_x0();
+  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+      problem_->get_runningModels();
+  const boost::shared_ptr<ActionModelAbstract>& terminal_model =
+      problem_->get_terminalModel();
+
+  // Roll out the perturbed control trajectories. Each thread uses its own
+  // action data and random-number generator
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#pragma omp parallel for num_threads(nthreads_) schedule(static)
+#endif
+  for (std::size_t k = 0; k < nsamples_; ++k) {
+#ifdef CROCODDYL_WITH_MULTITHREADING
+    const std::size_t tid = static_cast<std::size_t>(omp_get_thread_num());
+#else
+    const std::size_t tid = 0;
+#endif
+    std::vector<boost::shared_ptr<ActionDataAbstract> >& datas =
+        thread_datas_[tid];
+    std::vector<Eigen::VectorXd>& us = thread_us_[tid];
+    std::normal_distribution<double> normal(0., noise_std_);
+    double cost = 0.;
+    for (std::size_t t = 0; t < T; ++t) {
+      ActionModelAbstract& model = *models[t];
+      Eigen::VectorXd& noise = noises_[k][t];
+      const std::size_t nu = model.get_nu();
+      if (k == 0) {
+        noise.setZero();
+      } else {
+        for (std::size_t i = 0; i < nu; ++i) {
+          noise[i] = normal(rngs_[tid]);
+        }
+      }
+      us[t] = us_[t];
+      us[t] += noise;
+      if (model.get_has_control_limits()) {
+        us[t] = us[t].cwiseMax(model.get_u_lb()).cwiseMin(model.get_u_ub());
+        noise = us[t];
+        noise -= us_[t];
+      }
+      model.calc(datas[t], t == 0 ? x0 : datas[t - 1]->xnext, us[t]);
+      cost += datas[t]->cost;
+    }
+    terminal_model->calc(datas[T], T == 0 ? x0 : datas[T - 1]->xnext);
+    cost += datas[T]->cost;
+    costs_[k] =
+        std::isnan(cost) ? std::numeric_limits<double>::infinity() : cost;
+  }
+
+  // Compute the exponential weights of the samples
+  const double cost_min = costs_.minCoeff();
+  if (std::isinf(cost_min)) {
+    throw_pretty("Invalid argument: "
+                 << "all the sampled trajectories have an infinite cost");
+  }
+  weights_.array() = (-(costs_.array() - cost_min) / lambda_).exp();
+  weights_ /= weights_.sum();
+
+  // Compute the weighted control update
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#pragma omp parallel for num_threads(nthreads_)
+#endif
+  for (std::size_t t = 0; t < T; ++t) {
+    Eigen::VectorXd& du = dus_[t];
+    du.setZero();
+    for (std::size_t k = 0; k < nsamples_; ++k) {
+      if (weights_[k] != 0.) {
+        du += weights_[k] * noises_[k][t];
+      }
+    }
+  }
+  STOP_PROFILER("SolverMPPI::computeDirection");
+}
+
+double SolverMPPI::tryStep(const double steplength) {
+  START_PROFILER("SolverMPPI::tryStep");
+  const std::size_t T = problem_->get_T();
+  for (std::size_t t = 0; t < T; ++t) {
+    us_try_[t] = us_[t];
+    us_try_[t] += steplength * dus_[t];
+  }
+  problem_->rollout(us_try_, xs_try_);
+  cost_try_ = problem_->calc(xs_try_, us_try_);
+  STOP_PROFILER("SolverMPPI::tryStep");
+  return cost_ - cost_try_;
+}
+
+double SolverMPPI::stoppingCriteria() {
+  stop_ = 0.;
+  const std::size_t T = problem_->get_T();
+  for (std::size_t t = 0; t < T; ++t) {
+    stop_ += dus_[t].squaredNorm();
+  }
+  return stop_;
+}
+
+const Eigen::Vector2d& SolverMPPI::expectedImprovement() {
+  d_.setZero();
+  return d_;
+}
+
+void SolverMPPI::resizeData() {
+  START_PROFILER("SolverMPPI::resizeData");
+  SolverAbstract::resizeData();
+  allocateData();
+  STOP_PROFILER("SolverMPPI::resizeData");
+}
+
+void SolverMPPI::allocateData() {
+  const std::size_t T = problem_->get_T();
+  const std::vector<boost::shared_ptr<ActionModelAbstract> >& models =
+      problem_->get_runningModels();
+  const boost::shared_ptr<ActionModelAbstract>& terminal_model =
+      problem_->get_terminalModel();
+  xs_try_.resize(T + 1);
+  us_try_.resize(T);
+  dus_.resize(T);
+  for (std::size_t t = 0; t < T; ++t) {
+    const boost::shared_ptr<ActionModelAbstract>& model = models[t];
+    const std::size_t nu = model->get_nu();
+    xs_try_[t] = model->get_state()->zero();
+    us_try_[t] = Eigen::VectorXd::Zero(nu);
+    dus_[t] = Eigen::VectorXd::Zero(nu);
+  }
+  xs_try_.back() = terminal_model->get_state()->zero();
+
+  noises_.resize(nsamples_);
+  for (std::size_t k = 0; k < nsamples_; ++k) {
+    noises_[k].resize(T);
+    for (std::size_t t = 0; t < T; ++t) {
+      noises_[k][t] = Eigen::VectorXd::Zero(models[t]->get_nu());
+    }
+  }
+  costs_ = Eigen::VectorXd::Zero(nsamples_);
+  weights_ = Eigen::VectorXd::Zero(nsamples_);
+
+  thread_datas_.resize(nthreads_);
+  thread_us_.resize(nthreads_);
+  for (std::size_t i = 0; i < nthreads_; ++i) {
+    thread_datas_[i].resize(T + 1);
+    thread_us_[i].resize(T);
+    for (std::size_t t = 0; t < T; ++t) {
+      thread_datas_[i][t] = models[t]->createData();
+      thread_us_[i][t] = Eigen::VectorXd::Zero(models[t]->get_nu());
+    }
+    thread_datas_[i][T] = terminal_model->createData();
+  }
+  set_seed(seed_);
+}
+
+std::size_t SolverMPPI::get_nsamples() const { return nsamples_; }
+
+double SolverMPPI::get_lambda() const { return lambda_; }
+
+double SolverMPPI::get_noise_std() const { return noise_std_; }
+
+unsigned int SolverMPPI::get_seed() const { return seed_; }
+
+std::size_t SolverMPPI::get_nthreads() const {
+#ifndef CROCODDYL_WITH_MULTITHREADING
+  std::cerr << "Warning: the number of threads won't affect the computational "
+               "performance as multithreading "
+               "support is not enabled."
+            << std::endl;
+#endif
+  return nthreads_;
+}
+
+const std::vector<Eigen::VectorXd>& SolverMPPI::get_dus() const { return dus_; }
+
+const Eigen::VectorXd& SolverMPPI::get_sample_costs() const { return costs_; }
+
+const Eigen::VectorXd& SolverMPPI::get_weights() const { return weights_; }
+
+void SolverMPPI::set_nsamples(const std::size_t nsamples) {
+  if (nsamples == 0) {
+    throw_pretty("Invalid argument: "
+                 << "nsamples should be positive");
+  }
+  nsamples_ = nsamples;
+  allocateData();
+}
+
+void SolverMPPI::set_lambda(const double lambda) {
+  if (lambda <= 0.) {
+    throw_pretty("Invalid argument: "
+                 << "lambda should be positive");
+  }
+  lambda_ = lambda;
+}
+
+void SolverMPPI::set_noise_std(const double noise_std) {
+  if (noise_std < 0.) {
+    throw_pretty("Invalid argument: "
+                 << "noise_std should be a positive value");
+  }
+  noise_std_ = noise_std;
+}
+
+void SolverMPPI::set_seed(const unsigned int seed) {
+  seed_ = seed;
+  rngs_.resize(nthreads_);
+  for (std::size_t i = 0; i < nthreads_; ++i) {
+    rngs_[i].seed(seed_ + static_cast<unsigned int>(i));
+  }
+}
+
+void SolverMPPI::set_nthreads(const int nthreads) {
+#ifndef CROCODDYL_WITH_MULTITHREADING
+  (void)nthreads;
+  std::cerr << "Warning: the number of threads won't affect the computational "
+               "performance as multithreading "
+               "support is not enabled."
+            << std::endl;
+#else
+  if (nthreads < 1) {
+    nthreads_ = CROCODDYL_WITH_NTHREADS;
+  } else {
+    nthreads_ = static_cast<std::size_t>(nthreads);
+  }
+  if (!enableMultithreading()) {
+    std::cerr << "Warning: the number of threads won't affect the "
+                 "computational performance as multithreading "
+                 "support is not enabled."
+              << std::endl;
+    nthreads_ = 1;
+  }
+  allocateData();
+#endif
+}
+
+}  // namespace crocoddyl
@@ -9,6 +9,8 @@
 
 #include "crocoddyl/core/utils/callbacks.hpp"
 
+#include <algorithm>
+
 #include "crocoddyl/core/utils/exception.hpp"
 
 namespace crocoddyl {
@@ -238,4 +240,249 @@ void CallbackVerbose::operator()(SolverAbstract& solver) {
   std::cout << std::flush;
 }
 
+CallbackLogger::CallbackLogger(const std::size_t capacity,
+                               const bool with_trajectories)
+    : CallbackAbstract(),
+      capacity_(capacity),
+      with_trajectories_(with_trajectories),
+      size_(0),
+      head_(0) {
+  set_capacity(capacity);
+}
+
+CallbackLogger::~CallbackLogger() {}
+
+void CallbackLogger::operator()(SolverAbstract& solver) {
+  if (capacity_ == 0) {
+    return;
+  }
+  if (with_trajectories_) {
+    allocateTrajectories(solver);
+  }
+  const std::size_t i = head_;
+  iters_[i] = static_cast<int>(solver.get_iter());
+  costs_[i] = solver.get_cost();
+  stops_[i] = solver.get_stop();
+  grads_[i] = -solver.get_d()[1];
+  pregs_[i] = solver.get_preg();
+  dregs_[i] = solver.get_dreg();
+  steps_[i] = solver.get_steplength();
+  ffeass_[i] = solver.get_ffeas();
+  hfeass_[i] = solver.get_hfeas();
+  const std::vector<Eigen::VectorXd>& xs = solver.get_xs();
+  const std::vector<Eigen::VectorXd>& us = solver.get_us();
+  if (with_trajectories_) {
+    const std::vector<Eigen::VectorXd>& fs = solver.get_fs();
+    for (std::size_t t = 0, k = 0; t < xs.size(); ++t) {
+      const Eigen::Index nx = xs[t].size();
+      xs_log_.col(i).segment(k, nx) = xs[t];
+      k += nx;
+    }
+    for (std::size_t t = 0, k = 0; t < us.size(); ++t) {
+      const Eigen::Index nu = us[t].size();
+      us_log_.col(i).segment(k, nu) = us[t];
+      k += nu;
+    }
+    for (std::size_t t = 0, k = 0; t < fs.size(); ++t) {
+      const Eigen::Index ndx = fs[t].size();
+      fs_log_.col(i).segment(k, ndx) = fs[t];
+      k += ndx;
+    }
+  }
+  xs_ = xs;
+  us_ = us;
+  head_ = (head_ + 1) % capacity_;
+  if (size_ < capacity_) {
+    ++size_;
+  }
+}
+
+void CallbackLogger::reset() {
+  size_ = 0;
+  head_ = 0;
+}
+
+std::size_t CallbackLogger::get_size() const { return size_; }
+
+std::size_t CallbackLogger::get_capacity() const { return capacity_; }
+
+bool CallbackLogger::get_with_trajectories() const {
+  return with_trajectories_;
+}
+
+Eigen::Ref<const CallbackLogger::VectorXi> CallbackLogger::get_iters() const {
+  unwrap();
+  return iters_.head(size_);
+}
+
+Eigen::Ref<const Eigen::VectorXd> CallbackLogger::get_costs() const {
+  unwrap();
+  return costs_.head(size_);
+}
+
+Eigen::Ref<const Eigen::VectorXd> CallbackLogger::get_stops() const {
+  unwrap();
+  return stops_.head(size_);
+}
+
+Eigen::Ref<const Eigen::VectorXd> CallbackLogger::get_grads() const {
+  unwrap();
+  return grads_.head(size_);
+}
+
+Eigen::Ref<const Eigen::VectorXd> CallbackLogger::get_pregs() const {
+  unwrap();
+  return pregs_.head(size_);
+}
+
+Eigen::Ref<const Eigen::VectorXd> CallbackLogger::get_dregs() const {
+  unwrap();
+  return dregs_.head(size_);
+}
+
+Eigen::Ref<const Eigen::VectorXd> CallbackLogger::get_steps() const {
+  unwrap();
+  return steps_.head(size_);
+}
+
+Eigen::Ref<const Eigen::VectorXd> CallbackLogger::get_ffeass() const {
+  unwrap();
+  return ffeass_.head(size_);
+}
+
+Eigen::Ref<const Eigen::VectorXd> CallbackLogger::get_hfeass() const {
+  unwrap();
+  return hfeass_.head(size_);
+}
+
+const std::vector<Eigen::VectorXd>& CallbackLogger::get_xs() const {
+  return xs_;
+}
+
+const std::vector<Eigen::VectorXd>& CallbackLogger::get_us() const {
+  return us_;
+}
+
+Eigen::Ref<const Eigen::MatrixXd> CallbackLogger::get_xs_log() const {
+  unwrap();
+  return xs_log_.leftCols(std::min<Eigen::Index>(size_, xs_log_.cols()));
+}
+
+Eigen::Ref<const Eigen::MatrixXd> CallbackLogger::get_us_log() const {
+  unwrap();
+  return us_log_.leftCols(std::min<Eigen::Index>(size_, us_log_.cols()));
+}
+
+Eigen::Ref<const Eigen::MatrixXd> CallbackLogger::get_fs_log() const {
+  unwrap();
+  return fs_log_.leftCols(std::min<Eigen::Index>(size_, fs_log_.cols()));
+}
+
+std::vector<std::vector<Eigen::VectorXd> > CallbackLogger::get_fs() const {
+  if (!with_trajectories_) {
+    throw_pretty("Invalid argument: "
+                 << "the trajectories are not recorded (enable "
+                    "with_trajectories)");
+  }
+  const Eigen::Ref<const Eigen::MatrixXd> fs_log = get_fs_log();
+  std::vector<std::vector<Eigen::VectorXd> > fs(fs_log.cols());
+  for (Eigen::Index i = 0; i < fs_log.cols(); ++i) {
+    fs[i].reserve(ndxs_.size());
+    for (std::size_t t = 0, k = 0; t < ndxs_.size(); ++t) {
+      fs[i].push_back(fs_log.col(i).segment(k, ndxs_[t]));
+      k += ndxs_[t];
+    }
+  }
+  return fs;
+}
+
+void CallbackLogger::set_capacity(const std::size_t capacity) {
+  capacity_ = capacity;
+  iters_.resize(capacity);
+  costs_.resize(capacity);
+  stops_.resize(capacity);
+  grads_.resize(capacity);
+  pregs_.resize(capacity);
+  dregs_.resize(capacity);
+  steps_.resize(capacity);
+  ffeass_.resize(capacity);
+  hfeass_.resize(capacity);
+  xs_log_.resize(xs_log_.rows(), capacity);
+  us_log_.resize(us_log_.rows(), capacity);
+  fs_log_.resize(fs_log_.rows(), capacity);
+  reset();
+}
+
+void CallbackLogger::set_with_trajectories(const bool with_trajectories) {
+  with_trajectories_ = with_trajectories;
+  if (!with_trajectories_) {
+    xs_log_.resize(0, 0);
+    us_log_.resize(0, 0);
+    fs_log_.resize(0, 0);
+  }
+  reset();
+}
+
+template <typename Derived>
+static void rotateColumns(Eigen::PlainObjectBase<Derived>& buffer,
+                          const std::size_t shift) {
+  // The buffers are stored by columns, so rotating their columns is equivalent
+  // to rotating their contiguous memory
+  typename Derived::Scalar* data = buffer.data();
+  const Eigen::Index rows = buffer.rows();
+  std::rotate(data, data + static_cast<Eigen::Index>(shift) * rows,
+              data + buffer.size());
+}
+
+void CallbackLogger::unwrap() const {
+  // The oldest iteration is placed at the beginning of the buffers, so they
+  // can be returned as contiguous blocks. It only happens when the buffers
+  // have been overwritten.
+  if (size_ < capacity_ || head_ == 0) {
+    return;
+  }
+  rotateColumns(iters_, head_);
+  rotateColumns(costs_, head_);
+  rotateColumns(stops_, head_);
+  rotateColumns(grads_, head_);
+  rotateColumns(pregs_, head_);
+  rotateColumns(dregs_, head_);
+  rotateColumns(steps_, head_);
+  rotateColumns(ffeass_, head_);
+  rotateColumns(hfeass_, head_);
+  if (with_trajectories_ && xs_log_.cols() != 0) {
+    rotateColumns(xs_log_, head_);
+    rotateColumns(us_log_, head_);
+    rotateColumns(fs_log_, head_);
+  }
+  head_ = 0;
+}
+
+void CallbackLogger::allocateTrajectories(const SolverAbstract& solver) {
+  const std::vector<Eigen::VectorXd>& xs = solver.get_xs();
+  const std::vector<Eigen::VectorXd>& us = solver.get_us();
+  const std::vector<Eigen::VectorXd>& fs = solver.get_fs();
+  Eigen::Index nx = 0, nu = 0, ndx = 0;
+  for (std::size_t t = 0; t < xs.size(); ++t) {
+    nx += xs[t].size();
+  }
+  for (std::size_t t = 0; t < us.size(); ++t) {
+    nu += us[t].size();
+  }
+  ndxs_.resize(fs.size());
+  for (std::size_t t = 0; t < fs.size(); ++t) {
+    ndxs_[t] = fs[t].size();
+    ndx += ndxs_[t];
+  }
+  const Eigen::Index capacity = static_cast<Eigen::Index>(capacity_);
+  if (xs_log_.rows() != nx || us_log_.rows() != nu || fs_log_.rows() != ndx ||
+      xs_log_.cols() != capacity) {
+    // The recorded trajectories are not consistent with the new dimensions
+    xs_log_.resize(nx, capacity);
+    us_log_.resize(nu, capacity);
+    fs_log_.resize(ndx, capacity);
+    reset();
+  }
+}
+
 }  // namespace crocoddyl
@@ -365,6 +365,7 @@ class ProblemAndSolversTest(CopyModelTestCase):
     problem = crocoddyl.ShootingProblem(m.state.zero(), [m] * 10, m)
     MODEL.append(problem)
     MODEL.append(crocoddyl.CallbackVerbose())
+    MODEL.append(crocoddyl.CallbackLogger())
     MODEL.append(crocoddyl.SolverKKT(problem))
     MODEL.append(crocoddyl.SolverDDP(problem))
     MODEL.append(crocoddyl.SolverFDDP(problem))
@@ -190,6 +190,19 @@ class CostModelSumTestCase(unittest.TestCase):
             len(self.cost_sum.costs), 0, "The number of cost items should be zero"
         )
 
+    def test_changeCostStatus(self):
+        self.cost_sum.changeCostStatus("myCost", False)
+        self.assertFalse(self.cost_sum.costs["myCost"].active, "Wrong status.")
+        self.cost_sum.calc(self.data_sum, self.x, self.u)
+        self.assertEqual(self.data_sum.cost, 0.0, "Wrong cost value.")
+        # The status can also be changed directly in the cost item
+        self.cost_sum.costs["myCost"].active = True
+        self.COST.calc(self.data, self.x, self.u)
+        self.cost_sum.calc(self.data_sum, self.x, self.u)
+        self.assertAlmostEqual(
+            self.data.cost, self.data_sum.cost, 10, "Wrong cost value."
+        )
+
 
 class StateCostTest(CostModelAbstractTestCase):
     ROBOT_MODEL = example_robot_data.load("icub_reduced").model
@@ -122,9 +122,63 @@ class TalosArmShootingTest(ShootingProblemTestCase):
     MODEL_DER = crocoddyl.IntegratedActionModelEuler(DIFF_MODEL_DER, 1e-3)
 
 
+class Float32ShootingTest(unittest.TestCase):
+    def setUp(self):
+        self.T = randint(1, 101)
+        self.MODEL = crocoddyl.ActionModelUnicycle()
+        self.MODEL32 = crocoddyl.float32.ActionModelUnicycle()
+        self.xs = [self.MODEL.state.rand() for _ in range(self.T + 1)]
+        self.us = [np.random.rand(self.MODEL.nu) for _ in range(self.T)]
+        self.PROBLEM = crocoddyl.ShootingProblem(
+            self.xs[0], [self.MODEL] * self.T, self.MODEL
+        )
+        self.PROBLEM32 = crocoddyl.float32.ShootingProblem(
+            self.xs[0].astype(np.float32), [self.MODEL32] * self.T, self.MODEL32
+        )
+
+    def test_calc(self):
+        cost = self.PROBLEM.calc(self.xs, self.us)
+        cost32 = self.PROBLEM32.calc(
+            [x.astype(np.float32) for x in self.xs],
+            [u.astype(np.float32) for u in self.us],
+        )
+        self.assertTrue(np.isclose(cost, cost32, rtol=1e-4), "Wrong cost value.")
+        for d, d32 in zip(self.PROBLEM.runningDatas, self.PROBLEM32.runningDatas):
+            self.assertEqual(d32.xnext.dtype, np.float32, "Wrong scalar type.")
+            self.assertTrue(
+                np.allclose(d.xnext, d32.xnext, atol=1e-5), "Wrong next state."
+            )
+
+    def test_rollout(self):
+        xs = self.PROBLEM.rollout(self.us)
+        xs32 = self.PROBLEM32.rollout([u.astype(np.float32) for u in self.us])
+        for x, x32 in zip(xs, xs32):
+            self.assertTrue(np.allclose(x, x32, atol=1e-4), "Wrong rollout.")
+
+    def test_calcDiff(self):
+        xs32 = [x.astype(np.float32) for x in self.xs]
+        us32 = [u.astype(np.float32) for u in self.us]
+        self.PROBLEM.calc(self.xs, self.us)
+        self.PROBLEM32.calc(xs32, us32)
+        self.PROBLEM.calcDiff(self.xs, self.us)
+        self.PROBLEM32.calcDiff(xs32, us32)
+        for d, d32 in zip(self.PROBLEM.runningDatas, self.PROBLEM32.runningDatas):
+            self.assertEqual(d32.Fx.dtype, np.float32, "Wrong scalar type.")
+            self.assertTrue(np.allclose(d.Fx, d32.Fx, atol=1e-5), "Wrong Fx.")
+            self.assertTrue(np.allclose(d.Fu, d32.Fu, atol=1e-5), "Wrong Fu.")
+            self.assertTrue(np.allclose(d.Lx, d32.Lx, atol=1e-4), "Wrong Lx.")
+            self.assertTrue(np.allclose(d.Lu, d32.Lu, atol=1e-4), "Wrong Lu.")
+            self.assertTrue(np.allclose(d.Lxx, d32.Lxx, atol=1e-4), "Wrong Lxx.")
+            self.assertTrue(np.allclose(d.Luu, d32.Luu, atol=1e-4), "Wrong Luu.")
+
+
 if __name__ == "__main__":
     # test to be run
-    test_classes_to_run = [UnicycleShootingTest, TalosArmShootingTest]
+    test_classes_to_run = [
+        UnicycleShootingTest,
+        TalosArmShootingTest,
+        Float32ShootingTest,
+    ]
     loader = unittest.TestLoader()
     suites_list = []
     for test_class in test_classes_to_run:
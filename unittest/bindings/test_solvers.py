@@ -1,11 +1,16 @@
+import os
+import pickle
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from random import randint
 
 import example_robot_data
 import numpy as np
 import pinocchio
-from factory import DDPDerived, FDDPDerived
+from factory import DDPDerived, FDDPDerived, UnicycleModelDerived
 
 import crocoddyl
 
@@ -110,6 +115,30 @@ class SolverAbstractTestCase(unittest.TestCase):
             "Expected improvement doesn't match.",
         )
 
+    def test_shift(self):
+        # Run 2 iteration in order to boost test analysis
+        self.solver.solve([], [], 2)
+        self.solver_der.solve([], [], 2)
+        xs, us = self.solver.xs, self.solver.us
+        # Append a new node and shift the solver trajectories
+        self.PROBLEM.circularAppend(self.MODEL)
+        self.PROBLEM_DER.circularAppend(self.MODEL)
+        self.solver.shift()
+        self.solver_der.shift()
+        for t in range(self.T - 1):
+            self.assertTrue(
+                np.allclose(self.solver.xs[t], xs[t + 1], atol=1e-9),
+                "xs wasn't shifted.",
+            )
+            self.assertTrue(
+                np.allclose(self.solver.us[t], us[t + 1], atol=1e-9),
+                "us wasn't shifted.",
+            )
+        for x1, x2 in zip(self.solver.xs, self.solver_der.xs):
+            self.assertTrue(np.allclose(x1, x2, atol=1e-9), "xs doesn't match.")
+        for u1, u2 in zip(self.solver.us, self.solver_der.us):
+            self.assertTrue(np.allclose(u1, u2, atol=1e-9), "us doesn't match.")
+
 
 class UnicycleDDPTest(SolverAbstractTestCase):
     MODEL = crocoddyl.ActionModelUnicycle()
@@ -193,6 +222,172 @@ class TalosArmFDDPTest(SolverAbstractTestCase):
     SOLVER_DER = FDDPDerived
 
 
+class SlowUnicycleModelDerived(UnicycleModelDerived):
+    def __init__(self, delay):
+        UnicycleModelDerived.__init__(self)
+        self.delay = delay
+        self.ncalcs = 0
+
+    def calc(self, data, x, u=None):
+        self.ncalcs += 1
+        UnicycleModelDerived.calc(self, data, x, u)
+
+    def calcDiff(self, data, x, u=None):
+        time.sleep(self.delay)
+        UnicycleModelDerived.calcDiff(self, data, x, u)
+
+
+class SolverMaxTimeTest(unittest.TestCase):
+    T = 10
+    DELAY = 0.01
+
+    def test_first_direction_budget(self):
+        # The first search direction of a fresh solver exceeds the time budget,
+        # so the solver has to stop before trying any step
+        for SOLVER in [crocoddyl.SolverDDP, crocoddyl.SolverFDDP]:
+            model = SlowUnicycleModelDerived(self.DELAY)
+            problem = crocoddyl.ShootingProblem(
+                model.state.rand(), [model] * self.T, model
+            )
+            solver = SOLVER(problem)
+            solver.max_time = 0.5 * self.DELAY * 1e3
+            model.ncalcs = 0
+            self.assertFalse(solver.solve([], [], 10))
+            self.assertEqual(solver.status, crocoddyl.SolverStatus.MaxTimeReached)
+            self.assertEqual(solver.iter, 0)
+            self.assertEqual(model.ncalcs, self.T + 1, "Tried a step.")
+
+
+class CallbackLoggerTest(unittest.TestCase):
+    T = 10
+
+    def setUp(self):
+        model = crocoddyl.ActionModelUnicycle()
+        problem = crocoddyl.ShootingProblem(model.state.rand(), [model] * self.T, model)
+        self.solver = crocoddyl.SolverFDDP(problem)
+
+    def test_copies(self):
+        # The recorded values survive the changes of the logger buffers
+        logger = crocoddyl.CallbackLogger(1000, True)
+        self.solver.setCallbacks([logger])
+        self.solver.solve()
+        costs, xs_log = logger.costs, logger.xs_log
+        self.assertEqual(costs[-1], self.solver.cost)
+        logger.capacity = 1
+        self.assertEqual(costs[-1], self.solver.cost)
+        self.assertEqual(xs_log.shape[1], len(costs))
+        logger.reset()
+        self.assertEqual(len(logger.costs), 0)
+        self.assertEqual(costs[-1], self.solver.cost)
+
+    def test_fs(self):
+        logger = crocoddyl.CallbackLogger(1000, True)
+        self.solver.setCallbacks([logger])
+        self.solver.solve()
+        self.assertEqual(len(logger.fs), logger.size)
+        for f, fs in zip(logger.fs[-1], self.solver.fs):
+            self.assertTrue(np.allclose(f, fs, atol=1e-9), "Wrong gap.")
+        logger = crocoddyl.CallbackLogger()
+        self.solver.setCallbacks([logger])
+        self.solver.solve()
+        with self.assertRaises(Exception):
+            logger.fs
+
+    def test_save_logfile(self):
+        for with_trajectories in [True, False]:
+            logger = crocoddyl.CallbackLogger(1000, with_trajectories)
+            self.solver.setCallbacks([logger])
+            self.solver.solve()
+            with tempfile.TemporaryDirectory() as tmpdir:
+                filename = os.path.join(tmpdir, "log.pkl")
+                crocoddyl.saveLogfile(filename, logger)
+                with open(filename, "rb") as f:
+                    data = pickle.load(f)
+            self.assertEqual(len(data["costs"]), logger.size)
+            self.assertEqual("fs" in data, with_trajectories)
+
+
+class SolverStackedTest(unittest.TestCase):
+    T = 10
+
+    def test_views(self):
+        # The stacked arrays share memory with the solver, which they keep alive
+        model = crocoddyl.ActionModelLQR(4, 2)
+        problem = crocoddyl.ShootingProblem(model.state.rand(), [model] * self.T, model)
+        solver = crocoddyl.SolverDDP(problem)
+        solver.solve()
+        xs, us, K = solver.stacked_xs, solver.stacked_us, solver.stacked_K
+        self.assertTrue(np.array_equal(xs, np.array(solver.xs)))
+        self.assertTrue(np.array_equal(us, np.array(solver.us)))
+        self.assertTrue(np.array_equal(K.reshape(self.T, 2, 4), np.array(solver.K)))
+        self.assertTrue(np.shares_memory(xs, solver.stacked_xs))
+        solver.xs = [np.zeros(4)] * (self.T + 1)
+        self.assertEqual(solver.stacked_xs.sum(), 0.0)
+        self.assertEqual(xs.sum(), 0.0)
+        del solver
+        self.assertEqual(xs.shape, (self.T + 1, 4))
+        self.assertEqual(xs.sum(), 0.0)
+
+
+class SolverGILTest(unittest.TestCase):
+    T = 200
+    NSOLVES = 50
+
+    def setUp(self):
+        # Set up a problem and solver with a single thread
+        model = crocoddyl.ActionModelLQR(20, 10)
+        problem = crocoddyl.ShootingProblem(model.state.rand(), [model] * self.T, model)
+        problem.nthreads = 1
+        self.solver = crocoddyl.SolverFDDP(problem)
+
+    def solveMany(self, solver):
+        for _ in range(self.NSOLVES):
+            solver.solve([], [], 10)
+
+    def test_gil_release(self):
+        # A large problem takes long enough to observe the main thread
+        model = crocoddyl.ActionModelLQR(50, 25)
+        problem = crocoddyl.ShootingProblem(model.state.rand(), [model] * 500, model)
+        problem.nthreads = 1
+        solver = crocoddyl.SolverFDDP(problem)
+        started, done = threading.Event(), threading.Event()
+
+        def solve():
+            started.set()
+            solver.solve([], [], 10)
+            done.set()
+
+        # The main thread only makes progress while the other thread is solving
+        # if the GIL is released
+        thread = threading.Thread(target=solve)
+        thread.start()
+        started.wait()
+        ticks = 0
+        while not done.wait(0.001):
+            ticks += 1
+        thread.join()
+        self.assertGreater(ticks, 0, "The GIL is not released while solving.")
+        reference = crocoddyl.SolverFDDP(problem)
+        reference.solve([], [], 10)
+        self.assertAlmostEqual(solver.cost, reference.cost, 9, "Wrong cost.")
+
+    def test_python_derived_model(self):
+        # Python-derived models reacquire the GIL when they are called
+        model = UnicycleModelDerived()
+        problem = crocoddyl.ShootingProblem(model.state.rand(), [model] * 10, model)
+        solver = crocoddyl.SolverDDP(problem)
+        thread = threading.Thread(target=self.solveMany, args=(self.solver,))
+        thread.start()
+        solver.solve([], [], 10)
+        thread.join()
+        model = crocoddyl.ActionModelUnicycle()
+        reference = crocoddyl.SolverDDP(
+            crocoddyl.ShootingProblem(problem.x0, [model] * 10, model)
+        )
+        reference.solve([], [], 10)
+        self.assertAlmostEqual(solver.cost, reference.cost, 9, "Wrong cost.")
+
+
 if __name__ == "__main__":
     # test to be run
     test_classes_to_run = [
@@ -200,6 +395,10 @@ if __name__ == "__main__":
         UnicycleFDDPTest,
         TalosArmDDPTest,
         TalosArmFDDPTest,
+        SolverMaxTimeTest,
+        CallbackLoggerTest,
+        SolverStackedTest,
+        SolverGILTest,
     ]
     loader = unittest.TestLoader()
     suites_list = []
@@ -45,7 +45,9 @@ void test_calc(const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model) {
   const Eigen::VectorXd u = Eigen::VectorXd::Random(model->get_nu());
 
   // Getting the state dimension from calc() call
+  CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED();
   model->calc(data, x, u);
+  CROCODDYL_EIGEN_MALLOC_ALLOWED();
   BOOST_CHECK(static_cast<std::size_t>(data->xnext.size()) ==
               model->get_state()->get_nx());
 
@@ -54,7 +56,9 @@ void test_calc(const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model) {
 
   // Checking the termninal state
   double tol = std::sqrt(2.0 * std::numeric_limits<double>::epsilon());
+  CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED();
   model->calc(data, x);
+  CROCODDYL_EIGEN_MALLOC_ALLOWED();
   BOOST_CHECK((data->xnext - x).head(model->get_state()->get_nq()).isZero(tol));
 }
 
@@ -73,8 +77,10 @@ void test_partial_derivatives_against_numdiff(
   const Eigen::VectorXd u = Eigen::VectorXd::Random(model->get_nu());
 
   // Computing the action derivatives
+  CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED();
   model->calc(data, x, u);
   model->calcDiff(data, x, u);
+  CROCODDYL_EIGEN_MALLOC_ALLOWED();
   model_num_diff.calc(data_num_diff, x, u);
   model_num_diff.calcDiff(data_num_diff, x, u);
   // Tolerance defined as in
@@ -96,8 +102,10 @@ void test_partial_derivatives_against_numdiff(
 
   // Computing the action derivatives
   x = model->get_state()->rand();
+  CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED();
   model->calc(data, x);
   model->calcDiff(data, x);
+  CROCODDYL_EIGEN_MALLOC_ALLOWED();
   model_num_diff.calc(data_num_diff, x);
   model_num_diff.calcDiff(data_num_diff, x);
   BOOST_CHECK((data->Lx - data_num_diff->Lx).isZero(tol));
@@ -108,6 +116,43 @@ void test_partial_derivatives_against_numdiff(
   BOOST_CHECK((data->Gx - data_num_diff->Gx).isZero(tol));
 }
 
+void test_calc_batch(
+    const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model) {
+  typedef crocoddyl::ActionModelAbstract::MatrixXsRowMajor MatrixXsRowMajor;
+  // create the batch of datas and samples
+  const std::size_t N = 20;
+  const std::size_t nx = model->get_state()->get_nx();
+  std::vector<boost::shared_ptr<crocoddyl::ActionDataAbstract> > datas(N);
+  MatrixXsRowMajor X(N, nx);
+  const MatrixXsRowMajor U = MatrixXsRowMajor::Random(N, model->get_nu());
+  for (std::size_t i = 0; i < N; ++i) {
+    datas[i] = model->createData();
+    X.row(i) = model->get_state()->rand().transpose();
+  }
+  const boost::shared_ptr<crocoddyl::ActionDataAbstract>& data =
+      model->createData();
+
+  // Computing the batch of actions and their derivatives
+  MatrixXsRowMajor xnext(N, nx);
+  Eigen::VectorXd cost(N);
+  model->calcBatch(datas, X, U, xnext, cost);
+  model->calcDiffBatch(datas, X, U);
+
+  // Checking that they are equal to the ones computed sample by sample
+  for (std::size_t i = 0; i < N; ++i) {
+    model->calc(data, X.row(i).transpose(), U.row(i).transpose());
+    model->calcDiff(data, X.row(i).transpose(), U.row(i).transpose());
+    BOOST_CHECK((xnext.row(i).transpose() - data->xnext).isZero(1e-9));
+    BOOST_CHECK((datas[i]->xnext - data->xnext).isZero(1e-9));
+    BOOST_CHECK(std::abs(cost[i] - data->cost) < 1e-9);
+    BOOST_CHECK(std::abs(datas[i]->cost - data->cost) < 1e-9);
+    BOOST_CHECK((datas[i]->Fx - data->Fx).isZero(1e-9));
+    BOOST_CHECK((datas[i]->Fu - data->Fu).isZero(1e-9));
+    BOOST_CHECK((datas[i]->Lx - data->Lx).isZero(1e-9));
+    BOOST_CHECK((datas[i]->Lu - data->Lu).isZero(1e-9));
+  }
+}
+
 void test_check_action_data(ActionModelTypes::Type action_model_type) {
   // create the model
   ActionModelFactory factory;
@@ -160,6 +205,14 @@ void test_calc_integrated_action_model(
   test_calc(model);
 }
 
+void test_calc_batch_action_model(ActionModelTypes::Type action_model_type) {
+  // create the model
+  ActionModelFactory factory;
+  const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model =
+      factory.create(action_model_type);
+  test_calc_batch(model);
+}
+
 void test_partial_derivatives_action_model(
     ActionModelTypes::Type action_model_type) {
   // create the model
@@ -264,6 +317,8 @@ void register_action_model_unit_tests(
       BOOST_TEST_CASE(boost::bind(&test_check_action_data, action_model_type)));
   ts->add(
       BOOST_TEST_CASE(boost::bind(&test_calc_action_model, action_model_type)));
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_calc_batch_action_model, action_model_type)));
   ts->add(BOOST_TEST_CASE(
       boost::bind(&test_partial_derivatives_action_model, action_model_type)));
   framework::master_test_suite().add(ts);
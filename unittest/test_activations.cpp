@@ -89,6 +89,29 @@ void test_partial_derivatives_against_numdiff(
   // BOOST_CHECK((data->Arr - data_num_diff->Arr).isMuchSmallerThan(1.0, tol));
 }
 
+void test_hessian_type(ActivationModelTypes::Type activation_type) {
+  // create the model
+  ActivationModelFactory factory;
+  const boost::shared_ptr<crocoddyl::ActivationModelAbstract>& model =
+      factory.create(activation_type);
+
+  // create the corresponding data object
+  boost::shared_ptr<crocoddyl::ActivationDataAbstract> data =
+      model->createData();
+  BOOST_CHECK(data->hessian_type == model->get_hessian_type());
+
+  // Computing the activation derivatives
+  const Eigen::VectorXd r = Eigen::VectorXd::Random(model->get_nr());
+  model->calc(data, r);
+  model->calcDiff(data, r);
+
+  // Checking that a scalar Hessian is a multiple of the identity matrix
+  if (model->get_hessian_type() == crocoddyl::ScalarHessian) {
+    const Eigen::VectorXd& Arr = data->Arr.diagonal();
+    BOOST_CHECK((Arr.array() == Arr[0]).all());
+  }
+}
+
 //----------------------------------------------------------------------------//
 
 void register_unit_tests(ActivationModelTypes::Type activation_type) {
@@ -101,6 +124,7 @@ void register_unit_tests(ActivationModelTypes::Type activation_type) {
       boost::bind(&test_calc_returns_a_value, activation_type)));
   ts->add(BOOST_TEST_CASE(
       boost::bind(&test_partial_derivatives_against_numdiff, activation_type)));
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_hessian_type, activation_type)));
   framework::master_test_suite().add(ts);
 }
 
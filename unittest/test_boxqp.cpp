@@ -145,6 +145,91 @@ void test_box_qp_with_identity_hessian() {
   BOOST_CHECK(sol_reg.clamped_idx.size() == nc_reg);
 }
 
+void test_box_qp_warmstart() {
+  std::size_t nx = random_int_in_range(2, 10);
+  crocoddyl::BoxQP boxqp(nx);
+  crocoddyl::BoxQP boxqp_warm(nx);
+
+  Eigen::MatrixXd H = Eigen::MatrixXd::Random(nx, nx);
+  Eigen::MatrixXd hessian = H.transpose() * H;
+  hessian.diagonal().array() += 1.;
+  Eigen::VectorXd gradient = 10. * Eigen::VectorXd::Random(nx);
+  Eigen::VectorXd lb = -Eigen::VectorXd::Ones(nx);
+  Eigen::VectorXd ub = Eigen::VectorXd::Ones(nx);
+  Eigen::VectorXd xinit = Eigen::VectorXd::Zero(nx);
+  crocoddyl::BoxQPSolution sol = boxqp.solve(hessian, gradient, lb, ub, xinit);
+
+  // Warm-starting from the solution returns the same solution and active set
+  crocoddyl::BoxQPSolution sol_warm =
+      boxqp_warm.solve(hessian, gradient, lb, ub, sol);
+  BOOST_CHECK((sol_warm.x - sol.x).isZero(1e-7));
+  BOOST_CHECK(sol_warm.free_idx == sol.free_idx);
+  BOOST_CHECK(sol_warm.clamped_idx == sol.clamped_idx);
+  BOOST_CHECK((sol_warm.Hff_inv - sol.Hff_inv).isZero(1e-7));
+
+  // Warm-starting a perturbed problem converges to its cold-start solution
+  gradient += 0.1 * Eigen::VectorXd::Random(nx);
+  sol = boxqp.solve(hessian, gradient, lb, ub, xinit);
+  sol_warm = boxqp_warm.solve(hessian, gradient, lb, ub, sol_warm);
+  BOOST_CHECK((sol_warm.x - sol.x).isZero(1e-7));
+  BOOST_CHECK(sol_warm.free_idx.size() == sol.free_idx.size());
+  BOOST_CHECK(sol_warm.clamped_idx.size() == sol.clamped_idx.size());
+
+  // Checking the inverse of the free Hessian
+  const std::size_t nf = sol_warm.free_idx.size();
+  Eigen::MatrixXd Hff(nf, nf);
+  for (std::size_t i = 0; i < nf; ++i) {
+    for (std::size_t j = 0; j < nf; ++j) {
+      Hff(i, j) = hessian(sol_warm.free_idx[i], sol_warm.free_idx[j]);
+    }
+  }
+  Hff.diagonal().array() += boxqp_warm.get_reg();
+  BOOST_CHECK((Hff * sol_warm.Hff_inv - Eigen::MatrixXd::Identity(nf, nf))
+                  .isZero(1e-7));
+}
+
+void test_box_qp_warmstart_with_new_bounds() {
+  crocoddyl::BoxQP boxqp(2);
+  crocoddyl::BoxQP boxqp_warm(2);
+
+  // The first variable is clamped to its upper bound, while the second one is
+  // free
+  Eigen::MatrixXd hessian(2, 2);
+  hessian << 2., 1., 1., 2.;
+  Eigen::VectorXd gradient(2);
+  gradient << -5., 0.;
+  Eigen::VectorXd lb = -Eigen::VectorXd::Ones(2);
+  Eigen::VectorXd ub = Eigen::VectorXd::Ones(2);
+  Eigen::VectorXd xinit = Eigen::VectorXd::Zero(2);
+  crocoddyl::BoxQPSolution sol_prev =
+      boxqp.solve(hessian, gradient, lb, ub, xinit);
+  BOOST_CHECK(sol_prev.clamped_idx.size() == 1);
+  BOOST_CHECK(sol_prev.clamped_idx[0] == 0);
+
+  // Solving with shifted bounds from scratch
+  lb *= 1.05;
+  ub *= 1.05;
+  crocoddyl::BoxQPSolution sol = boxqp.solve(hessian, gradient, lb, ub, xinit);
+  BOOST_CHECK(sol.clamped_idx == sol_prev.clamped_idx);
+
+  // The warm start seeds the active set, which has not changed, so a single
+  // Newton step reaches the solution
+  boxqp_warm.set_maxiter(1);
+  crocoddyl::BoxQPSolution sol_warm =
+      boxqp_warm.solve(hessian, gradient, lb, ub, sol_prev);
+  BOOST_CHECK((sol_warm.x - sol.x).isZero(1e-9));
+  BOOST_CHECK(sol_warm.free_idx == sol.free_idx);
+  BOOST_CHECK(sol_warm.clamped_idx == sol.clamped_idx);
+
+  // A warm start without active set only uses the decision vector
+  crocoddyl::BoxQPSolution warmstart(sol_prev);
+  warmstart.free_idx.clear();
+  warmstart.clamped_idx.clear();
+  boxqp_warm.set_maxiter(100);
+  sol_warm = boxqp_warm.solve(hessian, gradient, lb, ub, warmstart);
+  BOOST_CHECK((sol_warm.x - sol.x).isZero(1e-9));
+}
+
 void register_unit_tests() {
   framework::master_test_suite().add(
       BOOST_TEST_CASE(boost::bind(&test_constructor)));
@@ -154,6 +239,10 @@ void register_unit_tests() {
       BOOST_TEST_CASE(boost::bind(&test_unconstrained_qp)));
   framework::master_test_suite().add(
       BOOST_TEST_CASE(boost::bind(&test_box_qp_with_identity_hessian)));
+  framework::master_test_suite().add(
+      BOOST_TEST_CASE(boost::bind(&test_box_qp_warmstart)));
+  framework::master_test_suite().add(
+      BOOST_TEST_CASE(boost::bind(&test_box_qp_warmstart_with_new_bounds)));
 }
 
 bool init_function() {
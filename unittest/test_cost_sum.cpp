@@ -341,6 +341,69 @@ void test_calcDiff(StateModelTypes::Type state_type) {
   BOOST_CHECK(data->Lxx == Lxx);
 }
 
+void test_calcDiff_fused(StateModelTypes::Type state_type) {
+  // setup the test
+  StateModelFactory state_factory;
+  crocoddyl::CostModelSum model(state_factory.create(state_type));
+  // create the corresponding data object
+  const boost::shared_ptr<crocoddyl::StateMultibody>& state =
+      boost::static_pointer_cast<crocoddyl::StateMultibody>(model.get_state());
+  pinocchio::Model& pinocchio_model = *state->get_pinocchio().get();
+  pinocchio::Data pinocchio_data(pinocchio_model);
+  crocoddyl::DataCollectorMultibody shared_data(&pinocchio_data);
+
+  // create and add some cost objects
+  for (std::size_t i = 0; i < 5; ++i) {
+    std::ostringstream os;
+    os << "random_cost_" << i;
+    model.addCost(os.str(), create_random_cost(state_type),
+                  Eigen::VectorXd::Random(1).cwiseAbs()[0]);
+  }
+  model.changeCostStatus("random_cost_4", false);
+
+  // create the data of the cost sum for both modes, where only the data of
+  // the fused mode allocates the stacked Jacobians
+  const boost::shared_ptr<crocoddyl::CostDataSum>& data =
+      model.createData(&shared_data);
+  model.set_fused(true);
+  BOOST_CHECK(model.get_fused());
+  const boost::shared_ptr<crocoddyl::CostDataSum>& data_fused =
+      model.createData(&shared_data);
+  BOOST_CHECK_EQUAL(data->Lstack.size(), 0);
+  BOOST_CHECK_EQUAL(data_fused->Lstack.cols(),
+                    state->get_ndx() + model.get_nu());
+  BOOST_CHECK_EQUAL(data_fused->Rstack.rows(), model.get_nr_total());
+
+  // compute the derivatives with and without the fused mode
+  const Eigen::VectorXd x = state->rand();
+  const Eigen::VectorXd u = Eigen::VectorXd::Random(model.get_nu());
+  crocoddyl::unittest::updateAllPinocchio(&pinocchio_model, &pinocchio_data, x);
+  model.calc(data_fused, x, u);
+  model.calcDiff(data_fused, x, u);
+  BOOST_CHECK_THROW(model.calcDiff(data, x, u), std::exception);
+  model.set_fused(false);
+  model.calc(data, x, u);
+  model.calcDiff(data, x, u);
+
+  // check that both modes provide the same derivatives
+  const double tol = sqrt(2.0 * std::numeric_limits<double>::epsilon());
+  BOOST_CHECK((data->Lx - data_fused->Lx).isZero(tol));
+  BOOST_CHECK((data->Lu - data_fused->Lu).isZero(tol));
+  BOOST_CHECK((data->Lxx - data_fused->Lxx).isZero(tol));
+  BOOST_CHECK((data->Lxu - data_fused->Lxu).isZero(tol));
+  BOOST_CHECK((data->Luu - data_fused->Luu).isZero(tol));
+
+  // check the terminal case
+  model.set_fused(false);
+  model.calc(data, x);
+  model.calcDiff(data, x);
+  model.set_fused(true);
+  model.calc(data_fused, x);
+  model.calcDiff(data_fused, x);
+  BOOST_CHECK((data->Lx - data_fused->Lx).isZero(tol));
+  BOOST_CHECK((data->Lxx - data_fused->Lxx).isZero(tol));
+}
+
 void test_get_costs(StateModelTypes::Type state_type) {
   // setup the test
   StateModelFactory state_factory;
@@ -447,6 +510,7 @@ void register_unit_tests(StateModelTypes::Type state_type) {
       BOOST_TEST_CASE(boost::bind(&test_removeCost_error_message, state_type)));
   ts->add(BOOST_TEST_CASE(boost::bind(&test_calc, state_type)));
   ts->add(BOOST_TEST_CASE(boost::bind(&test_calcDiff, state_type)));
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_calcDiff_fused, state_type)));
   ts->add(BOOST_TEST_CASE(boost::bind(&test_get_costs, state_type)));
   ts->add(BOOST_TEST_CASE(boost::bind(&test_get_nr, state_type)));
   ts->add(BOOST_TEST_CASE(boost::bind(&test_shareMemory, state_type)));
@@ -11,7 +11,11 @@
 #define BOOST_TEST_NO_MAIN
 #define BOOST_TEST_ALTERNATIVE_INIT_API
 
+#include "crocoddyl/core/activations/weighted-quadratic.hpp"
+#include "crocoddyl/core/costs/residual.hpp"
 #include "crocoddyl/multibody/data/multibody.hpp"
+#include "crocoddyl/multibody/residuals/frame-placement.hpp"
+#include "crocoddyl/multibody/residuals/state.hpp"
 #include "factory/cost.hpp"
 #include "unittest_common.hpp"
 
@@ -246,6 +250,122 @@ void test_partial_derivatives_in_cost_sum(
   BOOST_CHECK((data->Luu - data_sum->Luu).isZero());
 }
 
+void test_set_frame_against_numdiff(StateModelTypes::Type state_type) {
+  using namespace boost::placeholders;
+
+  // create the cost of the last frame, which has the longest kinematic chain
+  StateModelFactory state_factory;
+  const boost::shared_ptr<crocoddyl::StateMultibody>& state =
+      boost::static_pointer_cast<crocoddyl::StateMultibody>(
+          state_factory.create(state_type));
+  pinocchio::Model& pinocchio_model = *state->get_pinocchio().get();
+  pinocchio::Data pinocchio_data(pinocchio_model);
+  crocoddyl::DataCollectorMultibody shared_data(&pinocchio_data);
+  const boost::shared_ptr<crocoddyl::ResidualModelFramePlacement>& residual =
+      boost::make_shared<crocoddyl::ResidualModelFramePlacement>(
+          state, pinocchio_model.frames.size() - 1, pinocchio::SE3::Random(),
+          state->get_nv());
+  const boost::shared_ptr<crocoddyl::CostModelAbstract>& model =
+      boost::make_shared<crocoddyl::CostModelResidual>(state, residual);
+  const boost::shared_ptr<crocoddyl::CostDataAbstract>& data =
+      model->createData(&shared_data);
+
+  // Create the equivalent num diff model and data.
+  crocoddyl::CostModelNumDiff model_num_diff(model);
+  const boost::shared_ptr<crocoddyl::CostDataAbstract>& data_num_diff =
+      model_num_diff.createData(&shared_data);
+  std::vector<crocoddyl::CostModelNumDiff::ReevaluationFunction> reevals;
+  reevals.push_back(boost::bind(&crocoddyl::unittest::updateAllPinocchio,
+                                &pinocchio_model, &pinocchio_data, _1, _2));
+  model_num_diff.set_reevals(reevals);
+
+  // Computing the cost derivatives for the first frame
+  const Eigen::VectorXd x = state->rand();
+  const Eigen::VectorXd u = Eigen::VectorXd::Random(model->get_nu());
+  crocoddyl::unittest::updateAllPinocchio(&pinocchio_model, &pinocchio_data, x);
+  model->calc(data, x, u);
+  model->calcDiff(data, x, u);
+
+  // Move the cost to a frame of the first joint, whose kinematic chain is
+  // shorter, and compute the cost derivatives with the same data
+  pinocchio::FrameIndex id = 0;
+  while (pinocchio_model.frames[id].parent != 1) {
+    ++id;
+  }
+  residual->set_id(id);
+  model->calc(data, x, u);
+  model->calcDiff(data, x, u);
+  model_num_diff.calc(data_num_diff, x, u);
+  model_num_diff.calcDiff(data_num_diff, x, u);
+
+  // Checking that the blocks of the previous frame were cleared
+  double tol = std::pow(model_num_diff.get_disturbance(), 1. / 3.);
+  BOOST_CHECK((data->Lx - data_num_diff->Lx).isZero(tol));
+  BOOST_CHECK((data->Lxx - data_num_diff->Lxx).isZero(tol));
+  BOOST_CHECK((data->Lxu - data_num_diff->Lxu).isZero(tol));
+}
+
+void test_scalar_against_diagonal_hessian(StateModelTypes::Type state_type) {
+  // create a dense and a sparse residual
+  StateModelFactory state_factory;
+  const boost::shared_ptr<crocoddyl::StateMultibody>& state =
+      boost::static_pointer_cast<crocoddyl::StateMultibody>(
+          state_factory.create(state_type));
+  pinocchio::Model& pinocchio_model = *state->get_pinocchio().get();
+  pinocchio::Data pinocchio_data(pinocchio_model);
+  crocoddyl::DataCollectorMultibody shared_data(&pinocchio_data);
+  const std::size_t nu = state->get_nv();
+  std::vector<boost::shared_ptr<crocoddyl::ResidualModelAbstract> > residuals;
+  residuals.push_back(
+      boost::make_shared<crocoddyl::ResidualModelState>(state, nu));
+  residuals.push_back(
+      boost::make_shared<crocoddyl::ResidualModelFramePlacement>(
+          state, pinocchio_model.frames.size() - 1, pinocchio::SE3::Random(),
+          nu));
+
+  // Generating random values for the state and control
+  const Eigen::VectorXd x = state->rand();
+  const Eigen::VectorXd u = Eigen::VectorXd::Random(nu);
+  crocoddyl::unittest::updateAllPinocchio(&pinocchio_model, &pinocchio_data, x);
+
+  for (std::size_t i = 0; i < residuals.size(); ++i) {
+    // create the same cost with a scalar and a diagonal activation Hessian
+    const std::size_t nr = residuals[i]->get_nr();
+    crocoddyl::CostModelResidual scalar(
+        state, boost::make_shared<crocoddyl::ActivationModelQuad>(nr),
+        residuals[i]);
+    crocoddyl::CostModelResidual diagonal(
+        state,
+        boost::make_shared<crocoddyl::ActivationModelWeightedQuad>(
+            Eigen::VectorXd::Ones(nr)),
+        residuals[i]);
+    const boost::shared_ptr<crocoddyl::CostDataAbstract>& scalar_data =
+        scalar.createData(&shared_data);
+    const boost::shared_ptr<crocoddyl::CostDataAbstract>& diagonal_data =
+        diagonal.createData(&shared_data);
+
+    // Computing the cost derivatives
+    scalar.calc(scalar_data, x, u);
+    scalar.calcDiff(scalar_data, x, u);
+    diagonal.calc(diagonal_data, x, u);
+    diagonal.calcDiff(diagonal_data, x, u);
+
+    // Checking that both paths give the same derivatives, and that the
+    // products of the activation Hessian are only allocated when needed
+    BOOST_CHECK(scalar_data->residual->Arr_Rx.size() == 0);
+    BOOST_CHECK(scalar_data->residual->Arr_Ru.size() == 0);
+    BOOST_CHECK(diagonal_data->residual->Arr_Rx.rows() ==
+                static_cast<Eigen::Index>(nr));
+    BOOST_CHECK(residuals[i]->createData(&shared_data)->Arr_Rx.rows() ==
+                static_cast<Eigen::Index>(nr));
+    BOOST_CHECK((scalar_data->Lx - diagonal_data->Lx).isZero(1e-9));
+    BOOST_CHECK((scalar_data->Lu - diagonal_data->Lu).isZero(1e-9));
+    BOOST_CHECK((scalar_data->Lxx - diagonal_data->Lxx).isZero(1e-9));
+    BOOST_CHECK((scalar_data->Lxu - diagonal_data->Lxu).isZero(1e-9));
+    BOOST_CHECK((scalar_data->Luu - diagonal_data->Luu).isZero(1e-9));
+  }
+}
+
 //----------------------------------------------------------------------------//
 
 void register_cost_model_unit_tests(
@@ -269,6 +389,18 @@ void register_cost_model_unit_tests(
   framework::master_test_suite().add(ts);
 }
 
+void register_cost_residual_unit_tests(StateModelTypes::Type state_type) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_cost_residual_" << state_type;
+  std::cout << "Running " << test_name.str() << std::endl;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_set_frame_against_numdiff, state_type)));
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_scalar_against_diagonal_hessian, state_type)));
+  framework::master_test_suite().add(ts);
+}
+
 bool init_function() {
   // Test all costs available with all the activation types with all available
   // states types.
@@ -286,6 +418,11 @@ bool init_function() {
       }
     }
   }
+  for (size_t state_type =
+           StateModelTypes::all[StateModelTypes::StateMultibody_TalosArm];
+       state_type < StateModelTypes::all.size(); ++state_type) {
+    register_cost_residual_unit_tests(StateModelTypes::all[state_type]);
+  }
   return true;
 }
 
@@ -9,6 +9,10 @@
 #define BOOST_TEST_NO_MAIN
 #define BOOST_TEST_ALTERNATIVE_INIT_API
 
+#ifdef CROCODDYL_WITH_MULTITHREADING
+#include <omp.h>
+#endif  // CROCODDYL_WITH_MULTITHREADING
+
 #include "crocoddyl/core/integrator/euler.hpp"
 #include "crocoddyl/core/optctrl/shooting.hpp"
 #include "factory/action.hpp"
@@ -196,6 +200,100 @@ void test_calcDiff(ActionModelTypes::Type action_model_type) {
   BOOST_CHECK((problem2.get_terminalData()->Lxx - data->Lxx).isZero(1e-9));
 }
 
+void test_schedule(ActionModelTypes::Type action_model_type) {
+  // create the model
+  ActionModelFactory factory;
+  const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model =
+      factory.create(action_model_type);
+
+  // create the shooting problem
+  std::size_t T = 20;
+  const Eigen::VectorXd& x0 = model->get_state()->rand();
+  std::vector<boost::shared_ptr<crocoddyl::ActionModelAbstract> > models(T,
+                                                                         model);
+  crocoddyl::ShootingProblem problem(x0, models, model);
+
+  // create random trajectory
+  std::vector<Eigen::VectorXd> xs(T + 1);
+  std::vector<Eigen::VectorXd> us(T);
+  for (std::size_t i = 0; i < T; ++i) {
+    xs[i] = model->get_state()->rand();
+    us[i] = Eigen::VectorXd::Random(model->get_nu());
+  }
+  xs.back() = model->get_state()->rand();
+
+  // check the derivatives in each node for all the scheduling policies
+  const crocoddyl::ParallelSchedule schedules[] = {
+      crocoddyl::StaticSchedule, crocoddyl::DynamicSchedule,
+      crocoddyl::GuidedSchedule, crocoddyl::BalancedSchedule};
+  for (std::size_t s = 0; s < 4; ++s) {
+    problem.set_schedule(schedules[s]);
+    problem.set_chunksize(s);
+    BOOST_CHECK(problem.get_schedule() == schedules[s]);
+    BOOST_CHECK(problem.get_chunksize() == s);
+#ifdef CROCODDYL_WITH_MULTITHREADING
+    omp_sched_t kind, kind_after;
+    int chunksize, chunksize_after;
+    omp_get_schedule(&kind, &chunksize);
+#endif
+    const double cost = problem.calc(xs, us);
+    BOOST_CHECK(std::abs(problem.calcDiff(xs, us) - cost) <= 1e-9);
+#ifdef CROCODDYL_WITH_MULTITHREADING
+    // the runtime schedule of the host program is not modified
+    omp_get_schedule(&kind_after, &chunksize_after);
+    BOOST_CHECK(kind_after == kind);
+    BOOST_CHECK(chunksize_after == chunksize);
+#endif
+    for (std::size_t i = 0; i < T; ++i) {
+      const boost::shared_ptr<crocoddyl::ActionDataAbstract>& data =
+          model->createData();
+      model->calc(data, xs[i], us[i]);
+      model->calcDiff(data, xs[i], us[i]);
+      BOOST_CHECK(
+          (problem.get_runningDatas()[i]->xnext - data->xnext).isZero(1e-9));
+      BOOST_CHECK((problem.get_runningDatas()[i]->Fx - data->Fx).isZero(1e-9));
+      BOOST_CHECK((problem.get_runningDatas()[i]->Lx - data->Lx).isZero(1e-9));
+      BOOST_CHECK(
+          (problem.get_runningDatas()[i]->Luu - data->Luu).isZero(1e-9));
+    }
+    const boost::shared_ptr<crocoddyl::ActionDataAbstract>& data =
+        model->createData();
+    model->calc(data, xs.back());
+    model->calcDiff(data, xs.back());
+    BOOST_CHECK((problem.get_terminalData()->Lxx - data->Lxx).isZero(1e-9));
+  }
+
+  // check the per-node timings measured by the balanced policy
+  const Eigen::VectorXd& calc_timings = problem.get_calc_timings();
+  const Eigen::VectorXd& calcDiff_timings = problem.get_calcDiff_timings();
+  BOOST_CHECK(static_cast<std::size_t>(calc_timings.size()) == T + 1);
+  BOOST_CHECK(static_cast<std::size_t>(calcDiff_timings.size()) == T + 1);
+  BOOST_CHECK((calc_timings.array() >= 0.).all());
+  BOOST_CHECK((calcDiff_timings.array() >= 0.).all());
+  BOOST_CHECK(calcDiff_timings.sum() > 0.);
+  const double last_timing = calcDiff_timings[1];
+  problem.circularAppend(model);
+  BOOST_CHECK(problem.get_calcDiff_timings()[0] == last_timing);
+  BOOST_CHECK(problem.get_calcDiff_timings()[T - 1] == 0.);
+
+  // check that the timings of the replaced models are reset
+  problem.calcDiff(xs, us);
+  BOOST_CHECK(problem.get_calcDiff_timings()[1] > 0.);
+  BOOST_CHECK(problem.get_calcDiff_timings()[T] > 0.);
+  problem.updateModel(1, model);
+  problem.set_terminalModel(model);
+  BOOST_CHECK(problem.get_calc_timings()[1] == 0.);
+  BOOST_CHECK(problem.get_calcDiff_timings()[1] == 0.);
+  BOOST_CHECK(problem.get_calc_timings()[T] == 0.);
+  BOOST_CHECK(problem.get_calcDiff_timings()[T] == 0.);
+
+  // check that the copy keeps the scheduling policy
+  crocoddyl::ShootingProblem problem_copy(problem);
+  BOOST_CHECK(problem_copy.get_schedule() == problem.get_schedule());
+  BOOST_CHECK(problem_copy.get_chunksize() == problem.get_chunksize());
+  BOOST_CHECK(problem_copy.get_nthreads() == problem.get_nthreads());
+}
+
 void test_calcDiff_diffAction(
     DifferentialActionModelTypes::Type action_model_type,
     IntegratorTypes::Type integrator_type) {
@@ -446,6 +544,7 @@ void register_action_model_unit_tests(
   ts->add(BOOST_TEST_CASE(boost::bind(&test_calcDiff, action_model_type)));
   ts->add(BOOST_TEST_CASE(boost::bind(&test_quasiStatic, action_model_type)));
   ts->add(BOOST_TEST_CASE(boost::bind(&test_rollout, action_model_type)));
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_schedule, action_model_type)));
   framework::master_test_suite().add(ts);
 }
 
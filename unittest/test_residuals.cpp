@@ -65,7 +65,9 @@ void test_calc_returns_a_residual(ResidualModelTypes::Type residual_type,
 
   // Getting the residual value computed by calc()
   data->r *= nan("");
+  CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED();
   model->calc(data, x, u);
+  CROCODDYL_EIGEN_MALLOC_ALLOWED();
 
   // Checking that calc returns a residual value
   for (std::size_t i = 0; i < model->get_nr(); ++i)
@@ -168,8 +170,10 @@ void test_partial_derivatives_against_numdiff(
   crocoddyl::unittest::updateAllPinocchio(&pinocchio_model, &pinocchio_data, x);
   actuation_model->calc(actuation_data, x, u);
   actuation_model->calcDiff(actuation_data, x, u);
+  CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED();
   model->calc(data, x, u);
   model->calcDiff(data, x, u);
+  CROCODDYL_EIGEN_MALLOC_ALLOWED();
 
   // Computing the residual derivatives via numerical differentiation
   std::vector<crocoddyl::ResidualModelNumDiff::ReevaluationFunction> reevals;
@@ -188,6 +192,17 @@ void test_partial_derivatives_against_numdiff(
   BOOST_CHECK((data->Rx - data_num_diff->Rx).isZero(tol));
   BOOST_CHECK((data->Ru - data_num_diff->Ru).isZero(tol));
 
+  // Checking that the Jacobian is zero outside the supported columns
+  const crocoddyl::ResidualModelAbstract::ColumnBlocks& support =
+      model->get_x_support();
+  if (!support.empty()) {
+    Eigen::MatrixXd Rx = data_num_diff->Rx;
+    for (std::size_t i = 0; i < support.size(); ++i) {
+      Rx.middleCols(support[i].first, support[i].second).setZero();
+    }
+    BOOST_CHECK(Rx.isZero(tol));
+  }
+
   // Computing the residual derivatives
   x = model->get_state()->rand();
   crocoddyl::unittest::updateAllPinocchio(&pinocchio_model, &pinocchio_data, x);
@@ -195,8 +210,10 @@ void test_partial_derivatives_against_numdiff(
   actuation_model->calcDiff(actuation_data, x);
 
   // Computing the residual derivatives via numerical differentiation
+  CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED();
   model->calc(data, x);
   model->calcDiff(data, x);
+  CROCODDYL_EIGEN_MALLOC_ALLOWED();
   model_num_diff.calc(data_num_diff, x);
   model_num_diff.calcDiff(data_num_diff, x);
 
@@ -204,6 +221,85 @@ void test_partial_derivatives_against_numdiff(
   BOOST_CHECK((data->Rx - data_num_diff->Rx).isZero(tol));
 }
 
+void test_frame_kinematics_cache(ResidualModelTypes::Type residual_type,
+                                 StateModelTypes::Type state_type,
+                                 ActuationModelTypes::Type actuation_type) {
+  // Create the model
+  ResidualModelFactory residual_factory;
+  ActuationModelFactory actuation_factory;
+  boost::shared_ptr<crocoddyl::ActuationModelAbstract> actuation_model =
+      actuation_factory.create(actuation_type, state_type);
+  const boost::shared_ptr<crocoddyl::ResidualModelAbstract>& model =
+      residual_factory.create(residual_type, state_type,
+                              actuation_model->get_nu());
+
+  // Create the shared data with and without the frame kinematics cache
+  const boost::shared_ptr<crocoddyl::StateMultibody>& state =
+      boost::static_pointer_cast<crocoddyl::StateMultibody>(model->get_state());
+  pinocchio::Model& pinocchio_model = *state->get_pinocchio().get();
+  pinocchio::Data pinocchio_data(pinocchio_model);
+  pinocchio::Data pinocchio_data_ref(pinocchio_model);
+  const boost::shared_ptr<crocoddyl::ActuationDataAbstract>& actuation_data =
+      actuation_model->createData();
+  crocoddyl::DataCollectorActMultibody shared_data(&pinocchio_data,
+                                                   actuation_data);
+  crocoddyl::DataCollectorActMultibody shared_data_ref(&pinocchio_data_ref,
+                                                       actuation_data);
+
+  // Create two residual data that share the cache, and a reference one
+  const boost::shared_ptr<crocoddyl::ResidualDataAbstract>& data1 =
+      model->createData(&shared_data);
+  const boost::shared_ptr<crocoddyl::ResidualDataAbstract>& data2 =
+      model->createData(&shared_data);
+  const boost::shared_ptr<crocoddyl::ResidualDataAbstract>& data_ref =
+      model->createData(&shared_data_ref);
+
+  // Check that the cached kinematics are updated for each new state
+  for (std::size_t i = 0; i < 2; ++i) {
+    const Eigen::VectorXd x = model->get_state()->rand();
+    const Eigen::VectorXd u = Eigen::VectorXd::Random(model->get_nu());
+    crocoddyl::unittest::updateAllPinocchio(&pinocchio_model, &pinocchio_data,
+                                            x);
+    crocoddyl::unittest::updateAllPinocchio(&pinocchio_model,
+                                            &pinocchio_data_ref, x);
+    actuation_model->calc(actuation_data, x, u);
+    actuation_model->calcDiff(actuation_data, x, u);
+    {
+      const crocoddyl::FrameKinematicsCacheGuard cache_guard(
+          shared_data.frame_cache);
+      CROCODDYL_EIGEN_MALLOC_NOT_ALLOWED();
+      model->calc(data1, x, u);
+      model->calc(data2, x, u);
+      model->calcDiff(data1, x, u);
+      model->calcDiff(data2, x, u);
+      CROCODDYL_EIGEN_MALLOC_ALLOWED();
+    }
+    BOOST_CHECK(shared_data.frame_cache.stamp == 0);
+    model->calc(data_ref, x, u);
+    model->calcDiff(data_ref, x, u);
+
+    BOOST_CHECK((data1->r - data_ref->r).isZero(1e-9));
+    BOOST_CHECK((data2->r - data_ref->r).isZero(1e-9));
+    BOOST_CHECK((data1->Rx - data_ref->Rx).isZero(1e-9));
+    BOOST_CHECK((data2->Rx - data_ref->Rx).isZero(1e-9));
+  }
+
+  // Check that a released cache does not hide a new update of the kinematics
+  const Eigen::VectorXd x = model->get_state()->rand();
+  const Eigen::VectorXd u = Eigen::VectorXd::Random(model->get_nu());
+  crocoddyl::unittest::updateAllPinocchio(&pinocchio_model, &pinocchio_data, x);
+  crocoddyl::unittest::updateAllPinocchio(&pinocchio_model, &pinocchio_data_ref,
+                                          x);
+  actuation_model->calc(actuation_data, x, u);
+  actuation_model->calcDiff(actuation_data, x, u);
+  model->calc(data1, x, u);
+  model->calcDiff(data1, x, u);
+  model->calc(data_ref, x, u);
+  model->calcDiff(data_ref, x, u);
+  BOOST_CHECK((data1->r - data_ref->r).isZero(1e-9));
+  BOOST_CHECK((data1->Rx - data_ref->Rx).isZero(1e-9));
+}
+
 void test_reference() {
   ResidualModelFactory factory;
   StateModelTypes::Type state_type = StateModelTypes::StateMultibody_Talos;
@@ -277,6 +373,9 @@ void register_residual_model_unit_tests(
   ts->add(
       BOOST_TEST_CASE(boost::bind(&test_partial_derivatives_against_numdiff,
                                   residual_type, state_type, actuation_type)));
+  ts->add(
+      BOOST_TEST_CASE(boost::bind(&test_frame_kinematics_cache, residual_type,
+                                  state_type, actuation_type)));
   framework::master_test_suite().add(ts);
 }
 
@@ -11,6 +11,14 @@
 #define BOOST_TEST_NO_MAIN
 #define BOOST_TEST_ALTERNATIVE_INIT_API
 
+#include <atomic>
+#include <cstdlib>
+
+#include "crocoddyl/core/actions/diff-lqr.hpp"
+#include "crocoddyl/core/integrator/euler.hpp"
+#include "crocoddyl/core/solvers/batch.hpp"
+#include "crocoddyl/core/solvers/intro.hpp"
+#include "crocoddyl/core/solvers/mppi.hpp"
 #include "crocoddyl/core/utils/callbacks.hpp"
 #include "factory/solver.hpp"
 #include "unittest_common.hpp"
@@ -18,6 +26,20 @@
 using namespace boost::unit_test;
 using namespace crocoddyl::unittest;
 
+#ifdef __GLIBC__
+// Count the heap allocations of this executable by wrapping the glibc
+// allocator, which is used by Eigen and by the standard containers
+extern "C" void* __libc_malloc(std::size_t size);
+static std::atomic<bool> malloc_counting(false);
+static std::atomic<std::size_t> malloc_count(0);
+extern "C" void* malloc(std::size_t size) {
+  if (malloc_counting) {
+    ++malloc_count;
+  }
+  return __libc_malloc(size);
+}
+#endif  // __GLIBC__
+
 //____________________________________________________________________________//
 
 void test_kkt_dimension(ActionModelTypes::Type action_type, size_t T) {
@@ -85,6 +107,89 @@ void test_kkt_search_direction(ActionModelTypes::Type action_type, size_t T) {
 
 //____________________________________________________________________________//
 
+void test_kkt_sparse_factorization(ActionModelTypes::Type action_type,
+                                   size_t T) {
+  // Create the kkt solver
+  SolverFactory factory;
+  boost::shared_ptr<crocoddyl::SolverKKT> kkt =
+      boost::static_pointer_cast<crocoddyl::SolverKKT>(
+          factory.create(SolverTypes::SolverKKT, action_type, T));
+  const boost::shared_ptr<crocoddyl::ShootingProblem>& problem =
+      kkt->get_problem();
+  const boost::shared_ptr<crocoddyl::StateAbstract>& state =
+      problem->get_runningModels()[0]->get_state();
+  const std::size_t ndx = kkt->get_ndx();
+  const std::size_t nu = kkt->get_nu();
+  const std::size_t ndxi = state->get_ndx();
+  const std::size_t nui = problem->get_runningModels()[0]->get_nu();
+
+  // Compute the search direction twice, so the values of the sparse KKT
+  // matrix are updated in place
+  for (std::size_t k = 0; k < 2; ++k) {
+    std::vector<Eigen::VectorXd> xs;
+    std::vector<Eigen::VectorXd> us;
+    for (std::size_t i = 0; i < T; ++i) {
+      const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model =
+          problem->get_runningModels()[i];
+      xs.push_back(state->rand());
+      us.push_back(Eigen::VectorXd::Random(model->get_nu()));
+    }
+    xs.push_back(state->rand());
+    kkt->setCandidate(xs, us);
+    kkt->computeDirection();
+
+    // Check the blocks of the first node
+    const Eigen::MatrixXd kkt_mat = kkt->get_kkt();
+    const boost::shared_ptr<crocoddyl::ActionDataAbstract>& data =
+        problem->get_runningDatas()[0];
+    BOOST_CHECK((kkt_mat.block(0, 0, ndxi, ndxi) - data->Lxx).isZero(1e-9));
+    BOOST_CHECK((kkt_mat.block(0, ndx, ndxi, nui) - data->Lxu).isZero(1e-9));
+    BOOST_CHECK((kkt_mat.block(ndx, 0, nui, ndxi) - data->Lxu.transpose())
+                    .isZero(1e-9));
+    BOOST_CHECK((kkt_mat.block(ndx, ndx, nui, nui) - data->Luu).isZero(1e-9));
+    const std::size_t r = ndx + nu + ndxi;  // dynamics of the first node
+    BOOST_CHECK((kkt_mat.block(r, 0, ndxi, ndxi) + data->Fx).isZero(1e-9));
+    BOOST_CHECK((kkt_mat.block(r, ndx, ndxi, nui) + data->Fu).isZero(1e-9));
+
+    // Check the sparse factorization against the dense one
+    const Eigen::VectorXd primaldual = kkt_mat.lu().solve(-kkt->get_kktref());
+    BOOST_CHECK((kkt->get_primaldual() - primaldual).isZero(1e-9));
+
+    // Check that a copy of the solver builds its own factorization
+    crocoddyl::SolverKKT kkt_copy(*kkt);
+    kkt_copy.computeDirection();
+    BOOST_CHECK((kkt_copy.get_primaldual() - primaldual).isZero(1e-9));
+  }
+}
+
+//____________________________________________________________________________//
+
+void test_kkt_max_time(ActionModelTypes::Type action_type, size_t T) {
+  // Create the kkt solver
+  SolverFactory factory;
+  boost::shared_ptr<crocoddyl::SolverKKT> kkt =
+      boost::static_pointer_cast<crocoddyl::SolverKKT>(
+          factory.create(SolverTypes::SolverKKT, action_type, T));
+
+  // Solve the problem without time budget
+  kkt->solve();
+  const crocoddyl::SolverStatus status = kkt->get_status();
+  const double cost = kkt->get_cost();
+
+  // Check that the solver stops once the time budget is exhausted
+  kkt->set_max_time(1e-6);
+  BOOST_CHECK(!kkt->solve());
+  BOOST_CHECK(kkt->get_status() == crocoddyl::MaxTimeReached);
+
+  // Check that a large time budget does not affect the solver
+  kkt->set_max_time(1e6);
+  kkt->solve();
+  BOOST_CHECK(kkt->get_status() == status);
+  BOOST_CHECK(std::abs(kkt->get_cost() - cost) <= 1e-9 * (1. + std::abs(cost)));
+}
+
+//____________________________________________________________________________//
+
 void test_solver_against_kkt_solver(SolverTypes::Type solver_type,
                                     ActionModelTypes::Type action_type,
                                     size_t T) {
@@ -149,6 +254,578 @@ void test_solver_against_kkt_solver(SolverTypes::Type solver_type,
 
 //____________________________________________________________________________//
 
+void test_solver_parallel_backward(SolverTypes::Type solver_type,
+                                   ActionModelTypes::Type action_type,
+                                   size_t T) {
+  // Create the testing solver
+  SolverFactory solver_factory;
+  boost::shared_ptr<crocoddyl::SolverDDP> solver =
+      boost::static_pointer_cast<crocoddyl::SolverDDP>(
+          solver_factory.create(solver_type, action_type, T));
+  const boost::shared_ptr<crocoddyl::ShootingProblem>& problem =
+      solver->get_problem();
+  problem->set_nthreads(4);
+
+  // Generate the different state along the trajectory
+  const boost::shared_ptr<crocoddyl::StateAbstract>& state =
+      problem->get_runningModels()[0]->get_state();
+  std::vector<Eigen::VectorXd> xs;
+  std::vector<Eigen::VectorXd> us;
+  for (std::size_t i = 0; i < T; ++i) {
+    const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model =
+        problem->get_runningModels()[i];
+    xs.push_back(state->rand());
+    us.push_back(Eigen::VectorXd::Random(model->get_nu()));
+  }
+  xs.push_back(state->rand());
+
+  // Run the serial backward pass
+  solver->setCandidate(xs, us, false);
+  solver->calcDiff();
+  solver->backwardPass();
+  const std::vector<Eigen::MatrixXd> Vxx = solver->get_Vxx();
+  const std::vector<Eigen::VectorXd> Vx = solver->get_Vx();
+  const std::vector<crocoddyl::SolverDDP::MatrixXdRowMajor> K = solver->get_K();
+  const std::vector<Eigen::VectorXd> k = solver->get_k();
+
+  // Run the parallel backward pass and check that both are equivalent
+  solver->set_parallel_backward(true);
+  solver->backwardPass();
+  for (std::size_t t = 0; t < T; ++t) {
+    BOOST_CHECK((solver->get_Vxx()[t] - Vxx[t]).isZero(1e-7));
+    BOOST_CHECK((solver->get_Vx()[t] - Vx[t]).isZero(1e-7));
+    BOOST_CHECK((solver->get_K()[t] - K[t]).isZero(1e-7));
+    BOOST_CHECK((solver->get_k()[t] - k[t]).isZero(1e-7));
+  }
+}
+
+//____________________________________________________________________________//
+
+void test_solver_parallel_linesearch(SolverTypes::Type solver_type,
+                                     ActionModelTypes::Type action_type,
+                                     size_t T) {
+  // Create the testing solver
+  SolverFactory solver_factory;
+  boost::shared_ptr<crocoddyl::SolverDDP> solver =
+      boost::static_pointer_cast<crocoddyl::SolverDDP>(
+          solver_factory.create(solver_type, action_type, T));
+  const boost::shared_ptr<crocoddyl::ShootingProblem>& problem =
+      solver->get_problem();
+  problem->set_nthreads(4);
+  if (solver_type == SolverTypes::SolverFDDP ||
+      solver_type == SolverTypes::SolverBoxFDDP) {
+    // The FDDP line search is not supported by the concurrent line search
+    BOOST_CHECK_THROW(solver->set_parallel_linesearch(true), std::exception);
+    BOOST_CHECK(!solver->get_parallel_linesearch());
+    return;
+  }
+
+  // Generate the different state along the trajectory
+  const boost::shared_ptr<crocoddyl::StateAbstract>& state =
+      problem->get_runningModels()[0]->get_state();
+  std::vector<Eigen::VectorXd> xs;
+  std::vector<Eigen::VectorXd> us;
+  for (std::size_t i = 0; i < T; ++i) {
+    const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model =
+        problem->get_runningModels()[i];
+    xs.push_back(state->rand());
+    us.push_back(Eigen::VectorXd::Random(model->get_nu()));
+  }
+  xs.push_back(state->rand());
+
+  // Solve the problem with the sequential line search
+  solver->solve(xs, us, 100);
+  const std::vector<Eigen::VectorXd> xs_seq = solver->get_xs();
+  const std::vector<Eigen::VectorXd> us_seq = solver->get_us();
+  const std::size_t iter_seq = solver->get_iter();
+
+  // Solve the problem with the concurrent line search and check that both
+  // produce the same iterates
+  solver->set_parallel_linesearch(true);
+  solver->solve(xs, us, 100);
+  BOOST_CHECK_EQUAL(solver->get_iter(), iter_seq);
+  for (std::size_t t = 0; t < T; ++t) {
+    BOOST_CHECK((state->diff_dx(solver->get_xs()[t], xs_seq[t])).isZero(1e-9));
+    BOOST_CHECK((solver->get_us()[t] - us_seq[t]).isZero(1e-9));
+  }
+  BOOST_CHECK((state->diff_dx(solver->get_xs()[T], xs_seq[T])).isZero(1e-9));
+
+  // Check that the problem data, which might be swapped from an accepted
+  // trial, describes the solution
+  std::vector<double> costs(T + 1);
+  for (std::size_t t = 0; t < T; ++t) {
+    costs[t] = problem->get_runningDatas()[t]->cost;
+  }
+  costs[T] = problem->get_terminalData()->cost;
+  const double cost = problem->calc(solver->get_xs(), solver->get_us());
+  for (std::size_t t = 0; t < T; ++t) {
+    BOOST_CHECK(std::abs(problem->get_runningDatas()[t]->cost - costs[t]) <
+                1e-9);
+  }
+  BOOST_CHECK(std::abs(problem->get_terminalData()->cost - costs[T]) < 1e-9);
+  BOOST_CHECK(std::abs(cost - solver->get_cost()) < 1e-9);
+}
+
+//____________________________________________________________________________//
+
+void test_solver_multiple_shooting(ActionModelTypes::Type action_type,
+                                   size_t T) {
+  // Create the testing solver
+  SolverFactory solver_factory;
+  boost::shared_ptr<crocoddyl::SolverFDDP> solver =
+      boost::static_pointer_cast<crocoddyl::SolverFDDP>(
+          solver_factory.create(SolverTypes::SolverFDDP, action_type, T));
+  const boost::shared_ptr<crocoddyl::ShootingProblem>& problem =
+      solver->get_problem();
+  problem->set_nthreads(4);
+
+  // Generate the different state along the trajectory
+  const boost::shared_ptr<crocoddyl::StateAbstract>& state =
+      problem->get_runningModels()[0]->get_state();
+  std::vector<Eigen::VectorXd> xs;
+  std::vector<Eigen::VectorXd> us;
+  for (std::size_t i = 0; i < T; ++i) {
+    const boost::shared_ptr<crocoddyl::ActionModelAbstract>& model =
+        problem->get_runningModels()[i];
+    xs.push_back(state->rand());
+    us.push_back(Eigen::VectorXd::Random(model->get_nu()));
+  }
+  xs.push_back(state->rand());
+
+  // Solve the problem with the nonlinear rollout
+  BOOST_CHECK(solver->solve(xs, us, 200));
+  const double cost = solver->get_cost();
+
+  // Solve the problem with the multiple-shooting rollout and check that it
+  // converges to the same solution
+  solver->set_multiple_shooting(true);
+  solver->set_th_gaptol(1e-10);
+  BOOST_CHECK(solver->solve(xs, us, 200));
+  BOOST_CHECK(std::abs(solver->get_cost() - cost) <=
+              1e-6 * (1. + std::abs(cost)));
+  BOOST_CHECK(solver->get_ffeas() <= 1e-10);
+
+  // INTRO does not support the multiple-shooting rollout
+  crocoddyl::SolverIntro intro(problem);
+  BOOST_CHECK_THROW(intro.set_multiple_shooting(true), std::exception);
+}
+
+void test_solver_shift(SolverTypes::Type solver_type,
+                       ActionModelTypes::Type action_type, size_t T) {
+  // Create the testing solver
+  SolverFactory solver_factory;
+  boost::shared_ptr<crocoddyl::SolverDDP> solver =
+      boost::static_pointer_cast<crocoddyl::SolverDDP>(
+          solver_factory.create(solver_type, action_type, T));
+  const boost::shared_ptr<crocoddyl::ShootingProblem>& problem =
+      solver->get_problem();
+  if (solver_type == SolverTypes::SolverDDP ||
+      solver_type == SolverTypes::SolverBoxDDP) {
+    // The buffers of the concurrent line search are shifted too
+    problem->set_nthreads(4);
+    solver->set_parallel_linesearch(true);
+  }
+
+  // Solve the problem and store the solver trajectories and gains
+  solver->solve();
+  const std::vector<Eigen::VectorXd> xs = solver->get_xs();
+  const std::vector<Eigen::VectorXd> us = solver->get_us();
+  const std::vector<crocoddyl::SolverDDP::MatrixXdRowMajor> K = solver->get_K();
+  const std::vector<Eigen::VectorXd> k = solver->get_k();
+  const std::vector<Eigen::MatrixXd> Vxx = solver->get_Vxx();
+
+  // Append a new node and shift the solver trajectories
+  problem->circularAppend(problem->get_runningModels().back());
+  solver->shift();
+
+  // Check that the solver trajectories and gains were shifted, and that the
+  // last node was extrapolated
+  for (std::size_t t = 0; t < T - 1; ++t) {
+    BOOST_CHECK((solver->get_xs()[t] - xs[t + 1]).isZero(1e-9));
+    BOOST_CHECK((solver->get_us()[t] - us[t + 1]).isZero(1e-9));
+    BOOST_CHECK((solver->get_K()[t] - K[t + 1]).isZero(1e-9));
+    BOOST_CHECK((solver->get_k()[t] - k[t + 1]).isZero(1e-9));
+    BOOST_CHECK((solver->get_Vxx()[t] - Vxx[t + 1]).isZero(1e-9));
+  }
+  BOOST_CHECK((solver->get_xs()[T - 1] - xs[T]).isZero(1e-9));
+  BOOST_CHECK((solver->get_xs()[T] - xs[T]).isZero(1e-9));
+  BOOST_CHECK((solver->get_us()[T - 1] - us[T - 1]).isZero(1e-9));
+  BOOST_CHECK((solver->get_K()[T - 1] - K[T - 1]).isZero(1e-9));
+  BOOST_CHECK((solver->get_k()[T - 1] - k[T - 1]).isZero(1e-9));
+
+  // Check that the shifted trajectories can warm-start the solver
+  BOOST_CHECK(solver->solve(solver->get_xs(), solver->get_us()));
+}
+
+void test_solver_max_time(SolverTypes::Type solver_type,
+                          ActionModelTypes::Type action_type, size_t T) {
+  // Create the testing solver
+  SolverFactory solver_factory;
+  boost::shared_ptr<crocoddyl::SolverAbstract> solver =
+      solver_factory.create(solver_type, action_type, T);
+
+  // Check that a fresh solver, without any duration estimate, also stops
+  boost::shared_ptr<crocoddyl::SolverAbstract> fresh =
+      solver_factory.create(solver_type, action_type, T);
+  fresh->set_max_time(1e-6);
+  BOOST_CHECK(!fresh->solve());
+  BOOST_CHECK(fresh->get_status() == crocoddyl::MaxTimeReached);
+  BOOST_CHECK(fresh->get_iter() == 0);
+
+  // Solve the problem without time budget
+  BOOST_CHECK(solver->solve());
+  BOOST_CHECK(solver->get_status() == crocoddyl::Converged);
+  const double cost = solver->get_cost();
+
+  // Check that the solver stops once the time budget is exhausted
+  solver->set_max_time(1e-6);
+  BOOST_CHECK(!solver->solve());
+  BOOST_CHECK(solver->get_status() == crocoddyl::MaxTimeReached);
+
+  // Check that a large time budget does not affect the solver
+  solver->set_max_time(1e6);
+  BOOST_CHECK(solver->solve());
+  BOOST_CHECK(solver->get_status() == crocoddyl::Converged);
+  BOOST_CHECK(std::abs(solver->get_cost() - cost) <=
+              1e-9 * (1. + std::abs(cost)));
+}
+
+void test_solver_real_time_iteration(SolverTypes::Type solver_type,
+                                     ActionModelTypes::Type action_type,
+                                     size_t T) {
+  // Create the testing solver
+  SolverFactory solver_factory;
+  boost::shared_ptr<crocoddyl::SolverDDP> solver =
+      boost::static_pointer_cast<crocoddyl::SolverDDP>(
+          solver_factory.create(solver_type, action_type, T));
+
+  // Solve the problem
+  BOOST_CHECK(solver->solve());
+  const double cost = solver->get_cost();
+
+  // Run real-time iterations from the zero guess and check that they reach
+  // the same solution
+  BOOST_CHECK_THROW(solver->feedback(), std::exception);
+  solver->prepare();
+  for (std::size_t i = 0; i < 100; ++i) {
+    if (solver->feedback()) {
+      break;
+    }
+    solver->prepare(solver->get_xs(), solver->get_us(),
+                    solver->get_is_feasible());
+  }
+  BOOST_CHECK(solver->get_status() == crocoddyl::Converged);
+  BOOST_CHECK(std::abs(solver->get_cost() - cost) <=
+              1e-6 * (1. + std::abs(cost)));
+}
+
+class SolverDDPFailing : public crocoddyl::SolverDDP {
+ public:
+  explicit SolverDDPFailing(
+      boost::shared_ptr<crocoddyl::ShootingProblem> problem)
+      : crocoddyl::SolverDDP(problem) {}
+
+  virtual bool solve(const std::vector<Eigen::VectorXd>&,
+                     const std::vector<Eigen::VectorXd>&, const std::size_t,
+                     const bool, const double) {
+    throw_pretty("Invalid argument: "
+                 << "this solver always fails");
+  }
+};
+
+void test_solver_batch(SolverTypes::Type solver_type,
+                       ActionModelTypes::Type action_type, size_t T) {
+  // Create the testing solvers and solve them sequentially
+  SolverFactory solver_factory;
+  const std::size_t N = 4;
+  std::vector<boost::shared_ptr<crocoddyl::SolverAbstract> > solvers;
+  std::vector<double> costs;
+  std::vector<std::size_t> maxiters;
+  for (std::size_t i = 0; i < N; ++i) {
+    solvers.push_back(solver_factory.create(solver_type, action_type, T));
+    solvers[i]->get_problem()->set_nthreads(1);
+    maxiters.push_back(100 + i);
+    solvers[i]->solve(crocoddyl::DEFAULT_VECTOR, crocoddyl::DEFAULT_VECTOR,
+                      maxiters[i]);
+    costs.push_back(solvers[i]->get_cost());
+    // Reset the warm start
+    solvers[i]->setCandidate();
+  }
+
+  // Solve them concurrently and check that they reach the same solutions
+  crocoddyl::SolverBatch batch(solvers);
+  batch.set_nthreads(4);
+  BOOST_CHECK(batch.solve(maxiters) == N);
+  for (std::size_t i = 0; i < N; ++i) {
+    BOOST_CHECK(batch.get_converged()[i]);
+    BOOST_CHECK(std::abs(batch.get_costs()[i] - costs[i]) <=
+                1e-9 * (1. + std::abs(costs[i])));
+  }
+#ifdef CROCODDYL_WITH_CHECK_RUNTIME_MALLOC
+  // The concurrent solvers must not change the allocation state
+  BOOST_CHECK(Eigen::internal::is_malloc_allowed());
+#endif
+
+  // Check that the dimension of the iteration limits is checked
+  BOOST_CHECK_THROW(batch.solve(std::vector<std::size_t>(N + 1, 1)),
+                    std::exception);
+
+  // Check that a failing solver does not abort the other problems
+  solvers.push_back(boost::make_shared<SolverDDPFailing>(
+      solver_factory.create(solver_type, action_type, T)->get_problem()));
+  maxiters.push_back(1);
+  crocoddyl::SolverBatch failing_batch(solvers);
+  BOOST_CHECK(failing_batch.solve(maxiters) == N);
+  for (std::size_t i = 0; i < N; ++i) {
+    BOOST_CHECK(failing_batch.get_statuses()[i] == crocoddyl::Converged);
+    BOOST_CHECK(failing_batch.get_errors()[i].empty());
+  }
+  BOOST_CHECK(failing_batch.get_statuses()[N] == crocoddyl::Failed);
+  BOOST_CHECK(!failing_batch.get_errors()[N].empty());
+  BOOST_CHECK(std::isnan(failing_batch.get_costs()[N]));
+
+  // Check that the solvers cannot share a shooting problem
+  solvers.back() =
+      boost::make_shared<crocoddyl::SolverDDP>(solvers[0]->get_problem());
+  BOOST_CHECK_THROW(crocoddyl::SolverBatch{solvers}, std::exception);
+}
+
+void test_callback_logger(SolverTypes::Type solver_type,
+                          ActionModelTypes::Type action_type, size_t T) {
+  // Create the testing solver and the loggers, where the second one has fewer
+  // records than iterations
+  SolverFactory solver_factory;
+  const boost::shared_ptr<crocoddyl::SolverAbstract>& solver =
+      solver_factory.create(solver_type, action_type, T);
+  boost::shared_ptr<crocoddyl::CallbackLogger> logger =
+      boost::make_shared<crocoddyl::CallbackLogger>(1000, true);
+  boost::shared_ptr<crocoddyl::CallbackLogger> ring =
+      boost::make_shared<crocoddyl::CallbackLogger>(2, true);
+  std::vector<boost::shared_ptr<crocoddyl::CallbackAbstract> > cbs;
+  cbs.push_back(logger);
+  cbs.push_back(ring);
+  solver->setCallbacks(cbs);
+  solver->solve();
+
+  // Check the recorded iterations
+  const std::size_t n = logger->get_size();
+  BOOST_CHECK(n >= 1);
+  for (std::size_t i = 0; i < n; ++i) {
+    BOOST_CHECK(logger->get_iters()[i] == static_cast<int>(i));
+  }
+  BOOST_CHECK_EQUAL(logger->get_costs()[n - 1], solver->get_cost());
+  BOOST_CHECK_EQUAL(logger->get_steps()[n - 1], solver->get_steplength());
+  BOOST_CHECK_EQUAL(logger->get_xs().size(), T + 1);
+  BOOST_CHECK_EQUAL(logger->get_us().size(), T);
+  BOOST_CHECK_EQUAL(logger->get_xs_log().cols(), n);
+  BOOST_CHECK_EQUAL(logger->get_fs_log().rows(),
+                    (T + 1) * solver->get_problem()->get_ndx());
+  const std::vector<std::vector<Eigen::VectorXd> > fs = logger->get_fs();
+  BOOST_CHECK_EQUAL(fs.size(), n);
+  for (std::size_t t = 0; t < T + 1; ++t) {
+    BOOST_CHECK(fs[n - 1][t] == solver->get_fs()[t]);
+  }
+
+  // Check that the ring buffer keeps the last iterations in order
+  const std::size_t m = std::min<std::size_t>(n, 2);
+  BOOST_CHECK_EQUAL(ring->get_size(), m);
+  BOOST_CHECK(ring->get_costs() == logger->get_costs().tail(m));
+  BOOST_CHECK(ring->get_iters() == logger->get_iters().tail(m));
+  BOOST_CHECK(ring->get_xs_log() == logger->get_xs_log().rightCols(m));
+  BOOST_CHECK(ring->get_us_log() == logger->get_us_log().rightCols(m));
+  for (std::size_t t = 0, k = 0; t < T + 1; ++t) {
+    const Eigen::VectorXd& x = solver->get_xs()[t];
+    BOOST_CHECK(ring->get_xs_log().col(m - 1).segment(k, x.size()) == x);
+    k += x.size();
+  }
+
+  // Check that the records are removed
+  ring->reset();
+  BOOST_CHECK_EQUAL(ring->get_size(), 0);
+  BOOST_CHECK_EQUAL(ring->get_costs().size(), 0);
+}
+
+void test_solver_allocations(SolverTypes::Type solver_type,
+                             ActionModelTypes::Type action_type, size_t T) {
+  // Create the testing solver and solve the problem once, so any lazy
+  // allocation happens before counting
+  SolverFactory solver_factory;
+  const boost::shared_ptr<crocoddyl::SolverAbstract>& solver =
+      solver_factory.create(solver_type, action_type, T);
+  const boost::shared_ptr<crocoddyl::ShootingProblem>& problem =
+      solver->get_problem();
+  problem->set_nthreads(1);
+  const boost::shared_ptr<crocoddyl::StateAbstract>& state =
+      problem->get_runningModels()[0]->get_state();
+  std::vector<Eigen::VectorXd> xs;
+  std::vector<Eigen::VectorXd> us;
+  for (std::size_t i = 0; i < T; ++i) {
+    xs.push_back(state->rand());
+    us.push_back(
+        Eigen::VectorXd::Random(problem->get_runningModels()[i]->get_nu()));
+  }
+  xs.push_back(state->rand());
+  solver->solve(xs, us, 100);
+
+  // Solve it again from the same guess and check that the iterations do not
+  // allocate memory
+#ifdef __GLIBC__
+  malloc_count = 0;
+  malloc_counting = true;
+#endif
+  const bool converged = solver->solve(xs, us, 100);
+#ifdef __GLIBC__
+  malloc_counting = false;
+  BOOST_CHECK(malloc_count == 0);
+#endif
+  BOOST_CHECK(converged);
+}
+
+void test_solver_stacked_trajectories(SolverTypes::Type solver_type,
+                                      ActionModelTypes::Type action_type,
+                                      size_t T) {
+  // Create the testing solver and solve the problem
+  SolverFactory solver_factory;
+  const boost::shared_ptr<crocoddyl::SolverAbstract>& solver =
+      solver_factory.create(solver_type, action_type, T);
+  const boost::shared_ptr<crocoddyl::SolverDDP>& ddp =
+      boost::static_pointer_cast<crocoddyl::SolverDDP>(solver);
+  solver->solve();
+
+  // Check that the stacked buffers match the trajectories
+  const std::size_t nu = solver->get_us()[0].size();
+  const std::size_t ndx = solver->get_problem()->get_ndx();
+  const crocoddyl::SolverAbstract::MatrixXdRowMajor& xs =
+      solver->get_stacked_xs();
+  const crocoddyl::SolverAbstract::MatrixXdRowMajor& us =
+      solver->get_stacked_us();
+  const crocoddyl::SolverAbstract::MatrixXdRowMajor& fs =
+      solver->get_stacked_fs();
+  const crocoddyl::SolverAbstract::MatrixXdRowMajor& K = ddp->get_stacked_K();
+  const crocoddyl::SolverAbstract::MatrixXdRowMajor& k = ddp->get_stacked_k();
+  BOOST_CHECK_EQUAL(xs.rows(), T + 1);
+  BOOST_CHECK_EQUAL(us.rows(), T);
+  BOOST_CHECK_EQUAL(fs.rows(), T + 1);
+  BOOST_CHECK_EQUAL(K.rows(), T * nu);
+  BOOST_CHECK_EQUAL(K.cols(), ndx);
+  BOOST_CHECK_EQUAL(k.rows(), T);
+  for (std::size_t t = 0; t < T; ++t) {
+    BOOST_CHECK(xs.row(t).transpose() == solver->get_xs()[t]);
+    BOOST_CHECK(us.row(t).transpose() == solver->get_us()[t]);
+    BOOST_CHECK(fs.row(t).transpose() == solver->get_fs()[t]);
+    BOOST_CHECK(K.middleRows(t * nu, nu) == ddp->get_K()[t]);
+    BOOST_CHECK(k.row(t).transpose() == ddp->get_k()[t]);
+  }
+  BOOST_CHECK(xs.row(T).transpose() == solver->get_xs()[T]);
+  BOOST_CHECK(fs.row(T).transpose() == solver->get_fs()[T]);
+
+  // Check that the buffers are refreshed without being reallocated
+  const double* data = xs.data();
+  solver->setCandidate(solver->get_xs(), solver->get_us(), false);
+  solver->solve(solver->get_xs(), solver->get_us(), 1);
+  BOOST_CHECK(solver->get_stacked_xs().data() == data);
+  BOOST_CHECK(xs.row(T).transpose() == solver->get_xs()[T]);
+}
+
+void test_solver_euler_structure(size_t T) {
+  // Create two problems with the same Euler models, but only the second one
+  // declares the Euler block structure of its Jacobians
+  boost::shared_ptr<crocoddyl::DifferentialActionModelLQR> diff =
+      boost::make_shared<crocoddyl::DifferentialActionModelLQR>(6, 4, false);
+  boost::shared_ptr<crocoddyl::IntegratedActionModelEuler> dense =
+      boost::make_shared<crocoddyl::IntegratedActionModelEuler>(diff, 1e-2);
+  boost::shared_ptr<crocoddyl::IntegratedActionModelEuler> structured =
+      boost::make_shared<crocoddyl::IntegratedActionModelEuler>(diff, 1e-2);
+  structured->set_euler_structure(true);
+  BOOST_CHECK_EQUAL(dense->get_structure_timestep(), 0.);
+  BOOST_CHECK_EQUAL(structured->get_structure_timestep(), 1e-2);
+  const Eigen::VectorXd x0 = diff->get_state()->rand();
+  crocoddyl::SolverDDP dense_solver(
+      boost::make_shared<crocoddyl::ShootingProblem>(
+          x0,
+          std::vector<boost::shared_ptr<crocoddyl::ActionModelAbstract> >(
+              T, dense),
+          dense));
+  crocoddyl::SolverDDP structured_solver(
+      boost::make_shared<crocoddyl::ShootingProblem>(
+          x0,
+          std::vector<boost::shared_ptr<crocoddyl::ActionModelAbstract> >(
+              T, structured),
+          structured));
+
+  // Run the backward pass from the same infeasible guess
+  std::vector<Eigen::VectorXd> xs(T + 1);
+  std::vector<Eigen::VectorXd> us(T);
+  for (std::size_t t = 0; t < T; ++t) {
+    xs[t] = diff->get_state()->rand();
+    us[t] = Eigen::VectorXd::Random(diff->get_nu());
+  }
+  xs[T] = diff->get_state()->rand();
+  dense_solver.setCandidate(xs, us, false);
+  structured_solver.setCandidate(xs, us, false);
+  dense_solver.calcDiff();
+  structured_solver.calcDiff();
+  dense_solver.backwardPass();
+  structured_solver.backwardPass();
+
+  // Check that the structured products match the dense ones
+  for (std::size_t t = 0; t < T; ++t) {
+    BOOST_CHECK((structured_solver.get_Qxx()[t] - dense_solver.get_Qxx()[t])
+                    .isZero(1e-9));
+    BOOST_CHECK((structured_solver.get_Quu()[t] - dense_solver.get_Quu()[t])
+                    .isZero(1e-9));
+    BOOST_CHECK((structured_solver.get_Qxu()[t] - dense_solver.get_Qxu()[t])
+                    .isZero(1e-9));
+    BOOST_CHECK((structured_solver.get_Qx()[t] - dense_solver.get_Qx()[t])
+                    .isZero(1e-9));
+    BOOST_CHECK((structured_solver.get_Qu()[t] - dense_solver.get_Qu()[t])
+                    .isZero(1e-9));
+    BOOST_CHECK((structured_solver.get_Vxx()[t] - dense_solver.get_Vxx()[t])
+                    .isZero(1e-9));
+    BOOST_CHECK((structured_solver.get_Vx()[t] - dense_solver.get_Vx()[t])
+                    .isZero(1e-9));
+  }
+}
+
+void test_solver_mppi(ActionModelTypes::Type action_type, size_t T) {
+  // Create the reference solver and its shooting problem
+  SolverFactory solver_factory;
+  const boost::shared_ptr<crocoddyl::SolverAbstract>& fddp =
+      solver_factory.create(SolverTypes::SolverFDDP, action_type, T);
+  const boost::shared_ptr<crocoddyl::ShootingProblem>& problem =
+      fddp->get_problem();
+
+  // Run the sampling-based solver from a null control trajectory
+  crocoddyl::SolverMPPI mppi(problem, 50);
+  mppi.set_nthreads(4);
+  mppi.solve(crocoddyl::DEFAULT_VECTOR, crocoddyl::DEFAULT_VECTOR, 10);
+  std::vector<Eigen::VectorXd> us0(T);
+  for (std::size_t t = 0; t < T; ++t) {
+    us0[t] = Eigen::VectorXd::Zero(problem->get_runningModels()[t]->get_nu());
+  }
+  const std::vector<Eigen::VectorXd> xs0 = problem->rollout_us(us0);
+  BOOST_CHECK(mppi.get_cost() <= problem->calc(xs0, us0));
+  BOOST_CHECK(mppi.get_is_feasible());
+  BOOST_CHECK(std::abs(mppi.get_weights().sum() - 1.) < 1e-9);
+
+  // Check that the trajectories are obtained from a rollout
+  const std::vector<Eigen::VectorXd> xs = problem->rollout_us(mppi.get_us());
+  for (std::size_t t = 0; t < T + 1; ++t) {
+    BOOST_CHECK((mppi.get_xs()[t] - xs[t]).isZero(1e-9));
+  }
+
+  // Check that the samples are reproducible for the same seed
+  crocoddyl::SolverMPPI mppi_seed(problem, 50);
+  mppi_seed.set_nthreads(4);
+  mppi_seed.solve(crocoddyl::DEFAULT_VECTOR, crocoddyl::DEFAULT_VECTOR, 10);
+  BOOST_CHECK_EQUAL(mppi_seed.get_cost(), mppi.get_cost());
+
+  // Check that its trajectories can warm-start FDDP
+  BOOST_CHECK(fddp->solve(mppi.get_xs(), mppi.get_us(), 100, true));
+}
+
+//____________________________________________________________________________//
+
 void register_kkt_solver_unit_tests(ActionModelTypes::Type action_type,
                                     const std::size_t T) {
   boost::test_tools::output_test_stream test_name;
@@ -157,6 +834,9 @@ void register_kkt_solver_unit_tests(ActionModelTypes::Type action_type,
   ts->add(BOOST_TEST_CASE(boost::bind(&test_kkt_dimension, action_type, T)));
   ts->add(
       BOOST_TEST_CASE(boost::bind(&test_kkt_search_direction, action_type, T)));
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_kkt_sparse_factorization, action_type, T)));
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_kkt_max_time, action_type, T)));
   framework::master_test_suite().add(ts);
 }
 
@@ -172,6 +852,134 @@ void register_solvers_againt_kkt_unit_tests(SolverTypes::Type solver_type,
   framework::master_test_suite().add(ts);
 }
 
+void register_solver_parallel_backward_unit_tests(
+    SolverTypes::Type solver_type, ActionModelTypes::Type action_type,
+    const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_parallel_backward_" << solver_type << "_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_solver_parallel_backward,
+                                      solver_type, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_solver_parallel_linesearch_unit_tests(
+    SolverTypes::Type solver_type, ActionModelTypes::Type action_type,
+    const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_parallel_linesearch_" << solver_type << "_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_solver_parallel_linesearch,
+                                      solver_type, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_solver_multiple_shooting_unit_tests(
+    ActionModelTypes::Type action_type, const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_multiple_shooting_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_solver_multiple_shooting, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_solver_shift_unit_tests(SolverTypes::Type solver_type,
+                                      ActionModelTypes::Type action_type,
+                                      const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_shift_" << solver_type << "_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_solver_shift, solver_type, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_solver_real_time_unit_tests(SolverTypes::Type solver_type,
+                                          ActionModelTypes::Type action_type,
+                                          const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_real_time_" << solver_type << "_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_solver_max_time, solver_type, action_type, T)));
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_solver_real_time_iteration,
+                                      solver_type, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_solver_batch_unit_tests(SolverTypes::Type solver_type,
+                                      ActionModelTypes::Type action_type,
+                                      const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_batch_" << solver_type << "_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_solver_batch, solver_type, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_callback_logger_unit_tests(SolverTypes::Type solver_type,
+                                         ActionModelTypes::Type action_type,
+                                         const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_logger_" << solver_type << "_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_callback_logger, solver_type, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_solver_stacked_unit_tests(SolverTypes::Type solver_type,
+                                        ActionModelTypes::Type action_type,
+                                        const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_stacked_" << solver_type << "_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_solver_stacked_trajectories,
+                                      solver_type, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_solver_allocations_unit_tests(SolverTypes::Type solver_type,
+                                            ActionModelTypes::Type action_type,
+                                            const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_allocations_" << solver_type << "_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(
+      boost::bind(&test_solver_allocations, solver_type, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_solver_euler_structure_unit_tests(const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_euler_structure";
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_solver_euler_structure, T)));
+  framework::master_test_suite().add(ts);
+}
+
+void register_solver_mppi_unit_tests(ActionModelTypes::Type action_type,
+                                     const std::size_t T) {
+  boost::test_tools::output_test_stream test_name;
+  test_name << "test_mppi_" << action_type;
+  test_suite* ts = BOOST_TEST_SUITE(test_name.str());
+  std::cout << "Running " << test_name.str() << std::endl;
+  ts->add(BOOST_TEST_CASE(boost::bind(&test_solver_mppi, action_type, T)));
+  framework::master_test_suite().add(ts);
+}
+
 //____________________________________________________________________________//
 
 bool init_function() {
@@ -189,6 +997,48 @@ bool init_function() {
                                              ActionModelTypes::all[i], T);
     }
   }
+
+  for (size_t i = 0; i < ActionModelTypes::ActionModelImpulseFwdDynamics_HyQ;
+       ++i) {
+    register_solver_parallel_backward_unit_tests(SolverTypes::SolverDDP,
+                                                 ActionModelTypes::all[i], T);
+    register_solver_parallel_backward_unit_tests(SolverTypes::SolverFDDP,
+                                                 ActionModelTypes::all[i], T);
+    register_solver_parallel_linesearch_unit_tests(SolverTypes::SolverDDP,
+                                                   ActionModelTypes::all[i], T);
+    register_solver_parallel_linesearch_unit_tests(SolverTypes::SolverBoxDDP,
+                                                   ActionModelTypes::all[i], T);
+    register_solver_parallel_linesearch_unit_tests(SolverTypes::SolverFDDP,
+                                                   ActionModelTypes::all[i], T);
+    register_solver_parallel_linesearch_unit_tests(SolverTypes::SolverBoxFDDP,
+                                                   ActionModelTypes::all[i], T);
+    register_solver_multiple_shooting_unit_tests(ActionModelTypes::all[i], T);
+    register_solver_shift_unit_tests(SolverTypes::SolverDDP,
+                                     ActionModelTypes::all[i], T);
+    register_solver_shift_unit_tests(SolverTypes::SolverFDDP,
+                                     ActionModelTypes::all[i], T);
+    register_solver_shift_unit_tests(SolverTypes::SolverBoxDDP,
+                                     ActionModelTypes::all[i], T);
+    register_solver_shift_unit_tests(SolverTypes::SolverBoxFDDP,
+                                     ActionModelTypes::all[i], T);
+    register_solver_real_time_unit_tests(SolverTypes::SolverDDP,
+                                         ActionModelTypes::all[i], T);
+    register_solver_real_time_unit_tests(SolverTypes::SolverFDDP,
+                                         ActionModelTypes::all[i], T);
+    register_solver_batch_unit_tests(SolverTypes::SolverFDDP,
+                                     ActionModelTypes::all[i], T);
+    register_callback_logger_unit_tests(SolverTypes::SolverFDDP,
+                                        ActionModelTypes::all[i], T);
+    register_solver_stacked_unit_tests(SolverTypes::SolverDDP,
+                                       ActionModelTypes::all[i], T);
+    register_solver_mppi_unit_tests(ActionModelTypes::all[i], T);
+    // We start from 1 as 0 is the kkt solver, and we skip Ipopt
+    for (size_t s = 1; s < SolverTypes::SolverIpopt; ++s) {
+      register_solver_allocations_unit_tests(SolverTypes::all[s],
+                                             ActionModelTypes::all[i], T);
+    }
+  }
+  register_solver_euler_structure_unit_tests(T);
   return true;
 }
 
@@ -25,6 +25,7 @@
 #include <string>
 
 #include "crocoddyl/core/utils/exception.hpp"
+#include "crocoddyl/core/utils/malloc-check.hpp"
 #include "random_generator.hpp"
 
 namespace crocoddyl {